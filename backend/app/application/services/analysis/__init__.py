@@ -0,0 +1,19 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gold Price Analyzer - Analysis Services
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+License: MIT
+"""
+
+from app.application.services.analysis.correlation_service import (
+    CorrelationService,
+    get_correlation_service,
+)
+
+__all__ = [
+    "CorrelationService",
+    "get_correlation_service",
+]
@@ -0,0 +1,505 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gold Price Analyzer - Correlation Service
+
+همبستگی غلتان، بتا و هم‌انباشتگی بین دارایی‌ها (طلا، GLD، DXY، ...)
+
+Rolling correlation and beta for many windows and asset pairs in one
+pass: the five running sums (x, y, x², y², xy) are cumulative-summed once
+per pair and every window is a difference of two cumsum slices. Engle-
+Granger cointegration is computed on the last `window` log prices.
+
+Results are cached per (pair, window, as-of date). When new bars arrive
+only they are appended: per-window accumulators update the latest
+statistics in O(1) per bar instead of recomputing the history.
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+License: MIT
+"""
+
+import math
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.logging import get_logger
+from app.infrastructure.database.models import DollarIndexPrice, GoldPriceFact
+
+logger = get_logger(__name__)
+
+Pair = Tuple[str, str]
+
+DEFAULT_WINDOWS = (20, 60, 120, 250)
+
+# asset -> daily close source in the database
+ASSETS = {
+    "gold": ("gold_price_facts", "yahoo_finance"),
+    "gold_converted": ("gold_price_facts", "alpha_vantage_gold_converted"),
+    "gld": ("gold_price_facts", "alpha_vantage_gld"),
+    "dxy": ("dollar_index_prices", None),
+}
+
+# MacKinnon (2010) critical values, Engle-Granger with constant, 2 variables
+EG_CRITICAL_VALUES = {"1%": -3.90, "5%": -3.34, "10%": -3.04}
+
+
+# ====================================
+# Vectorized kernels
+# ====================================
+def _cumsum0(a: np.ndarray) -> np.ndarray:
+    out = np.empty(len(a) + 1)
+    out[0] = 0.0
+    np.cumsum(a, out=out[1:])
+    return out
+
+
+def rolling_corr_beta(
+    y: np.ndarray,
+    x: np.ndarray,
+    windows: Sequence[int],
+) -> Dict[int, Tuple[np.ndarray, np.ndarray]]:
+    """
+    Rolling correlation and beta (y on x) for several windows.
+
+    Args:
+        y: Dependent series (e.g. gold returns)
+        x: Explanatory series (e.g. DXY returns), same length
+        windows: Window lengths
+
+    Returns:
+        window -> (corr, beta), each aligned with the inputs
+        (NaN for the first `window - 1` positions)
+    """
+    y = np.asarray(y, dtype=np.float64)
+    x = np.asarray(x, dtype=np.float64)
+    n = len(x)
+
+    # centering keeps the cumsum differences well conditioned
+    xc = x - x.mean() if n else x
+    yc = y - y.mean() if n else y
+    sx, sy = _cumsum0(xc), _cumsum0(yc)
+    sxx, syy, sxy = _cumsum0(xc * xc), _cumsum0(yc * yc), _cumsum0(xc * yc)
+
+    results = {}
+    for w in windows:
+        corr = np.full(n, np.nan)
+        beta = np.full(n, np.nan)
+
+        if 2 <= w <= n:
+            wx = sx[w:] - sx[:-w]
+            wy = sy[w:] - sy[:-w]
+            cov = (sxy[w:] - sxy[:-w]) - wx * wy / w
+            var_x = (sxx[w:] - sxx[:-w]) - wx * wx / w
+            var_y = (syy[w:] - syy[:-w]) - wy * wy / w
+
+            with np.errstate(divide="ignore", invalid="ignore"):
+                corr[w - 1:] = np.where((var_x > 0) & (var_y > 0), cov / np.sqrt(var_x * var_y), np.nan)
+                beta[w - 1:] = np.where(var_x > 0, cov / var_x, np.nan)
+
+        results[w] = (corr, beta)
+
+    return results
+
+
+def engle_granger(log_y: np.ndarray, log_x: np.ndarray) -> Dict[str, Any]:
+    """
+    Engle-Granger two-step cointegration test.
+
+    1. OLS  log_y = a + b * log_x
+    2. ADF(1) on the residuals (no constant)
+
+    Returns:
+        t_stat, critical_values, cointegrated (5%), hedge_ratio, half_life
+    """
+    n = len(log_x)
+    if n < 20:
+        return {"n": n, "t_stat": None, "cointegrated": None}
+
+    design = np.column_stack([np.ones(n), log_x])
+    (alpha, hedge), *_ = np.linalg.lstsq(design, log_y, rcond=None)
+    resid = log_y - alpha - hedge * log_x
+
+    de = np.diff(resid)
+    z = np.column_stack([resid[1:-1], de[:-1]])
+    target = de[1:]
+    coef, *_ = np.linalg.lstsq(z, target, rcond=None)
+    eps = target - z @ coef
+    dof = len(target) - z.shape[1]
+    sigma2 = float(eps @ eps) / dof
+    se = math.sqrt(sigma2 * np.linalg.inv(z.T @ z)[0, 0])
+    gamma = float(coef[0])
+    t_stat = gamma / se if se > 0 else float("nan")
+
+    half_life = -math.log(2) / math.log(1 + gamma) if -1 < gamma < 0 else None
+
+    return {
+        "n": n,
+        "t_stat": round(t_stat, 4),
+        "critical_values": EG_CRITICAL_VALUES,
+        "cointegrated": bool(t_stat < EG_CRITICAL_VALUES["5%"]),
+        "hedge_ratio": round(float(hedge), 6),
+        "half_life_bars": round(half_life, 2) if half_life is not None else None,
+    }
+
+
+def _round(value: float, digits: int = 6) -> Optional[float]:
+    return None if value is None or not np.isfinite(value) else round(float(value), digits)
+
+
+# ====================================
+# Incremental state
+# ====================================
+class WindowAccumulator:
+    """Running sums over the last `window` (x, y) pairs, O(1) per update."""
+
+    # re-sum from the buffer now and then to stop floating point drift
+    RESYNC_EVERY = 1000
+
+    def __init__(self, window: int):
+        self.window = window
+        self.buffer: Deque[Tuple[float, float]] = deque()
+        self.sx = self.sy = self.sxx = self.syy = self.sxy = 0.0
+        self._updates = 0
+
+    def push(self, x: float, y: float) -> None:
+        self.buffer.append((x, y))
+        self._add(x, y, 1.0)
+        if len(self.buffer) > self.window:
+            old_x, old_y = self.buffer.popleft()
+            self._add(old_x, old_y, -1.0)
+
+        self._updates += 1
+        if self._updates % self.RESYNC_EVERY == 0:
+            self._resync()
+
+    def _add(self, x: float, y: float, sign: float) -> None:
+        self.sx += sign * x
+        self.sy += sign * y
+        self.sxx += sign * x * x
+        self.syy += sign * y * y
+        self.sxy += sign * x * y
+
+    def _resync(self) -> None:
+        self.sx = self.sy = self.sxx = self.syy = self.sxy = 0.0
+        for x, y in self.buffer:
+            self._add(x, y, 1.0)
+
+    def stats(self) -> Tuple[Optional[float], Optional[float]]:
+        """(corr, beta) of the current window, None until the window is full."""
+        n = len(self.buffer)
+        if n < self.window:
+            return None, None
+
+        cov = self.sxy - self.sx * self.sy / n
+        var_x = self.sxx - self.sx * self.sx / n
+        var_y = self.syy - self.sy * self.sy / n
+
+        corr = cov / math.sqrt(var_x * var_y) if var_x > 0 and var_y > 0 else None
+        beta = cov / var_x if var_x > 0 else None
+        return corr, beta
+
+
+@dataclass
+class PairState:
+    """Aligned log prices of one pair plus its per-window accumulators."""
+
+    pair: Pair
+    dates: List[pd.Timestamp] = field(default_factory=list)
+    log_y: List[float] = field(default_factory=list)
+    log_x: List[float] = field(default_factory=list)
+    accumulators: Dict[int, WindowAccumulator] = field(default_factory=dict)
+
+    @property
+    def last_date(self) -> Optional[pd.Timestamp]:
+        return self.dates[-1] if self.dates else None
+
+
+# ====================================
+# Service
+# ====================================
+class CorrelationService:
+    """
+    Multi-pair, multi-window rolling correlation / beta / cointegration.
+
+    Example:
+        >>> service = CorrelationService()
+        >>> service.update(("gold", "dxy"), gold_close, dxy_close)
+        >>> service.get(("gold", "dxy"), window=60)
+        {'pair': 'gold:dxy', 'window': 60, 'corr': -0.42, 'beta': -1.1, ...}
+    """
+
+    def __init__(self, windows: Sequence[int] = DEFAULT_WINDOWS, cache_size: int = 4096):
+        """
+        Initialize service.
+
+        Args:
+            windows: Windows maintained incrementally for every pair
+            cache_size: Maximum cached (pair, window, as-of) results
+        """
+        self.windows = tuple(sorted(set(windows)))
+        self.cache_size = cache_size
+        self._pairs: Dict[Pair, PairState] = {}
+        self._cache: "OrderedDict[Tuple[Pair, int, date], Dict[str, Any]]" = OrderedDict()
+
+    # ------------------------------------------------------------------
+    # Data
+    # ------------------------------------------------------------------
+    def update(self, pair: Pair, y_close: pd.Series, x_close: pd.Series) -> int:
+        """
+        Feed price levels for a pair; only bars newer than the stored
+        ones are processed.
+
+        Args:
+            pair: (y asset, x asset), e.g. ("gold", "dxy")
+            y_close: Close prices of the dependent asset (DatetimeIndex)
+            x_close: Close prices of the explanatory asset (DatetimeIndex)
+
+        Returns:
+            int: Number of new aligned bars
+        """
+        state = self._pairs.setdefault(
+            pair,
+            PairState(pair=pair, accumulators={w: WindowAccumulator(w) for w in self.windows}),
+        )
+
+        aligned = pd.concat(
+            [_daily(y_close).rename("y"), _daily(x_close).rename("x")],
+            axis=1,
+            join="inner",
+        ).dropna()
+        aligned = aligned[(aligned["y"] > 0) & (aligned["x"] > 0)]
+
+        if state.last_date is not None:
+            aligned = aligned[aligned.index > state.last_date]
+
+        if aligned.empty:
+            return 0
+
+        log_y = np.log(aligned["y"].to_numpy(dtype=float))
+        log_x = np.log(aligned["x"].to_numpy(dtype=float))
+
+        prev_y = state.log_y[-1] if state.log_y else None
+        prev_x = state.log_x[-1] if state.log_x else None
+
+        for y, x in zip(log_y, log_x):
+            if prev_y is not None:
+                for acc in state.accumulators.values():
+                    acc.push(x - prev_x, y - prev_y)
+            prev_y, prev_x = y, x
+
+        state.dates.extend(aligned.index)
+        state.log_y.extend(log_y.tolist())
+        state.log_x.extend(log_x.tolist())
+
+        logger.debug("correlation_pair_updated", pair=_name(pair), new_bars=len(aligned))
+        return len(aligned)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def get(
+        self,
+        pair: Pair,
+        window: int,
+        as_of: Optional[date] = None,
+        cointegration: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Statistics of one window ending at `as_of` (default: latest bar).
+        """
+        state = self._pairs.get(pair)
+        if state is None or not state.dates:
+            return {"pair": _name(pair), "window": window, "as_of": None, "n": 0}
+
+        end = len(state.dates) if as_of is None else int(
+            np.searchsorted(np.array(state.dates, dtype="datetime64[ns]"),
+                            np.datetime64(pd.Timestamp(as_of), "ns"), side="right")
+        )
+        if end == 0:
+            return {"pair": _name(pair), "window": window, "as_of": None, "n": 0}
+
+        as_of_date = state.dates[end - 1].date()
+        key = (pair, window, as_of_date)
+
+        cached = self._cache.get(key)
+        if cached is not None and (not cointegration or "cointegration" in cached):
+            self._cache.move_to_end(key)
+            return cached
+
+        latest = end == len(state.dates)
+        if latest and window in state.accumulators:
+            corr, beta = state.accumulators[window].stats()
+        else:
+            corr, beta = self._window_stats(state, end, window)
+
+        result = {
+            "pair": _name(pair),
+            "window": window,
+            "as_of": as_of_date.isoformat(),
+            "n": min(window, end - 1),
+            "corr": _round(corr),
+            "beta": _round(beta),
+        }
+
+        if cointegration:
+            start = max(0, end - window)
+            result["cointegration"] = engle_granger(
+                np.asarray(state.log_y[start:end]),
+                np.asarray(state.log_x[start:end]),
+            )
+
+        self._store(key, result)
+        return result
+
+    def history(self, pair: Pair, windows: Optional[Sequence[int]] = None) -> pd.DataFrame:
+        """
+        Full rolling history (one cumsum pass for all windows).
+
+        Returns:
+            DataFrame indexed by date with corr_{w} / beta_{w} columns
+        """
+        state = self._pairs.get(pair)
+        windows = tuple(windows or self.windows)
+        if state is None or len(state.dates) < 2:
+            return pd.DataFrame()
+
+        ry = np.diff(np.asarray(state.log_y))
+        rx = np.diff(np.asarray(state.log_x))
+        stats = rolling_corr_beta(ry, rx, windows)
+
+        columns = {}
+        for w in windows:
+            columns[f"corr_{w}"], columns[f"beta_{w}"] = stats[w]
+
+        return pd.DataFrame(columns, index=pd.DatetimeIndex(state.dates[1:], name="date"))
+
+    async def refresh(self, session: AsyncSession, pairs: Sequence[Pair]) -> Dict[str, int]:
+        """
+        Load only bars newer than what each pair already holds.
+
+        Returns:
+            pair name -> number of new aligned bars
+        """
+        loaded: Dict[Tuple[str, Optional[date]], pd.Series] = {}
+        new_bars = {}
+
+        for pair in pairs:
+            state = self._pairs.get(pair)
+            since = state.last_date.date() if state and state.last_date is not None else None
+
+            series = []
+            for asset in pair:
+                if (asset, since) not in loaded:
+                    loaded[(asset, since)] = await load_close_series(session, asset, since)
+                series.append(loaded[(asset, since)])
+
+            new_bars[_name(pair)] = self.update(pair, series[0], series[1])
+
+        return new_bars
+
+    def summary(self, pairs: Sequence[Pair], windows: Optional[Sequence[int]] = None,
+                as_of: Optional[date] = None) -> List[Dict[str, Any]]:
+        """All windows of all pairs."""
+        return [
+            self.get(pair, w, as_of)
+            for pair in pairs
+            for w in (windows or self.windows)
+        ]
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+    def _window_stats(self, state: PairState, end: int, window: int) -> Tuple[float, float]:
+        start = max(0, end - window - 1)
+        ry = np.diff(np.asarray(state.log_y[start:end]))
+        rx = np.diff(np.asarray(state.log_x[start:end]))
+        if len(rx) < window:
+            return None, None
+        corr, beta = rolling_corr_beta(ry, rx, (window,))[window]
+        return corr[-1], beta[-1]
+
+    def _store(self, key: Tuple[Pair, int, date], value: Dict[str, Any]) -> None:
+        self._cache[key] = value
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+
+async def load_close_series(
+    session: AsyncSession,
+    asset: str,
+    since: Optional[date] = None,
+) -> pd.Series:
+    """
+    Daily closes of an asset (bars after `since` only).
+
+    Raises:
+        ValueError: unknown asset
+    """
+    if asset not in ASSETS:
+        raise ValueError(f"Unknown asset: {asset} (known: {', '.join(sorted(ASSETS))})")
+
+    table, source = ASSETS[asset]
+
+    if table == "dollar_index_prices":
+        stmt = select(DollarIndexPrice.date, DollarIndexPrice.close).order_by(DollarIndexPrice.date)
+        if since is not None:
+            stmt = stmt.where(DollarIndexPrice.date > since)
+    else:
+        stmt = (
+            select(GoldPriceFact.timestamp, GoldPriceFact.close)
+            .where(GoldPriceFact.timeframe == 'daily', GoldPriceFact.source == source)
+            .order_by(GoldPriceFact.timestamp)
+        )
+        if since is not None:
+            stmt = stmt.where(GoldPriceFact.timestamp >= pd.Timestamp(since, tz="UTC") + pd.Timedelta(days=1))
+
+    rows = (await session.execute(stmt)).all()
+    if not rows:
+        return pd.Series(dtype=float)
+
+    index = pd.to_datetime([r[0] for r in rows], utc=True)
+    return pd.Series([float(r[1]) for r in rows], index=index, name=asset)
+
+
+def parse_pair(text: str) -> Pair:
+    """'gold:dxy' -> ('gold', 'dxy')"""
+    parts = [p.strip() for p in text.split(":")]
+    if len(parts) != 2 or not all(parts):
+        raise ValueError(f"Invalid pair: {text!r} (expected 'asset:asset')")
+    for asset in parts:
+        if asset not in ASSETS:
+            raise ValueError(f"Unknown asset: {asset} (known: {', '.join(sorted(ASSETS))})")
+    return parts[0], parts[1]
+
+
+_service: Optional[CorrelationService] = None
+
+
+def get_correlation_service() -> CorrelationService:
+    """Process-wide service (its cache survives between requests)."""
+    global _service
+    if _service is None:
+        _service = CorrelationService()
+    return _service
+
+
+def _daily(series: pd.Series) -> pd.Series:
+    """Index normalized to calendar dates (naive) so daily series align."""
+    index = pd.DatetimeIndex(series.index)
+    if index.tz is not None:
+        index = index.tz_convert("UTC").tz_localize(None)
+    out = pd.Series(series.to_numpy(dtype=float), index=index.normalize())
+    return out[~out.index.duplicated(keep="last")].sort_index()
+
+
+def _name(pair: Pair) -> str:
+    return f"{pair[0]}:{pair[1]}"
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gold Price Analyzer - Historical Backfill
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+License: MIT
+"""
+
+from app.application.services.backfill.runner import (
+    BackfillCheckpointStore,
+    BackfillEstimate,
+    BackfillReport,
+    BackfillRunner,
+    BackfillSource,
+    DateChunk,
+    QuotaExhausted,
+    RateLimiter,
+    shard_range,
+)
+from app.application.services.backfill.sources import (
+    BACKFILL_SOURCES,
+    DollarIndexSource,
+    NewsAPISource,
+    YahooCandleSource,
+    build_source,
+)
+
+__all__ = [
+    "BACKFILL_SOURCES",
+    "BackfillCheckpointStore",
+    "BackfillEstimate",
+    "BackfillReport",
+    "BackfillRunner",
+    "BackfillSource",
+    "DateChunk",
+    "DollarIndexSource",
+    "NewsAPISource",
+    "QuotaExhausted",
+    "RateLimiter",
+    "YahooCandleSource",
+    "build_source",
+    "shard_range",
+]
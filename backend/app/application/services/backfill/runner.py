@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gold Price Analyzer - Historical Backfill
+
+Backfills a date range in chunks that run concurrently and are
+checkpointed in `backfill_chunks`:
+
+    chunks = shard_range(start, end, chunk)      # aligned to the epoch
+    todo   = chunks not marked done               # missing, failed, or left running
+    run    = todo under a per-source semaphore + request spacing + quota
+
+Chunk boundaries are multiples of the chunk length since 1970-01-01,
+clipped to the requested range, so re-running the same backfill (or
+a longer one) finds the chunks it already finished. An interrupted or
+failed run is resumed by running it again.
+
+Sources implement `fetch_chunk(chunk, throttle)` and await `throttle()`
+before every API request; see sources.py.
+
+    runner = BackfillRunner(YahooCandleSource('daily'))
+    print((await runner.estimate(start, end)).to_dict())    # dry run
+    report = await runner.run(start, end)
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+License: MIT
+"""
+
+import asyncio
+import math
+import time
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+from app.application.services.scheduling.collection_scheduler import QuotaBudget
+from app.core.logging import get_logger
+from app.infrastructure.database.base import AsyncSessionLocal
+from app.infrastructure.database.repositories.backfill_repository import (
+    get_chunk_statuses,
+    upsert_chunk_status,
+)
+
+logger = get_logger(__name__)
+
+CHUNK_RUNNING = "running"
+CHUNK_DONE = "done"
+CHUNK_FAILED = "failed"
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+
+def _utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=UTC) if value.tzinfo is None else value.astimezone(UTC)
+
+
+@dataclass(frozen=True)
+class DateChunk:
+    """Half-open range [start, end) in UTC."""
+
+    start: datetime
+    end: datetime
+
+    @property
+    def key(self) -> Tuple[datetime, datetime]:
+        return self.start, self.end
+
+
+def shard_range(start: datetime, end: datetime, chunk: timedelta) -> List[DateChunk]:
+    """
+    Split [start, end) into chunks aligned to multiples of `chunk` since the epoch.
+
+    The first and last chunk are clipped to the range.
+    """
+    start, end = _utc(start), _utc(end)
+    if chunk <= timedelta(0):
+        raise ValueError("chunk must be positive")
+
+    chunks = []
+    boundary = _EPOCH + ((start - _EPOCH) // chunk) * chunk
+    while boundary < end:
+        chunk_end = boundary + chunk
+        chunks.append(DateChunk(max(boundary, start), min(chunk_end, end)))
+        boundary = chunk_end
+    return chunks
+
+
+class QuotaExhausted(RuntimeError):
+    """The source's API budget is used up; the chunk is retried on the next run."""
+
+
+class RateLimiter:
+    """Awaitable spacing between request starts, drawing from an optional quota."""
+
+    def __init__(
+        self,
+        min_interval_seconds: float = 0.0,
+        quota: Optional[QuotaBudget] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.min_interval_seconds = min_interval_seconds
+        self.quota = quota
+        self.calls = 0
+        self._clock = clock
+        self._lock = asyncio.Lock()
+        self._last: Optional[float] = None
+
+    async def __call__(self) -> None:
+        async with self._lock:
+            if self._last is not None:
+                wait = self._last + self.min_interval_seconds - self._clock()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+            if self.quota is not None and not self.quota.try_acquire():
+                raise QuotaExhausted("API quota exhausted")
+            self._last = self._clock()
+            self.calls += 1
+
+
+class BackfillSource:
+    """
+    Base class of a backfillable source.
+
+    Attributes:
+        name: Job name in backfill_chunks
+        chunk_days: Default chunk length
+        concurrency: Chunks running at once
+        min_interval_seconds: Spacing between two API requests
+        quota_source: Key of the daily API budget (see build_default_quotas)
+        calls_per_chunk: API requests one chunk makes
+        max_history_days: How far back the source serves data (None: no limit)
+    """
+
+    name: str = ""
+    chunk_days: float = 30
+    concurrency: int = 1
+    min_interval_seconds: float = 0.0
+    quota_source: Optional[str] = None
+    calls_per_chunk: int = 1
+    max_history_days: Optional[int] = None
+
+    def calls_for(self, chunks: Sequence[DateChunk]) -> int:
+        """API requests needed to run `chunks`."""
+        return self.calls_per_chunk * len(chunks)
+
+    async def fetch_chunk(self, chunk: DateChunk, throttle: Callable[[], Awaitable[None]]) -> int:
+        """Fetch and store one chunk; returns rows written. Raise to fail the chunk."""
+        raise NotImplementedError
+
+
+class BackfillCheckpointStore:
+    """Chunk statuses in backfill_chunks."""
+
+    def __init__(self, session_factory: Callable[[], Any] = AsyncSessionLocal):
+        self.session_factory = session_factory
+
+    async def statuses(self, job: str) -> Dict[Tuple[datetime, datetime], str]:
+        async with self.session_factory() as session:
+            return await get_chunk_statuses(session, job)
+
+    async def mark(
+        self,
+        job: str,
+        chunk: DateChunk,
+        status: str,
+        rows: int = 0,
+        error: Optional[str] = None,
+    ) -> None:
+        async with self.session_factory() as session:
+            await upsert_chunk_status(session, job, chunk.start, chunk.end, status, rows=rows, error=error)
+            await session.commit()
+
+
+@dataclass
+class BackfillEstimate:
+    """Dry-run cost of a backfill."""
+
+    job: str
+    chunks_total: int
+    chunks_done: int
+    chunks_todo: int
+    api_calls: int
+    min_seconds: float
+    quota_remaining: Optional[int] = None
+    quota_days: Optional[int] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "job": self.job,
+            "chunks_total": self.chunks_total,
+            "chunks_done": self.chunks_done,
+            "chunks_todo": self.chunks_todo,
+            "api_calls": self.api_calls,
+            "min_seconds": round(self.min_seconds, 1),
+            "quota_remaining": self.quota_remaining,
+            "quota_days": self.quota_days,
+        }
+
+
+@dataclass
+class BackfillReport:
+    """Outcome of one backfill run."""
+
+    job: str
+    chunks_todo: int = 0
+    done: int = 0
+    failed: int = 0
+    quota_exhausted: int = 0
+    rows: int = 0
+    api_calls: int = 0
+    elapsed: float = 0.0
+    errors: Dict[str, str] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "job": self.job,
+            "chunks_todo": self.chunks_todo,
+            "done": self.done,
+            "failed": self.failed,
+            "quota_exhausted": self.quota_exhausted,
+            "rows": self.rows,
+            "api_calls": self.api_calls,
+            "elapsed_seconds": round(self.elapsed, 1),
+        }
+
+
+class BackfillRunner:
+    """Runs the unfinished chunks of a source's date range."""
+
+    def __init__(
+        self,
+        source: BackfillSource,
+        checkpoints: Optional[BackfillCheckpointStore] = None,
+        quota: Optional[QuotaBudget] = None,
+        chunk_days: Optional[float] = None,
+        concurrency: Optional[int] = None,
+    ):
+        """
+        Args:
+            source: What to backfill
+            checkpoints: Chunk status store (default: backfill_chunks)
+            quota: API budget shared with other users of the same key
+            chunk_days: Chunk length (default: source.chunk_days)
+            concurrency: Chunks at once (default: source.concurrency)
+        """
+        self.source = source
+        self.checkpoints = checkpoints or BackfillCheckpointStore()
+        self.quota = quota
+        self.chunk = timedelta(days=chunk_days or source.chunk_days)
+        self.concurrency = concurrency or source.concurrency
+
+    def chunks(self, start: datetime, end: datetime, now: Optional[datetime] = None) -> List[DateChunk]:
+        """
+        Chunks of [start, end), clipped to the history the source serves.
+
+        A clamped start is rounded up to the next chunk boundary: `now - N
+        days` moves on every run, and a first chunk starting there would
+        get a new key each time and never be recognised as done.
+        """
+        start, end = _utc(start), _utc(end)
+        if self.source.max_history_days is not None:
+            earliest = _utc(now or datetime.now(UTC)) - timedelta(days=self.source.max_history_days)
+            earliest = _EPOCH - ((_EPOCH - earliest) // self.chunk) * self.chunk
+            if start < earliest:
+                logger.warning("backfill_range_clamped", job=self.source.name,
+                               requested=start.isoformat(), earliest=earliest.isoformat())
+                start = earliest
+        return shard_range(start, end, self.chunk)
+
+    async def plan(self, start: datetime, end: datetime) -> Tuple[List[DateChunk], List[DateChunk]]:
+        """(all chunks, chunks that are missing, failed or were left running)."""
+        chunks = self.chunks(start, end)
+        statuses = await self.checkpoints.statuses(self.source.name)
+        done_keys = {(_utc(s), _utc(e)) for (s, e), status in statuses.items() if status == CHUNK_DONE}
+        return chunks, [c for c in chunks if c.key not in done_keys]
+
+    async def estimate(self, start: datetime, end: datetime) -> BackfillEstimate:
+        """Dry run: what a `run` over the range would cost."""
+        chunks, todo = await self.plan(start, end)
+        calls = self.source.calls_for(todo)
+        estimate = BackfillEstimate(
+            job=self.source.name,
+            chunks_total=len(chunks),
+            chunks_done=len(chunks) - len(todo),
+            chunks_todo=len(todo),
+            api_calls=calls,
+            min_seconds=calls * self.source.min_interval_seconds,
+        )
+        if self.quota is not None:
+            estimate.quota_remaining = self.quota.remaining
+            estimate.quota_days = math.ceil(calls / self.quota.limit) if self.quota.limit else None
+        return estimate
+
+    async def run(self, start: datetime, end: datetime) -> BackfillReport:
+        """Run every unfinished chunk; failures are recorded, not raised."""
+        started = time.perf_counter()
+        _, todo = await self.plan(start, end)
+        report = BackfillReport(job=self.source.name, chunks_todo=len(todo))
+        limiter = RateLimiter(self.source.min_interval_seconds, self.quota)
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        logger.info("backfill_started", job=self.source.name, chunks=len(todo),
+                    concurrency=self.concurrency, start=_utc(start).isoformat(), end=_utc(end).isoformat())
+
+        async def run_chunk(chunk: DateChunk) -> None:
+            async with semaphore:
+                await self.checkpoints.mark(self.source.name, chunk, CHUNK_RUNNING)
+                try:
+                    rows = await self.source.fetch_chunk(chunk, limiter)
+                except Exception as e:
+                    report.failed += 1
+                    if isinstance(e, QuotaExhausted):
+                        report.quota_exhausted += 1
+                    report.errors[chunk.start.isoformat()] = str(e)
+                    logger.warning("backfill_chunk_failed", job=self.source.name,
+                                   chunk_start=chunk.start.isoformat(), error=str(e))
+                    await self.checkpoints.mark(self.source.name, chunk, CHUNK_FAILED, error=str(e)[:2000])
+                    return
+                report.done += 1
+                report.rows += rows
+                await self.checkpoints.mark(self.source.name, chunk, CHUNK_DONE, rows=rows)
+                logger.info("backfill_chunk_done", job=self.source.name,
+                            chunk_start=chunk.start.isoformat(), rows=rows)
+
+        await asyncio.gather(*(run_chunk(chunk) for chunk in todo))
+
+        report.api_calls = limiter.calls
+        report.elapsed = time.perf_counter() - started
+        logger.info("backfill_finished", **report.to_dict())
+        return report
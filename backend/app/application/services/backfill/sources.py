@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gold Price Analyzer - Backfill Sources
+
+    gold_daily / gold_hourly   Yahoo Finance GC=F candles by date range
+    dollar_index               Alpha Vantage FX_DAILY (one `full` request,
+                               split into chunks locally)
+    newsapi                    NewsAPI articles, one request per keyword
+                               per chunk (free tier: last 30 days)
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+License: MIT
+"""
+
+import asyncio
+from datetime import timedelta
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence
+
+import pandas as pd
+
+from app.application.services.backfill.runner import BackfillSource, DateChunk
+from app.application.services.ingestion import CandleSink
+
+
+class YahooCandleSource(BackfillSource):
+    """GC=F candles from Yahoo Finance (no API key, informal rate limit)."""
+
+    INTERVALS = {'daily': '1d', 'hourly': '1h'}
+
+    concurrency = 2
+    min_interval_seconds = 1.0
+
+    def __init__(self, timeframe: str = 'daily', service=None):
+        if timeframe not in self.INTERVALS:
+            raise ValueError(f"Unknown timeframe '{timeframe}', expected one of {list(self.INTERVALS)}")
+        if service is None:
+            from app.application.services.data_collection.yahoo_finance_service import YahooFinanceService
+            service = YahooFinanceService()
+        self.service = service
+        self.timeframe = timeframe
+        self.name = f"gold_{timeframe}"
+        self.chunk_days = 365 if timeframe == 'daily' else 30
+        # Yahoo serves 1h bars for the last 730 days only
+        self.max_history_days = None if timeframe == 'daily' else 729
+
+    async def fetch_chunk(self, chunk: DateChunk, throttle: Callable[[], Awaitable[None]]) -> int:
+        await throttle()
+        data = await asyncio.to_thread(
+            self.service.fetch_historical_data,
+            interval=self.INTERVALS[self.timeframe],
+            start=chunk.start,
+            end=chunk.end,
+            raise_errors=True,
+        )
+        rows = self.service._frame_to_price_dicts(data, self.timeframe)
+        return await CandleSink(self.service.source, self.timeframe)(rows)
+
+
+class DollarIndexSource(BackfillSource):
+    """
+    DXY days from Alpha Vantage.
+
+    FX_DAILY has no date filter: the `full` series is requested once per
+    run and every chunk stores its slice.
+    """
+
+    name = "dollar_index"
+    chunk_days = 365
+    concurrency = 4
+    # free tier: 5 requests per minute
+    min_interval_seconds = 12.0
+    quota_source = "alpha_vantage"
+
+    def __init__(self, service=None):
+        if service is None:
+            from app.application.services.data_collection.dollar_index_service import DollarIndexService
+            service = DollarIndexService()
+        self.service = service
+        self._frame: Optional[pd.DataFrame] = None
+        self._lock = asyncio.Lock()
+
+    def calls_for(self, chunks: Sequence[DateChunk]) -> int:
+        return 1 if chunks else 0
+
+    async def _series(self, throttle: Callable[[], Awaitable[None]]) -> pd.DataFrame:
+        async with self._lock:
+            if self._frame is None:
+                await throttle()
+                frame = await self.service.fetch_daily_data(outputsize='full')
+                if frame is None:
+                    raise RuntimeError("Dollar index fetch failed")
+                self._frame = frame
+        return self._frame
+
+    async def fetch_chunk(self, chunk: DateChunk, throttle: Callable[[], Awaitable[None]]) -> int:
+        frame = await self._series(throttle)
+        start = pd.Timestamp(chunk.start).tz_convert(None)
+        end = pd.Timestamp(chunk.end).tz_convert(None)
+        part = frame[(frame.index >= start) & (frame.index < end)]
+        if part.empty:
+            return 0
+        # a failed write must fail the chunk, so the next run retries it
+        return await self.service.save_to_database(part, raise_errors=True)
+
+
+class NewsAPISource(BackfillSource):
+    """NewsAPI articles per chunk, one request per keyword."""
+
+    name = "newsapi"
+    chunk_days = 7
+    concurrency = 1
+    min_interval_seconds = 1.0
+    quota_source = "newsapi"
+    # free tier
+    max_history_days = 30
+
+    def __init__(self, service=None, keywords: Optional[List[str]] = None):
+        self._service = service
+        self._keywords = keywords
+
+    @property
+    def service(self):
+        # NewsAPIService requires a key; a dry run does not
+        if self._service is None:
+            from app.application.services.data_collection.newsapi_service import NewsAPIService
+            self._service = NewsAPIService()
+        return self._service
+
+    @property
+    def keywords(self) -> List[str]:
+        if self._keywords is not None:
+            return self._keywords
+        from app.application.services.data_collection.newsapi_service import NewsAPIService
+        return NewsAPIService.GOLD_KEYWORDS
+
+    @property
+    def calls_per_chunk(self) -> int:
+        return len(self.keywords)
+
+    async def fetch_chunk(self, chunk: DateChunk, throttle: Callable[[], Awaitable[None]]) -> int:
+        # NewsAPI `to` is an inclusive day; the chunk end is exclusive
+        result = await self.service.fetch_range(
+            chunk.start,
+            chunk.end - timedelta(seconds=1),
+            keywords=self.keywords,
+            throttle=throttle,
+            raise_errors=True,
+        )
+        if result.failed:
+            raise RuntimeError(f"{result.failed} NewsAPI requests or batches failed")
+        return result.written
+
+
+BACKFILL_SOURCES: Dict[str, Callable[[], BackfillSource]] = {
+    "gold_daily": lambda: YahooCandleSource('daily'),
+    "gold_hourly": lambda: YahooCandleSource('hourly'),
+    "dollar_index": DollarIndexSource,
+    "newsapi": NewsAPISource,
+}
+
+
+def build_source(name: str) -> BackfillSource:
+    """Backfill source by job name (see BACKFILL_SOURCES)."""
+    try:
+        return BACKFILL_SOURCES[name]()
+    except KeyError:
+        raise ValueError(f"Unknown backfill source '{name}', expected one of {list(BACKFILL_SOURCES)}") from None
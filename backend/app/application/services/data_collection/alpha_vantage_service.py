@@ -7,23 +7,40 @@ Author: Hoseyn Doulabi (@hoseynd-ai)
 Created: 2025-10-25
 """
 
-from datetime import datetime, UTC
+import asyncio
+from datetime import date, datetime, UTC, timedelta
 from typing import List, Dict, Any, Optional
-import requests
 
+from app.application.services.ingestion import CandleSink, IngestionPipeline, Stage
 from app.core.config import settings
 from app.core.logging import get_logger
+from app.infrastructure.cache.http_cache import classify_alpha_vantage, get_http_cache
 from app.infrastructure.database.base import AsyncSessionLocal
-from app.infrastructure.database.models import GoldPriceFact
+from app.infrastructure.database.repositories.gold_price_repository import (
+    get_watermark,
+    touch_watermark,
+)
 
 logger = get_logger(__name__)
 
 
+def last_completed_trading_day(now: Optional[datetime] = None) -> date:
+    """Most recent weekday strictly before today (UTC)."""
+    day = (now or datetime.now(UTC)).date() - timedelta(days=1)
+    while day.weekday() >= 5:
+        day -= timedelta(days=1)
+    return day
+
+
 class AlphaVantageService:
     """Alpha Vantage Service for Gold OHLCV Data."""
     
     BASE_URL = "https://www.alphavantage.co/query"
     SYMBOL = "GLD"
+    SOURCE = "alpha_vantage_gld"
+    
+    # `compact` output covers the latest 100 trading days
+    COMPACT_DAYS = 100
     
     def __init__(self, api_key: Optional[str] = None):
         """Initialize Alpha Vantage Service."""
@@ -47,10 +64,19 @@ class AlphaVantageService:
         }
         
         try:
-            response = requests.get(self.BASE_URL, params=params, timeout=30)
+            response = get_http_cache().get_json(
+                'alpha_vantage',
+                self.BASE_URL,
+                params=params,
+                timeout=30,
+                classify=classify_alpha_vantage,
+            )
+            
+            if response.stale:
+                logger.warning("alpha_vantage_serving_cached_data", reason=response.stale_reason)
             
             if response.status_code == 200:
-                data = response.json()
+                data = response.json() or {}
                 
                 if "Error Message" in data:
                     logger.error("alpha_vantage_error", error=data["Error Message"])
@@ -106,7 +132,7 @@ class AlphaVantageService:
                     'volume': volume,
                     'price_change': price_change,
                     'price_change_pct': round(price_change_pct, 2),
-                    'source': 'alpha_vantage_gld',
+                    'source': self.SOURCE,
                     'market': 'etf',
                     'data_quality': 1.0,
                 }
@@ -119,51 +145,74 @@ class AlphaVantageService:
         
         return candles
     
-    async def fetch_and_save_daily_candles(self, outputsize: str = "compact") -> int:
-        """Fetch daily candles and save to database."""
-        logger.info("fetching_and_saving_daily_candles")
+    async def fetch_and_save_daily_candles(
+        self,
+        outputsize: str = "compact",
+        incremental: bool = True
+    ) -> int:
+        """
+        Fetch daily candles and save to database.
         
-        data = self.fetch_daily_time_series(outputsize=outputsize)
+        With `incremental=True` the stored high-water mark decides what to
+        request: nothing when the last trading day is already stored,
+        `compact` when the gap fits in 100 days, `full` otherwise. Only
+        candles newer than the mark are written, in one bulk upsert.
         
-        if not data:
-            logger.warning("no_data_to_save")
-            return 0
+        Args:
+            outputsize: Output size used when nothing is stored yet
+            incremental: Resume from the last stored candle
+        """
+        logger.info("fetching_and_saving_daily_candles", incremental=incremental)
         
-        candles = self.parse_time_series_to_candles(data)
+        latest = None
+        if incremental:
+            async with AsyncSessionLocal() as session:
+                latest = await get_watermark(session, self.SOURCE, 'daily')
         
-        if not candles:
-            logger.warning("no_candles_parsed")
-            return 0
+        if latest is not None:
+            if latest.date() >= last_completed_trading_day():
+                logger.info("alpha_vantage_up_to_date", last_timestamp=latest.isoformat())
+                async with AsyncSessionLocal() as session:
+                    await touch_watermark(session, self.SOURCE, 'daily')
+                    await session.commit()
+                return 0
+            
+            gap_days = (datetime.now(UTC).date() - latest.date()).days
+            outputsize = "compact" if gap_days < self.COMPACT_DAYS else "full"
         
-        saved_count = 0
+        async def fetch(size: str) -> List[Dict[str, Any]]:
+            data = await asyncio.to_thread(self.fetch_daily_time_series, outputsize=size)
+            if not data:
+                logger.warning("no_data_to_save")
+            # the API lists newest first; each committed batch may advance the watermark
+            return sorted(self.parse_time_series_to_candles(data), key=lambda candle: candle['timestamp'])
         
-        async with AsyncSessionLocal() as session:
-            from sqlalchemy import select
-            
-            for candle_data in candles:
-                try:
-                    existing = await session.execute(
-                        select(GoldPriceFact).where(
-                            GoldPriceFact.timestamp == candle_data['timestamp'],
-                            GoldPriceFact.timeframe == 'daily',
-                            GoldPriceFact.source == 'alpha_vantage_gld'
-                        )
-                    )
-                    
-                    if existing.scalar_one_or_none():
-                        continue
-                    
-                    candle = GoldPriceFact(**candle_data)
-                    session.add(candle)
-                    saved_count += 1
-                    
-                except Exception as e:
-                    logger.error("save_candle_error", error=str(e))
-                    continue
-            
-            await session.commit()
+        def is_new(candle: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            return candle if latest is None or candle['timestamp'] > latest else None
+        
+        # fetch -> candles -> newer than the watermark -> batched upsert + watermark
+        # fail_fast: a lost batch stops the run (and raises) before a later
+        # batch moves the watermark past it
+        pipeline = IngestionPipeline("alpha_vantage_daily", [
+            Stage("fetch", fetch, fan_out=True),
+            Stage("filter", is_new),
+            Stage("sink", CandleSink(self.SOURCE, 'daily'), batch_size=settings.INGEST_BATCH_SIZE),
+        ], fail_fast=True)
+        result = await pipeline.run([outputsize])
+        saved_count = result.written
+        
+        if not saved_count:
+            parsed = result.stages["fetch"].emitted
+            if parsed:
+                # every parsed candle is already stored
+                logger.info("alpha_vantage_up_to_date",
+                           parsed=parsed,
+                           last_timestamp=latest.isoformat() if latest else None)
+            else:
+                logger.warning("no_candles_parsed")
+            return 0
         
-        logger.info("daily_candles_saved", saved=saved_count)
+        logger.info("daily_candles_saved", saved=saved_count, outputsize=outputsize)
         return saved_count
     
     def get_current_quote(self) -> Optional[Dict[str, Any]]:
@@ -175,10 +224,16 @@ class AlphaVantageService:
         }
         
         try:
-            response = requests.get(self.BASE_URL, params=params, timeout=10)
+            response = get_http_cache().get_json(
+                'alpha_vantage_quote',
+                self.BASE_URL,
+                params=params,
+                timeout=10,
+                classify=classify_alpha_vantage,
+            )
             
             if response.status_code == 200:
-                data = response.json()
+                data = response.json() or {}
                 
                 if "Global Quote" in data and data["Global Quote"]:
                     quote = data["Global Quote"]
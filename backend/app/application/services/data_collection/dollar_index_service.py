@@ -21,10 +21,13 @@ from typing import Optional, Dict, List
 from sqlalchemy import select, and_
 from sqlalchemy.orm import Session
 
+from app.application.services.ingestion import DollarIndexSink, IngestionPipeline, Stage
 from app.infrastructure.database.base import get_db, AsyncSessionLocal
 from app.infrastructure.database.models import DollarIndexPrice
 from app.core.config import settings
 from app.core.logging import get_logger
+from app.infrastructure.cache.http_cache import classify_alpha_vantage, get_http_cache
+from app.infrastructure.cache.query_cache import cached, invalidate
 
 logger = get_logger(__name__)
 
@@ -86,10 +89,16 @@ class DollarIndexService:
         }
         
         try:
-            response = requests.get(self.BASE_URL, params=params, timeout=30)
+            response = get_http_cache().get_json(
+                'dollar_index',
+                self.BASE_URL,
+                params=params,
+                timeout=30,
+                classify=classify_alpha_vantage,
+            )
             response.raise_for_status()
             
-            data = response.json()
+            data = response.json() or {}
             
             # چک کردن خطا
             if 'Error Message' in data:
@@ -142,67 +151,52 @@ class DollarIndexService:
             logger.error("unexpected_error", error=str(e))
             return None
     
-    async def save_to_database(self, df: pd.DataFrame) -> int:
+    async def save_to_database(self, df: pd.DataFrame, raise_errors: bool = False) -> int:
         """
         ذخیره داده‌ها در database
         
         Args:
             df: DataFrame حاوی داده‌های DXY
+            raise_errors: اگر ردیف یا دسته‌ای ذخیره نشد خطا raise شود (برای backfill)
             
         Returns:
             تعداد رکوردهای ذخیره شده
+        
+        Raises:
+            RuntimeError: raise_errors و ذخیره بخشی از داده‌ها ناموفق بود
         """
         logger.info("saving_dollar_index_to_db", records=len(df))
         
-        saved_count = 0
-        updated_count = 0
+        def to_row(record: Dict) -> Dict:
+            return {
+                'date': record['date'].date(),
+                'open': float(record['open']),
+                'high': float(record['high']),
+                'low': float(record['low']),
+                'close': float(record['close']),
+            }
         
-        async with AsyncSessionLocal() as session:
-            for date, row in df.iterrows():
-                try:
-                    # چک وجود
-                    result = await session.execute(
-                        select(DollarIndexPrice).where(
-                            DollarIndexPrice.date == date.date()
-                        )
-                    )
-                    existing = result.scalar_one_or_none()
-                    
-                    if existing:
-                        # به‌روزرسانی
-                        existing.open = float(row['open'])
-                        existing.high = float(row['high'])
-                        existing.low = float(row['low'])
-                        existing.close = float(row['close'])
-                        existing.updated_at = datetime.utcnow()
-                        updated_count += 1
-                    else:
-                        # ساخت جدید
-                        dxy_price = DollarIndexPrice(
-                            date=date.date(),
-                            open=float(row['open']),
-                            high=float(row['high']),
-                            low=float(row['low']),
-                            close=float(row['close'])
-                        )
-                        session.add(dxy_price)
-                        saved_count += 1
-                    
-                except Exception as e:
-                    logger.warning("save_record_error",
-                                 date=str(date.date()),
-                                 error=str(e))
-                    continue
-            
-            await session.commit()
+        # frame rows -> DXY rows -> batched upsert on date (insert یا update در یک statement)
+        pipeline = IngestionPipeline("dollar_index", [
+            Stage("normalize", to_row),
+            Stage("sink", DollarIndexSink(), batch_size=settings.INGEST_BATCH_SIZE),
+        ])
+        records = df.rename_axis('date').reset_index().to_dict('records')
+        result = await pipeline.run(records)
+        
+        if result.written:
+            await invalidate("dollar_index")
         
         logger.info("dollar_index_saved",
-                   saved=saved_count,
-                   updated=updated_count,
-                   total=saved_count + updated_count)
+                   total=result.written,
+                   failed=result.failed)
+        
+        if raise_errors and result.failed:
+            raise RuntimeError(f"{result.failed} dollar index rows or batches failed to save")
         
-        return saved_count + updated_count
+        return result.written
     
+    @cached("dollar_index")
     async def get_latest_data(
         self,
         days: int = 30
@@ -334,6 +328,7 @@ class DollarIndexService:
         
         return f"{strength} و {direction}"
     
+    @cached("dollar_index")
     async def get_statistics(self) -> Dict:
         """آمار کلی داده‌های DXY"""
         async with AsyncSessionLocal() as session:
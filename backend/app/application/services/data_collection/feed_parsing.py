@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gold Price Analyzer - RSS Feed Parsing
+
+CPU-bound half of RSS collection, kept free of app imports so it is
+cheap to load in worker processes:
+
+    parse_feed(content, source, category)  - feedparser + bulk normalization
+
+Returns plain dicts with NewsEvent columns (picklable, no feedparser
+objects cross the process boundary).
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+License: MIT
+"""
+
+import calendar
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any, Dict, List, Optional, Sequence
+
+import feedparser
+
+
+@dataclass
+class ParsedFeed:
+    """Normalized entries of one feed."""
+
+    source: str
+    records: List[Dict[str, Any]] = field(default_factory=list)
+    entries: int = 0
+    failed: int = 0
+    warning: Optional[str] = None
+
+
+def _first_url(items: Any) -> Optional[str]:
+    if items:
+        return items[0].get('url')
+    return None
+
+
+def normalize_entries(
+    entries: Sequence[Any],
+    source: str,
+    category: Optional[str],
+    now: Optional[datetime] = None,
+) -> ParsedFeed:
+    """
+    Turn feedparser entries into NewsEvent column dicts.
+
+    Entries that fail are counted, not raised. One timestamp is taken
+    for every entry without a date.
+    """
+    now = now or datetime.now(UTC)
+    parsed = ParsedFeed(source=source, entries=len(entries))
+
+    for entry in entries:
+        try:
+            published = entry.get('published_parsed') or entry.get('updated_parsed')
+            # struct_time (UTC) -> datetime without a per-field constructor call
+            published_at = (
+                datetime.fromtimestamp(calendar.timegm(published), UTC) if published else now
+            )
+
+            if entry.get('content'):
+                content = entry['content'][0].get('value', '')
+            else:
+                content = entry.get('summary', '')
+
+            parsed.records.append({
+                'title': entry.get('title', 'No Title')[:500],
+                'description': entry.get('summary', entry.get('description', ''))[:1000],
+                'content': content,
+                'url': entry.get('link', ''),
+                'image_url': _first_url(entry.get('media_content')) or _first_url(entry.get('media_thumbnail')),
+                'published_at': published_at,
+                'source': source,
+                'author': entry.get('author', 'Unknown')[:200],
+                'category': category,
+            })
+        except Exception:
+            parsed.failed += 1
+
+    return parsed
+
+
+def parse_feed(content: bytes, source: str, category: Optional[str]) -> ParsedFeed:
+    """Parse an RSS/Atom document and normalize its entries (runs in a worker)."""
+    feed = feedparser.parse(content)
+    parsed = normalize_entries(feed.entries, source, category)
+    if feed.bozo:
+        parsed.warning = str(feed.get('bozo_exception'))
+    return parsed
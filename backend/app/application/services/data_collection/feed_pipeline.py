@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gold Price Analyzer - RSS Ingestion Pipeline
+
+RSS collection on the staged IngestionPipeline, so the stages overlap
+and parsing never runs on the event loop:
+
+    fetch (threads, NEWS_FETCH_CONCURRENCY)
+      -> parse + normalize + filter (worker pool, NEWS_PARSE_WORKERS)
+      -> dedup (one URL lookup per batch)
+      -> bulk insert
+
+Stage queues hold at most NEWS_PIPELINE_QUEUE_SIZE items, so a slow
+stage back-pressures the one before it instead of buffering every feed.
+
+NEWS_PARSE_EXECUTOR=process uses one spawn-context pool for the whole
+process (never a fork of the app with its logging, DB pool and event
+loop threads); it is started on first use and stopped on shutdown.
+
+    pipeline = FeedPipeline(fetch=service.fetch_rss_content, is_relevant=service.is_gold_related)
+    stats = await pipeline.run(NewsService.RSS_FEEDS, cutoff)
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+License: MIT
+"""
+
+import asyncio
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+from app.application.services.data_collection.feed_parsing import ParsedFeed, parse_feed
+from app.application.services.ingestion import (
+    IngestionPipeline,
+    NewsDeduplicator,
+    NewsEventStore,
+    NewsSink,
+    Stage,
+)
+from app.core.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+__all__ = [
+    "FeedPipeline",
+    "FeedPipelineStats",
+    "NewsEventStore",
+    "get_parse_process_pool",
+    "shutdown_parse_process_pool",
+]
+
+_process_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_parse_process_pool(workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """Shared spawn-context parse pool, started on first use."""
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(
+            max_workers=workers or settings.NEWS_PARSE_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _process_pool
+
+
+def shutdown_parse_process_pool() -> None:
+    """Stop the shared parse pool (application shutdown)."""
+    global _process_pool
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=False, cancel_futures=True)
+        _process_pool = None
+
+
+@dataclass
+class FeedPipelineStats:
+    """Counters of one pipeline run."""
+
+    feeds_fetched: int = 0
+    entries: int = 0
+    saved: int = 0
+    skipped_old: int = 0
+    skipped_not_gold: int = 0
+    skipped_duplicate: int = 0
+    failed: int = 0
+    saved_by_source: Dict[str, int] = field(default_factory=dict)
+
+
+class FeedPipeline:
+    """fetch -> parse -> filter -> dedup -> bulk insert, stages overlapping."""
+
+    def __init__(
+        self,
+        fetch: Callable[[str], Optional[bytes]],
+        is_relevant: Optional[Callable[[str, str], bool]] = None,
+        store: Optional[NewsEventStore] = None,
+        executor: Optional[Executor] = None,
+        workers: Optional[int] = None,
+        fetch_concurrency: Optional[int] = None,
+        queue_size: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        batch_linger: Optional[float] = None,
+    ):
+        """
+        Args:
+            fetch: Blocking url -> response body (None on failure), run in threads
+            is_relevant: (title, description) -> keep; None keeps everything
+            store: Dedup / insert target (default: news_events)
+            executor: Parse pool (default: NEWS_PARSE_EXECUTOR; a thread pool
+                per run, or the shared process pool)
+            workers: Concurrent parse jobs (default: NEWS_PARSE_WORKERS)
+            fetch_concurrency: Feeds fetched at once (default: NEWS_FETCH_CONCURRENCY)
+            queue_size: Bound of the stage queues (default: NEWS_PIPELINE_QUEUE_SIZE)
+            batch_size: Records per dedup query / insert (default: NEWS_INSERT_BATCH_SIZE)
+            batch_linger: Seconds to wait for a full batch (default: INGEST_BATCH_LINGER_SECONDS)
+        """
+        self.fetch = fetch
+        self.is_relevant = is_relevant
+        self.store = store or NewsEventStore()
+        self.executor = executor
+        self.workers = workers or settings.NEWS_PARSE_WORKERS
+        self.fetch_concurrency = fetch_concurrency or settings.NEWS_FETCH_CONCURRENCY
+        self.queue_size = queue_size or settings.NEWS_PIPELINE_QUEUE_SIZE
+        self.batch_size = batch_size or settings.NEWS_INSERT_BATCH_SIZE
+        self.batch_linger = batch_linger
+
+    def _make_executor(self) -> Tuple[Executor, bool]:
+        """Parse pool for one run, and whether the run owns (shuts down) it."""
+        if self.executor is not None:
+            return self.executor, False
+        if settings.NEWS_PARSE_EXECUTOR.lower() == "process":
+            return get_parse_process_pool(self.workers), False
+        return ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="feed-parse"), True
+
+    async def run(
+        self,
+        feeds: Mapping[str, Mapping[str, Any]],
+        cutoff: datetime,
+    ) -> FeedPipelineStats:
+        """
+        Collect every feed ({source: {'url', 'category', ...}}).
+
+        Articles published before `cutoff` are skipped.
+        """
+        stats = FeedPipelineStats()
+        executor, owned = self._make_executor()
+        loop = asyncio.get_running_loop()
+
+        async def fetch(item: Tuple[str, Mapping[str, Any]]):
+            source, info = item
+            try:
+                content = await asyncio.to_thread(self.fetch, info['url'])
+            except Exception as e:
+                logger.error("fetch_source_error", source=source, error=str(e))
+                content = None
+            if not content:
+                logger.warning("no_entries", source=source)
+                return None
+            stats.feeds_fetched += 1
+            return source, info.get('category'), content
+
+        async def parse(item: Tuple[str, Optional[str], bytes]) -> List[Dict[str, Any]]:
+            source, category, content = item
+            feed: ParsedFeed = await loop.run_in_executor(executor, parse_feed, content, source, category)
+            if feed.warning:
+                logger.warning("rss_parse_warning", source=source, exception=feed.warning)
+            stats.entries += feed.entries
+            stats.failed += feed.failed
+            records = self._filter(feed.records, cutoff, stats)
+            logger.info("rss_feed_parsed", source=source, entries=feed.entries, kept=len(records))
+            return records
+
+        dedup = NewsDeduplicator(self.store)
+        sink = NewsSink(self.store)
+        pipeline = IngestionPipeline(
+            "rss",
+            [
+                Stage("fetch", fetch, concurrency=self.fetch_concurrency),
+                Stage("parse", parse, concurrency=self.workers, fan_out=True),
+                Stage("dedup", dedup, batch_size=self.batch_size),
+                Stage("sink", sink, batch_size=self.batch_size),
+            ],
+            queue_size=self.queue_size,
+            batch_linger=self.batch_linger,
+        )
+
+        try:
+            result = await pipeline.run(feeds.items())
+        finally:
+            if owned:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+        stats.saved = result.written
+        stats.skipped_duplicate = dedup.duplicates
+        stats.saved_by_source = dict(sink.saved_by_source)
+        # parse errors count one feed, dedup / insert errors every record of the batch
+        stats.failed += result.failed
+        return stats
+
+    def _filter(self, records: List[Dict[str, Any]], cutoff: datetime, stats: FeedPipelineStats) -> List[Dict[str, Any]]:
+        kept = []
+        for record in records:
+            if record['published_at'] < cutoff:
+                stats.skipped_old += 1
+            elif self.is_relevant is not None and not self.is_relevant(record['title'], record['description']):
+                stats.skipped_not_gold += 1
+            else:
+                kept.append(record)
+        return kept
@@ -5,21 +5,113 @@ Gold Price Analyzer - GLD to Gold Converter
 
 Converts GLD ETF prices to actual Gold spot prices.
 
+GLD holds slightly less gold per share every year (expense ratio), so
+the gold/GLD ratio drifts. Instead of one fixed factor, each candle is
+converted with a factor interpolated from a daily ratio series:
+
+    ratio(day) = reference close / GLD close      (GLD_REFERENCE_SOURCES)
+    factor(t)  = interp(t, rolling median of ratio)
+
+The conversion runs over whole columns and is written with one bulk
+upsert per batch; only GLD candles newer than the converted watermark
+are read.
+
 Author: Hoseyn Doulabi (@hoseynd-ai)
 Created: 2025-10-25
 License: MIT
 """
 
 from datetime import datetime, UTC
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Sequence
+
+import numpy as np
+import pandas as pd
 from sqlalchemy import select
 
+from app.core.config import settings
 from app.core.logging import get_logger
 from app.infrastructure.database.base import AsyncSessionLocal
 from app.infrastructure.database.models import GoldPriceFact
+from app.infrastructure.database.repositories.gold_price_repository import (
+    bulk_upsert_candles,
+    get_watermark,
+    touch_watermark,
+    update_watermark,
+)
 
 logger = get_logger(__name__)
 
+GLD_SOURCE = 'alpha_vantage_gld'
+CONVERTED_SOURCE = 'alpha_vantage_gold_converted'
+
+_PRICE_COLUMNS = ('open', 'high', 'low', 'close', 'price_change')
+_EPOCH = pd.Timestamp(0, tz=UTC)
+
+
+def _epoch_seconds(timestamps: pd.DatetimeIndex) -> np.ndarray:
+    return ((timestamps - _EPOCH) / pd.Timedelta(seconds=1)).to_numpy(dtype=float)
+
+
+def _utc_index(values: Sequence[datetime]) -> pd.DatetimeIndex:
+    return pd.DatetimeIndex(pd.to_datetime(list(values), utc=True))
+
+
+def factor_series(gld: pd.Series, reference: pd.Series, smoothing_days: int = 1) -> pd.Series:
+    """
+    Daily reference/GLD close ratio on the days both have a candle.
+
+    Args:
+        gld: GLD closes indexed by UTC timestamp
+        reference: Gold closes (USD/oz) indexed by UTC timestamp; several
+            sources on one day are averaged
+        smoothing_days: Centered rolling median window (futures basis and
+            closing-time differences are noisy day to day)
+
+    Returns:
+        pd.Series: Factor indexed by UTC day
+    """
+    gld_daily = gld.groupby(gld.index.floor('D')).last()
+    reference_daily = reference.groupby(reference.index.floor('D')).mean()
+    ratio = (reference_daily / gld_daily).dropna()
+    ratio = ratio[np.isfinite(ratio) & (ratio > 0)].sort_index()
+    if smoothing_days > 1 and len(ratio):
+        ratio = ratio.rolling(smoothing_days, min_periods=1, center=True).median()
+    return ratio
+
+
+def interpolate_factors(timestamps: pd.DatetimeIndex, factors: pd.Series) -> np.ndarray:
+    """Factor at every timestamp (linear between days, flat beyond both ends)."""
+    return np.interp(_epoch_seconds(timestamps), _epoch_seconds(factors.index), factors.to_numpy(dtype=float))
+
+
+def convert_frame(frame: pd.DataFrame, factors: np.ndarray) -> List[Dict[str, Any]]:
+    """
+    Convert GLD candle columns to gold candle rows.
+
+    Args:
+        frame: GLD candles (timestamp, timeframe, OHLC, volume, price_change, price_change_pct)
+        factors: Conversion factor per row
+
+    Returns:
+        list: GoldPriceFact dictionaries for bulk_upsert_candles
+    """
+    converted = pd.DataFrame({
+        'timestamp': frame['timestamp'],
+        'timeframe': frame['timeframe'],
+        **{
+            col: np.round(pd.to_numeric(frame[col], errors='coerce').to_numpy(dtype=float) * factors, 2)
+            for col in _PRICE_COLUMNS
+        },
+        'volume': pd.to_numeric(frame['volume'], errors='coerce').astype('Int64'),
+        'price_change_pct': pd.to_numeric(frame['price_change_pct'], errors='coerce').astype(float),
+        'source': CONVERTED_SOURCE,
+        'market': 'spot',
+        'data_quality': 0.95,
+    })
+    # NaN / <NA> -> NULL
+    converted = converted.astype(object).where(converted.notna(), None)
+    return converted.to_dict('records')
+
 
 class GoldCandleConverter:
     """
@@ -27,19 +119,24 @@ class GoldCandleConverter:
     
     Converts GLD ETF candlesticks to Gold spot price candles.
     
+    CONVERSION_FACTOR is only the last-resort fallback when neither
+    reference candles nor live quotes are available.
+    
     Author: Hoseyn Doulabi (@hoseynd-ai)
     Created: 2025-10-25
     """
     
     CONVERSION_FACTOR = 10.89
     
-    def __init__(self, conversion_factor: float = None):
+    def __init__(self, conversion_factor: Optional[float] = None):
         """
         Initialize converter.
         
         Args:
-            conversion_factor: Custom conversion factor (default: 10.89)
+            conversion_factor: Fixed conversion factor; default is the
+                time-varying series from stored reference prices
         """
+        self.fixed_factor = conversion_factor
         self.conversion_factor = conversion_factor or self.CONVERSION_FACTOR
         logger.info("gold_candle_converter_initialized", factor=self.conversion_factor)
     
@@ -74,7 +171,7 @@ class GoldCandleConverter:
     
     def convert_gld_candle_to_gold(self, gld_candle: GoldPriceFact) -> Dict[str, Any]:
         """
-        Convert a single GLD candle to Gold candle.
+        Convert a single GLD candle to Gold candle (fixed factor).
         
         Args:
             gld_candle: GLD candle from database
@@ -92,60 +189,121 @@ class GoldCandleConverter:
             'volume': gld_candle.volume,
             'price_change': round(float(gld_candle.price_change) * self.conversion_factor, 2),
             'price_change_pct': gld_candle.price_change_pct,
-            'source': 'alpha_vantage_gold_converted',
+            'source': CONVERTED_SOURCE,
             'market': 'spot',
             'data_quality': 0.95,
         }
     
-    async def convert_and_save_gld_candles(self) -> int:
+    async def _closes(self, session, sources: Sequence[str]) -> pd.Series:
+        """Daily closes of the given sources, indexed by UTC timestamp."""
+        result = await session.execute(
+            select(GoldPriceFact.timestamp, GoldPriceFact.close).where(
+                GoldPriceFact.source.in_(list(sources)),
+                GoldPriceFact.timeframe == 'daily',
+            )
+        )
+        rows = result.all()
+        return pd.Series(
+            pd.to_numeric([close for _, close in rows], errors='coerce').astype(float),
+            index=_utc_index([ts for ts, _ in rows]),
+            dtype=float,
+        )
+    
+    async def load_factor_series(self, session) -> pd.Series:
+        """Smoothed daily gold/GLD factor from stored reference candles."""
+        gld = await self._closes(session, [GLD_SOURCE])
+        reference = await self._closes(session, settings.GLD_REFERENCE_SOURCES)
+        return factor_series(gld, reference, settings.GLD_FACTOR_SMOOTHING_DAYS)
+    
+    async def convert_and_save_gld_candles(
+        self,
+        timeframe: str = 'daily',
+        full_refresh: bool = False,
+    ) -> int:
         """
-        Convert all GLD candles to Gold candles and save.
+        Convert GLD candles newer than the last conversion and save them.
+        
+        Args:
+            timeframe: GLD timeframe to convert
+            full_refresh: Reconvert every GLD candle (e.g. after new
+                reference history changed the factor series)
         
         Returns:
             int: Number of candles converted and saved
         """
-        logger.info("converting_gld_candles_to_gold")
-        
-        self.conversion_factor = await self.calculate_current_conversion_factor()
-        
-        saved_count = 0
+        logger.info("converting_gld_candles_to_gold", timeframe=timeframe, full_refresh=full_refresh)
         
         async with AsyncSessionLocal() as session:
-            result = await session.execute(
-                select(GoldPriceFact)
-                .where(GoldPriceFact.source == 'alpha_vantage_gld')
-                .order_by(GoldPriceFact.timestamp.desc())
+            since = None if full_refresh else await get_watermark(session, CONVERTED_SOURCE, timeframe)
+            
+            query = select(
+                GoldPriceFact.timestamp,
+                GoldPriceFact.timeframe,
+                GoldPriceFact.open,
+                GoldPriceFact.high,
+                GoldPriceFact.low,
+                GoldPriceFact.close,
+                GoldPriceFact.volume,
+                GoldPriceFact.price_change,
+                GoldPriceFact.price_change_pct,
+            ).where(
+                GoldPriceFact.source == GLD_SOURCE,
+                GoldPriceFact.timeframe == timeframe,
             )
-            gld_candles = result.scalars().all()
+            if since is not None:
+                query = query.where(GoldPriceFact.timestamp > since)
+            
+            result = await session.execute(query.order_by(GoldPriceFact.timestamp))
+            frame = pd.DataFrame(result.all(), columns=[
+                'timestamp', 'timeframe', 'open', 'high', 'low', 'close',
+                'volume', 'price_change', 'price_change_pct',
+            ])
             
-            logger.info("gld_candles_found", count=len(gld_candles))
+            logger.info("gld_candles_found", count=len(frame), since=since.isoformat() if since else None)
             
-            for gld_candle in gld_candles:
-                try:
-                    existing = await session.execute(
-                        select(GoldPriceFact).where(
-                            GoldPriceFact.timestamp == gld_candle.timestamp,
-                            GoldPriceFact.timeframe == gld_candle.timeframe,
-                            GoldPriceFact.source == 'alpha_vantage_gold_converted'
-                        )
-                    )
-                    
-                    if existing.scalar_one_or_none():
-                        logger.debug("gold_candle_exists", timestamp=gld_candle.timestamp.isoformat())
-                        continue
-                    
-                    gold_candle_data = self.convert_gld_candle_to_gold(gld_candle)
-                    
-                    gold_candle = GoldPriceFact(**gold_candle_data)
-                    session.add(gold_candle)
-                    saved_count += 1
-                    
-                except Exception as e:
-                    logger.error("convert_candle_error", error=str(e))
-                    continue
+            if frame.empty:
+                await touch_watermark(session, CONVERTED_SOURCE, timeframe)
+                await session.commit()
+                return 0
             
+            factors = await self._factors_for(session, _utc_index(frame['timestamp']))
+            rows = convert_frame(frame, factors)
+            saved_count = await bulk_upsert_candles(session, rows)
+            await update_watermark(
+                session,
+                CONVERTED_SOURCE,
+                timeframe,
+                last_timestamp=pd.Timestamp(frame['timestamp'].max()).to_pydatetime(),
+                rows=saved_count,
+            )
             await session.commit()
         
-        logger.info("gld_candles_converted", saved=saved_count, factor=self.conversion_factor)
+        logger.info(
+            "gld_candles_converted",
+            saved=saved_count,
+            factor_min=round(float(factors.min()), 4),
+            factor_max=round(float(factors.max()), 4),
+        )
         
         return saved_count
+    
+    async def _factors_for(self, session, timestamps: pd.DatetimeIndex) -> np.ndarray:
+        """
+        Conversion factor per candle.
+        
+        An explicit constructor factor is used as is; otherwise the stored
+        reference series, falling back to the live quote ratio when no
+        reference candle overlaps a GLD candle.
+        """
+        if self.fixed_factor is not None:
+            return np.full(len(timestamps), self.fixed_factor)
+        
+        series = await self.load_factor_series(session)
+        if len(series):
+            logger.info("conversion_factor_series_loaded", days=len(series),
+                        first=series.index[0].isoformat(), last=series.index[-1].isoformat())
+            return interpolate_factors(timestamps, series)
+        
+        self.conversion_factor = await self.calculate_current_conversion_factor()
+        logger.warning("conversion_factor_series_empty", fallback=self.conversion_factor)
+        return np.full(len(timestamps), self.conversion_factor)
@@ -12,11 +12,15 @@ License: MIT
 
 from datetime import datetime, UTC, timedelta
 from typing import List, Dict, Any, Optional
+import re
 import feedparser
 import requests
 from bs4 import BeautifulSoup
 
+from app.application.services.data_collection.feed_parsing import normalize_entries
+from app.application.services.data_collection.feed_pipeline import FeedPipeline
 from app.core.logging import get_logger
+from app.infrastructure.cache.query_cache import cached, invalidate
 from app.infrastructure.database.base import AsyncSessionLocal
 from app.infrastructure.database.models.news_event import NewsEvent
 
@@ -64,17 +68,19 @@ class NewsService:
     
     def __init__(self):
         """Initialize News Service."""
+        # one pass over the text instead of one `in` per keyword
+        self._keyword_pattern = re.compile('|'.join(re.escape(k.lower()) for k in self.GOLD_KEYWORDS))
         logger.info("news_service_initialized", feeds=len(self.RSS_FEEDS))
     
-    def fetch_rss_feed(self, feed_url: str) -> Optional[feedparser.FeedParserDict]:
+    def fetch_rss_content(self, feed_url: str) -> Optional[bytes]:
         """
-        Fetch RSS feed from URL.
+        Download an RSS feed (blocking; the pipeline runs it in a thread).
         
         Args:
             feed_url: RSS feed URL
             
         Returns:
-            Parsed feed or None if failed
+            Response body or None if failed
         """
         try:
             logger.info("fetching_rss_feed", url=feed_url)
@@ -86,23 +92,12 @@ class NewsService:
             response = requests.get(feed_url, headers=headers, timeout=15)
             
             if response.status_code == 200:
-                feed = feedparser.parse(response.content)
-                
-                if feed.bozo:
-                    logger.warning("rss_parse_warning", 
-                                 url=feed_url,
-                                 exception=str(feed.bozo_exception))
-                
-                logger.info("rss_feed_fetched", 
-                           url=feed_url, 
-                           entries=len(feed.entries))
-                
-                return feed
-            else:
-                logger.warning("rss_fetch_failed", 
-                              url=feed_url, 
-                              status=response.status_code)
-                return None
+                return response.content
+            
+            logger.warning("rss_fetch_failed", 
+                          url=feed_url, 
+                          status=response.status_code)
+            return None
                 
         except requests.exceptions.Timeout:
             logger.error("rss_fetch_timeout", url=feed_url)
@@ -111,6 +106,33 @@ class NewsService:
             logger.error("rss_fetch_error", url=feed_url, error=str(e))
             return None
     
+    def fetch_rss_feed(self, feed_url: str) -> Optional[feedparser.FeedParserDict]:
+        """
+        Fetch and parse RSS feed from URL.
+        
+        Args:
+            feed_url: RSS feed URL
+            
+        Returns:
+            Parsed feed or None if failed
+        """
+        content = self.fetch_rss_content(feed_url)
+        if content is None:
+            return None
+        
+        feed = feedparser.parse(content)
+        
+        if feed.bozo:
+            logger.warning("rss_parse_warning", 
+                         url=feed_url,
+                         exception=str(feed.bozo_exception))
+        
+        logger.info("rss_feed_fetched", 
+                   url=feed_url, 
+                   entries=len(feed.entries))
+        
+        return feed
+    
     def is_gold_related(self, title: str, description: str) -> bool:
         """
         Check if article is gold-related using keywords.
@@ -122,14 +144,7 @@ class NewsService:
         Returns:
             True if article mentions gold-related keywords
         """
-        text = f"{title} {description}".lower()
-        
-        for keyword in self.GOLD_KEYWORDS:
-            if keyword.lower() in text:
-                logger.debug("gold_keyword_found", keyword=keyword)
-                return True
-        
-        return False
+        return self._keyword_pattern.search(f"{title} {description}".lower()) is not None
     
     def parse_feed_entry(self, entry: Any, source: str) -> Optional[Dict[str, Any]]:
         """
@@ -142,56 +157,13 @@ class NewsService:
         Returns:
             Dictionary with NewsEvent fields or None if parsing failed
         """
-        try:
-            # Parse published date
-            published = entry.get('published_parsed') or entry.get('updated_parsed')
-            if published:
-                pub_date = datetime(*published[:6], tzinfo=UTC)
-            else:
-                pub_date = datetime.now(UTC)
-            
-            # Extract content
-            content = ''
-            if entry.get('content'):
-                content = entry.content[0].get('value', '')
-            elif entry.get('summary'):
-                content = entry.summary
-            
-            # Extract image URL
-            image_url = None
-            if entry.get('media_content'):
-                image_url = entry.media_content[0].get('url')
-            elif entry.get('media_thumbnail'):
-                image_url = entry.media_thumbnail[0].get('url')
-            
-            # Build news data
-            news_data = {
-                'title': entry.get('title', 'No Title')[:500],
-                'description': entry.get('summary', entry.get('description', ''))[:1000],
-                'content': content,
-                'url': entry.get('link', ''),
-                'image_url': image_url,
-                'published_at': pub_date,
-                'source': source,
-                'author': entry.get('author', 'Unknown')[:200],
-                'category': self.RSS_FEEDS[source]['category'],
-                
-                # Sentiment fields (to be calculated later by ML)
-                'sentiment_score': None,
-                'sentiment_label': None,
-                'confidence': None,
-                'price_impact': None,
-                'impact_score': None,
-            }
-            
-            return news_data
-            
-        except Exception as e:
+        parsed = normalize_entries([entry], source, self.RSS_FEEDS[source]['category'])
+        if not parsed.records:
             logger.error("parse_entry_error", 
                         source=source, 
-                        error=str(e),
                         entry_title=entry.get('title', 'Unknown')[:50])
             return None
+        return parsed.records[0]
     
     async def fetch_and_save_news(self, 
                                   hours_back: int = 24, 
@@ -212,118 +184,43 @@ class NewsService:
                    sources=list(self.RSS_FEEDS.keys()))
         
         cutoff_time = datetime.now(UTC) - timedelta(hours=hours_back)
-        saved_count = 0
-        skipped_old = 0
-        skipped_not_gold = 0
-        skipped_duplicate = 0
         
-        for source_key, source_info in self.RSS_FEEDS.items():
-            try:
-                logger.info("processing_source", 
-                           source=source_key,
-                           name=source_info['name'])
-                
-                # Fetch feed
-                feed = self.fetch_rss_feed(source_info['url'])
-                
-                if not feed or not feed.entries:
-                    logger.warning("no_entries", source=source_key)
-                    continue
-                
-                logger.info("processing_entries", 
-                           source=source_key,
-                           count=len(feed.entries))
-                
-                # Process entries
-                async with AsyncSessionLocal() as session:
-                    for entry in feed.entries:
-                        try:
-                            # Parse entry
-                            news_data = self.parse_feed_entry(entry, source_key)
-                            
-                            if not news_data:
-                                continue
-                            
-                            # Skip old articles
-                            if news_data['published_at'] < cutoff_time:
-                                skipped_old += 1
-                                logger.debug("article_too_old", 
-                                           title=news_data['title'][:50],
-                                           published=news_data['published_at'])
-                                continue
-                            
-                            # Filter gold-related
-                            if filter_gold:
-                                if not self.is_gold_related(
-                                    news_data['title'], 
-                                    news_data['description']
-                                ):
-                                    skipped_not_gold += 1
-                                    logger.debug("not_gold_related", 
-                                               title=news_data['title'][:50])
-                                    continue
-                            
-                            # Check if exists (by URL)
-                            from sqlalchemy import select
-                            result = await session.execute(
-                                select(NewsEvent).where(
-                                    NewsEvent.url == news_data['url']
-                                )
-                            )
-                            
-                            existing = result.scalar_one_or_none()
-                            if existing:
-                                skipped_duplicate += 1
-                                logger.debug("news_exists", 
-                                           url=news_data['url'],
-                                           id=existing.id)
-                                continue
-                            
-                            # Save new article
-                            news = NewsEvent(**news_data)
-                            session.add(news)
-                            saved_count += 1
-                            
-                            logger.info("news_saved", 
-                                      title=news_data['title'][:50],
-                                      source=source_key,
-                                      published=news_data['published_at'])
-                            
-                        except Exception as e:
-                            logger.error("process_entry_error", 
-                                       source=source_key, 
-                                       error=str(e),
-                                       exc_info=True)
-                            continue
-                    
-                    await session.commit()
-                
-            except Exception as e:
-                logger.error("fetch_source_error", 
-                           source=source_key, 
-                           error=str(e),
-                           exc_info=True)
-                continue
+        # fetch -> parse (worker pool) -> filter -> dedup -> bulk insert
+        pipeline = FeedPipeline(
+            fetch=self.fetch_rss_content,
+            is_relevant=self.is_gold_related if filter_gold else None,
+        )
+        stats = await pipeline.run(self.RSS_FEEDS, cutoff_time)
+        
+        if stats.saved:
+            await invalidate("news")
         
         logger.info("news_fetch_complete", 
-                   saved=saved_count,
-                   skipped_old=skipped_old,
-                   skipped_not_gold=skipped_not_gold,
-                   skipped_duplicate=skipped_duplicate)
+                   saved=stats.saved,
+                   feeds=stats.feeds_fetched,
+                   entries=stats.entries,
+                   skipped_old=stats.skipped_old,
+                   skipped_not_gold=stats.skipped_not_gold,
+                   skipped_duplicate=stats.skipped_duplicate,
+                   failed=stats.failed)
         
-        return saved_count
+        return stats.saved
     
+    @cached("news")
     async def get_latest_news(self, limit: int = 10, 
-                             source: Optional[str] = None) -> List[NewsEvent]:
+                             source: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Get latest news articles from database.
         
+        Returned as plain dicts (`NewsEvent.to_dict()`): the result is
+        cached and shared between callers, so no ORM instances.
+        
         Args:
             limit: Maximum number of articles to return
             source: Filter by source (optional)
             
         Returns:
-            List of NewsEvent objects
+            List of article dicts
         """
         async with AsyncSessionLocal() as session:
             from sqlalchemy import select
@@ -342,7 +239,7 @@ class NewsService:
                        count=len(articles),
                        source=source)
             
-            return articles
+            return [article.to_dict() for article in articles]
     
     async def get_news_by_timerange(self, 
                                     start_time: datetime,
@@ -376,6 +273,7 @@ class NewsService:
             
             return articles
     
+    @cached("news")
     async def get_news_stats(self) -> Dict[str, Any]:
         """
         Get news database statistics.
@@ -9,15 +9,23 @@ Author: Hoseyn Doulabi (@hoseynd-ai)
 Created: 2025-10-25 16:09:04 UTC
 """
 
+import asyncio
 import requests
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
-from sqlalchemy import select
+from typing import Awaitable, Callable, List, Dict, Optional
 
-from app.infrastructure.database.base import AsyncSessionLocal
-from app.infrastructure.database.models import NewsEvent
+from app.application.services.ingestion import (
+    IngestionPipeline,
+    NewsDeduplicator,
+    NewsEventStore,
+    NewsSink,
+    PipelineResult,
+    Stage,
+)
 from app.core.logging import get_logger
+from app.infrastructure.cache.query_cache import invalidate
 from app.core.config import settings
+from app.infrastructure.cache.http_cache import classify_newsapi, get_http_cache
 
 logger = get_logger(__name__)
 
@@ -73,7 +81,8 @@ class NewsAPIService:
         from_date: datetime,
         to_date: datetime,
         language: str = 'en',
-        page_size: int = 100
+        page_size: int = 100,
+        raise_errors: bool = False
     ) -> List[Dict]:
         """
         دریافت اخبار با یک keyword
@@ -84,6 +93,7 @@ class NewsAPIService:
             to_date: تا تاریخ
             language: زبان
             page_size: تعداد در هر صفحه (max: 100)
+            raise_errors: خطا raise شود بجای لیست خالی (برای backfill)
             
         Returns:
             لیست اخبار
@@ -104,10 +114,17 @@ class NewsAPIService:
         }
         
         try:
-            response = requests.get(self.BASE_URL, params=params, timeout=30)
+            # cached per (keyword, date range); stale copy served on 429
+            response = get_http_cache().get_json(
+                'newsapi',
+                self.BASE_URL,
+                params=params,
+                timeout=30,
+                classify=classify_newsapi,
+            )
             response.raise_for_status()
             
-            data = response.json()
+            data = response.json() or {}
             
             if data.get('status') == 'ok':
                 articles = data.get('articles', [])
@@ -121,10 +138,14 @@ class NewsAPIService:
                 logger.error("newsapi_error",
                            keyword=keyword,
                            error=error_msg)
+                if raise_errors:
+                    raise RuntimeError(f"NewsAPI error: {error_msg}")
                 return []
                 
         except requests.exceptions.RequestException as e:
             logger.error("request_error", keyword=keyword, error=str(e))
+            if raise_errors:
+                raise
             return []
     
     async def fetch_historical_news(
@@ -157,148 +178,101 @@ class NewsAPIService:
                    to_date=to_date.date(),
                    days=days_back)
         
-        keywords_to_use = keywords or self.GOLD_KEYWORDS
-        all_articles = []
-        
-        # جمع‌آوری با هر keyword
-        for i, keyword in enumerate(keywords_to_use, 1):
-            print(f"📰 [{i}/{len(keywords_to_use)}] Searching: '{keyword}'...")
-            
-            articles = await self.fetch_news(
-                keyword=keyword,
-                from_date=from_date,
-                to_date=to_date
-            )
-            
-            all_articles.extend(articles)
-            print(f"   ✅ Found: {len(articles)} articles")
-            
-            # کمی صبر کنیم (rate limit)
-            if i < len(keywords_to_use):
-                import asyncio
-                await asyncio.sleep(1)
-        
-        # حذف duplicate
-        print(f"\n🔄 Removing duplicates...")
-        unique_articles = self._deduplicate_articles(all_articles)
-        print(f"   ✅ Unique articles: {len(unique_articles)}")
-        
-        # ذخیره
-        print(f"\n💾 Saving to database...")
-        saved = await self._save_articles(unique_articles)
-        
-        logger.info("historical_fetch_complete",
-                   total_fetched=len(all_articles),
-                   unique=len(unique_articles),
-                   saved=saved)
-        
-        return saved
+        result = await self.fetch_range(from_date, to_date, keywords)
+        return result.written
     
-    def _deduplicate_articles(self, articles: List[Dict]) -> List[Dict]:
+    async def fetch_range(
+        self,
+        from_date: datetime,
+        to_date: datetime,
+        keywords: Optional[List[str]] = None,
+        throttle: Optional[Callable[[], Awaitable[None]]] = None,
+        raise_errors: bool = False
+    ) -> PipelineResult:
         """
-        حذف اخبار تکراری بر اساس URL
+        جمع‌آوری و ذخیره اخبار یک بازه تاریخ
         
         Args:
-            articles: لیست اخبار
+            from_date: از تاریخ
+            to_date: تا تاریخ (شامل)
+            keywords: لیست کلمات کلیدی (پیش‌فرض: GOLD_KEYWORDS)
+            throttle: قبل از هر درخواست await می‌شود (پیش‌فرض: 1 ثانیه فاصله)
+            raise_errors: خطای درخواست‌ها در result.failed شمرده شود
             
         Returns:
-            لیست بدون تکرار
+            نتیجه pipeline (written = تعداد اخبار جدید)
         """
-        seen_urls = set()
-        seen_titles = set()
-        unique = []
+        keywords_to_use = keywords or self.GOLD_KEYWORDS
         
-        for article in articles:
-            url = article.get('url', '')
-            title = article.get('title', '')
-            
-            # چک URL
-            if url and url not in seen_urls:
-                seen_urls.add(url)
-                
-                # چک title (برای اخباری که URL های مختلف دارن)
-                if title and title not in seen_titles:
-                    seen_titles.add(title)
-                    unique.append(article)
+        async def fetch(keyword: str) -> List[Dict]:
+            if throttle is not None:
+                await throttle()
+            articles = await self.fetch_news(keyword=keyword, from_date=from_date, to_date=to_date,
+                                             raise_errors=raise_errors)
+            if throttle is None:
+                # NewsAPI rate limit - یک درخواست در ثانیه
+                await asyncio.sleep(1)
+            return articles
         
-        return unique
+        # keyword -> articles -> NewsEvent rows -> dedup (URL + title) -> bulk insert
+        store = NewsEventStore()
+        dedup = NewsDeduplicator(store, by_title=True)
+        pipeline = IngestionPipeline("newsapi", [
+            Stage("fetch", fetch, fan_out=True),
+            Stage("normalize", self._to_news_event),
+            Stage("dedup", dedup, batch_size=settings.NEWS_INSERT_BATCH_SIZE),
+            Stage("sink", NewsSink(store), batch_size=settings.NEWS_INSERT_BATCH_SIZE),
+        ])
+        result = await pipeline.run(keywords_to_use)
+        
+        if result.written:
+            await invalidate("news")
+        
+        logger.info("historical_fetch_complete",
+                   from_date=from_date.date(),
+                   to_date=to_date.date(),
+                   total_fetched=result.stages["fetch"].emitted,
+                   skipped_duplicate=dedup.duplicates,
+                   saved=result.written,
+                   failed=result.failed)
+        
+        return result
     
-    async def _save_articles(self, articles: List[Dict]) -> int:
+    @staticmethod
+    def _to_news_event(article: Dict) -> Optional[Dict]:
         """
-        ذخیره اخبار در database
+        تبدیل یک خبر NewsAPI به ستون‌های NewsEvent
         
         Args:
-            articles: لیست اخبار
+            article: خبر خام NewsAPI
             
         Returns:
-            تعداد اخبار ذخیره شده
+            دیکشنری NewsEvent یا None (بدون URL / title)
         """
-        saved_count = 0
-        skipped_count = 0
-        
-        async with AsyncSessionLocal() as session:
-            for article in articles:
-                try:
-                    url = article.get('url')
-                    title = article.get('title')
-                    
-                    if not url or not title:
-                        continue
-                    
-                    # چک وجود در database
-                    result = await session.execute(
-                        select(NewsEvent).where(NewsEvent.url == url)
-                    )
-                    existing = result.scalar_one_or_none()
-                    
-                    if existing:
-                        skipped_count += 1
-                        continue
-                    
-                    # Parse تاریخ
-                    published_at_str = article.get('publishedAt', '')
-                    try:
-                        published_at = datetime.fromisoformat(
-                            published_at_str.replace('Z', '+00:00')
-                        )
-                    except:
-                        published_at = datetime.utcnow()
-                    
-                    # ساخت NewsEvent
-                    news_event = NewsEvent(
-                        title=title[:500],
-                        description=article.get('description', '')[:2000] or '',
-                        url=url[:500],
-                        source='newsapi',
-                        author=article.get('author', 'Unknown')[:200] or 'Unknown',
-                        published_at=published_at,
-                        category='market',
-                        sentiment_score=None,  # بعداً با FinBERT
-                        sentiment_label=None,
-                        confidence=None
-                    )
-                    
-                    session.add(news_event)
-                    saved_count += 1
-                    
-                except Exception as e:
-                    logger.warning("save_article_error",
-                                 title=article.get('title', 'N/A')[:50],
-                                 error=str(e))
-                    continue
-            
-            await session.commit()
+        url = article.get('url')
+        title = article.get('title')
+        if not url or not title:
+            return None
         
-        logger.info("articles_saved",
-                   saved=saved_count,
-                   skipped=skipped_count)
+        try:
+            published_at = datetime.fromisoformat(
+                (article.get('publishedAt') or '').replace('Z', '+00:00')
+            )
+        except ValueError:
+            published_at = datetime.utcnow()
         
-        return saved_count
+        return {
+            'title': title[:500],
+            'description': (article.get('description') or '')[:2000],
+            'url': url[:500],
+            'source': 'newsapi',
+            'author': (article.get('author') or 'Unknown')[:200],
+            'published_at': published_at,
+            'category': 'market',
+        }
 
 
 if __name__ == "__main__":
-    import asyncio
-    
     async def test():
         print("\n" + "="*70)
         print("🧪 Testing NewsAPI Service")
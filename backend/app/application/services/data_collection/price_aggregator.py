@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gold Price Analyzer - Spot Price Aggregator
+
+Queries every configured spot price source at the same time and returns
+as soon as enough valid prices have arrived, instead of waiting for one
+slow source after another.
+
+- first-good-wins (quorum=1) or median of a quorum
+- remaining requests are cancelled / ignored once the answer is known
+- per-source latency and error rate (EWMA)
+- failing sources are skipped for a cooldown that grows with failures
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+License: MIT
+"""
+
+import asyncio
+import statistics
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.metrics import COLLECTOR_FETCH_SECONDS
+
+logger = get_logger(__name__)
+
+PriceSource = Callable[[], Optional[float]]
+
+
+@dataclass
+class SourceStats:
+    """Health of one price source."""
+
+    name: str
+    calls: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    latency_ewma: Optional[float] = None
+    error_rate: float = 0.0
+    skip_until: float = 0.0
+    last_price: Optional[float] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "name": self.name,
+            "calls": self.calls,
+            "failures": self.failures,
+            "consecutive_failures": self.consecutive_failures,
+            "latency_ms": round(self.latency_ewma * 1000, 1) if self.latency_ewma is not None else None,
+            "error_rate": round(self.error_rate, 3),
+            "last_price": self.last_price,
+        }
+
+
+class SpotPriceAggregator:
+    """
+    Concurrent fan-out over spot price sources.
+
+    Example:
+        >>> aggregator = SpotPriceAggregator({
+        ...     "kitco": real_service.scrape_kitco,
+        ...     "goldprice_org": simple_service.fetch_from_goldprice_org,
+        ... })
+        >>> aggregator.get_current_price()
+        4113.5
+    """
+
+    def __init__(
+        self,
+        sources: Dict[str, PriceSource],
+        quorum: int = 1,
+        timeout: float = 15.0,
+        min_price: float = 1000.0,
+        max_price: float = 10000.0,
+        failure_threshold: int = 3,
+        cooldown_seconds: float = 300.0,
+        max_cooldown_seconds: float = 3600.0,
+        alpha: float = 0.3,
+        executor: Optional[ThreadPoolExecutor] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize aggregator.
+
+        Args:
+            sources: Name -> blocking function returning a price or None
+            quorum: Valid prices needed before answering (median is returned)
+            timeout: Overall deadline for one quote in seconds
+            min_price: Lowest plausible USD/oz price
+            max_price: Highest plausible USD/oz price
+            failure_threshold: Consecutive failures before a source is skipped
+            cooldown_seconds: First skip period (doubles per extra failure)
+            max_cooldown_seconds: Longest skip period
+            alpha: EWMA smoothing for latency and error rate
+            executor: Thread pool for blocking source calls
+            clock: Monotonic clock (injectable for tests)
+        """
+        if not sources:
+            raise ValueError("At least one price source is required")
+
+        self.sources = dict(sources)
+        self.quorum = max(1, quorum)
+        self.timeout = timeout
+        self.min_price = min_price
+        self.max_price = max_price
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self.max_cooldown_seconds = max_cooldown_seconds
+        self.alpha = alpha
+        self._clock = clock
+        self._executor = executor or ThreadPoolExecutor(
+            max_workers=max(4, 2 * len(self.sources)),
+            thread_name_prefix="spot-price",
+        )
+        self._lock = threading.Lock()
+        self._stats = {name: SourceStats(name=name) for name in self.sources}
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    def get_current_price(self) -> Optional[float]:
+        """
+        Query all healthy sources concurrently.
+
+        Returns:
+            Price from the first valid source (or median of `quorum`
+            prices); None when no source answered with a valid price.
+        """
+        names = self._active_sources()
+        started = self._clock()
+        pending: Dict[Future, str] = {}
+
+        for name in names:
+            future = self._executor.submit(self._call_source, name)
+            pending[future] = name
+
+        prices: Dict[str, float] = {}
+        deadline = started + self.timeout
+
+        while pending and len(prices) < self.quorum:
+            remaining = deadline - self._clock()
+            if remaining <= 0:
+                break
+
+            done, _ = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = pending.pop(future)
+                price = future.result()
+                if price is not None:
+                    prices[name] = price
+
+        # answer is known; drop the slow ones (running calls finish in the
+        # background and still update their stats)
+        for future in pending:
+            future.cancel()
+
+        if not prices:
+            logger.warning(
+                "spot_price_all_sources_failed",
+                sources=names,
+                elapsed_ms=round((self._clock() - started) * 1000),
+            )
+            return None
+
+        price = statistics.median(prices.values())
+        logger.info(
+            "spot_price_aggregated",
+            price=price,
+            sources=sorted(prices),
+            cancelled=sorted(pending.values()),
+            elapsed_ms=round((self._clock() - started) * 1000),
+        )
+        return price
+
+    async def get_current_price_async(self) -> Optional[float]:
+        """Same as `get_current_price` without blocking the event loop."""
+        return await asyncio.to_thread(self.get_current_price)
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """Per-source health snapshot."""
+        with self._lock:
+            return [s.to_dict() for s in self._stats.values()]
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+    def _active_sources(self) -> List[str]:
+        """Sources not in cooldown; all of them if every source is cooling down."""
+        now = self._clock()
+        with self._lock:
+            active = [name for name, s in self._stats.items() if s.skip_until <= now]
+
+        if not active:
+            logger.warning("spot_price_all_sources_cooling_down")
+            return list(self.sources)
+
+        return active
+
+    def _call_source(self, name: str) -> Optional[float]:
+        started = self._clock()
+        try:
+            price = self.sources[name]()
+        except Exception as e:
+            logger.error("spot_price_source_error", source=name, error=str(e))
+            price = None
+
+        if price is not None and not (self.min_price < price < self.max_price):
+            logger.warning("spot_price_out_of_range", source=name, price=price)
+            price = None
+
+        self._record(name, self._clock() - started, price)
+        return price
+
+    def _record(self, name: str, latency: float, price: Optional[float]) -> None:
+        COLLECTOR_FETCH_SECONDS.labels(
+            source=name, outcome="error" if price is None else "ok"
+        ).observe(max(latency, 0.0))
+
+        with self._lock:
+            s = self._stats[name]
+            s.calls += 1
+            s.latency_ewma = latency if s.latency_ewma is None else (
+                self.alpha * latency + (1 - self.alpha) * s.latency_ewma
+            )
+            failed = price is None
+            s.error_rate = self.alpha * float(failed) + (1 - self.alpha) * s.error_rate
+
+            if not failed:
+                s.consecutive_failures = 0
+                s.skip_until = 0.0
+                s.last_price = price
+                return
+
+            s.failures += 1
+            s.consecutive_failures += 1
+
+            if s.consecutive_failures >= self.failure_threshold:
+                extra = s.consecutive_failures - self.failure_threshold
+                cooldown = min(self.cooldown_seconds * (2 ** extra), self.max_cooldown_seconds)
+                s.skip_until = self._clock() + cooldown
+                logger.warning(
+                    "spot_price_source_skipped",
+                    source=name,
+                    consecutive_failures=s.consecutive_failures,
+                    cooldown_seconds=cooldown,
+                )
+
+
+_default_aggregator: Optional[SpotPriceAggregator] = None
+_default_lock = threading.Lock()
+
+
+def get_spot_price_aggregator() -> SpotPriceAggregator:
+    """
+    Shared aggregator over every scraper/API we have.
+
+    Shared so source health survives across service instances.
+    """
+    global _default_aggregator
+
+    with _default_lock:
+        if _default_aggregator is None:
+            from app.application.services.data_collection.kitco_gold_service import KitcoGoldService
+            from app.application.services.data_collection.real_gold_service import RealGoldService
+            from app.application.services.data_collection.simple_gold_service import SimpleGoldService
+
+            kitco = KitcoGoldService()
+            real = RealGoldService()
+            simple = SimpleGoldService()
+
+            _default_aggregator = SpotPriceAggregator(
+                sources={
+                    "kitco_json": kitco.get_current_price,
+                    "kitco_scrape": real.scrape_kitco,
+                    "goldprice_org": simple.fetch_from_goldprice_org,
+                    "metals_api": simple.fetch_current_price_metals_api,
+                },
+                quorum=settings.SPOT_PRICE_QUORUM,
+                timeout=settings.SPOT_PRICE_TIMEOUT_SECONDS,
+            )
+
+        return _default_aggregator
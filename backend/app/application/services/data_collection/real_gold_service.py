@@ -10,12 +10,17 @@ Created: 2025-10-25
 License: MIT
 """
 
+import asyncio
 from datetime import datetime, UTC, timedelta
 from typing import Optional
 import requests
 from bs4 import BeautifulSoup
 import re
 
+from app.application.services.data_collection.price_aggregator import (
+    SpotPriceAggregator,
+    get_spot_price_aggregator,
+)
 from app.core.logging import get_logger
 from app.infrastructure.database.base import AsyncSessionLocal
 from app.infrastructure.database.models import GoldPriceFact
@@ -33,8 +38,9 @@ class RealGoldService:
     Created: 2025-10-25
     """
     
-    def __init__(self):
+    def __init__(self, aggregator: Optional[SpotPriceAggregator] = None):
         """Initialize service."""
+        self.aggregator = aggregator
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
         }
@@ -91,10 +97,14 @@ class RealGoldService:
         """
         Get current gold price.
         
+        Kitco (JSON + page), GoldPrice.org and Metals-API are queried
+        concurrently; the first valid price wins.
+        
         Returns:
             float: Current gold price in USD per ounce
         """
-        price = self.scrape_kitco()
+        aggregator = self.aggregator or get_spot_price_aggregator()
+        price = aggregator.get_current_price()
         if price:
             return price
         
@@ -107,7 +117,7 @@ class RealGoldService:
         Returns:
             bool: True if successful
         """
-        price = self.get_current_price()
+        price = await asyncio.to_thread(self.get_current_price)
         
         if not price:
             logger.error("failed_to_get_price")
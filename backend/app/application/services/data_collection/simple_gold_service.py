@@ -10,11 +10,16 @@ Created: 2025-10-25
 License: MIT
 """
 
+import asyncio
 from datetime import datetime, UTC, timedelta
 from typing import Optional, Dict, Any, List
 import requests
 from decimal import Decimal
 
+from app.application.services.data_collection.price_aggregator import (
+    SpotPriceAggregator,
+    get_spot_price_aggregator,
+)
 from app.core.logging import get_logger
 from app.infrastructure.database.base import AsyncSessionLocal
 from app.infrastructure.database.models import GoldPriceFact
@@ -35,8 +40,9 @@ class SimpleGoldService:
     Created: 2025-10-25
     """
     
-    def __init__(self):
+    def __init__(self, aggregator: Optional[SpotPriceAggregator] = None):
         """Initialize service."""
+        self.aggregator = aggregator
         self.metals_api_url = "https://api.metals.dev/v1/latest"
         self.gold_api_url = "https://www.goldapi.io/api"
         logger.info("simple_gold_service_initialized")
@@ -110,16 +116,13 @@ class SimpleGoldService:
         """
         Get current gold price from best available source.
         
+        All sources are queried concurrently; the first valid price wins.
+        
         Returns:
             float: Current gold price in USD per ounce
         """
-        # Try 1: GoldPrice.org
-        price = self.fetch_from_goldprice_org()
-        if price:
-            return price
-        
-        # Try 2: Metals-API
-        price = self.fetch_current_price_metals_api()
+        aggregator = self.aggregator or get_spot_price_aggregator()
+        price = aggregator.get_current_price()
         if price:
             return price
         
@@ -134,7 +137,7 @@ class SimpleGoldService:
         Returns:
             bool: True if successful
         """
-        price = self.get_current_price()
+        price = await asyncio.to_thread(self.get_current_price)
         
         if not price:
             logger.error("failed_to_get_current_price")
@@ -12,14 +12,17 @@ Created: 2025-10-25
 License: MIT
 """
 
+import asyncio
 from datetime import datetime, UTC, timedelta
 from typing import List, Dict, Any, Optional
 import yfinance as yf
 import pandas as pd
 
+from app.application.services.ingestion import CandleSink, IngestionPipeline, Stage
+from app.core.config import settings
 from app.core.logging import get_logger
 from app.infrastructure.database.base import AsyncSessionLocal
-from app.infrastructure.database.models import GoldPriceFact
+from app.infrastructure.database.repositories.gold_price_repository import get_watermark
 
 logger = get_logger(__name__)
 
@@ -60,7 +63,10 @@ class YahooFinanceService:
     def fetch_historical_data(
         self,
         period: str = "1mo",
-        interval: str = "1d"
+        interval: str = "1d",
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        raise_errors: bool = False,
     ) -> pd.DataFrame:
         """
         Fetch historical gold price data.
@@ -68,6 +74,9 @@ class YahooFinanceService:
         Args:
             period: Data period ('1d', '5d', '1mo', '3mo', '6mo', '1y', '5y')
             interval: Data interval ('1m', '5m', '1h', '1d', '1wk', '1mo')
+            start: Explicit range start (overrides `period`)
+            end: Explicit range end (exclusive, default: now)
+            raise_errors: Re-raise fetch errors instead of returning an empty frame
         
         Returns:
             pd.DataFrame: Historical price data
@@ -78,14 +87,18 @@ class YahooFinanceService:
         logger.info(
             "fetching_yahoo_finance_data",
             symbol=self.symbol,
-            period=period,
+            period=None if start else period,
+            start=start.isoformat() if start else None,
             interval=interval
         )
         
         try:
             # دریافت داده
             ticker = yf.Ticker(self.symbol)
-            data = ticker.history(period=period, interval=interval)
+            if start is not None:
+                data = ticker.history(start=start, end=end, interval=interval)
+            else:
+                data = ticker.history(period=period, interval=interval)
             
             if data.empty:
                 logger.warning("yahoo_finance_no_data", symbol=self.symbol)
@@ -106,6 +119,8 @@ class YahooFinanceService:
                 error=str(e),
                 exc_info=True
             )
+            if raise_errors:
+                raise
             return pd.DataFrame()
     
     def _convert_to_price_dict(
@@ -147,108 +162,155 @@ class YahooFinanceService:
             'data_quality': 1.0,
         }
     
-    async def fetch_and_save_daily_prices(
+    def _frame_to_price_dicts(
         self,
-        days: int = 30
-    ) -> int:
+        data: pd.DataFrame,
+        timeframe: str
+    ) -> List[Dict[str, Any]]:
         """
-        Fetch and save daily gold prices.
+        Convert a whole yfinance frame to GoldPriceFact dictionaries.
+        
+        Column-wise equivalent of `_convert_to_price_dict` (no iterrows).
         
         Args:
-            days: Number of days to fetch (max 730)
+            data: yfinance history frame (Open, High, Low, Close, Volume)
+            timeframe: Timeframe (hourly, daily)
         
         Returns:
-            int: Number of records saved
-            
-        Author: Hoseyn Doulabi (@hoseynd-ai)
-        Created: 2025-10-25
+            list: Dictionaries for GoldPriceFact model
         """
-        logger.info(
-            "fetching_daily_prices",
-            days=days,
-            symbol=self.symbol
-        )
+        if data.empty:
+            return []
         
-        # دریافت داده
-        period = f"{days}d" if days <= 59 else f"{days//30}mo"
-        data = self.fetch_historical_data(period=period, interval="1d")
+        index = pd.DatetimeIndex(data.index)
+        if index.tz is None:
+            index = index.tz_localize(UTC)
+        else:
+            index = index.tz_convert(UTC)
         
-        if data.empty:
-            logger.warning("no_daily_data_to_save")
-            return 0
+        open_ = data['Open'].astype(float)
+        close = data['Close'].astype(float)
+        price_change = close - open_
+        price_change_pct = (price_change / open_.where(open_ != 0) * 100).fillna(0).round(2)
+        volume = data['Volume'].fillna(0).astype('int64')
+        
+        frame = pd.DataFrame({
+            'timestamp': index.to_pydatetime(),
+            'timeframe': timeframe,
+            'open': open_.to_numpy(),
+            'high': data['High'].astype(float).to_numpy(),
+            'low': data['Low'].astype(float).to_numpy(),
+            'close': close.to_numpy(),
+            'volume': volume.to_numpy(),
+            'price_change': price_change.to_numpy(),
+            'price_change_pct': price_change_pct.to_numpy(),
+            'source': self.source,
+            'market': 'futures',
+            'data_quality': 1.0,
+        })
+        
+        return frame.to_dict('records')
+    
+    async def _fetch_and_save(
+        self,
+        timeframe: str,
+        interval: str,
+        bar: timedelta,
+        days: int,
+        max_days: int,
+        incremental: bool,
+    ) -> int:
+        """
+        Fetch only bars newer than the high-water mark and bulk-upsert them.
         
-        # ذخیره در database
-        saved_count = 0
+        Args:
+            timeframe: Stored timeframe (daily, hourly)
+            interval: yfinance interval (1d, 1h)
+            bar: Length of one bar
+            days: Window used when nothing is stored yet (or incremental=False)
+            max_days: Largest window Yahoo serves for this interval
+            incremental: Resume from the stored high-water mark
+        
+        Returns:
+            int: Number of records saved
+        """
+        now = datetime.now(UTC)
         
         async with AsyncSessionLocal() as session:
-            for timestamp, row in data.iterrows():
-                try:
-                    # تبدیل timestamp
-                    if isinstance(timestamp, pd.Timestamp):
-                        timestamp = timestamp.to_pydatetime()
-                    
-                    # اطمینان از timezone
-                    if timestamp.tzinfo is None:
-                        timestamp = timestamp.replace(tzinfo=UTC)
-                    
-                    # ساخت dictionary
-                    price_data = self._convert_to_price_dict(
-                        row,
-                        timestamp,
-                        'daily'
-                    )
-                    
-                    # چک کردن وجود داده
-                    from sqlalchemy import select
-                    existing = await session.execute(
-                        select(GoldPriceFact).where(
-                            GoldPriceFact.timestamp == timestamp,
-                            GoldPriceFact.timeframe == 'daily',
-                            GoldPriceFact.source == self.source
-                        )
-                    )
-                    
-                    if existing.scalar_one_or_none():
-                        logger.debug(
-                            "price_already_exists",
-                            timestamp=timestamp.isoformat()
-                        )
-                        continue
-                    
-                    # ذخیره
-                    price = GoldPriceFact(**price_data)
-                    session.add(price)
-                    saved_count += 1
-                    
-                except Exception as e:
-                    logger.error(
-                        "failed_to_save_price",
-                        timestamp=str(timestamp),
-                        error=str(e)
-                    )
-                    continue
+            latest = (
+                await get_watermark(session, self.source, timeframe)
+                if incremental else None
+            )
+        
+        if latest is not None:
+            if latest.tzinfo is None:
+                latest = latest.replace(tzinfo=UTC)
+            start = latest + bar
             
-            # Commit همه
-            await session.commit()
+            # آخرین کندل هنوز بسته نشده - نیازی به درخواست نیست
+            if start + bar > now:
+                logger.info(
+                    "yahoo_finance_up_to_date",
+                    timeframe=timeframe,
+                    last_timestamp=latest.isoformat()
+                )
+                return 0
+        else:
+            start = now - timedelta(days=days)
+        
+        start = max(start, now - timedelta(days=max_days))
+        
+        async def fetch(range_start: datetime) -> List[Dict[str, Any]]:
+            # yfinance مسدودکننده است - اجرا در thread
+            data = await asyncio.to_thread(
+                self.fetch_historical_data,
+                interval=interval,
+                start=range_start,
+            )
+            if data.empty:
+                logger.warning("no_price_data_to_save", timeframe=timeframe)
+            # oldest first: each committed batch may advance the watermark
+            return sorted(self._frame_to_price_dicts(data, timeframe), key=lambda row: row['timestamp'])
+        
+        def is_new(row: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            return row if latest is None or row['timestamp'] > latest else None
+        
+        # fetch -> rows -> newer than the watermark -> batched upsert + watermark
+        # fail_fast: a lost batch stops the run (and raises) before a later
+        # batch moves the watermark past it
+        pipeline = IngestionPipeline(f"yahoo_{timeframe}", [
+            Stage("fetch", fetch, fan_out=True),
+            Stage("filter", is_new),
+            Stage("sink", CandleSink(self.source, timeframe), batch_size=settings.INGEST_BATCH_SIZE),
+        ], fail_fast=True)
+        result = await pipeline.run([start])
+        saved_count = result.written
         
         logger.info(
-            "daily_prices_saved",
-            total_fetched=len(data),
+            "prices_saved",
+            timeframe=timeframe,
+            total_fetched=result.stages["fetch"].emitted,
             saved=saved_count,
+            start=start.isoformat(),
             author="Hoseyn Doulabi (@hoseynd-ai)"
         )
         
         return saved_count
     
-    async def fetch_and_save_hourly_prices(
+    async def fetch_and_save_daily_prices(
         self,
-        days: int = 7
+        days: int = 30,
+        incremental: bool = True
     ) -> int:
         """
-        Fetch and save hourly gold prices.
+        Fetch and save daily gold prices.
+        
+        With `incremental=True` only candles after the stored high-water
+        mark are requested; `days` is used for the very first run.
         
         Args:
             days: Number of days to fetch (max 730)
+            incremental: Resume from the last stored candle
         
         Returns:
             int: Number of records saved
@@ -257,77 +319,55 @@ class YahooFinanceService:
         Created: 2025-10-25
         """
         logger.info(
-            "fetching_hourly_prices",
+            "fetching_daily_prices",
             days=days,
+            incremental=incremental,
             symbol=self.symbol
         )
         
-        # دریافت داده
-        period = f"{days}d"
-        data = self.fetch_historical_data(period=period, interval="1h")
-        
-        if data.empty:
-            logger.warning("no_hourly_data_to_save")
-            return 0
+        return await self._fetch_and_save(
+            timeframe='daily',
+            interval='1d',
+            bar=timedelta(days=1),
+            days=days,
+            max_days=730,
+            incremental=incremental,
+        )
+    
+    async def fetch_and_save_hourly_prices(
+        self,
+        days: int = 7,
+        incremental: bool = True
+    ) -> int:
+        """
+        Fetch and save hourly gold prices.
         
-        # ذخیره در database
-        saved_count = 0
+        Args:
+            days: Number of days to fetch (max 730)
+            incremental: Resume from the last stored candle
         
-        async with AsyncSessionLocal() as session:
-            for timestamp, row in data.iterrows():
-                try:
-                    # تبدیل timestamp
-                    if isinstance(timestamp, pd.Timestamp):
-                        timestamp = timestamp.to_pydatetime()
-                    
-                    # اطمینان از timezone
-                    if timestamp.tzinfo is None:
-                        timestamp = timestamp.replace(tzinfo=UTC)
-                    
-                    # ساخت dictionary
-                    price_data = self._convert_to_price_dict(
-                        row,
-                        timestamp,
-                        'hourly'
-                    )
-                    
-                    # چک کردن وجود داده
-                    from sqlalchemy import select
-                    existing = await session.execute(
-                        select(GoldPriceFact).where(
-                            GoldPriceFact.timestamp == timestamp,
-                            GoldPriceFact.timeframe == 'hourly',
-                            GoldPriceFact.source == self.source
-                        )
-                    )
-                    
-                    if existing.scalar_one_or_none():
-                        continue
-                    
-                    # ذخیره
-                    price = GoldPriceFact(**price_data)
-                    session.add(price)
-                    saved_count += 1
-                    
-                except Exception as e:
-                    logger.error(
-                        "failed_to_save_hourly_price",
-                        timestamp=str(timestamp),
-                        error=str(e)
-                    )
-                    continue
+        Returns:
+            int: Number of records saved
             
-            # Commit همه
-            await session.commit()
-        
+        Author: Hoseyn Doulabi (@hoseynd-ai)
+        Created: 2025-10-25
+        """
         logger.info(
-            "hourly_prices_saved",
-            total_fetched=len(data),
-            saved=saved_count,
-            author="Hoseyn Doulabi (@hoseynd-ai)"
+            "fetching_hourly_prices",
+            days=days,
+            incremental=incremental,
+            symbol=self.symbol
         )
         
-        return saved_count
+        return await self._fetch_and_save(
+            timeframe='hourly',
+            interval='1h',
+            bar=timedelta(hours=1),
+            days=days,
+            # Yahoo serves 1h bars for the last 730 days only
+            max_days=729,
+            incremental=incremental,
+        )
     
     def get_current_price(self) -> Optional[float]:
         """
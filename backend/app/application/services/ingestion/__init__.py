@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gold Price Analyzer - Ingestion Pipelines
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+License: MIT
+"""
+
+from app.application.services.ingestion.pipeline import (
+    IngestionAborted,
+    IngestionPipeline,
+    PipelineResult,
+    Stage,
+    StageStats,
+)
+from app.application.services.ingestion.stages import (
+    CandleSink,
+    DollarIndexSink,
+    NewsDeduplicator,
+    NewsEventStore,
+    NewsSink,
+)
+
+__all__ = [
+    "CandleSink",
+    "DollarIndexSink",
+    "IngestionAborted",
+    "IngestionPipeline",
+    "NewsDeduplicator",
+    "NewsEventStore",
+    "NewsSink",
+    "PipelineResult",
+    "Stage",
+    "StageStats",
+]
@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gold Price Analyzer - Ingestion Pipeline
+
+Collectors as explicit stages connected by bounded asyncio queues:
+
+    source -> fetch -> normalize -> dedup -> enrich -> sink
+
+Every stage runs `concurrency` workers. A stage with `batch_size`
+receives lists (up to batch_size items, or whatever arrived within
+INGEST_BATCH_LINGER_SECONDS), which is how sinks write in batches.
+A full queue blocks the stage before it (backpressure), so a slow
+database write slows fetching down instead of buffering everything.
+
+Stage functions are async and return:
+
+    map stage     one item, or None to drop it
+    fan_out       an iterable of items (fetch 1 feed -> N entries)
+    batch stage   a list to forward item by item, or an int (rows
+                  written) when it is the last stage
+
+An exception fails only the item (or batch) being processed; it is
+logged and counted, and the pipeline carries on. With `fail_fast` the
+first exception stops every stage and `run` raises IngestionAborted:
+sinks that advance a watermark (candles) must not commit batch N+1
+after batch N was lost, or the delta fetch would never retry N.
+
+Per-stage metrics: gold_ingest_stage_items_total (received / emitted /
+dropped / failed), gold_ingest_stage_seconds, gold_ingest_stage_lag_seconds
+(time waiting in the input queue) and gold_ingest_queue_depth.
+
+    pipeline = IngestionPipeline("newsapi", [
+        Stage("fetch", fetch_keyword, fan_out=True),
+        Stage("normalize", normalize),
+        Stage("dedup", dedup, batch_size=200),
+        Stage("sink", sink, batch_size=200),
+    ])
+    result = await pipeline.run(keywords)
+    result.written
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+License: MIT
+"""
+
+import asyncio
+import inspect
+import time
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterable, Awaitable, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.metrics import (
+    INGEST_QUEUE_DEPTH,
+    INGEST_STAGE_ITEMS,
+    INGEST_STAGE_LAG_SECONDS,
+    INGEST_STAGE_SECONDS,
+)
+
+logger = get_logger(__name__)
+
+_DONE = object()
+
+
+class IngestionAborted(RuntimeError):
+    """A fail-fast pipeline stopped on a stage error (chained as __cause__)."""
+
+    def __init__(self, pipeline: str, stage: str, error: Exception):
+        super().__init__(f"{pipeline}: stage '{stage}' failed: {error}")
+        self.pipeline = pipeline
+        self.stage = stage
+
+
+@dataclass
+class Stage:
+    """One step of a pipeline."""
+
+    name: str
+    fn: Callable[[Any], Awaitable[Any]]
+    concurrency: int = 1
+    batch_size: Optional[int] = None
+    fan_out: bool = False
+
+
+@dataclass
+class StageStats:
+    """Counters of one stage in one run."""
+
+    received: int = 0
+    emitted: int = 0
+    dropped: int = 0
+    failed: int = 0
+    busy_seconds: float = 0.0
+    max_lag_seconds: float = 0.0
+
+    def summary(self, elapsed: float) -> Dict[str, Any]:
+        return {
+            'received': self.received,
+            'emitted': self.emitted,
+            'dropped': self.dropped,
+            'failed': self.failed,
+            'items_per_second': round(self.received / elapsed, 1) if elapsed > 0 else None,
+            'max_lag_ms': round(self.max_lag_seconds * 1000, 1),
+        }
+
+
+@dataclass
+class PipelineResult:
+    """Outcome of `IngestionPipeline.run`."""
+
+    name: str
+    stages: Dict[str, StageStats] = field(default_factory=dict)
+    elapsed: float = 0.0
+
+    @property
+    def written(self) -> int:
+        """What the last stage emitted (rows written, for a sink)."""
+        return list(self.stages.values())[-1].emitted if self.stages else 0
+
+    @property
+    def failed(self) -> int:
+        return sum(s.failed for s in self.stages.values())
+
+
+class IngestionPipeline:
+    """Bounded-queue stage runner."""
+
+    def __init__(
+        self,
+        name: str,
+        stages: Sequence[Stage],
+        queue_size: Optional[int] = None,
+        batch_linger: Optional[float] = None,
+        fail_fast: bool = False,
+    ):
+        """
+        Args:
+            name: Pipeline name (metrics label)
+            stages: Stages in order; the first receives the source items
+            queue_size: Bound of every stage's input queue (default: INGEST_QUEUE_SIZE)
+            batch_linger: Seconds a batch stage waits to fill a batch
+                (default: INGEST_BATCH_LINGER_SECONDS)
+            fail_fast: Stop at the first stage error and raise IngestionAborted
+        """
+        if not stages:
+            raise ValueError("A pipeline needs at least one stage")
+        names = [stage.name for stage in stages]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Stage names must be unique: {names}")
+        self.name = name
+        self.stages = list(stages)
+        self.queue_size = queue_size or settings.INGEST_QUEUE_SIZE
+        self.batch_linger = settings.INGEST_BATCH_LINGER_SECONDS if batch_linger is None else batch_linger
+        self.fail_fast = fail_fast
+
+    async def run(self, source: Union[Iterable[Any], AsyncIterable[Any]]) -> PipelineResult:
+        """
+        Push every source item through the stages and wait for the last one.
+
+        Raises:
+            IngestionAborted: fail_fast pipeline and a stage failed
+        """
+        started = time.perf_counter()
+        result = PipelineResult(self.name, {stage.name: StageStats() for stage in self.stages})
+        inboxes = [asyncio.Queue(maxsize=self.queue_size) for _ in self.stages]
+
+        workers: List[List[asyncio.Task]] = []
+        for i, stage in enumerate(self.stages):
+            outbox = inboxes[i + 1] if i + 1 < len(self.stages) else None
+            workers.append([
+                asyncio.create_task(self._worker(stage, inboxes[i], outbox, result.stages[stage.name]))
+                for _ in range(max(1, stage.concurrency))
+            ])
+
+        async def drive() -> None:
+            await self._feed(source, inboxes[0])
+            # close the stages in order: a stage ends once everything before it has
+            for inbox, stage_workers in zip(inboxes, workers):
+                for _ in stage_workers:
+                    await inbox.put(_DONE)
+                await asyncio.gather(*stage_workers)
+
+        # a failed worker must not leave the feeder blocked on a full queue
+        tasks = [asyncio.create_task(drive())] + [task for stage_workers in workers for task in stage_workers]
+        try:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            for task in done:
+                if not task.cancelled() and task.exception() is not None:
+                    raise task.exception()
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+        result.elapsed = time.perf_counter() - started
+        logger.info(
+            "ingestion_pipeline_finished",
+            pipeline=self.name,
+            elapsed_ms=round(result.elapsed * 1000, 1),
+            written=result.written,
+            stages={name: stats.summary(result.elapsed) for name, stats in result.stages.items()},
+        )
+        return result
+
+    @staticmethod
+    async def _feed(source: Union[Iterable[Any], AsyncIterable[Any]], inbox: asyncio.Queue) -> None:
+        if hasattr(source, '__aiter__'):
+            async for item in source:
+                await inbox.put((time.monotonic(), item))
+        else:
+            for item in source:
+                await inbox.put((time.monotonic(), item))
+
+    async def _worker(
+        self,
+        stage: Stage,
+        inbox: asyncio.Queue,
+        outbox: Optional[asyncio.Queue],
+        stats: StageStats,
+    ) -> None:
+        labels = {'pipeline': self.name, 'stage': stage.name}
+        lag_metric = INGEST_STAGE_LAG_SECONDS.labels(**labels)
+        seconds_metric = INGEST_STAGE_SECONDS.labels(**labels)
+        depth_metric = INGEST_QUEUE_DEPTH.labels(**labels)
+        counters = {
+            outcome: INGEST_STAGE_ITEMS.labels(outcome=outcome, **labels)
+            for outcome in ('received', 'emitted', 'dropped', 'failed')
+        }
+
+        def count(outcome: str, n: int) -> None:
+            if n:
+                setattr(stats, outcome, getattr(stats, outcome) + n)
+                counters[outcome].inc(n)
+
+        done = False
+        while not done:
+            if stage.batch_size:
+                entries, done = await self._take_batch(inbox, stage.batch_size)
+                if not entries:
+                    return
+                payload: Any = [item for _, item in entries]
+                size = len(entries)
+            else:
+                entry = await inbox.get()
+                if entry is _DONE:
+                    return
+                entries, size = [entry], 1
+                payload = entry[1]
+
+            lag = time.monotonic() - entries[0][0]
+            lag_metric.observe(lag)
+            stats.max_lag_seconds = max(stats.max_lag_seconds, lag)
+            depth_metric.set(inbox.qsize())
+            count('received', size)
+
+            started = time.perf_counter()
+            try:
+                output = stage.fn(payload)
+                if inspect.isawaitable(output):
+                    output = await output
+            except Exception as e:
+                count('failed', size)
+                logger.error("ingestion_stage_error", pipeline=self.name, stage=stage.name,
+                             items=size, error=str(e), exc_info=True)
+                if self.fail_fast:
+                    raise IngestionAborted(self.name, stage.name, e) from e
+                continue
+            finally:
+                elapsed = time.perf_counter() - started
+                stats.busy_seconds += elapsed
+                seconds_metric.observe(elapsed)
+
+            items = self._outputs(stage, output)
+            if items is None:
+                # sink: the stage returned the number of rows written
+                count('emitted', int(output or 0))
+                continue
+            count('emitted', len(items))
+            # fan-out may emit more than it received; it drops only when it emits nothing
+            count('dropped', (0 if items else size) if stage.fan_out else max(0, size - len(items)))
+            if outbox is not None:
+                now = time.monotonic()
+                for item in items:
+                    await outbox.put((now, item))
+
+    @staticmethod
+    def _outputs(stage: Stage, output: Any) -> Optional[List[Any]]:
+        """Items to forward, or None when `output` is a row count."""
+        if stage.batch_size:
+            if output is None:
+                return []
+            if isinstance(output, int):
+                return None
+            return list(output)
+        if stage.fan_out:
+            return list(output or ())
+        return [] if output is None else [output]
+
+    async def _take_batch(self, inbox: asyncio.Queue, size: int) -> Tuple[List[Any], bool]:
+        """Up to `size` entries; waits at most `batch_linger` after the first. True when the stream ended."""
+        entry = await inbox.get()
+        if entry is _DONE:
+            return [], True
+        batch = [entry]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.batch_linger
+        while len(batch) < size:
+            try:
+                entry = inbox.get_nowait()
+            except asyncio.QueueEmpty:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    entry = await asyncio.wait_for(inbox.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+            if entry is _DONE:
+                return batch, True
+            batch.append(entry)
+        return batch, False
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gold Price Analyzer - Ingestion Stages
+
+Reusable dedup and sink stages for IngestionPipeline. Each is an async
+callable taking one batch (a list of row dicts):
+
+    NewsDeduplicator   drops URLs seen in this run or already stored
+                       (one SELECT ... IN per batch)
+    NewsSink           executemany insert into news_events
+    CandleSink         bulk upsert into gold_price_facts + watermark
+    DollarIndexSink    upsert into dollar_index_prices on date
+
+Sinks return the number of rows written and commit once per batch.
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+License: MIT
+"""
+
+from datetime import date, datetime
+from typing import Any, Callable, Dict, List, Sequence, Set
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.core.logging import get_logger
+from app.core.metrics import ROWS_INGESTED
+from app.infrastructure.database.base import AsyncSessionLocal
+from app.infrastructure.database.models import DollarIndexPrice, NewsEvent
+from app.infrastructure.database.repositories.gold_price_repository import (
+    bulk_upsert_candles,
+    update_watermark,
+)
+
+logger = get_logger(__name__)
+
+
+class NewsEventStore:
+    """Batched dedup lookups and inserts into news_events."""
+
+    def __init__(self, session_factory: Callable[[], Any] = AsyncSessionLocal):
+        self.session_factory = session_factory
+
+    async def existing_urls(self, urls: Sequence[str]) -> Set[str]:
+        """URLs of the batch that are already stored (one query)."""
+        async with self.session_factory() as session:
+            result = await session.execute(select(NewsEvent.url).where(NewsEvent.url.in_(list(urls))))
+            return set(result.scalars().all())
+
+    async def insert(self, records: Sequence[Dict[str, Any]]) -> int:
+        """Insert records in one executemany round trip."""
+        async with self.session_factory() as session:
+            await session.execute(insert(NewsEvent), list(records))
+            await session.commit()
+        return len(records)
+
+
+class NewsDeduplicator:
+    """Batch stage: keep articles whose URL (and optionally title) is new."""
+
+    def __init__(self, store: NewsEventStore, by_title: bool = False):
+        """
+        Args:
+            store: URL lookup target
+            by_title: Also drop a title already seen in this run
+                (syndicated stories under different URLs)
+        """
+        self.store = store
+        self.by_title = by_title
+        self.duplicates = 0
+        self._seen_urls: Set[str] = set()
+        self._seen_titles: Set[str] = set()
+
+    async def __call__(self, records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        fresh = []
+        for record in records:
+            title = record.get('title')
+            if record['url'] in self._seen_urls or (self.by_title and title in self._seen_titles):
+                self.duplicates += 1
+                continue
+            self._seen_urls.add(record['url'])
+            if self.by_title:
+                self._seen_titles.add(title)
+            fresh.append(record)
+
+        if not fresh:
+            return []
+        existing = await self.store.existing_urls([r['url'] for r in fresh])
+        self.duplicates += sum(1 for r in fresh if r['url'] in existing)
+        return [r for r in fresh if r['url'] not in existing]
+
+
+class NewsSink:
+    """Batch sink: insert articles, counting them per source."""
+
+    def __init__(self, store: NewsEventStore):
+        self.store = store
+        self.saved_by_source: Dict[str, int] = {}
+
+    async def __call__(self, records: List[Dict[str, Any]]) -> int:
+        if not records:
+            return 0
+        saved = await self.store.insert(records)
+        counts: Dict[str, int] = {}
+        for record in records:
+            counts[record['source']] = counts.get(record['source'], 0) + 1
+        for source, count in counts.items():
+            self.saved_by_source[source] = self.saved_by_source.get(source, 0) + count
+            ROWS_INGESTED.labels(table="news_events", source=source).inc(count)
+        return saved
+
+
+class CandleSink:
+    """
+    Batch sink: bulk upsert candles and advance the collector's watermark.
+
+    Every batch moves the watermark to its newest candle, so feed it
+    oldest first, with one worker, in a fail_fast pipeline: otherwise a
+    failed batch is skipped by every later delta fetch.
+    """
+
+    def __init__(
+        self,
+        source: str,
+        timeframe: str,
+        session_factory: Callable[[], Any] = AsyncSessionLocal,
+    ):
+        self.source = source
+        self.timeframe = timeframe
+        self.session_factory = session_factory
+
+    async def __call__(self, candles: List[Dict[str, Any]]) -> int:
+        if not candles:
+            return 0
+        async with self.session_factory() as session:
+            written = await bulk_upsert_candles(session, candles)
+            await update_watermark(
+                session,
+                self.source,
+                self.timeframe,
+                last_timestamp=max(c['timestamp'] for c in candles),
+                rows=written,
+            )
+            await session.commit()
+        return written
+
+
+def build_dollar_index_upsert(rows: Sequence[Dict[str, Any]]):
+    """INSERT ... ON CONFLICT (date) DO UPDATE for DXY days."""
+    stmt = pg_insert(DollarIndexPrice).values(list(rows))
+    return stmt.on_conflict_do_update(
+        index_elements=[DollarIndexPrice.date],
+        set_={
+            'open': stmt.excluded.open,
+            'high': stmt.excluded.high,
+            'low': stmt.excluded.low,
+            'close': stmt.excluded.close,
+            'updated_at': func.now(),
+        },
+    )
+
+
+class DollarIndexSink:
+    """Batch sink: upsert DXY days ({'date', 'open', 'high', 'low', 'close'})."""
+
+    def __init__(self, session_factory: Callable[[], Any] = AsyncSessionLocal):
+        self.session_factory = session_factory
+
+    async def __call__(self, rows: List[Dict[str, Any]]) -> int:
+        if not rows:
+            return 0
+        # one row per date - Postgres rejects a statement touching the same key twice
+        by_date: Dict[date, Dict[str, Any]] = {}
+        for row in rows:
+            day = row['date'].date() if isinstance(row['date'], datetime) else row['date']
+            by_date[day] = {**row, 'date': day}
+        async with self.session_factory() as session:
+            result = await session.execute(build_dollar_index_upsert(list(by_date.values())))
+            await session.commit()
+        written = result.rowcount if result.rowcount is not None and result.rowcount >= 0 else len(by_date)
+        ROWS_INGESTED.labels(table="dollar_index_prices", source="dollar_index").inc(written)
+        return written
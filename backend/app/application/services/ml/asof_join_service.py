@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gold Price Analyzer - As-Of Join Service
+
+هم‌ترازسازی سری‌های خارجی (DXY، نرخ بهره، VIX، ...) روی timeline طلا
+
+Aligns any number of exogenous series onto the gold timeline: every gold
+bar gets the latest observation at or before its timestamp, unless that
+observation is older than the source's staleness limit (then NaN).
+
+Alignment is a `np.searchsorted` over sorted int64 timestamps followed by
+a positional take, and all new columns are attached with one concat, so
+the gold frame is copied once regardless of how many sources are joined.
+Per-source derived features (returns, lags) are computed once on the
+source's own timeline and cached; rolling correlations with gold are
+cached per gold timeline.
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+License: MIT
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class ExogenousSource:
+    """
+    An external series to align onto the gold timeline.
+
+    Attributes:
+        name: Column prefix (e.g. "dxy")
+        frame: DataFrame with a DatetimeIndex (naive = UTC)
+        columns: Columns to join
+        max_staleness: Oldest observation still considered current
+        availability_lag: Delay before an observation is known
+            (e.g. a daily close stamped 00:00 but published at 21:00)
+        return_periods: pct_change periods on the source's own bars
+        lags: Lags (in source bars) of the first column
+        corr_windows: Rolling correlation windows with gold returns
+    """
+
+    name: str
+    frame: pd.DataFrame
+    columns: Sequence[str] = ("close",)
+    max_staleness: pd.Timedelta = pd.Timedelta(days=4)
+    availability_lag: pd.Timedelta = pd.Timedelta(0)
+    return_periods: Sequence[int] = (1, 5)
+    lags: Sequence[int] = ()
+    corr_windows: Sequence[int] = ()
+
+
+def to_utc_ns(index: pd.Index) -> np.ndarray:
+    """DatetimeIndex -> int64 nanoseconds since epoch (naive treated as UTC)."""
+    index = pd.DatetimeIndex(index)
+    if index.tz is None:
+        index = index.tz_localize("UTC")
+    return index.tz_convert("UTC").as_unit("ns").asi8
+
+
+def asof_positions(
+    left_ns: np.ndarray,
+    right_ns: np.ndarray,
+    max_staleness_ns: Optional[int] = None,
+) -> np.ndarray:
+    """
+    For every left timestamp, position of the latest right timestamp <= it.
+
+    Args:
+        left_ns: Sorted target timestamps
+        right_ns: Sorted source timestamps
+        max_staleness_ns: Maximum allowed age of the matched observation
+
+    Returns:
+        int64 positions into `right_ns`; -1 where no (fresh) match exists
+    """
+    pos = np.searchsorted(right_ns, left_ns, side="right") - 1
+
+    missing = pos < 0
+    if max_staleness_ns is not None and len(right_ns):
+        age = left_ns - right_ns[np.maximum(pos, 0)]
+        missing |= age > max_staleness_ns
+
+    pos[missing] = -1
+    return pos
+
+
+def take_asof(values: np.ndarray, positions: np.ndarray) -> np.ndarray:
+    """Positional take with NaN where `positions == -1`."""
+    if len(values) == 0:
+        return np.full(len(positions), np.nan)
+    out = values.astype(np.float64, copy=False)[np.maximum(positions, 0)]
+    out[positions < 0] = np.nan
+    return out
+
+
+def _fingerprint(obj: pd.DataFrame | pd.Series) -> Tuple[int, int]:
+    return len(obj), int(pd.util.hash_pandas_object(obj, index=True).sum())
+
+
+class AsofJoinService:
+    """
+    As-of join engine with a per-source feature cache.
+
+    Example:
+        >>> joiner = AsofJoinService()
+        >>> dxy = ExogenousSource("dxy", df_dxy, lags=(1, 5), corr_windows=(20, 60))
+        >>> df = joiner.join(df_gold, [dxy])
+    """
+
+    def __init__(self, cache_size: int = 64):
+        """
+        Initialize service.
+
+        Args:
+            cache_size: Maximum entries in each of the source and correlation caches
+        """
+        self.cache_size = cache_size
+        self._source_cache: "OrderedDict[Tuple, pd.DataFrame]" = OrderedDict()
+        self._corr_cache: "OrderedDict[Tuple, np.ndarray]" = OrderedDict()
+
+    def clear_cache(self) -> None:
+        """Drop all cached derived features."""
+        self._source_cache.clear()
+        self._corr_cache.clear()
+
+    def source_features(self, source: ExogenousSource) -> pd.DataFrame:
+        """
+        Raw columns + returns + lags on the source's own timeline (cached).
+        """
+        frame = source.frame[list(source.columns)].sort_index()
+        key = (
+            source.name,
+            tuple(source.columns),
+            tuple(source.return_periods),
+            tuple(source.lags),
+            _fingerprint(frame),
+        )
+
+        cached = self._source_cache.get(key)
+        if cached is not None:
+            self._source_cache.move_to_end(key)
+            return cached
+
+        base = frame[source.columns[0]].astype(float)
+        features = {f"{source.name}_{col}": frame[col].astype(float) for col in source.columns}
+
+        for period in source.return_periods:
+            features[f"{source.name}_return_{period}"] = base.pct_change(period)
+
+        for lag in source.lags:
+            features[f"{source.name}_{source.columns[0]}_lag_{lag}"] = base.shift(lag)
+
+        derived = pd.DataFrame(features, index=frame.index)
+        self._store(self._source_cache, key, derived)
+
+        logger.debug("asof_source_features_computed", source=source.name, rows=len(derived))
+        return derived
+
+    def align(
+        self,
+        target_index: pd.Index,
+        source: ExogenousSource,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Align a source's feature columns onto `target_index`.
+
+        Returns:
+            Column name -> float64 array aligned with `target_index`
+        """
+        features = self.source_features(source)
+
+        left_ns = to_utc_ns(target_index)
+        right_ns = to_utc_ns(features.index) + source.availability_lag.value
+        positions = asof_positions(left_ns, right_ns, source.max_staleness.value)
+
+        aligned = {
+            col: take_asof(features[col].to_numpy(), positions)
+            for col in features.columns
+        }
+
+        # age of the joined observation (staleness visible to the model)
+        age_hours = (left_ns - right_ns[np.maximum(positions, 0)]) / 3.6e12
+        age_hours[positions < 0] = np.nan
+        aligned[f"{source.name}_age_hours"] = age_hours
+
+        matched = int((positions >= 0).sum())
+        logger.debug(
+            "asof_source_aligned",
+            source=source.name,
+            matched=matched,
+            missing=len(positions) - matched,
+        )
+        return aligned
+
+    def rolling_correlation(
+        self,
+        gold_returns: pd.Series,
+        source_returns: np.ndarray,
+        source_name: str,
+        window: int,
+    ) -> np.ndarray:
+        """Rolling correlation on the gold timeline (cached)."""
+        key = (source_name, window, _fingerprint(gold_returns), hash(source_returns.tobytes()))
+
+        cached = self._corr_cache.get(key)
+        if cached is not None:
+            self._corr_cache.move_to_end(key)
+            return cached
+
+        corr = gold_returns.rolling(window).corr(
+            pd.Series(source_returns, index=gold_returns.index)
+        ).to_numpy()
+        self._store(self._corr_cache, key, corr)
+        return corr
+
+    def join(
+        self,
+        df: pd.DataFrame,
+        sources: Sequence[ExogenousSource],
+        price_column: str = "close",
+    ) -> pd.DataFrame:
+        """
+        Attach all sources' aligned features to the gold frame.
+
+        Args:
+            df: Gold frame with a sorted DatetimeIndex
+            sources: Exogenous sources
+            price_column: Gold column used for correlation features
+
+        Returns:
+            New DataFrame: `df` columns followed by the joined features
+        """
+        columns: Dict[str, np.ndarray] = {}
+        gold_returns: Optional[pd.Series] = None
+
+        for source in sources:
+            if source.frame is None or source.frame.empty:
+                logger.warning("asof_source_empty", source=source.name)
+                continue
+
+            aligned = self.align(df.index, source)
+            columns.update(aligned)
+
+            if source.corr_windows:
+                if gold_returns is None:
+                    gold_returns = df[price_column].pct_change()
+                # correlate against the source's 1-bar return aligned to gold bars
+                level = aligned[f"{source.name}_{source.columns[0]}"]
+                exo_returns = np.full_like(level, np.nan)
+                exo_returns[1:] = level[1:] / level[:-1] - 1
+                for window in source.corr_windows:
+                    columns[f"{source.name}_corr_{window}"] = self.rolling_correlation(
+                        gold_returns, exo_returns, source.name, window
+                    )
+
+        if not columns:
+            return df
+
+        logger.info("asof_join_completed", sources=[s.name for s in sources], columns=len(columns))
+        return pd.concat([df, pd.DataFrame(columns, index=df.index)], axis=1)
+
+    def _store(self, cache: "OrderedDict[Tuple, Any]", key: Tuple, value: Any) -> None:
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > self.cache_size:
+            cache.popitem(last=False)
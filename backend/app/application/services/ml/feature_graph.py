@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gold Price Analyzer - Feature Graph
+
+Declarative feature registry. Every feature names its inputs and the
+number of extra rows of history it needs (`window`); the registry turns
+a set of requested columns into a dependency-ordered plan, so shared
+intermediates are computed once per evaluation:
+
+    returns      -> returns_lag_*, volatility_*
+    sma_20       -> bb_middle -> bb_upper / bb_lower
+    ema_12/26    -> macd -> macd_signal -> macd_histogram
+
+Only the columns a caller asks for (and what they depend on) are computed.
+
+    registry = get_feature_registry()
+    registry.evaluate(df, ["rsi", "volatility_5d"])        # batch
+    live = IncrementalFeatures(registry, ["rsi", "macd"])  # new bars only
+    live.update(new_bars)
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+License: MIT
+"""
+
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+if TYPE_CHECKING:
+    from app.application.services.ml.feature_matrix import FeatureMatrix
+
+# ستون‌های خروجی به همان ترتیب قبلی (calculate_all_indicators / add_price_features)
+INDICATOR_FEATURES = [
+    'sma_20', 'sma_50', 'ema_12', 'ema_26', 'rsi',
+    'macd', 'macd_signal', 'macd_histogram',
+    'bb_upper', 'bb_middle', 'bb_lower',
+]
+
+LAGS = (1, 2, 3, 5, 7)
+
+PRICE_FEATURES = [
+    'returns', 'returns_5d', 'returns_10d', 'returns_20d',
+    'volatility_5d', 'volatility_10d', 'volatility_20d',
+    'high_low_ratio', 'close_open_ratio',
+    'volume_sma_5', 'volume_ratio',
+    *[col for lag in LAGS for col in (f'close_lag_{lag}', f'returns_lag_{lag}')],
+]
+
+SENTIMENT_FEATURES = ['sentiment_lag_1', 'sentiment_lag_3', 'sentiment_ma_5']
+
+
+def ema_window(span: int) -> int:
+    """Rows after which the EMA start-up error is below (1 - 2/(span+1))^(15*span) ~ 1e-13."""
+    return 15 * span
+
+
+@dataclass(frozen=True)
+class Feature:
+    """One node of the graph."""
+
+    name: str
+    inputs: Tuple[str, ...]
+    compute: Callable[..., pd.Series]
+    window: int = 0
+    group: str = 'engineered'
+    public: bool = True
+
+
+class FeatureRegistry:
+    """
+    Named features and their dependencies.
+
+    Names that are not registered are source columns and must be present
+    in the evaluated frame (open, high, low, close, volume,
+    sentiment_score, ...).
+    """
+
+    def __init__(self):
+        self._features: Dict[str, Feature] = {}
+
+    def add(
+        self,
+        name: str,
+        inputs: Sequence[str],
+        compute: Callable[..., pd.Series],
+        window: int = 0,
+        group: str = 'engineered',
+        public: bool = True,
+    ) -> Feature:
+        """
+        Register a feature.
+
+        Args:
+            name: Output column
+            inputs: Columns / features passed positionally to `compute`
+            compute: Function of the input Series
+            window: Extra rows of history needed beyond the current row
+            group: price, technical, sentiment, engineered
+            public: False for intermediates that are never returned by default
+        """
+        if name in self._features:
+            raise ValueError(f"Feature already registered: {name}")
+        feature = Feature(name, tuple(inputs), compute, window, group, public)
+        self._features[name] = feature
+        return feature
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._features
+
+    def __getitem__(self, name: str) -> Feature:
+        return self._features[name]
+
+    def names(self, group: Optional[str] = None) -> List[str]:
+        """Public features in registration order (optionally one group)."""
+        return [
+            f.name for f in self._features.values()
+            if f.public and (group is None or f.group == group)
+        ]
+
+    def plan(self, targets: Iterable[str]) -> List[Feature]:
+        """
+        Features needed for `targets`, each once, dependencies first.
+
+        Raises:
+            ValueError: dependency cycle
+        """
+        order: List[Feature] = []
+        done: set = set()
+        visiting: set = set()
+
+        def visit(name: str) -> None:
+            if name in done or name not in self._features:
+                return
+            if name in visiting:
+                raise ValueError(f"Feature dependency cycle at {name}")
+            visiting.add(name)
+            feature = self._features[name]
+            for dep in feature.inputs:
+                visit(dep)
+            visiting.discard(name)
+            done.add(name)
+            order.append(feature)
+
+        for target in targets:
+            visit(target)
+        return order
+
+    def sources(self, targets: Iterable[str]) -> List[str]:
+        """Source columns the targets read."""
+        needed = []
+        for feature in self.plan(targets):
+            needed.extend(i for i in feature.inputs if i not in self._features and i not in needed)
+        needed.extend(t for t in targets if t not in self._features and t not in needed)
+        return needed
+
+    def lookback(self, targets: Iterable[str]) -> int:
+        """Rows of history needed before a new row for exact values."""
+        depth: Dict[str, int] = {}
+        for feature in self.plan(targets):
+            depth[feature.name] = feature.window + max(
+                (depth.get(i, 0) for i in feature.inputs), default=0
+            )
+        return max((depth.get(t, 0) for t in targets), default=0)
+
+    def evaluate(self, df: pd.DataFrame, targets: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """
+        Compute `targets` (default: every public feature) over `df`.
+
+        Raises:
+            KeyError: a source column is missing from `df`
+        """
+        targets = list(targets) if targets is not None else self.names()
+        missing = [c for c in self.sources(targets) if c not in df.columns]
+        if missing:
+            raise KeyError(f"Missing source columns: {missing}")
+
+        values: Dict[str, pd.Series] = {}
+        for feature in self.plan(targets):
+            args = [values[i] if i in values else df[i] for i in feature.inputs]
+            values[feature.name] = feature.compute(*args)
+
+        return pd.DataFrame(
+            {t: values[t] if t in values else df[t] for t in targets},
+            index=df.index,
+        )
+
+    def evaluate_into(self, df: pd.DataFrame, targets: Sequence[str], out: "FeatureMatrix") -> None:
+        """
+        Compute `targets` and write each one into its slot of `out`.
+
+        Intermediates are released after their last consumer, so at most
+        a few float64 columns are alive next to the float32 matrix.
+        """
+        targets = list(targets)
+        missing = [c for c in self.sources(targets) if c not in df.columns]
+        if missing:
+            raise KeyError(f"Missing source columns: {missing}")
+
+        plan = self.plan(targets)
+        wanted = set(targets)
+        consumers = Counter(i for feature in plan for i in feature.inputs)
+
+        for name in targets:
+            if name not in self._features:
+                out[name] = df[name]
+
+        values: Dict[str, pd.Series] = {}
+        for feature in plan:
+            result = feature.compute(*[values[i] if i in values else df[i] for i in feature.inputs])
+            if feature.name in wanted:
+                out[feature.name] = result
+            if consumers[feature.name]:
+                values[feature.name] = result
+            for i in feature.inputs:
+                consumers[i] -= 1
+                if consumers[i] == 0:
+                    values.pop(i, None)
+
+
+class IncrementalFeatures:
+    """
+    Evaluate the same graph on new bars only.
+
+    Keeps the last `lookback(targets)` source rows; every `update`
+    evaluates buffer + new bars and returns the rows of the new bars.
+    """
+
+    def __init__(
+        self,
+        registry: "FeatureRegistry",
+        targets: Sequence[str],
+        history: Optional[pd.DataFrame] = None,
+    ):
+        self.registry = registry
+        self.targets = list(targets)
+        self.columns = registry.sources(self.targets)
+        self.lookback = registry.lookback(self.targets)
+        self._buffer = pd.DataFrame(columns=self.columns)
+        if history is not None and not history.empty:
+            self._buffer = history[self.columns].iloc[-self.lookback:] if self.lookback else self._buffer
+
+    def update(self, bars: pd.DataFrame) -> pd.DataFrame:
+        """Feature rows for `bars` (appended after everything seen so far)."""
+        if bars.empty:
+            return pd.DataFrame(columns=self.targets)
+        frame = bars[self.columns] if self._buffer.empty else pd.concat([self._buffer, bars[self.columns]])
+        result = self.registry.evaluate(frame, self.targets).iloc[-len(bars):]
+        if self.lookback:
+            self._buffer = frame.iloc[-self.lookback:]
+        return result
+
+
+# ====================================
+# Default feature set
+# ====================================
+def _rsi(gain: pd.Series, loss: pd.Series) -> pd.Series:
+    rs = gain / loss
+    return 100 - (100 / (1 + rs))
+
+
+def build_default_registry() -> FeatureRegistry:
+    """
+    Indicators, price features and sentiment features used by the ML pipeline.
+    
+    Registration order is the column order of INDICATOR_FEATURES,
+    PRICE_FEATURES and SENTIMENT_FEATURES.
+    """
+    r = FeatureRegistry()
+
+    # --- intermediates ---
+    r.add('close_diff', ['close'], lambda c: c.diff(), window=1, public=False)
+    r.add('close_std_20', ['close'], lambda c: c.rolling(window=20).std(), window=19, public=False)
+    r.add('rsi_gain', ['close_diff'], lambda d: d.where(d > 0, 0).rolling(window=14).mean(), window=13, public=False)
+    r.add('rsi_loss', ['close_diff'], lambda d: (-d.where(d < 0, 0)).rolling(window=14).mean(), window=13, public=False)
+
+    # --- technical ---
+    r.add('sma_20', ['close'], lambda c: c.rolling(window=20).mean(), window=19, group='technical')
+    r.add('sma_50', ['close'], lambda c: c.rolling(window=50).mean(), window=49, group='technical')
+    r.add('ema_12', ['close'], lambda c: c.ewm(span=12, adjust=False).mean(), window=ema_window(12), group='technical')
+    r.add('ema_26', ['close'], lambda c: c.ewm(span=26, adjust=False).mean(), window=ema_window(26), group='technical')
+    r.add('rsi', ['rsi_gain', 'rsi_loss'], _rsi, group='technical')
+    r.add('macd', ['ema_12', 'ema_26'], lambda fast, slow: fast - slow, group='technical')
+    r.add('macd_signal', ['macd'], lambda m: m.ewm(span=9, adjust=False).mean(), window=ema_window(9), group='technical')
+    r.add('macd_histogram', ['macd', 'macd_signal'], lambda m, s: m - s, group='technical')
+    r.add('bb_upper', ['bb_middle', 'close_std_20'], lambda m, sd: m + sd * 2, group='technical')
+    r.add('bb_middle', ['sma_20'], lambda s: s, group='technical')
+    r.add('bb_lower', ['bb_middle', 'close_std_20'], lambda m, sd: m - sd * 2, group='technical')
+
+    # --- price ---
+    r.add('returns', ['close'], lambda c: c.pct_change(), window=1)
+    for n in (5, 10, 20):
+        r.add(f'returns_{n}d', ['close'], lambda c, n=n: c.pct_change(n), window=n)
+    for n in (5, 10, 20):
+        r.add(f'volatility_{n}d', ['returns'], lambda x, n=n: x.rolling(n).std(), window=n - 1)
+    r.add('high_low_ratio', ['high', 'low'], lambda h, l: h / l)
+    r.add('close_open_ratio', ['close', 'open'], lambda c, o: c / o)
+    r.add('volume_sma_5', ['volume'], lambda v: v.rolling(5).mean(), window=4)
+    r.add('volume_ratio', ['volume', 'volume_sma_5'], lambda v, s: v / s)
+    for lag in LAGS:
+        r.add(f'close_lag_{lag}', ['close'], lambda c, lag=lag: c.shift(lag), window=lag)
+        r.add(f'returns_lag_{lag}', ['returns'], lambda x, lag=lag: x.shift(lag), window=lag)
+
+    # --- sentiment ---
+    r.add('sentiment_lag_1', ['sentiment_score'], lambda s: s.shift(1), window=1, group='sentiment')
+    r.add('sentiment_lag_3', ['sentiment_score'], lambda s: s.shift(3), window=3, group='sentiment')
+    r.add('sentiment_ma_5', ['sentiment_score'], lambda s: s.rolling(5).mean(), window=4, group='sentiment')
+    return r
+
+
+@lru_cache(maxsize=1)
+def get_feature_registry() -> FeatureRegistry:
+    """Process-wide default registry."""
+    return build_default_registry()
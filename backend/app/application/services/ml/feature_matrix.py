@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gold Price Analyzer - Feature Matrix
+
+One preallocated, C-contiguous float32 block with named column offsets,
+filled column by column in place. Replaces a DataFrame that grows one
+float64 column at a time (every assignment re-blocks, and
+`.values` at the end copies everything again).
+
+    matrix = FeatureMatrix.allocate(index, columns)
+    matrix["rsi"] = rsi_series          # written into its slot
+    matrix.scale_minmax_(scaler)        # in place
+    windows = sequence_windows(matrix.values, 60)   # view, no copy
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+License: MIT
+"""
+
+from typing import Dict, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+DTYPE = np.float32
+
+
+class FeatureMatrix:
+    """float32 rows x named columns, stored in one contiguous block."""
+
+    def __init__(self, values: np.ndarray, columns: Sequence[str], index: pd.Index):
+        if values.ndim != 2 or values.shape != (len(index), len(columns)):
+            raise ValueError(
+                f"values shape {values.shape} does not match {len(index)} rows x {len(columns)} columns"
+            )
+        self.values = values
+        self.columns: List[str] = list(columns)
+        self.offsets: Dict[str, int] = {name: i for i, name in enumerate(self.columns)}
+        self.index = index
+
+    @classmethod
+    def allocate(cls, index: pd.Index, columns: Sequence[str]) -> "FeatureMatrix":
+        """Uninitialized matrix (every column must be written before use)."""
+        return cls(np.empty((len(index), len(columns)), dtype=DTYPE), columns, index)
+
+    @property
+    def shape(self):
+        return self.values.shape
+
+    @property
+    def nbytes(self) -> int:
+        return self.values.nbytes
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.offsets
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        """Column view (strided, no copy)."""
+        return self.values[:, self.offsets[name]]
+
+    def __setitem__(self, name: str, data: Union[pd.Series, np.ndarray, float]) -> None:
+        """Write a column into its slot (cast to float32)."""
+        if isinstance(data, pd.Series):
+            data = data.to_numpy(dtype=np.float64, na_value=np.nan)
+        np.copyto(self.values[:, self.offsets[name]], data, casting="unsafe")
+
+    def valid_rows(self, extra: Optional[np.ndarray] = None) -> np.ndarray:
+        """Boolean mask of rows without NaN (and without NaN in `extra`)."""
+        mask = ~np.isnan(self.values).any(axis=1)
+        if extra is not None:
+            mask &= ~np.isnan(extra).reshape(len(mask), -1).any(axis=1)
+        return mask
+
+    def take_rows(self, mask: np.ndarray) -> "FeatureMatrix":
+        """
+        Rows where `mask` is True.
+
+        NaN rows of a feature matrix are the warm-up at the start and the
+        target horizon at the end, so the kept rows are usually one
+        contiguous run and the result is a view; otherwise one copy.
+        """
+        kept = np.flatnonzero(mask)
+        if len(kept) == 0:
+            return FeatureMatrix(self.values[:0], self.columns, self.index[:0])
+        first, last = kept[0], kept[-1] + 1
+        if last - first == len(kept):
+            return FeatureMatrix(self.values[first:last], self.columns, self.index[first:last])
+        return FeatureMatrix(np.ascontiguousarray(self.values[kept]), self.columns, self.index[kept])
+
+    def scale_minmax_(self, scaler, fit: bool = True) -> "FeatureMatrix":
+        """
+        Min-max scale in place with a sklearn MinMaxScaler.
+
+        Same arithmetic as `scaler.transform` (X * scale_ + min_) without
+        the float64 copy.
+        """
+        if fit:
+            scaler.fit(self.values)
+        self.values *= scaler.scale_.astype(DTYPE, copy=False)
+        self.values += scaler.min_.astype(DTYPE, copy=False)
+        return self
+
+    def to_frame(self) -> pd.DataFrame:
+        """DataFrame over the same block (single float32 block, no copy)."""
+        return pd.DataFrame(self.values, index=self.index, columns=self.columns, copy=False)
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "FeatureMatrix":
+        """Copy a DataFrame into a new float32 matrix."""
+        matrix = cls.allocate(df.index, df.columns)
+        for name in df.columns:
+            matrix[name] = df[name]
+        return matrix
+
+
+def sequence_windows(values: np.ndarray, sequence_length: int) -> np.ndarray:
+    """
+    Read-only view of every `sequence_length` window, in LSTM layout.
+
+    Returns shape (len(values) - sequence_length, sequence_length, features):
+    window i is values[i : i + sequence_length] and predicts row
+    i + sequence_length. Nothing is copied.
+    """
+    if len(values) <= sequence_length:
+        return np.empty((0, sequence_length, values.shape[1]), dtype=values.dtype)
+    windows = sliding_window_view(values, sequence_length, axis=0)  # (n - L + 1, features, L)
+    return windows[:-1].transpose(0, 2, 1)
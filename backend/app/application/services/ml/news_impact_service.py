@@ -0,0 +1,440 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gold Price Analyzer - News Impact Service
+
+سیگنال آنلاین تأثیر اخبار با decay نمایی
+
+Every scored article contributes `impact_score × confidence`, which then
+decays with a configurable half-life:
+
+    value(t) = Σ contribution_i · 2^(-(t - t_i) / half_life)
+
+Two series are kept: `intensity` (unsigned, how much news is moving the
+market) and `pressure` (signed by the sentiment direction).
+
+Because the sum is linear, the running value is updated in O(1) per
+article (decay to the article time, then add) and per tick (decay to
+now). The state row and one checkpoint per article are persisted, so the
+signal survives restarts and can be evaluated at any past timestamp by
+finding the last checkpoint at or before it and decaying forward - no
+rescan of news history, for live inference or for training.
+
+Articles published before the current state time (late arrivals,
+re-scoring) are applied exactly: their decayed contribution is added to
+the running value and to every later checkpoint with one UPDATE.
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+License: MIT
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, UTC
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import delete, func, insert, select, text, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.application.services.ml.asof_join_service import asof_positions, to_utc_ns
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.infrastructure.database.models import NewsImpactCheckpoint, NewsImpactState
+from app.infrastructure.database.repositories.sentiment_rollup_repository import ScoredArticle
+
+logger = get_logger(__name__)
+
+SIGNAL_NAME = "news_impact"
+
+# ستون‌های سیگنال در dataset های ML | Signal columns in ML datasets
+NEWS_IMPACT_FEATURES = ["news_impact_intensity", "news_impact_pressure"]
+
+# بعد از 20 نیمه عمر سهم یک خبر کمتر از یک میلیونیم است
+NEGLIGIBLE_HALF_LIVES = 20
+
+CHECKPOINT_CHUNK = 5000
+
+
+def contribution(article: ScoredArticle, sign: int = 1) -> Tuple[float, float]:
+    """(intensity, pressure) added by one article."""
+    value = sign * article.impact_score * article.confidence
+    return value, value * float(np.sign(article.score))
+
+
+def decay_factor(seconds: float, half_life_seconds: float) -> float:
+    """2^(-Δt / half_life); Δt <= 0 means no decay."""
+    return 2.0 ** (-max(seconds, 0.0) / half_life_seconds)
+
+
+def _utc(ts: datetime) -> datetime:
+    return ts.replace(tzinfo=UTC) if ts.tzinfo is None else ts
+
+
+@dataclass
+class DecayedImpact:
+    """
+    In-memory running state.
+
+    Attributes:
+        half_life_seconds: Decay half-life
+        as_of: Time of the newest applied article
+        intensity: Unsigned value at `as_of`
+        pressure: Signed value at `as_of`
+        article_count: Articles applied
+    """
+
+    half_life_seconds: float
+    as_of: Optional[datetime] = None
+    intensity: float = 0.0
+    pressure: float = 0.0
+    article_count: int = 0
+
+    def value_at(self, ts: datetime) -> Tuple[float, float]:
+        """
+        (intensity, pressure) decayed to `ts`.
+
+        Only valid for ts >= as_of; earlier times come from checkpoints.
+        """
+        if self.as_of is None:
+            return 0.0, 0.0
+        factor = decay_factor((_utc(ts) - self.as_of).total_seconds(), self.half_life_seconds)
+        return self.intensity * factor, self.pressure * factor
+
+    def add(self, ts: datetime, intensity: float, pressure: float) -> bool:
+        """
+        Apply one contribution.
+
+        Returns:
+            bool: True if applied in order (ts >= as_of), False for a late article
+        """
+        ts = _utc(ts)
+        self.article_count += 1
+
+        if self.as_of is None or ts >= self.as_of:
+            self.intensity, self.pressure = self.value_at(ts)
+            self.intensity += intensity
+            self.pressure += pressure
+            self.as_of = ts
+            return True
+
+        factor = decay_factor((self.as_of - ts).total_seconds(), self.half_life_seconds)
+        self.intensity += intensity * factor
+        self.pressure += pressure * factor
+        return False
+
+
+def decayed_series(
+    query_ns: np.ndarray,
+    checkpoint_ns: np.ndarray,
+    intensity: np.ndarray,
+    pressure: np.ndarray,
+    half_life_seconds: float,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Evaluate the signal at many timestamps at once.
+
+    Args:
+        query_ns: Sorted query timestamps (int64 ns)
+        checkpoint_ns: Sorted checkpoint timestamps (int64 ns)
+        intensity, pressure: Checkpoint values
+        half_life_seconds: Decay half-life
+
+    Returns:
+        (intensity, pressure) arrays aligned with `query_ns` (0 before the first article)
+    """
+    out_i = np.zeros(len(query_ns))
+    out_p = np.zeros(len(query_ns))
+    if len(checkpoint_ns) == 0:
+        return out_i, out_p
+
+    pos = asof_positions(query_ns, checkpoint_ns)
+    found = pos >= 0
+    p = pos[found]
+    age = (query_ns[found] - checkpoint_ns[p]) / 1e9
+    factor = np.exp2(-age / half_life_seconds)
+    out_i[found] = intensity[p] * factor
+    out_p[found] = pressure[p] * factor
+    return out_i, out_p
+
+
+class NewsImpactService:
+    """
+    Persistent decayed news impact.
+
+    Example:
+        >>> service = get_news_impact_service()
+        >>> async with AsyncSessionLocal() as session:
+        ...     await service.record(session, scored_articles)
+        ...     await session.commit()
+        ...     now = await service.current(session)
+    """
+
+    def __init__(self, half_life_hours: Optional[float] = None, name: str = SIGNAL_NAME):
+        """
+        Args:
+            half_life_hours: Decay half-life (default: NEWS_IMPACT_HALF_LIFE_HOURS)
+            name: Signal name (state row / checkpoint key)
+        """
+        self.half_life_seconds = (half_life_hours or settings.NEWS_IMPACT_HALF_LIFE_HOURS) * 3600
+        self.name = name
+
+    # ------------------------------------------------------------------
+    # State
+    # ------------------------------------------------------------------
+
+    async def load_state(self, session: AsyncSession, for_update: bool = False) -> Optional[DecayedImpact]:
+        """Persisted state, or None if missing or built with another half-life."""
+        stmt = select(NewsImpactState).where(NewsImpactState.name == self.name)
+        if for_update:
+            stmt = stmt.with_for_update()
+        row = (await session.execute(stmt)).scalar_one_or_none()
+
+        if row is None or row.half_life_seconds != self.half_life_seconds:
+            return None
+
+        return DecayedImpact(
+            half_life_seconds=self.half_life_seconds,
+            as_of=row.as_of,
+            intensity=row.intensity,
+            pressure=row.pressure,
+            article_count=row.article_count,
+        )
+
+    async def _save_state(self, session: AsyncSession, state: DecayedImpact) -> None:
+        await session.merge(
+            NewsImpactState(
+                name=self.name,
+                half_life_seconds=self.half_life_seconds,
+                as_of=state.as_of,
+                intensity=state.intensity,
+                pressure=state.pressure,
+                article_count=state.article_count,
+            )
+        )
+
+    async def _insert_checkpoints(self, session: AsyncSession, rows: List[Dict[str, Any]]) -> None:
+        for i in range(0, len(rows), CHECKPOINT_CHUNK):
+            await session.execute(insert(NewsImpactCheckpoint), rows[i:i + CHECKPOINT_CHUNK])
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    async def record(
+        self,
+        session: AsyncSession,
+        articles: Iterable[ScoredArticle],
+        sign: int = 1,
+    ) -> DecayedImpact:
+        """
+        Apply scored articles to the signal. Does not commit.
+
+        Args:
+            session: Database session (same transaction as the scoring)
+            articles: Newly scored articles
+            sign: -1 to retract a previous score (re-scoring)
+
+        Returns:
+            DecayedImpact: Updated state
+        """
+        articles = sorted(articles, key=lambda a: _utc(a.published_at))
+        if not articles:
+            state = await self.load_state(session)
+            return state or DecayedImpact(self.half_life_seconds)
+
+        state = await self.load_state(session, for_update=True)
+        if state is None:
+            # اولین اجرا یا تغییر half-life: ساخت کامل از news_events
+            # (امتیازهای جدید flush شده‌اند و در rebuild حساب می‌شوند)
+            await session.flush()
+            state = await self.rebuild(session)
+            if sign > 0:
+                return state
+            await session.flush()
+
+        pending: List[Dict[str, Any]] = []
+        late = 0
+
+        for article in articles:
+            ts = _utc(article.published_at)
+            delta_i, delta_p = contribution(article, sign)
+
+            if state.add(ts, delta_i, delta_p):
+                pending.append({
+                    "name": self.name,
+                    "ts": ts,
+                    "intensity": state.intensity,
+                    "pressure": state.pressure,
+                })
+            else:
+                await self._apply_late(session, ts, delta_i, delta_p)
+                late += 1
+
+        await self._insert_checkpoints(session, pending)
+        await self._save_state(session, state)
+
+        logger.info("news_impact_recorded",
+                   articles=len(articles),
+                   late=late,
+                   intensity=round(state.intensity, 4),
+                   pressure=round(state.pressure, 4))
+        return state
+
+    async def _apply_late(self, session: AsyncSession, ts: datetime, delta_i: float, delta_p: float) -> None:
+        """Insert a checkpoint in the past and shift every later checkpoint."""
+        base_i, base_p = await self.value_at(session, ts)
+
+        await session.execute(
+            insert(NewsImpactCheckpoint).values(
+                name=self.name, ts=ts, intensity=base_i + delta_i, pressure=base_p + delta_p
+            )
+        )
+
+        factor = func.power(
+            2.0,
+            -func.extract("epoch", NewsImpactCheckpoint.ts - ts) / self.half_life_seconds,
+        )
+        await session.execute(
+            update(NewsImpactCheckpoint)
+            .where(NewsImpactCheckpoint.name == self.name, NewsImpactCheckpoint.ts > ts)
+            .values(
+                intensity=NewsImpactCheckpoint.intensity + delta_i * factor,
+                pressure=NewsImpactCheckpoint.pressure + delta_p * factor,
+            )
+        )
+
+    async def rebuild(self, session: AsyncSession) -> DecayedImpact:
+        """
+        Recompute state and checkpoints from `news_events`. Does not commit.
+
+        Used on first run, after a half-life change and after forced re-analysis.
+        """
+        result = await session.execute(
+            text(
+                """
+                SELECT published_at, sentiment_score, confidence, impact_score
+                FROM news_events
+                WHERE sentiment_score IS NOT NULL
+                ORDER BY published_at ASC, id ASC
+                """
+            )
+        )
+
+        state = DecayedImpact(self.half_life_seconds)
+        rows: List[Dict[str, Any]] = []
+
+        for published_at, score, confidence, impact_score in result:
+            article = ScoredArticle(
+                published_at=published_at,
+                score=float(score or 0),
+                confidence=float(confidence or 0),
+                impact_score=float(impact_score or 0),
+                price_impact=None,
+            )
+            state.add(article.published_at, *contribution(article))
+            rows.append({
+                "name": self.name,
+                "ts": state.as_of,
+                "intensity": state.intensity,
+                "pressure": state.pressure,
+            })
+
+        await session.execute(delete(NewsImpactCheckpoint).where(NewsImpactCheckpoint.name == self.name))
+        await self._insert_checkpoints(session, rows)
+        await self._save_state(session, state)
+
+        logger.info("news_impact_rebuilt",
+                   articles=state.article_count,
+                   half_life_hours=self.half_life_seconds / 3600)
+        return state
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    async def current(self, session: AsyncSession, at: Optional[datetime] = None) -> Dict[str, Any]:
+        """Live value: persisted state decayed to `at` (default: now). O(1)."""
+        at = _utc(at or datetime.now(UTC))
+        state = await self.load_state(session) or DecayedImpact(self.half_life_seconds)
+
+        if state.as_of is not None and at < state.as_of:
+            intensity, pressure = await self.value_at(session, at)
+        else:
+            intensity, pressure = state.value_at(at)
+
+        return {
+            "at": at.isoformat(),
+            "half_life_hours": self.half_life_seconds / 3600,
+            "intensity": intensity,
+            "pressure": pressure,
+            "last_article_at": state.as_of.isoformat() if state.as_of else None,
+        }
+
+    async def value_at(self, session: AsyncSession, ts: datetime) -> Tuple[float, float]:
+        """(intensity, pressure) at any timestamp via the last checkpoint <= ts."""
+        ts = _utc(ts)
+        row = (
+            await session.execute(
+                select(NewsImpactCheckpoint.ts, NewsImpactCheckpoint.intensity, NewsImpactCheckpoint.pressure)
+                .where(NewsImpactCheckpoint.name == self.name, NewsImpactCheckpoint.ts <= ts)
+                .order_by(NewsImpactCheckpoint.ts.desc(), NewsImpactCheckpoint.id.desc())
+                .limit(1)
+            )
+        ).first()
+
+        if row is None:
+            return 0.0, 0.0
+
+        factor = decay_factor((ts - row.ts).total_seconds(), self.half_life_seconds)
+        return row.intensity * factor, row.pressure * factor
+
+    def checkpoints_query(self, start: Optional[datetime] = None, end: Optional[datetime] = None):
+        """
+        Checkpoints needed to evaluate the signal on [start, end].
+
+        Checkpoints older than `NEGLIGIBLE_HALF_LIVES` half-lives before
+        `start` are skipped.
+        """
+        stmt = (
+            select(NewsImpactCheckpoint.ts, NewsImpactCheckpoint.intensity, NewsImpactCheckpoint.pressure)
+            .where(NewsImpactCheckpoint.name == self.name)
+            .order_by(NewsImpactCheckpoint.ts, NewsImpactCheckpoint.id)
+        )
+        if start is not None:
+            horizon = pd.Timedelta(seconds=NEGLIGIBLE_HALF_LIVES * self.half_life_seconds)
+            stmt = stmt.where(NewsImpactCheckpoint.ts >= _utc(start) - horizon)
+        if end is not None:
+            stmt = stmt.where(NewsImpactCheckpoint.ts <= _utc(end))
+        return stmt
+
+    def series_at(self, index: pd.DatetimeIndex, checkpoints: pd.DataFrame) -> pd.DataFrame:
+        """
+        Evaluate the signal at every timestamp of `index`.
+
+        Args:
+            index: Sorted timestamps (naive = UTC)
+            checkpoints: Rows of `checkpoints_query` (ts, intensity, pressure)
+
+        Returns:
+            DataFrame with news_impact_intensity and news_impact_pressure
+        """
+        intensity, pressure = decayed_series(
+            to_utc_ns(index),
+            to_utc_ns(pd.DatetimeIndex(checkpoints["ts"])),
+            checkpoints["intensity"].to_numpy(dtype=float),
+            checkpoints["pressure"].to_numpy(dtype=float),
+            self.half_life_seconds,
+        )
+        return pd.DataFrame(
+            dict(zip(NEWS_IMPACT_FEATURES, (intensity, pressure))),
+            index=index,
+        )
+
+
+@lru_cache(maxsize=1)
+def get_news_impact_service() -> NewsImpactService:
+    """Shared instance (configured half-life)."""
+    return NewsImpactService()
@@ -13,10 +13,19 @@ Created: 2025-10-25
 from typing import Dict, Any, List
 from textblob import TextBlob
 import re
+import time
 
+from app.application.services.ml.news_impact_service import get_news_impact_service
 from app.core.logging import get_logger
+from app.core.metrics import MODEL_INFERENCE_SECONDS, SENTIMENT_ARTICLES, timed
+from app.infrastructure.cache.query_cache import invalidate
 from app.infrastructure.database.base import AsyncSessionLocal
 from app.infrastructure.database.models.news_event import NewsEvent
+from app.infrastructure.database.repositories.sentiment_rollup_repository import (
+    ScoredArticle,
+    apply_sentiment_rollups,
+    rebuild_sentiment_rollups,
+)
 
 logger = get_logger(__name__)
 
@@ -57,6 +66,7 @@ class SentimentAnalysisLite:
         """مقداردهی اولیه | Initialize"""
         logger.info("sentiment_lite_initialized")
     
+    @timed("analyze_text", MODEL_INFERENCE_SECONDS, level="debug", model="textblob")
     def analyze_text(self, text: str) -> Dict[str, Any]:
         """
         تحلیل احساسات متن | Analyze text sentiment
@@ -160,7 +170,9 @@ class SentimentAnalysisLite:
             news_articles = result.scalars().all()
             
             logger.info("news_articles_found", count=len(news_articles))
+            scored: List[ScoredArticle] = []
             
+            started = time.perf_counter()
             for news in news_articles:
                 try:
                     text = f"{news.title}. {news.description or ''}"
@@ -169,10 +181,12 @@ class SentimentAnalysisLite:
                     news.sentiment_score = sentiment['score']
                     news.sentiment_label = sentiment['label']
                     news.confidence = sentiment['confidence']
+                    news.sentiment_model = 'textblob'
                     news.price_impact = sentiment['price_impact']
                     news.impact_score = sentiment['impact_score']
                     
                     analyzed_count += 1
+                    scored.append(ScoredArticle.from_news(news))
                     
                     logger.info("news_analyzed_lite",
                                id=news.id,
@@ -186,8 +200,27 @@ class SentimentAnalysisLite:
                                error=str(e))
                     continue
             
+            elapsed = time.perf_counter() - started
+            SENTIMENT_ARTICLES.labels(analyzer="textblob").inc(analyzed_count)
+            logger.info("sentiment_throughput",
+                       analyzer="textblob",
+                       articles=analyzed_count,
+                       articles_per_second=round(analyzed_count / elapsed, 2) if elapsed > 0 else None)
+            
+            # بروزرسانی rollup ها و news impact در همان تراکنش | Update rollups and news impact in the same transaction
+            if force_reanalyze:
+                await session.flush()
+                await rebuild_sentiment_rollups(session)
+                await get_news_impact_service().rebuild(session)
+            else:
+                await apply_sentiment_rollups(session, scored)
+                await get_news_impact_service().record(session, scored)
+            
             await session.commit()
         
+        if analyzed_count:
+            await invalidate("news")
+        
         logger.info("all_news_analyzed_lite", count=analyzed_count)
         return analyzed_count
     
@@ -11,14 +11,30 @@ Created: 2025-10-25
 License: MIT
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Sequence
 from transformers import AutoTokenizer, AutoModelForSequenceClassification
+import numpy as np
 import torch
 from datetime import datetime, UTC
+from pathlib import Path
+import hashlib
+import json
+import re
+import time
 
+from app.application.services.ml.news_impact_service import get_news_impact_service
+from app.core.config import settings
 from app.core.logging import get_logger
+from app.core.metrics import MODEL_INFERENCE_SECONDS, SENTIMENT_ARTICLES, timed
+from app.infrastructure.cache.query_cache import invalidate
+from app.infrastructure.cache.token_cache import TokenCache, content_hash
 from app.infrastructure.database.base import AsyncSessionLocal
 from app.infrastructure.database.models.news_event import NewsEvent
+from app.infrastructure.database.repositories.sentiment_rollup_repository import (
+    ScoredArticle,
+    apply_sentiment_rollups,
+    rebuild_sentiment_rollups,
+)
 
 logger = get_logger(__name__)
 
@@ -60,20 +76,34 @@ class SentimentAnalysisService:
         'very_bearish': -0.7,
     }
     
-    def __init__(self, model_name: str = None):
+    # int8 = dynamic quantization of nn.Linear, onnx = ONNX Runtime with graph optimizations
+    VARIANTS = ('fp32', 'int8', 'onnx')
+    
+    # full = title + description, title_first = short title + capped description
+    SCORING_MODES = ('full', 'title_first')
+    
+    def __init__(self, model_name: str = None, variant: Optional[str] = None):
         """
         مقداردهی اولیه | Initialize sentiment analyzer
         
         Args:
-            model_name: نام مدل (پیش‌فرض: FinBERT) | Model name (default: FinBERT)
+            model_name: نام مدل یا مسیر محلی (پیش‌فرض: FINBERT_MODEL_NAME) | Model name or local path
+            variant: fp32, int8 یا onnx (پیش‌فرض: FINBERT_VARIANT) | Model variant
         """
-        self.model_name = model_name or self.MODEL_NAME
+        self.model_name = model_name or settings.FINBERT_MODEL_NAME or self.MODEL_NAME
+        self.variant = (variant or settings.FINBERT_VARIANT).lower()
+        if self.variant not in self.VARIANTS:
+            raise ValueError(f"Unknown FinBERT variant: {self.variant} (expected one of {self.VARIANTS})")
         self.tokenizer = None
         self.model = None
-        self.device = 'cuda' if torch.cuda.is_available() else 'cpu'
+        self._token_cache: Optional[TokenCache] = None
+        # int8 و onnx فقط روی CPU | int8 and onnx run on CPU only
+        use_cuda = self.variant == 'fp32' and torch.cuda.is_available()
+        self.device = 'cuda' if use_cuda else 'cpu'
         
         logger.info("sentiment_service_initialized", 
                    model=self.model_name,
+                   variant=self.variant,
                    device=self.device)
     
     def load_model(self):
@@ -88,28 +118,68 @@ class SentimentAnalysisService:
             return
         
         try:
-            logger.info("loading_finbert_model", model=self.model_name)
+            logger.info("loading_finbert_model", model=self.model_name, variant=self.variant)
             
             # بارگذاری tokenizer | Load tokenizer
             self.tokenizer = AutoTokenizer.from_pretrained(self.model_name)
             
-            # بارگذاری مدل | Load model
-            self.model = AutoModelForSequenceClassification.from_pretrained(
-                self.model_name
-            )
-            
-            # انتقال به GPU/CPU | Move to device
-            self.model.to(self.device)
-            self.model.eval()  # حالت ارزیابی | Evaluation mode
+            if self.variant == 'onnx':
+                self.model = self._load_onnx_model()
+            else:
+                # بارگذاری مدل | Load model
+                model = AutoModelForSequenceClassification.from_pretrained(
+                    self.model_name
+                )
+                model.eval()  # حالت ارزیابی | Evaluation mode
+                
+                if self.variant == 'int8':
+                    # وزن‌های int8 برای لایه‌های Linear | int8 weights for the Linear layers
+                    model = torch.quantization.quantize_dynamic(
+                        model, {torch.nn.Linear}, dtype=torch.qint8
+                    )
+                
+                # انتقال به GPU/CPU | Move to device
+                self.model = model.to(self.device)
             
             logger.info("finbert_model_loaded", 
                        model=self.model_name,
+                       variant=self.variant,
                        device=self.device)
             
         except Exception as e:
             logger.error("model_load_error", error=str(e))
             raise
     
+    def _load_onnx_model(self):
+        """
+        مدل ONNX Runtime | ONNX Runtime model
+        
+        The first load exports the checkpoint and runs the ONNX Runtime
+        graph optimizer into FINBERT_ONNX_DIR; later loads reuse the file.
+        Requires optimum[onnxruntime].
+        """
+        try:
+            from optimum.onnxruntime import ORTModelForSequenceClassification, ORTOptimizer
+            from optimum.onnxruntime.configuration import OptimizationConfig
+        except ImportError as e:
+            raise ImportError("FINBERT_VARIANT=onnx requires optimum[onnxruntime]") from e
+        
+        export_dir = Path(settings.FINBERT_ONNX_DIR) / re.sub(r'[^A-Za-z0-9_.-]+', '_', self.model_name)
+        optimized = export_dir / 'model_optimized.onnx'
+        
+        if not optimized.exists():
+            logger.info("finbert_onnx_exporting", model=self.model_name, path=str(export_dir))
+            exported = ORTModelForSequenceClassification.from_pretrained(self.model_name, export=True)
+            ORTOptimizer.from_pretrained(exported).optimize(
+                save_dir=export_dir,
+                optimization_config=OptimizationConfig(
+                    optimization_level=settings.FINBERT_ONNX_OPTIMIZATION_LEVEL
+                ),
+            )
+        
+        return ORTModelForSequenceClassification.from_pretrained(export_dir, file_name=optimized.name)
+    
+    @timed("analyze_text", MODEL_INFERENCE_SECONDS, level="debug", model="finbert")
     def analyze_text(self, text: str) -> Dict[str, Any]:
         """
         تحلیل احساسات یک متن | Analyze sentiment of text
@@ -151,44 +221,12 @@ class SentimentAnalysisService:
                 outputs = self.model(**inputs)
                 predictions = torch.nn.functional.softmax(outputs.logits, dim=-1)
             
-            # استخراج احتمالات | Extract probabilities
-            probs = predictions[0].cpu().numpy()
-            
-            # نگاشت به برچسب‌ها | Map to labels
-            # FinBERT output order: [positive, negative, neutral]
-            probabilities = {
-                'positive': float(probs[0]),
-                'negative': float(probs[1]),
-                'neutral': float(probs[2]),
-            }
-            
-            # یافتن برچسب با بیشترین احتمال | Find label with highest probability
-            label = max(probabilities, key=probabilities.get)
-            confidence = probabilities[label]
-            
-            # محاسبه امتیاز (-1 تا 1) | Calculate score (-1 to 1)
-            score = (
-                probabilities['positive'] * 1.0 +
-                probabilities['neutral'] * 0.0 +
-                probabilities['negative'] * -1.0
-            )
-            
-            # تعیین تأثیر بر قیمت | Determine price impact
-            price_impact, impact_score = self._calculate_price_impact(score, confidence)
-            
-            result = {
-                'label': label,
-                'score': round(score, 3),
-                'confidence': round(confidence, 3),
-                'probabilities': {k: round(v, 3) for k, v in probabilities.items()},
-                'price_impact': price_impact,
-                'impact_score': round(impact_score, 3),
-            }
+            result = self._build_result(predictions[0].cpu().numpy())
             
             logger.debug("sentiment_analyzed", 
                         text=text[:50],
-                        label=label,
-                        score=round(score, 2))
+                        label=result['label'],
+                        score=round(result['score'], 2))
             
             return result
             
@@ -198,6 +236,232 @@ class SentimentAnalysisService:
                         error=str(e))
             raise
     
+    def analyze_batch(self, texts: List[str], batch_size: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        تحلیل دسته‌ای | Analyze several texts, `batch_size` per forward pass
+        
+        Same result dicts as `analyze_text`, in input order.
+        
+        Args:
+            texts: متن‌های ورودی | Input texts
+            batch_size: اندازه دسته (پیش‌فرض: FINBERT_BATCH_SIZE) | Batch size
+        """
+        if self.model is None:
+            self.load_model()
+        
+        encoded = self.tokenizer(
+            list(texts),
+            truncation=True,
+            max_length=settings.FINBERT_MAX_LENGTH
+        )['input_ids']
+        return self.analyze_encoded(encoded, batch_size)
+    
+    def analyze_articles(
+        self,
+        titles: List[str],
+        descriptions: Optional[List[Optional[str]]] = None,
+        mode: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        تحلیل اخبار | Score articles (title + description) in the given scoring mode
+        
+        See `encode_articles` for the modes.
+        """
+        return self.analyze_encoded(self.encode_articles(titles, descriptions, mode))
+    
+    def encode_articles(
+        self,
+        titles: List[str],
+        descriptions: Optional[List[Optional[str]]] = None,
+        mode: Optional[str] = None,
+    ) -> List[List[int]]:
+        """
+        توکن‌سازی یکباره | Tokenize a batch of articles once
+        
+        The token IDs can be kept and passed to `analyze_encoded` again
+        (re-analysis, another checkpoint with the same tokenizer).
+        
+        Modes (default: FINBERT_SCORING_MODE):
+            full         "title. description", up to FINBERT_MAX_LENGTH tokens
+            title_first  title up to FINBERT_TITLE_MAX_LENGTH tokens, then at most
+                         FINBERT_DESCRIPTION_TOKEN_BUDGET description tokens
+                         (0 = title only)
+        
+        Returns:
+            list: شناسه توکن‌ها با توکن‌های ویژه | Token IDs with special tokens, one list per article
+        """
+        if self.tokenizer is None:
+            self.load_model()
+        
+        mode = (mode or settings.FINBERT_SCORING_MODE).lower()
+        if mode not in self.SCORING_MODES:
+            raise ValueError(f"Unknown scoring mode: {mode} (expected one of {self.SCORING_MODES})")
+        descriptions = descriptions if descriptions is not None else [None] * len(titles)
+        
+        if mode == 'full':
+            texts = [f"{title}. {description or ''}" for title, description in zip(titles, descriptions)]
+            return self.tokenizer(
+                texts,
+                truncation=True,
+                max_length=settings.FINBERT_MAX_LENGTH
+            )['input_ids']
+        
+        # عنوان با طول کوتاه، توضیحات محدود به بودجه | Short title, description capped at its budget
+        title_ids = self.tokenizer(
+            list(titles),
+            add_special_tokens=False,
+            truncation=True,
+            max_length=max(1, settings.FINBERT_TITLE_MAX_LENGTH - 2)
+        )['input_ids']
+        budget = settings.FINBERT_DESCRIPTION_TOKEN_BUDGET
+        if budget <= 0:
+            return [self.tokenizer.build_inputs_with_special_tokens(ids) for ids in title_ids]
+        
+        description_ids = self.tokenizer(
+            [description or '' for description in descriptions],
+            add_special_tokens=False,
+            truncation=True,
+            max_length=budget
+        )['input_ids']
+        separator = self.tokenizer('.', add_special_tokens=False)['input_ids']
+        return [
+            self.tokenizer.build_inputs_with_special_tokens(title + separator + description if description else title)
+            for title, description in zip(title_ids, description_ids)
+        ]
+    
+    def tokenizer_version(self, mode: Optional[str] = None) -> str:
+        """
+        نسخه توکن‌ساز | Key under which token IDs stay valid
+        
+        Tokenizer class, vocabulary hash, lower-casing, scoring mode and its
+        length limits. A new checkpoint with the same tokenizer keeps the key.
+        """
+        if self.tokenizer is None:
+            self.load_model()
+        
+        mode = (mode or settings.FINBERT_SCORING_MODE).lower()
+        vocab = json.dumps(sorted(self.tokenizer.get_vocab().items()), ensure_ascii=False)
+        limits = (
+            [settings.FINBERT_MAX_LENGTH] if mode == 'full'
+            else [settings.FINBERT_TITLE_MAX_LENGTH, settings.FINBERT_DESCRIPTION_TOKEN_BUDGET]
+        )
+        return '-'.join([
+            type(self.tokenizer).__name__,
+            hashlib.sha1(vocab.encode('utf-8')).hexdigest()[:12],
+            'lower' if self.tokenizer.init_kwargs.get('do_lower_case') else 'cased',
+            mode,
+            *map(str, limits),
+        ])
+    
+    def encode_news(self, articles: List[NewsEvent], mode: Optional[str] = None) -> List[Sequence[int]]:
+        """
+        توکن‌های اخبار با کش دیسک | Token IDs of news_events rows, via the token cache
+        
+        Cached articles come back as views into the memory-mapped cache;
+        only new or edited articles (title/description hash changed) go
+        through the tokenizer (and are then cached).
+        With FINBERT_TOKEN_CACHE_ENABLED off this is `encode_articles`.
+        """
+        if not settings.FINBERT_TOKEN_CACHE_ENABLED:
+            return self.encode_articles(
+                [news.title for news in articles], [news.description for news in articles], mode
+            )
+        
+        version = self.tokenizer_version(mode)
+        if self._token_cache is None or self._token_cache.tokenizer_version != version:
+            self._token_cache = TokenCache(settings.FINBERT_TOKEN_CACHE_DIR, version)
+        cache = self._token_cache
+        
+        hashes = [content_hash(news.title, news.description) for news in articles]
+        encoded: List[Optional[Sequence[int]]] = cache.get_many([news.id for news in articles], hashes)
+        missing = [i for i, ids in enumerate(encoded) if ids is None]
+        if missing:
+            fresh = self.encode_articles(
+                [articles[i].title for i in missing], [articles[i].description for i in missing], mode
+            )
+            cache.add([articles[i].id for i in missing], fresh, [hashes[i] for i in missing])
+            for i, ids in zip(missing, fresh):
+                encoded[i] = ids
+        
+        logger.info("token_cache_lookup",
+                   articles=len(articles),
+                   hits=len(articles) - len(missing),
+                   version=version)
+        return encoded
+    
+    @timed("analyze_encoded", MODEL_INFERENCE_SECONDS, level="debug", model="finbert_batch")
+    def analyze_encoded(self, encoded: Sequence[Sequence[int]], batch_size: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        تحلیل توکن‌های آماده | Score pre-tokenized inputs
+        
+        Inputs are batched by length, so short headlines are not padded
+        to the longest article of the run. Results are in input order.
+        
+        Args:
+            encoded: شناسه توکن‌ها (encode_articles / encode_news) | Token IDs per article (lists or arrays)
+            batch_size: اندازه دسته (پیش‌فرض: FINBERT_BATCH_SIZE) | Batch size
+        """
+        if self.model is None:
+            self.load_model()
+        
+        batch_size = batch_size or settings.FINBERT_BATCH_SIZE
+        order = sorted(range(len(encoded)), key=lambda i: len(encoded[i]))
+        results: List[Optional[Dict[str, Any]]] = [None] * len(encoded)
+        
+        for start in range(0, len(order), batch_size):
+            rows = order[start:start + batch_size]
+            inputs = self.tokenizer.pad(
+                {'input_ids': [np.asarray(encoded[i]).tolist() for i in rows]},
+                return_tensors="pt"
+            )
+            if 'token_type_ids' in self.tokenizer.model_input_names:
+                inputs['token_type_ids'] = torch.zeros_like(inputs['input_ids'])
+            inputs = inputs.to(self.device)
+            
+            with torch.no_grad():
+                outputs = self.model(**inputs)
+                predictions = torch.nn.functional.softmax(outputs.logits, dim=-1)
+            
+            for i, probs in zip(rows, predictions.cpu().numpy()):
+                results[i] = self._build_result(probs)
+        
+        return results
+    
+    def _build_result(self, probs) -> Dict[str, Any]:
+        """
+        ساخت نتیجه از احتمالات softmax | Result dict from one row of softmax output
+        
+        FinBERT output order: [positive, negative, neutral]
+        """
+        probabilities = {
+            'positive': float(probs[0]),
+            'negative': float(probs[1]),
+            'neutral': float(probs[2]),
+        }
+        
+        # یافتن برچسب با بیشترین احتمال | Find label with highest probability
+        label = max(probabilities, key=probabilities.get)
+        confidence = probabilities[label]
+        
+        # محاسبه امتیاز (-1 تا 1) | Calculate score (-1 to 1)
+        score = (
+            probabilities['positive'] * 1.0 +
+            probabilities['neutral'] * 0.0 +
+            probabilities['negative'] * -1.0
+        )
+        
+        # تعیین تأثیر بر قیمت | Determine price impact
+        price_impact, impact_score = self._calculate_price_impact(score, confidence)
+        
+        return {
+            'label': label,
+            'score': round(score, 3),
+            'confidence': round(confidence, 3),
+            'probabilities': {k: round(v, 3) for k, v in probabilities.items()},
+            'price_impact': price_impact,
+            'impact_score': round(impact_score, 3),
+        }
+    
     def _calculate_price_impact(self, score: float, confidence: float) -> tuple:
         """
         محاسبه تأثیر احتمالی بر قیمت | Calculate likely price impact
@@ -249,20 +513,29 @@ class SentimentAnalysisService:
             if not news:
                 raise ValueError(f"News article {news_id} not found")
             
-            # ترکیب عنوان و توضیحات | Combine title and description
-            text = f"{news.title}. {news.description or ''}"
-            
-            # تحلیل | Analyze
-            sentiment = self.analyze_text(text)
-            
+            # تحلیل عنوان و توضیحات | Analyze title and description
+            sentiment = self.analyze_articles([news.title], [news.description])[0]
+
+            # امتیاز قبلی از rollup کم می‌شود | Retract the previous score from the rollups
+            if news.sentiment_score is not None:
+                previous = [ScoredArticle.from_news(news)]
+                await apply_sentiment_rollups(session, previous, sign=-1)
+                await get_news_impact_service().record(session, previous, sign=-1)
+
             # بروزرسانی دیتابیس | Update database
             news.sentiment_score = sentiment['score']
             news.sentiment_label = sentiment['label']
             news.confidence = sentiment['confidence']
+            news.sentiment_model = 'finbert'
             news.price_impact = sentiment['price_impact']
             news.impact_score = sentiment['impact_score']
-            
+
+            scored = [ScoredArticle.from_news(news)]
+            await apply_sentiment_rollups(session, scored)
+            await get_news_impact_service().record(session, scored)
+
             await session.commit()
+            await invalidate("news")
             
             logger.info("news_sentiment_updated",
                        news_id=news_id,
@@ -272,10 +545,43 @@ class SentimentAnalysisService:
             
             return sentiment
     
+    def _score_batch(self, articles: List[NewsEvent], encoded: Sequence[Sequence[int]]) -> List[Optional[Dict[str, Any]]]:
+        """
+        تحلیل یک دسته با تلاش دوباره تکی | Score one batch; on failure retry article by article
+        
+        Returns:
+            list: نتیجه یا None برای اخبار خطادار | Result per article, None where scoring failed
+        """
+        try:
+            return self.analyze_encoded(encoded)
+        except Exception as e:
+            logger.error("news_batch_analysis_error",
+                        ids=[news.id for news in articles],
+                        error=str(e))
+        
+        results: List[Optional[Dict[str, Any]]] = []
+        for news, ids in zip(articles, encoded):
+            try:
+                results.append(self.analyze_encoded([ids])[0])
+            except Exception as e:
+                logger.error("news_analysis_error",
+                            id=news.id,
+                            title=news.title[:50],
+                            error=str(e))
+                results.append(None)
+        return results
+    
     async def analyze_all_news(self, force_reanalyze: bool = False) -> int:
         """
         تحلیل احساسات تمام اخبار | Analyze sentiment of all news articles
         
+        Articles are scored in batches of FINBERT_BATCH_SIZE and each batch
+        is committed on its own, so a failing batch (e.g. out of memory) only
+        loses its own articles. New articles go in publication order with
+        their rollup and news impact updates, keeping the impact signal
+        append-only. A forced re-analysis uses length-sorted batches, skips
+        the per-batch deltas and rebuilds both aggregates once at the end.
+        
         Args:
             force_reanalyze: تحلیل مجدد اخبار قبلی | Re-analyze previously analyzed news
             
@@ -285,6 +591,7 @@ class SentimentAnalysisService:
         logger.info("analyzing_all_news", force_reanalyze=force_reanalyze)
         
         analyzed_count = 0
+        failed_count = 0
         
         async with AsyncSessionLocal() as session:
             from sqlalchemy import select
@@ -301,39 +608,74 @@ class SentimentAnalysisService:
             
             logger.info("news_articles_found", count=len(news_articles))
             
-            for news in news_articles:
-                try:
-                    # ترکیب عنوان و توضیحات | Combine title and description
-                    text = f"{news.title}. {news.description or ''}"
-                    
-                    # تحلیل | Analyze
-                    sentiment = self.analyze_text(text)
+            started = time.perf_counter()
+            
+            # توکن‌ها از کش دیسک، دسته‌ها بر اساس طول | Cached token IDs, batches of similar length
+            encoded = self.encode_news(news_articles) if news_articles else []
+            if force_reanalyze:
+                # دسته‌های هم‌طول برای padding کمتر | Similar lengths, less padding
+                order = sorted(range(len(news_articles)), key=lambda i: len(encoded[i]))
+            else:
+                # ترتیب انتشار؛ بدون checkpoint دیرهنگام | Publication order, no late checkpoints
+                order = sorted(range(len(news_articles)), key=lambda i: news_articles[i].published_at)
+            batch_size = settings.FINBERT_BATCH_SIZE
+            
+            for start in range(0, len(order), batch_size):
+                rows = order[start:start + batch_size]
+                batch = [news_articles[i] for i in rows]
+                sentiments = self._score_batch(batch, [encoded[i] for i in rows])
+                
+                scored: List[ScoredArticle] = []
+                
+                for news, sentiment in zip(batch, sentiments):
+                    if sentiment is None:
+                        failed_count += 1
+                        continue
                     
                     # بروزرسانی | Update
                     news.sentiment_score = sentiment['score']
                     news.sentiment_label = sentiment['label']
                     news.confidence = sentiment['confidence']
+                    news.sentiment_model = 'finbert'
                     news.price_impact = sentiment['price_impact']
                     news.impact_score = sentiment['impact_score']
                     
                     analyzed_count += 1
+                    scored.append(ScoredArticle.from_news(news))
                     
                     logger.info("news_analyzed",
                                id=news.id,
                                title=news.title[:50],
                                sentiment=sentiment['label'],
                                score=round(sentiment['score'], 2))
-                    
-                except Exception as e:
-                    logger.error("news_analysis_error",
-                               id=news.id,
-                               title=news.title[:50],
-                               error=str(e))
+                
+                if not scored:
                     continue
-            
-            await session.commit()
+                
+                if not force_reanalyze:
+                    # rollup ها و news impact در تراکنش همین دسته | Rollups and news impact in this batch's transaction
+                    await apply_sentiment_rollups(session, scored)
+                    await get_news_impact_service().record(session, scored)
+                await session.commit()
+            
+            elapsed = time.perf_counter() - started
+            SENTIMENT_ARTICLES.labels(analyzer="finbert").inc(analyzed_count)
+            logger.info("sentiment_throughput",
+                       analyzer="finbert",
+                       articles=analyzed_count,
+                       failed=failed_count,
+                       articles_per_second=round(analyzed_count / elapsed, 2) if elapsed > 0 else None)
+            
+            if force_reanalyze and analyzed_count:
+                # یک بار ساخت کامل از news_events | One exact rebuild from news_events
+                await rebuild_sentiment_rollups(session)
+                await get_news_impact_service().rebuild(session)
+                await session.commit()
+        
+        if analyzed_count:
+            await invalidate("news")
         
-        logger.info("all_news_analyzed", count=analyzed_count)
+        logger.info("all_news_analyzed", count=analyzed_count, failed=failed_count)
         
         return analyzed_count
     
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gold Price Analyzer - Sentiment Cascade
+
+TextBlob on every article, FinBERT only where it matters:
+
+    lite (SentimentAnalysisLite)  ->  escalate?  ->  accurate (FinBERT)
+
+An article is escalated when the lite result is unreliable (confidence
+below SENTIMENT_CASCADE_MIN_CONFIDENCE) or the article can move the
+price (lite |score| >= SENTIMENT_CASCADE_IMPACT_THRESHOLD, or the text
+mentions one of SENTIMENT_CASCADE_IMPACT_KEYWORDS). Escalated articles
+are scored in FinBERT batches. Every result carries the tier that
+produced it (`model`), which is stored in news_events.sentiment_model.
+
+    cascade = SentimentCascade()
+    results = cascade.analyze_texts(headlines)
+    results[0]['model']        # 'textblob' or 'finbert'
+    results[0]['escalation']   # None, 'low_confidence', 'high_impact', 'impact_keyword'
+
+If FinBERT cannot be loaded (transformers missing, no weights), the lite
+results are kept.
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+License: MIT
+"""
+
+import re
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+from app.application.services.ml.news_impact_service import get_news_impact_service
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.metrics import SENTIMENT_ARTICLES
+from app.infrastructure.cache.query_cache import invalidate
+from app.infrastructure.database.base import AsyncSessionLocal
+from app.infrastructure.database.models.news_event import NewsEvent
+from app.infrastructure.database.repositories.sentiment_rollup_repository import (
+    ScoredArticle,
+    apply_sentiment_rollups,
+    rebuild_sentiment_rollups,
+)
+
+logger = get_logger(__name__)
+
+TIER_LITE = 'textblob'
+TIER_ACCURATE = 'finbert'
+
+
+class SentimentCascade:
+    """
+    تحلیل احساسات دو مرحله‌ای | Two-tier sentiment scorer
+
+    Both analyzers are created on first use, so importing this module
+    needs neither TextBlob nor transformers.
+    """
+
+    def __init__(
+        self,
+        lite: Any = None,
+        accurate: Any = None,
+        min_confidence: Optional[float] = None,
+        impact_threshold: Optional[float] = None,
+        impact_keywords: Optional[Sequence[str]] = None,
+    ):
+        """
+        Args:
+            lite: Object with analyze_text(text) (default: SentimentAnalysisLite)
+            accurate: Object with analyze_batch(texts) (default: SentimentAnalysisService)
+            min_confidence: Escalate lite results below this confidence
+            impact_threshold: Escalate lite results with |score| at or above this
+            impact_keywords: Escalate texts mentioning any of these (whole words)
+        """
+        self._lite = lite
+        self._accurate = accurate
+        self.min_confidence = (
+            min_confidence if min_confidence is not None else settings.SENTIMENT_CASCADE_MIN_CONFIDENCE
+        )
+        self.impact_threshold = (
+            impact_threshold if impact_threshold is not None else settings.SENTIMENT_CASCADE_IMPACT_THRESHOLD
+        )
+        keywords = impact_keywords if impact_keywords is not None else settings.SENTIMENT_CASCADE_IMPACT_KEYWORDS
+        self._keyword_pattern = (
+            re.compile(r'\b(?:' + '|'.join(re.escape(k.lower()) for k in keywords) + r')\b')
+            if keywords else None
+        )
+        self._accurate_unavailable = False
+
+    @property
+    def lite(self) -> Any:
+        if self._lite is None:
+            from app.application.services.ml.sentiment_analysis_lite import SentimentAnalysisLite
+            self._lite = SentimentAnalysisLite()
+        return self._lite
+
+    @property
+    def accurate(self) -> Any:
+        if self._accurate is None:
+            from app.application.services.ml.sentiment_analysis_service import SentimentAnalysisService
+            self._accurate = SentimentAnalysisService()
+        return self._accurate
+
+    def escalation_reason(self, text: str, lite_result: Dict[str, Any]) -> Optional[str]:
+        """Why `text` should go to FinBERT, or None to keep the lite score."""
+        if lite_result['confidence'] < self.min_confidence:
+            return 'low_confidence'
+        if abs(lite_result['score']) >= self.impact_threshold:
+            return 'high_impact'
+        if self._keyword_pattern is not None and self._keyword_pattern.search(text.lower()):
+            return 'impact_keyword'
+        return None
+
+    def analyze_text(self, text: str) -> Dict[str, Any]:
+        """Cascade result for one text (see `analyze_texts`)."""
+        return self.analyze_texts([text])[0]
+
+    def analyze_texts(self, texts: Sequence[str]) -> List[Dict[str, Any]]:
+        """
+        تحلیل آبشاری | Score texts through the cascade
+
+        Returns the analyzer result dicts in input order, each with
+        `model` (tier that produced the score) and `escalation` (reason
+        FinBERT was asked, None when the lite score was kept).
+        """
+        results: List[Dict[str, Any]] = []
+        escalated: List[int] = []
+        for i, text in enumerate(texts):
+            result = dict(self.lite.analyze_text(text))
+            result['model'] = TIER_LITE
+            result['escalation'] = self.escalation_reason(text, result)
+            if result['escalation'] is not None:
+                escalated.append(i)
+            results.append(result)
+
+        if escalated and not self._accurate_unavailable:
+            accurate = self._score_accurate([texts[i] for i in escalated])
+            if accurate is not None:
+                for i, result in zip(escalated, accurate):
+                    reason = results[i]['escalation']
+                    results[i] = dict(result, model=TIER_ACCURATE, escalation=reason)
+
+        logger.debug("sentiment_cascade_scored", articles=len(texts), escalated=len(escalated))
+        return results
+
+    def _score_accurate(self, texts: List[str]) -> Optional[List[Dict[str, Any]]]:
+        try:
+            return self.accurate.analyze_batch(texts)
+        except (ImportError, OSError) as e:
+            # بدون FinBERT امتیازهای سبک حفظ می‌شوند | Keep the lite scores without FinBERT
+            self._accurate_unavailable = True
+            logger.warning("sentiment_cascade_accurate_unavailable", error=str(e))
+            return None
+
+    async def analyze_all_news(self, force_reanalyze: bool = False) -> int:
+        """
+        تحلیل تمام اخبار | Analyze all news through the cascade
+
+        Args:
+            force_reanalyze: تحلیل مجدد | Re-analyze
+
+        Returns:
+            int: تعداد تحلیل شده | Count analyzed
+        """
+        logger.info("analyzing_all_news_cascade", force_reanalyze=force_reanalyze)
+
+        async with AsyncSessionLocal() as session:
+            from sqlalchemy import select
+
+            query = select(NewsEvent)
+            if not force_reanalyze:
+                query = query.where(NewsEvent.sentiment_score == None)
+
+            result = await session.execute(query)
+            news_articles = result.scalars().all()
+            logger.info("news_articles_found", count=len(news_articles))
+
+            started = time.perf_counter()
+            texts = [f"{news.title}. {news.description or ''}" for news in news_articles]
+            sentiments = self.analyze_texts(texts)
+
+            scored: List[ScoredArticle] = []
+            tiers = {TIER_LITE: 0, TIER_ACCURATE: 0}
+            for news, sentiment in zip(news_articles, sentiments):
+                news.sentiment_score = sentiment['score']
+                news.sentiment_label = sentiment['label']
+                news.confidence = sentiment['confidence']
+                news.sentiment_model = sentiment['model']
+                news.price_impact = sentiment['price_impact']
+                news.impact_score = sentiment['impact_score']
+                tiers[sentiment['model']] += 1
+                scored.append(ScoredArticle.from_news(news))
+
+            analyzed_count = len(scored)
+            elapsed = time.perf_counter() - started
+            for tier, count in tiers.items():
+                SENTIMENT_ARTICLES.labels(analyzer=f"cascade_{tier}").inc(count)
+            logger.info("sentiment_throughput",
+                       analyzer="cascade",
+                       articles=analyzed_count,
+                       escalated=tiers[TIER_ACCURATE],
+                       articles_per_second=round(analyzed_count / elapsed, 2) if elapsed > 0 else None)
+
+            # بروزرسانی rollup ها و news impact در همان تراکنش | Update rollups and news impact in the same transaction
+            if force_reanalyze:
+                await session.flush()
+                await rebuild_sentiment_rollups(session)
+                await get_news_impact_service().rebuild(session)
+            else:
+                await apply_sentiment_rollups(session, scored)
+                await get_news_impact_service().record(session, scored)
+
+            await session.commit()
+
+        if analyzed_count:
+            await invalidate("news")
+
+        logger.info("all_news_analyzed_cascade", count=analyzed_count, **tiers)
+        return analyzed_count
@@ -11,7 +11,9 @@ Created: 2025-10-25
 
 import pandas as pd
 import numpy as np
-from typing import Dict
+from typing import Dict, Optional, Sequence
+
+from app.application.services.ml.feature_graph import INDICATOR_FEATURES, get_feature_registry
 
 
 class TechnicalIndicatorsService:
@@ -75,32 +77,23 @@ class TechnicalIndicatorsService:
     def calculate_all_indicators(
         self,
         df: pd.DataFrame,
-        price_column: str = 'close'
+        price_column: str = 'close',
+        columns: Optional[Sequence[str]] = None
     ) -> pd.DataFrame:
-        """محاسبه همه اندیکاتورها"""
-        result = df.copy()
-        prices = df[price_column]
-        
-        # Moving Averages
-        result['sma_20'] = self.calculate_sma(prices, 20)
-        result['sma_50'] = self.calculate_sma(prices, 50)
-        result['ema_12'] = self.calculate_ema(prices, 12)
-        result['ema_26'] = self.calculate_ema(prices, 26)
+        """
+        محاسبه همه اندیکاتورها (یا فقط columns)
         
-        # RSI
-        result['rsi'] = self.calculate_rsi(prices, 14)
-        
-        # MACD
-        macd_data = self.calculate_macd(prices)
-        result['macd'] = macd_data['macd']
-        result['macd_signal'] = macd_data['signal']
-        result['macd_histogram'] = macd_data['histogram']
+        از feature graph استفاده می‌کند: SMA-20 برای bb_middle و EMA ها
+        برای MACD فقط یک بار محاسبه می‌شوند.
+        """
+        result = df.copy()
+        source = df if price_column == 'close' else pd.DataFrame({'close': df[price_column]})
         
-        # Bollinger Bands
-        bb_data = self.calculate_bollinger_bands(prices)
-        result['bb_upper'] = bb_data['upper']
-        result['bb_middle'] = bb_data['middle']
-        result['bb_lower'] = bb_data['lower']
+        indicators = get_feature_registry().evaluate(
+            source, INDICATOR_FEATURES if columns is None else columns
+        )
+        for col in indicators.columns:
+            result[col] = indicators[col]
         
         return result
     
@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gold Price Analyzer - Scheduling Services
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+License: MIT
+"""
+
+from app.application.services.scheduling.collection_scheduler import (
+    CollectionScheduler,
+    CollectorJob,
+    QuotaBudget,
+)
+
+__all__ = [
+    "CollectionScheduler",
+    "CollectorJob",
+    "QuotaBudget",
+]
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gold Price Analyzer - Collection Jobs
+
+Default collector jobs for the scheduler. Each job looks up the newest
+row it already stored and only asks its source for the missing window
+instead of a fixed `period` / `days` range.
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+License: MIT
+"""
+
+import math
+from datetime import date, datetime, UTC
+from typing import Dict, List, Optional
+
+from app.application.services.scheduling.collection_scheduler import (
+    CollectionScheduler,
+    CollectorJob,
+    QuotaBudget,
+)
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.infrastructure.database.base import AsyncSessionLocal
+from app.infrastructure.database.repositories.collection_state_repository import (
+    get_latest_dollar_index_date,
+    get_latest_news_timestamp,
+)
+
+logger = get_logger(__name__)
+
+# Alpha Vantage `compact` output covers the last 100 trading days
+ALPHA_VANTAGE_COMPACT_DAYS = 100
+
+
+def days_since(latest: Optional[datetime], default: int, maximum: int) -> int:
+    """
+    Whole days to request so that the window covers `latest` .. now.
+
+    Args:
+        latest: Newest stored timestamp (None when nothing is stored)
+        default: Window used for an empty table
+        maximum: Upper bound accepted by the source
+
+    Returns:
+        int: Number of days to fetch (at least 1)
+    """
+    if latest is None:
+        return default
+
+    if latest.tzinfo is None:
+        latest = latest.replace(tzinfo=UTC)
+
+    elapsed = datetime.now(UTC) - latest
+    return max(1, min(maximum, elapsed.days + 1))
+
+
+def hours_since(latest: Optional[datetime], default: int, maximum: int) -> int:
+    """Whole hours to request so that the window covers `latest` .. now."""
+    if latest is None:
+        return default
+
+    if latest.tzinfo is None:
+        latest = latest.replace(tzinfo=UTC)
+
+    elapsed = datetime.now(UTC) - latest
+    return max(1, min(maximum, math.ceil(elapsed.total_seconds() / 3600) + 1))
+
+
+def outputsize_for(latest: Optional[date]) -> str:
+    """Pick Alpha Vantage `compact` when the gap fits in 100 days."""
+    if latest is None:
+        return "full"
+
+    if isinstance(latest, datetime):
+        latest = latest.date()
+
+    gap = (datetime.now(UTC).date() - latest).days
+    return "compact" if gap < ALPHA_VANTAGE_COMPACT_DAYS else "full"
+
+
+# ====================================
+# Collector runs
+# ====================================
+async def collect_yahoo_daily() -> int:
+    """Yahoo Finance GC=F daily candles after the stored high-water mark."""
+    from app.application.services.data_collection.yahoo_finance_service import YahooFinanceService
+
+    service = YahooFinanceService()
+    return await service.fetch_and_save_daily_prices(days=30, incremental=True)
+
+
+async def collect_alpha_vantage_daily() -> int:
+    """Alpha Vantage GLD daily candles after the stored high-water mark."""
+    from app.application.services.data_collection.alpha_vantage_service import AlphaVantageService
+
+    service = AlphaVantageService()
+    return await service.fetch_and_save_daily_candles(outputsize="full", incremental=True)
+
+
+async def collect_dollar_index() -> int:
+    """DXY daily values newer than the last stored trading day."""
+    from app.application.services.data_collection.dollar_index_service import DollarIndexService
+
+    async with AsyncSessionLocal() as session:
+        latest = await get_latest_dollar_index_date(session)
+
+    service = DollarIndexService()
+    df = await service.fetch_daily_data(outputsize=outputsize_for(latest))
+
+    if df is None or df.empty:
+        return 0
+
+    if latest is not None:
+        df = df[df.index.date > latest]
+
+    if df.empty:
+        return 0
+
+    return await service.save_to_database(df)
+
+
+async def collect_rss_news() -> int:
+    """RSS news published since the newest stored RSS article."""
+    from app.application.services.data_collection.news_service import NewsService
+
+    service = NewsService()
+    async with AsyncSessionLocal() as session:
+        latest = await get_latest_news_timestamp(session, service.RSS_FEEDS.keys())
+
+    hours_back = hours_since(
+        latest,
+        default=settings.NEWS_FETCH_INTERVAL_HOURS * 4,
+        maximum=settings.NEWS_MAX_AGE_DAYS * 24,
+    )
+    return await service.fetch_and_save_news(hours_back=hours_back, filter_gold=True)
+
+
+async def collect_newsapi() -> int:
+    """NewsAPI articles since the newest stored NewsAPI article."""
+    from app.application.services.data_collection.newsapi_service import NewsAPIService
+
+    async with AsyncSessionLocal() as session:
+        latest = await get_latest_news_timestamp(session, ["newsapi"])
+
+    service = NewsAPIService()
+    days_back = days_since(latest, default=7, maximum=30)
+    return await service.fetch_historical_news(days_back=days_back)
+
+
+async def collect_kitco_spot() -> bool:
+    """Hourly spot price snapshot (skips when the hour is already stored)."""
+    from app.application.services.data_collection.real_gold_service import RealGoldService
+
+    service = RealGoldService()
+    return await service.save_current_price()
+
+
+# ====================================
+# Default job set
+# ====================================
+def build_default_quotas() -> Dict[str, QuotaBudget]:
+    """Daily request budgets for the rate-limited APIs."""
+    return {
+        "alpha_vantage": QuotaBudget(settings.ALPHA_VANTAGE_DAILY_QUOTA),
+        "newsapi": QuotaBudget(settings.NEWSAPI_DAILY_QUOTA),
+    }
+
+
+def build_default_jobs() -> List[CollectorJob]:
+    """
+    Build the standard collector job list from settings.
+
+    Alpha Vantage GLD and DXY share the same API key, so they draw from
+    the same `alpha_vantage` quota budget.
+    """
+    jitter = settings.SCHEDULER_JITTER_SECONDS
+
+    jobs = [
+        CollectorJob(
+            name="yahoo_finance",
+            run=collect_yahoo_daily,
+            interval_seconds=settings.GOLD_PRICE_FETCH_INTERVAL_MINUTES * 60,
+            jitter_seconds=jitter,
+        ),
+        CollectorJob(
+            name="alpha_vantage",
+            run=collect_alpha_vantage_daily,
+            interval_seconds=settings.ALPHA_VANTAGE_FETCH_INTERVAL_HOURS * 3600,
+            jitter_seconds=jitter,
+            quota_source="alpha_vantage",
+        ),
+        CollectorJob(
+            name="dollar_index",
+            run=collect_dollar_index,
+            interval_seconds=settings.DXY_FETCH_INTERVAL_HOURS * 3600,
+            jitter_seconds=jitter,
+            quota_source="alpha_vantage",
+        ),
+        CollectorJob(
+            name="rss_news",
+            run=collect_rss_news,
+            interval_seconds=settings.NEWS_FETCH_INTERVAL_HOURS * 3600,
+            jitter_seconds=jitter,
+        ),
+        CollectorJob(
+            name="kitco",
+            run=collect_kitco_spot,
+            interval_seconds=settings.KITCO_FETCH_INTERVAL_MINUTES * 60,
+            jitter_seconds=jitter,
+        ),
+    ]
+
+    if settings.NEWSAPI_KEY:
+        jobs.append(
+            CollectorJob(
+                name="newsapi",
+                run=collect_newsapi,
+                interval_seconds=settings.NEWSAPI_FETCH_INTERVAL_HOURS * 3600,
+                jitter_seconds=jitter,
+                quota_source="newsapi",
+                # one request per keyword
+                calls_per_run=8,
+            )
+        )
+    else:
+        logger.info("newsapi_job_disabled", reason="NEWSAPI_KEY not configured")
+
+    return jobs
+
+
+def create_default_scheduler() -> CollectionScheduler:
+    """Scheduler with the default jobs, quotas and concurrency cap."""
+    return CollectionScheduler(
+        jobs=build_default_jobs(),
+        max_concurrency=settings.SCHEDULER_MAX_CONCURRENCY,
+        quotas=build_default_quotas(),
+    )
@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gold Price Analyzer - Collection Scheduler
+
+In-process asyncio scheduler for the data collectors.
+
+Every collector runs on its own interval with random jitter. A global
+semaphore caps how many collectors run at once, and per-source quota
+budgets stop a collector before it burns through a free-tier API limit.
+Runs missed while a collector was busy (or the process was suspended)
+are coalesced into a single catch-up run.
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+License: MIT
+"""
+
+import asyncio
+import random
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, UTC
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional
+
+from app.core.logging import get_logger
+from app.core.metrics import COLLECTOR_RUN_SECONDS
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class CollectorJob:
+    """
+    A single scheduled collector.
+
+    Attributes:
+        name: Unique job name (used in logs and status)
+        run: Coroutine factory executing one collection run
+        interval_seconds: Time between two runs
+        jitter_seconds: Maximum random delay added to each run
+        quota_source: Key of the API quota budget this job consumes
+        calls_per_run: Quota units consumed by one run
+        run_on_start: Run immediately (after jitter) instead of after one interval
+    """
+
+    name: str
+    run: Callable[[], Awaitable[Any]]
+    interval_seconds: float
+    jitter_seconds: float = 0.0
+    quota_source: Optional[str] = None
+    calls_per_run: int = 1
+    run_on_start: bool = True
+
+
+@dataclass
+class JobState:
+    """Runtime statistics of a scheduled job."""
+
+    runs: int = 0
+    failures: int = 0
+    skipped_quota: int = 0
+    coalesced: int = 0
+    last_started_at: Optional[datetime] = None
+    last_finished_at: Optional[datetime] = None
+    last_duration_seconds: Optional[float] = None
+    last_result: Any = None
+    last_error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "runs": self.runs,
+            "failures": self.failures,
+            "skipped_quota": self.skipped_quota,
+            "coalesced": self.coalesced,
+            "last_started_at": self.last_started_at.isoformat() if self.last_started_at else None,
+            "last_finished_at": self.last_finished_at.isoformat() if self.last_finished_at else None,
+            "last_duration_seconds": self.last_duration_seconds,
+            "last_result": self.last_result if isinstance(self.last_result, (int, float, str, bool)) else None,
+            "last_error": self.last_error,
+        }
+
+
+class QuotaBudget:
+    """
+    Sliding-window request budget for a rate-limited API.
+
+    Example:
+        >>> budget = QuotaBudget(limit=25, period_seconds=86400)
+        >>> budget.try_acquire()
+        True
+    """
+
+    def __init__(
+        self,
+        limit: int,
+        period_seconds: float = 86400,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.limit = limit
+        self.period_seconds = period_seconds
+        self._clock = clock
+        self._calls: Deque[float] = deque()
+
+    def _expire(self, now: float) -> None:
+        while self._calls and now - self._calls[0] >= self.period_seconds:
+            self._calls.popleft()
+
+    @property
+    def remaining(self) -> int:
+        """Quota units still available in the current window."""
+        self._expire(self._clock())
+        return max(0, self.limit - len(self._calls))
+
+    def try_acquire(self, units: int = 1) -> bool:
+        """Consume `units` if available; return False when the budget is exhausted."""
+        now = self._clock()
+        self._expire(now)
+
+        if len(self._calls) + units > self.limit:
+            return False
+
+        self._calls.extend([now] * units)
+        return True
+
+
+class CollectionScheduler:
+    """
+    Async scheduler running collectors on independent intervals.
+
+    Usage (FastAPI lifespan):
+        >>> scheduler = CollectionScheduler(build_default_jobs())
+        >>> await scheduler.start()
+        >>> ...
+        >>> await scheduler.stop()
+
+    Usage (standalone worker):
+        >>> await scheduler.run_forever()
+    """
+
+    def __init__(
+        self,
+        jobs: Optional[List[CollectorJob]] = None,
+        max_concurrency: int = 2,
+        quotas: Optional[Dict[str, QuotaBudget]] = None,
+        clock: Callable[[], float] = time.monotonic,
+        rng: Optional[random.Random] = None,
+    ):
+        """
+        Initialize scheduler.
+
+        Args:
+            jobs: Collector jobs to schedule
+            max_concurrency: Maximum collectors running at the same time
+            quotas: Quota budgets keyed by `CollectorJob.quota_source`
+            clock: Monotonic clock (injectable for tests)
+            rng: Random generator used for jitter
+        """
+        self.jobs: Dict[str, CollectorJob] = {}
+        self.states: Dict[str, JobState] = {}
+        self.quotas: Dict[str, QuotaBudget] = quotas or {}
+        self.max_concurrency = max_concurrency
+
+        self._clock = clock
+        self._rng = rng or random.Random()
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._stopping: Optional[asyncio.Event] = None
+
+        for job in jobs or []:
+            self.add_job(job)
+
+    # ====================================
+    # Job management
+    # ====================================
+    def add_job(self, job: CollectorJob) -> None:
+        """Register a job (before or after start)."""
+        if job.name in self.jobs:
+            raise ValueError(f"Job '{job.name}' is already scheduled")
+
+        self.jobs[job.name] = job
+        self.states[job.name] = JobState()
+
+        if self.is_running:
+            self._tasks[job.name] = asyncio.create_task(
+                self._job_loop(job), name=f"collector:{job.name}"
+            )
+
+    @property
+    def is_running(self) -> bool:
+        """True while job loops are active."""
+        return bool(self._tasks)
+
+    def status(self) -> Dict[str, Any]:
+        """Snapshot of all job states and quota budgets."""
+        return {
+            "running": self.is_running,
+            "max_concurrency": self.max_concurrency,
+            "jobs": {name: state.to_dict() for name, state in self.states.items()},
+            "quotas": {name: budget.remaining for name, budget in self.quotas.items()},
+        }
+
+    # ====================================
+    # Lifecycle
+    # ====================================
+    async def start(self) -> None:
+        """Start one loop task per job."""
+        if self.is_running:
+            return
+
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._stopping = asyncio.Event()
+
+        for job in self.jobs.values():
+            self._tasks[job.name] = asyncio.create_task(
+                self._job_loop(job), name=f"collector:{job.name}"
+            )
+
+        logger.info(
+            "collection_scheduler_started",
+            jobs=list(self.jobs.keys()),
+            max_concurrency=self.max_concurrency,
+        )
+
+    async def stop(self) -> None:
+        """Cancel all job loops and wait for them to exit."""
+        if not self.is_running:
+            return
+
+        self._stopping.set()
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks.clear()
+
+        logger.info("collection_scheduler_stopped")
+
+    async def run_forever(self) -> None:
+        """Start the scheduler and block until cancelled."""
+        await self.start()
+        try:
+            await self._stopping.wait()
+        finally:
+            await self.stop()
+
+    async def run_job_now(self, name: str) -> Any:
+        """Run one job immediately (still honours concurrency and quota)."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return await self._execute(self.jobs[name])
+
+    # ====================================
+    # Internals
+    # ====================================
+    def _jitter(self, job: CollectorJob) -> float:
+        if job.jitter_seconds <= 0:
+            return 0.0
+        return self._rng.uniform(0, job.jitter_seconds)
+
+    async def _job_loop(self, job: CollectorJob) -> None:
+        state = self.states[job.name]
+        now = self._clock()
+        next_run = now if job.run_on_start else now + job.interval_seconds
+
+        while True:
+            delay = max(0.0, next_run - self._clock()) + self._jitter(job)
+            await asyncio.sleep(delay)
+
+            await self._execute(job)
+
+            # Coalesce missed runs: if the run (or a suspended process)
+            # overshot one or more intervals, run once and continue
+            # from now instead of firing the backlog back-to-back.
+            next_run += job.interval_seconds
+            now = self._clock()
+            if next_run <= now:
+                missed = int((now - next_run) // job.interval_seconds) + 1
+                state.coalesced += missed
+                logger.info(
+                    "collector_runs_coalesced",
+                    job=job.name,
+                    missed=missed,
+                )
+                next_run = now + job.interval_seconds
+
+    async def _execute(self, job: CollectorJob) -> Any:
+        state = self.states[job.name]
+
+        budget = self.quotas.get(job.quota_source) if job.quota_source else None
+        if budget is not None and not budget.try_acquire(job.calls_per_run):
+            state.skipped_quota += 1
+            logger.warning(
+                "collector_quota_exhausted",
+                job=job.name,
+                quota_source=job.quota_source,
+                limit=budget.limit,
+            )
+            return None
+
+        async with self._semaphore:
+            state.last_started_at = datetime.now(UTC)
+            started = self._clock()
+
+            try:
+                result = await job.run()
+                COLLECTOR_RUN_SECONDS.labels(job=job.name, outcome="ok").observe(self._clock() - started)
+                state.runs += 1
+                state.last_result = result
+                state.last_error = None
+                logger.info(
+                    "collector_run_completed",
+                    job=job.name,
+                    result=result if isinstance(result, (int, float, str, bool)) else None,
+                    duration_seconds=round(self._clock() - started, 3),
+                )
+                return result
+
+            except asyncio.CancelledError:
+                raise
+
+            except Exception as e:
+                COLLECTOR_RUN_SECONDS.labels(job=job.name, outcome="error").observe(self._clock() - started)
+                state.failures += 1
+                state.last_error = str(e)
+                logger.error(
+                    "collector_run_failed",
+                    job=job.name,
+                    error=str(e),
+                    exc_info=True,
+                )
+                return None
+
+            finally:
+                state.last_finished_at = datetime.now(UTC)
+                state.last_duration_seconds = round(self._clock() - started, 3)
@@ -0,0 +1,15 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gold Price Analyzer - Streaming Services
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+License: MIT
+"""
+
+from app.application.services.streaming.price_stream_service import PriceStreamService
+
+__all__ = [
+    "PriceStreamService",
+]
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gold Price Analyzer - Price Stream Service
+
+The single upstream feeder behind the streaming endpoints. It polls the
+spot price aggregator, recomputes indicators from stored candles and
+summarizes recent news sentiment, and publishes only what changed:
+
+    tick        - live spot price
+    indicators  - latest SMA / EMA / RSI / MACD / Bollinger values
+    sentiment   - last 24h news sentiment summary and decayed news impact
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+License: MIT
+"""
+
+import asyncio
+from datetime import datetime, UTC, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import pandas as pd
+from sqlalchemy import func, select
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.infrastructure.streaming.broker import StreamBroker
+
+logger = get_logger(__name__)
+
+INDICATOR_COLUMNS = (
+    "sma_20", "sma_50", "ema_12", "ema_26", "rsi",
+    "macd", "macd_signal", "macd_histogram",
+    "bb_upper", "bb_middle", "bb_lower",
+)
+
+Loader = Callable[[], Awaitable[Optional[Dict[str, Any]]]]
+
+
+class PriceStreamService:
+    """
+    Feeds the stream broker.
+
+    Example:
+        >>> feeder = PriceStreamService(get_stream_broker())
+        >>> feeder.start()
+        >>> ...
+        >>> await feeder.stop()
+    """
+
+    def __init__(
+        self,
+        broker: StreamBroker,
+        tick_loader: Optional[Loader] = None,
+        indicators_loader: Optional[Loader] = None,
+        sentiment_loader: Optional[Loader] = None,
+        tick_interval: Optional[float] = None,
+        indicators_interval: Optional[float] = None,
+        sentiment_interval: Optional[float] = None,
+    ):
+        """
+        Initialize feeder.
+
+        Args:
+            broker: Broker to publish to
+            tick_loader: Coroutine returning the live tick (default: spot aggregator)
+            indicators_loader: Coroutine returning indicator values (default: database)
+            sentiment_loader: Coroutine returning a sentiment summary (default: database)
+            tick_interval: Seconds between price polls
+            indicators_interval: Seconds between indicator refreshes
+            sentiment_interval: Seconds between sentiment refreshes
+        """
+        self.broker = broker
+        self._feeds = [
+            ("tick", tick_loader or self.load_tick,
+             tick_interval or settings.STREAM_TICK_SECONDS),
+            ("indicators", indicators_loader or self.load_indicators,
+             indicators_interval or settings.STREAM_INDICATORS_SECONDS),
+            ("sentiment", sentiment_loader or self.load_sentiment,
+             sentiment_interval or settings.STREAM_SENTIMENT_SECONDS),
+        ]
+        self._last: Dict[str, Any] = {}
+        self._tasks: List[asyncio.Task] = []
+
+    def start(self) -> None:
+        """Start one polling task per topic."""
+        if self._tasks:
+            return
+        for topic, loader, interval in self._feeds:
+            self._tasks.append(
+                asyncio.create_task(self._feed_loop(topic, loader, interval), name=f"stream-{topic}")
+            )
+        logger.info("price_stream_started", topics=[f[0] for f in self._feeds])
+
+    async def stop(self) -> None:
+        """Cancel the polling tasks."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        logger.info("price_stream_stopped")
+
+    async def poll_once(self, topic: str) -> bool:
+        """
+        Load one topic and publish it if it changed.
+
+        Returns:
+            bool: True if something was published
+        """
+        loader = next(f[1] for f in self._feeds if f[0] == topic)
+        data = await loader()
+
+        if data is None or data == self._last.get(topic):
+            return False
+
+        self._last[topic] = data
+        await self.broker.publish(topic, data)
+        return True
+
+    async def _feed_loop(self, topic: str, loader: Loader, interval: float) -> None:
+        while True:
+            try:
+                await self.poll_once(topic)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("price_stream_feed_error", topic=topic, error=str(e))
+            await asyncio.sleep(interval)
+
+    # ------------------------------------------------------------------
+    # Default loaders
+    # ------------------------------------------------------------------
+    async def load_tick(self) -> Optional[Dict[str, Any]]:
+        """Live spot price from the concurrent aggregator."""
+        from app.application.services.data_collection.price_aggregator import (
+            get_spot_price_aggregator,
+        )
+
+        price = await get_spot_price_aggregator().get_current_price_async()
+        if price is None:
+            return None
+
+        previous = self._last.get("tick")
+        change = price - previous["price"] if previous else 0.0
+
+        return {
+            "price": round(price, 2),
+            "change": round(change, 2),
+            "currency": "USD",
+            "unit": "oz",
+        }
+
+    async def load_indicators(self) -> Optional[Dict[str, Any]]:
+        """Indicator values of the newest stored candle."""
+        from app.application.services.ml.technical_indicators_service import (
+            TechnicalIndicatorsService,
+        )
+        from app.infrastructure.database.base import AsyncSessionLocal
+        from app.infrastructure.database.models import GoldPriceFact
+
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(
+                select(GoldPriceFact.timestamp, GoldPriceFact.close)
+                .where(
+                    GoldPriceFact.timeframe == settings.STREAM_INDICATORS_TIMEFRAME,
+                    GoldPriceFact.source == settings.STREAM_INDICATORS_SOURCE,
+                )
+                .order_by(GoldPriceFact.timestamp.desc())
+                .limit(120)
+            )
+            rows = result.all()
+
+        if not rows:
+            return None
+
+        df = pd.DataFrame(rows, columns=["timestamp", "close"]).iloc[::-1]
+        df["close"] = df["close"].astype(float)
+        last = TechnicalIndicatorsService().calculate_all_indicators(df).iloc[-1]
+
+        return {
+            "timestamp": last["timestamp"].isoformat(),
+            "timeframe": settings.STREAM_INDICATORS_TIMEFRAME,
+            "close": float(last["close"]),
+            **{
+                col: (None if pd.isna(last[col]) else round(float(last[col]), 4))
+                for col in INDICATOR_COLUMNS
+            },
+        }
+
+    async def load_sentiment(self) -> Optional[Dict[str, Any]]:
+        """Sentiment summary of the last 24 hours of news."""
+        from app.application.services.ml.news_impact_service import get_news_impact_service
+        from app.infrastructure.database.base import AsyncSessionLocal
+        from app.infrastructure.database.models import NewsEvent
+
+        since = datetime.now(UTC) - timedelta(hours=24)
+
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(
+                select(
+                    func.count(NewsEvent.id),
+                    func.avg(NewsEvent.sentiment_score),
+                    func.count(NewsEvent.id).filter(NewsEvent.price_impact == "bullish"),
+                    func.count(NewsEvent.id).filter(NewsEvent.price_impact == "bearish"),
+                    func.max(NewsEvent.published_at),
+                ).where(
+                    NewsEvent.published_at >= since,
+                    NewsEvent.sentiment_score.isnot(None),
+                )
+            )
+            count, avg_score, bullish, bearish, latest = result.one()
+            impact = await get_news_impact_service().current(session)
+
+        if not count:
+            return None
+
+        return {
+            "window_hours": 24,
+            "articles": count,
+            "avg_sentiment": round(float(avg_score), 4),
+            "bullish": bullish,
+            "bearish": bearish,
+            "latest_published_at": latest.isoformat() if latest else None,
+            "news_impact": round(impact["intensity"], 4),
+            "news_pressure": round(impact["pressure"], 4),
+        }
@@ -10,7 +10,7 @@ Created: 2025-10-23
 Updated: 2025-10-25 16:16:30 UTC
 """
 
-from typing import Optional, List
+from typing import Dict, Optional, List
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -71,6 +71,10 @@ class Settings(BaseSettings):
         default=False,
         description="Echo SQL queries (for debugging)"
     )
+    DB_READ_CHUNK_SIZE: int = Field(
+        default=10_000,
+        description="Rows fetched per round trip by the streaming readers"
+    )
     
     @property
     def DATABASE_URL(self) -> str:
@@ -160,6 +164,64 @@ class Settings(BaseSettings):
     FINBERT_MODEL_NAME: str = "ProsusAI/finbert"
     FINBERT_MAX_LENGTH: int = 512
     FINBERT_BATCH_SIZE: int = 8
+    FINBERT_SCORING_MODE: str = Field(
+        default="full",
+        description="full (title + description) or title_first (short title, capped description)"
+    )
+    FINBERT_TITLE_MAX_LENGTH: int = Field(
+        default=64,
+        description="Token limit for titles in title_first mode (special tokens included)"
+    )
+    FINBERT_DESCRIPTION_TOKEN_BUDGET: int = Field(
+        default=64,
+        description="Description tokens appended after the title in title_first mode (0 = title only)"
+    )
+    FINBERT_TOKEN_CACHE_ENABLED: bool = Field(
+        default=True,
+        description="Keep tokenized news_events on disk for re-analysis runs"
+    )
+    FINBERT_TOKEN_CACHE_DIR: str = Field(
+        default="models/token_cache",
+        description="Memory-mapped token cache, one subdirectory per tokenizer version"
+    )
+    FINBERT_VARIANT: str = Field(
+        default="fp32",
+        description="fp32, int8 (dynamic quantization) or onnx (ONNX Runtime, needs optimum[onnxruntime])"
+    )
+    FINBERT_ONNX_DIR: str = Field(
+        default="models/finbert_onnx",
+        description="Where the optimized ONNX export is written and reused"
+    )
+    FINBERT_ONNX_OPTIMIZATION_LEVEL: int = Field(
+        default=2,
+        description="ONNX Runtime graph optimization level (0-99, 2 = extended fusions)"
+    )
+
+    # Sentiment cascade (sentiment_cascade.py): TextBlob first, FinBERT when needed
+    SENTIMENT_CASCADE_MIN_CONFIDENCE: float = Field(
+        default=0.2,
+        description="Lite results below this confidence are re-scored by FinBERT"
+    )
+    SENTIMENT_CASCADE_IMPACT_THRESHOLD: float = Field(
+        default=0.5,
+        description="Lite |score| at or above this is high-impact and re-scored by FinBERT"
+    )
+    SENTIMENT_CASCADE_IMPACT_KEYWORDS: List[str] = Field(
+        default=["fed", "rate", "rates", "inflation", "cpi", "war", "sanctions", "central bank", "recession"],
+        description="Headlines mentioning any of these are re-scored by FinBERT"
+    )
+
+    # Sentiment rollups (sentiment_rollups table)
+    SENTIMENT_ROLLUP_BUCKETS: List[str] = Field(
+        default=["1h", "4h", "1d"],
+        description="Bucket sizes maintained as articles are scored (m/h/d suffix)"
+    )
+
+    # Decayed news impact (news_impact_service.py)
+    NEWS_IMPACT_HALF_LIFE_HOURS: float = Field(
+        default=12.0,
+        description="Half-life of an article's impact × confidence contribution"
+    )
     
     # LSTM Model
     LSTM_SEQUENCE_LENGTH: int = 60
@@ -175,20 +237,205 @@ class Settings(BaseSettings):
     NEWS_FETCH_INTERVAL_HOURS: int = 6
     NEWS_MAX_AGE_DAYS: int = 30
     
+    # RSS ingestion pipeline (feed_pipeline.py)
+    NEWS_PARSE_EXECUTOR: str = Field(
+        default="thread",
+        description="thread pool, or process (one shared spawn-context pool) for feedparser + entry normalization"
+    )
+    NEWS_PARSE_WORKERS: int = Field(
+        default=2,
+        description="Feeds parsed at the same time"
+    )
+    NEWS_FETCH_CONCURRENCY: int = Field(
+        default=4,
+        description="Feeds downloaded at the same time"
+    )
+    NEWS_PIPELINE_QUEUE_SIZE: int = Field(
+        default=8,
+        description="Bound of the fetch -> parse and parse -> insert queues"
+    )
+    NEWS_INSERT_BATCH_SIZE: int = Field(
+        default=200,
+        description="Articles per dedup query and bulk insert"
+    )
+
+    # Staged ingestion pipelines (services/ingestion)
+    INGEST_QUEUE_SIZE: int = Field(
+        default=100,
+        description="Bound of every stage's input queue (backpressure)"
+    )
+    INGEST_BATCH_SIZE: int = Field(
+        default=500,
+        description="Rows per sink write (candles, DXY days, articles)"
+    )
+    INGEST_BATCH_LINGER_SECONDS: float = Field(
+        default=0.5,
+        description="How long a batch stage waits to fill a batch"
+    )
+
     # Gold Price Collection
     GOLD_PRICE_FETCH_INTERVAL_MINUTES: int = 60
-    
+
+    # Spot price fan-out (see price_aggregator.py)
+    SPOT_PRICE_QUORUM: int = 1  # 1 = first valid price wins
+    SPOT_PRICE_TIMEOUT_SECONDS: float = 15.0
+
+    # Other collectors
+    ALPHA_VANTAGE_FETCH_INTERVAL_HOURS: int = 24
+    DXY_FETCH_INTERVAL_HOURS: int = 24
+    NEWSAPI_FETCH_INTERVAL_HOURS: int = 12
+    KITCO_FETCH_INTERVAL_MINUTES: int = 60
+
+    # GLD -> gold conversion (gold_candle_converter.py)
+    GLD_REFERENCE_SOURCES: List[str] = Field(
+        default=["yahoo_finance"],
+        description="Stored gold candle sources the GLD conversion factor is derived from"
+    )
+    GLD_FACTOR_SMOOTHING_DAYS: int = Field(
+        default=20,
+        description="Rolling median window over the daily gold/GLD ratio (1 = none)"
+    )
+
+    # ============================================================================
+    # Collection Scheduler
+    # ============================================================================
+    SCHEDULER_ENABLED: bool = Field(
+        default=False,
+        description="Run the collection scheduler inside the API process"
+    )
+    SCHEDULER_MAX_CONCURRENCY: int = Field(
+        default=2,
+        description="Maximum number of collectors running at the same time"
+    )
+    SCHEDULER_JITTER_SECONDS: int = Field(
+        default=30,
+        description="Random delay added to every scheduled run"
+    )
+
+    # API quota budgets (requests per day, free tiers)
+    ALPHA_VANTAGE_DAILY_QUOTA: int = 25
+    NEWSAPI_DAILY_QUOTA: int = 100
+
+    # ============================================================================
+    # Live Streaming (WebSocket / SSE)
+    # ============================================================================
+    STREAM_ENABLED: bool = Field(
+        default=False,
+        description="Expose /api/v1/stream and run the broker"
+    )
+    STREAM_FEEDER_ENABLED: bool = Field(
+        default=True,
+        description="Run the upstream feeder in this process (one per deployment)"
+    )
+    STREAM_BACKEND: str = Field(
+        default="memory",
+        description="memory or redis (multi-worker)"
+    )
+    STREAM_REDIS_CHANNEL: str = "gold:stream"
+    STREAM_QUEUE_SIZE: int = Field(
+        default=100,
+        description="Per-subscriber queue bound (oldest dropped when full)"
+    )
+    STREAM_HEARTBEAT_SECONDS: float = 15.0
+    STREAM_TICK_SECONDS: float = 10.0
+    STREAM_INDICATORS_SECONDS: float = 300.0
+    STREAM_SENTIMENT_SECONDS: float = 300.0
+    STREAM_INDICATORS_TIMEFRAME: str = "daily"
+    STREAM_INDICATORS_SOURCE: str = "yahoo_finance"
+
     # ============================================================================
     # Logging Configuration
     # ============================================================================
     LOG_LEVEL: str = "INFO"
     LOG_FORMAT: str = "json"  # json or console
+    LOG_MODE: str = Field(
+        default="standard",
+        description="standard or fast (orjson + queue handler + sampling, for backfills)"
+    )
+    LOG_SAMPLE_RATE: float = Field(
+        default=0.01,
+        description="Fraction of LOG_SAMPLED_EVENTS kept in fast mode"
+    )
+    LOG_SAMPLED_EVENTS: List[str] = Field(
+        default=[
+            "gold_keyword_found",
+            "news_exists",
+            "news_saved",
+            "news_analyzed",
+            "news_analyzed_lite",
+            "sentiment_analyzed",
+            "sentiment_analyzed_lite",
+            "parse_candle_error",
+            "convert_candle_error",
+            "save_record_error",
+            "save_article_error",
+        ],
+        description="Per-item events inside loops that fast mode samples"
+    )
+
+    # Prometheus metrics (GET /metrics)
+    METRICS_ENABLED: bool = Field(
+        default=True,
+        description="Expose /metrics and time API requests"
+    )
     
     # ============================================================================
     # Cache Configuration
     # ============================================================================
     CACHE_TTL_SECONDS: int = 3600  # 1 hour
-    
+
+    # Query result cache (see app/infrastructure/cache/query_cache.py)
+    QUERY_CACHE_ENABLED: bool = Field(
+        default=True,
+        description="Cache read-heavy service queries"
+    )
+    QUERY_CACHE_BACKEND: str = Field(
+        default="memory",
+        description="memory (per-process only) or redis (shared tier)"
+    )
+    QUERY_CACHE_TTLS: Dict[str, int] = Field(
+        default={
+            "news": 600,
+            "dollar_index": 3600,
+        },
+        description="Result TTL in seconds per namespace"
+    )
+    QUERY_CACHE_LOCAL_TTL_SECONDS: int = Field(
+        default=5,
+        description="Upper bound for per-process entries (bounds drift between workers)"
+    )
+    QUERY_CACHE_LOCAL_MAX_ENTRIES: int = Field(
+        default=1024,
+        description="LRU size of the per-process tier"
+    )
+
+    # External API response cache (see app/infrastructure/cache/http_cache.py)
+    HTTP_CACHE_MODE: str = Field(
+        default="live",
+        description="live, off, record or replay"
+    )
+    HTTP_CACHE_BACKEND: str = Field(
+        default="file",
+        description="file or redis"
+    )
+    HTTP_CACHE_DIR: str = Field(
+        default=".cache/http",
+        description="Directory for the file backend (and recorded fixtures)"
+    )
+    HTTP_CACHE_TTLS: Dict[str, int] = Field(
+        default={
+            "alpha_vantage": 6 * 3600,       # daily candles
+            "alpha_vantage_quote": 60,       # GLOBAL_QUOTE
+            "dollar_index": 6 * 3600,
+            "newsapi": 3600,
+        },
+        description="Response TTL in seconds per source"
+    )
+    HTTP_CACHE_MAX_STALE_SECONDS: int = Field(
+        default=7 * 24 * 3600,
+        description="Oldest cached response served when a quota is exhausted"
+    )
+
     # ============================================================================
     # Security
     # ============================================================================
@@ -3,21 +3,54 @@
 """
 Gold Price Analyzer - Logging Configuration
 
+Two modes (LOG_MODE):
+
+    standard  - the original pipeline; static app fields are added to
+                every event by `add_app_context`
+    fast      - for backfills and other hot loops:
+                * levels below LOG_LEVEL are no-ops (filtering bound logger)
+                * static app fields are serialized once and appended to
+                  every rendered line instead of being copied into each event
+                * JSON is rendered with orjson
+                * lines go through a QueueHandler; a background
+                  QueueListener does the actual write to stdout
+                * per-item events listed in LOG_SAMPLED_EVENTS are kept
+                  1-in-N (N = 1 / LOG_SAMPLE_RATE); each kept line carries
+                  `sampled_every` and how many were `suppressed` since the last one
+
 Author: Hoseyn Doulabi (@hoseynd-ai)
 Project Manager: Hoseyn Doulabi
 Created: 2025-10-24
 License: MIT
 """
 
+import atexit
+import itertools
 import logging
+import logging.handlers
+import queue
 import sys
-from typing import Any
+import threading
+from typing import Any, Dict, Iterable, Optional, TextIO
 
 import structlog
 from structlog.types import EventDict
 
 from app.core.config import settings
 
+_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional[logging.Handler] = None
+
+
+def app_context() -> Dict[str, Any]:
+    """Static fields attached to every log line."""
+    return {
+        "app": settings.APP_NAME,
+        "version": settings.APP_VERSION,
+        "environment": settings.ENVIRONMENT,
+        "author": "Hoseyn Doulabi (@hoseynd-ai)",
+    }
+
 
 def add_app_context(logger: Any, method_name: str, event_dict: EventDict) -> EventDict:
     """Add app context to logs."""
@@ -28,14 +61,125 @@ def add_app_context(logger: Any, method_name: str, event_dict: EventDict) -> Eve
     return event_dict
 
 
-def setup_logging() -> None:
-    """Configure logging."""
+class EventSampler:
+    """
+    Keep 1 in `every` occurrences of the listed events.
+
+    Counting is per event name, so a burst of `gold_keyword_found` does
+    not hide an occasional `news_saved`.
+    """
+
+    def __init__(self, events: Iterable[str], rate: float):
+        self.events = frozenset(events)
+        self.every = max(1, round(1 / rate)) if rate > 0 else 0
+        self._counters: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, logger: Any, method_name: str, event_dict: EventDict) -> EventDict:
+        event = event_dict.get("event")
+        if event not in self.events or self.every == 1:
+            return event_dict
+        if self.every == 0:
+            raise structlog.DropEvent
+
+        counter = self._counters.get(event)
+        if counter is None:
+            with self._lock:
+                counter = self._counters.setdefault(event, itertools.count())
+
+        n = next(counter)
+        if n % self.every:
+            raise structlog.DropEvent
+
+        event_dict["sampled_every"] = self.every
+        event_dict["suppressed"] = 0 if n == 0 else self.every - 1
+        return event_dict
+
+
+class FastJSONRenderer:
+    """orjson renderer that appends pre-serialized static fields."""
+
+    def __init__(self, static: Dict[str, Any]):
+        import orjson
+
+        self._dumps = orjson.dumps
+        self._option = orjson.OPT_NON_STR_KEYS
+        self._static = orjson.dumps(static)[1:-1]
+
+    def __call__(self, logger: Any, method_name: str, event_dict: EventDict) -> str:
+        body = self._dumps(event_dict, default=str, option=self._option)
+        if len(body) > 2:
+            return (body[:-1] + b"," + self._static + b"}").decode()
+        return (b"{" + self._static + b"}").decode()
+
+
+def _stop_queue_logging() -> None:
+    global _listener, _queue_handler
+
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_handler = None
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def _setup_fast(level: int, stream: TextIO) -> None:
+    global _listener, _queue_handler
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+
+    output = logging.StreamHandler(stream)
+    output.setFormatter(logging.Formatter("%(message)s"))
+
+    _queue_handler = logging.handlers.QueueHandler(log_queue)
+    _listener = logging.handlers.QueueListener(log_queue, output)
+    _listener.start()
+
+    root = logging.getLogger()
+    root.addHandler(_queue_handler)
+    root.setLevel(level)
+
+    structlog.configure(
+        processors=[
+            structlog.contextvars.merge_contextvars,
+            EventSampler(settings.LOG_SAMPLED_EVENTS, settings.LOG_SAMPLE_RATE),
+            structlog.stdlib.add_logger_name,
+            structlog.processors.add_log_level,
+            structlog.processors.TimeStamper(fmt="iso", utc=True),
+            structlog.processors.format_exc_info,
+            FastJSONRenderer(app_context()),
+        ],
+        logger_factory=structlog.stdlib.LoggerFactory(),
+        wrapper_class=structlog.make_filtering_bound_logger(level),
+        cache_logger_on_first_use=True,
+    )
+
+
+def setup_logging(mode: Optional[str] = None, stream: Optional[TextIO] = None) -> None:
+    """
+    Configure logging.
+
+    Args:
+        mode: "standard" or "fast" (default: LOG_MODE)
+        stream: Output stream (default: stdout)
+    """
+    mode = (mode or settings.LOG_MODE).lower()
+    level = getattr(logging, settings.LOG_LEVEL.upper())
+    stream = stream or sys.stdout
+
+    _stop_queue_logging()
+
+    if mode == "fast":
+        _setup_fast(level, stream)
+        return
+
     logging.basicConfig(
         format="%(message)s",
-        stream=sys.stdout,
-        level=getattr(logging, settings.LOG_LEVEL.upper()),
+        stream=stream,
+        level=level,
     )
-    
+
     structlog.configure(
         processors=[
             structlog.contextvars.merge_contextvars,
@@ -56,6 +200,16 @@ def setup_logging() -> None:
     )
 
 
+def flush_logging() -> None:
+    """Block until every queued fast-mode line has been written."""
+    if _listener is not None:
+        _listener.stop()
+        _listener.start()
+
+
+atexit.register(_stop_queue_logging)
+
+
 def get_logger(name: str) -> structlog.BoundLogger:
     """Get logger instance."""
     return structlog.get_logger(name)
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gold Price Analyzer - Metrics
+
+Prometheus metrics for the hot paths, and `timed`, which measures a
+block or function once and reports it twice: as a histogram observation
+and as a structlog span event (`span_finished`, with duration_ms).
+
+    with timed("load_price_data", DB_QUERY_SECONDS, query="load_price_data"):
+        df = pd.read_sql(...)
+
+    @timed("analyze_text", MODEL_INFERENCE_SECONDS, model="finbert", level="debug")
+    def analyze_text(...): ...
+
+Exposed at GET /metrics.
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+License: MIT
+"""
+
+import functools
+import inspect
+import time
+from typing import Any, Callable, Optional
+
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, Counter, Gauge, Histogram, generate_latest
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# از میلی‌ثانیه تا چند دقیقه
+LATENCY_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 180.0,
+)
+
+
+# ====================================
+# Metrics
+# ====================================
+DB_QUERY_SECONDS = Histogram(
+    "gold_db_query_seconds",
+    "Database query latency",
+    ["query"],
+    buckets=LATENCY_BUCKETS,
+)
+
+COLLECTOR_FETCH_SECONDS = Histogram(
+    "gold_collector_fetch_seconds",
+    "Upstream fetch latency by source",
+    ["source", "outcome"],
+    buckets=LATENCY_BUCKETS,
+)
+
+COLLECTOR_RUN_SECONDS = Histogram(
+    "gold_collector_run_seconds",
+    "Scheduled collector run duration",
+    ["job", "outcome"],
+    buckets=LATENCY_BUCKETS,
+)
+
+ROWS_INGESTED = Counter(
+    "gold_rows_ingested_total",
+    "Rows written by collectors",
+    ["table", "source"],
+)
+
+SENTIMENT_ARTICLES = Counter(
+    "gold_sentiment_articles_total",
+    "Articles scored (rate() gives articles per second)",
+    ["analyzer"],
+)
+
+MODEL_INFERENCE_SECONDS = Histogram(
+    "gold_model_inference_seconds",
+    "Model inference latency",
+    ["model"],
+    buckets=LATENCY_BUCKETS,
+)
+
+CACHE_REQUESTS = Counter(
+    "gold_cache_requests_total",
+    "Cache lookups by result (hit, miss, stale, ...)",
+    ["cache", "result"],
+)
+
+PIPELINE_STEP_SECONDS = Histogram(
+    "gold_pipeline_step_seconds",
+    "ML dataset pipeline step duration",
+    ["step"],
+    buckets=LATENCY_BUCKETS,
+)
+
+INGEST_STAGE_ITEMS = Counter(
+    "gold_ingest_stage_items_total",
+    "Items through an ingestion stage (received, emitted, dropped, failed)",
+    ["pipeline", "stage", "outcome"],
+)
+
+INGEST_STAGE_SECONDS = Histogram(
+    "gold_ingest_stage_seconds",
+    "Time an ingestion stage spends on one item or batch",
+    ["pipeline", "stage"],
+    buckets=LATENCY_BUCKETS,
+)
+
+INGEST_STAGE_LAG_SECONDS = Histogram(
+    "gold_ingest_stage_lag_seconds",
+    "Time an item waits in a stage's input queue",
+    ["pipeline", "stage"],
+    buckets=LATENCY_BUCKETS,
+)
+
+INGEST_QUEUE_DEPTH = Gauge(
+    "gold_ingest_queue_depth",
+    "Items waiting in a stage's input queue",
+    ["pipeline", "stage"],
+)
+
+HTTP_REQUEST_SECONDS = Histogram(
+    "gold_http_request_seconds",
+    "API request latency",
+    ["method", "route", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+
+
+# ====================================
+# Timing
+# ====================================
+class timed:
+    """
+    Time a block (context manager) or a function (decorator, sync or async).
+
+    Args:
+        span: Span name in the log event
+        histogram: Histogram to observe (optional)
+        level: structlog level of the span event ("info", "debug", ...)
+        **labels: Histogram labels, also logged
+
+    After a `with` block, `elapsed` (seconds) and `ms` hold the duration.
+    """
+
+    def __init__(
+        self,
+        span: str,
+        histogram: Optional[Histogram] = None,
+        level: str = "info",
+        **labels: Any,
+    ):
+        self.span = span
+        self.histogram = histogram
+        self.level = level
+        self.labels = labels
+        self.elapsed = 0.0
+        self._started = 0.0
+
+    def __enter__(self) -> "timed":
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.elapsed = time.perf_counter() - self._started
+        self._record(error=exc_type is not None)
+
+    @property
+    def ms(self) -> float:
+        """Elapsed milliseconds (rounded)."""
+        return round(self.elapsed * 1000, 3)
+
+    def _record(self, error: bool = False) -> None:
+        if self.histogram is not None:
+            metric = self.histogram.labels(**self.labels) if self.labels else self.histogram
+            metric.observe(self.elapsed)
+        getattr(logger, self.level)(
+            "span_finished",
+            span=self.span,
+            duration_ms=self.ms,
+            error=error,
+            **self.labels,
+        )
+
+    def __call__(self, func: Callable) -> Callable:
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with timed(self.span, self.histogram, self.level, **self.labels):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with timed(self.span, self.histogram, self.level, **self.labels):
+                return func(*args, **kwargs)
+        return wrapper
+
+
+def observe_cache(cache: str, result: str) -> None:
+    """Count one cache lookup."""
+    CACHE_REQUESTS.labels(cache=cache, result=result).inc()
+
+
+def render_latest() -> tuple:
+    """(body, content type) for the /metrics endpoint."""
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gold Price Analyzer - HTTP Response Cache
+
+Persistent response cache for the rate-limited collector APIs
+(Alpha Vantage, NewsAPI, DXY).
+
+Responses are keyed by source + URL + normalized query params (API keys
+are dropped from the key) and stored on disk or in Redis. Every source
+has its own TTL. When an API reports that the quota is exhausted, the
+last good response is served even if it is stale.
+
+Modes (HTTP_CACHE_MODE):
+    live    - serve fresh entries, fetch and store otherwise (default)
+    off     - always hit the network, never store
+    record  - always hit the network and store every good response
+    replay  - never hit the network; serve stored entries regardless of
+              age and raise CacheMissError for anything unknown
+
+Recording fixtures for offline pipeline tests:
+    HTTP_CACHE_MODE=record HTTP_CACHE_DIR=tests/fixtures/http python scripts/...
+    HTTP_CACHE_MODE=replay HTTP_CACHE_DIR=tests/fixtures/http pytest ...
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+License: MIT
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Mapping, Optional
+
+import requests
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.metrics import COLLECTOR_FETCH_SECONDS, observe_cache
+
+logger = get_logger(__name__)
+
+# Query parameters that never take part in the cache key
+SECRET_PARAMS = {"apikey", "api_key", "apiKey", "token", "access_key"}
+
+# Response classification returned by the per-source classifiers
+OK = "ok"
+RATE_LIMITED = "rate_limited"
+ERROR = "error"
+
+Classifier = Callable[[int, Any], str]
+
+
+class CacheMissError(requests.exceptions.RequestException):
+    """Raised in replay mode when no stored response exists."""
+
+
+@dataclass
+class CachedResponse:
+    """Minimal response object returned by `HttpResponseCache.get_json`."""
+
+    status_code: int
+    data: Any
+    from_cache: bool = False
+    stale: bool = False
+    # why a stale entry was served: RATE_LIMITED or "network_error"
+    stale_reason: Optional[str] = None
+
+    def json(self) -> Any:
+        """Parsed JSON body (mirrors `requests.Response.json`)."""
+        return self.data
+
+    def raise_for_status(self) -> None:
+        """Raise `requests.HTTPError` for 4xx/5xx responses."""
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f"HTTP {self.status_code}")
+
+
+# ====================================
+# Response classifiers
+# ====================================
+def classify_default(status_code: int, data: Any) -> str:
+    """Any 200 response is good; 429 means quota exhausted."""
+    if status_code == 429:
+        return RATE_LIMITED
+    return OK if status_code == 200 else ERROR
+
+
+def classify_alpha_vantage(status_code: int, data: Any) -> str:
+    """Alpha Vantage returns HTTP 200 with a `Note` / `Information` on throttling."""
+    if status_code != 200 or not isinstance(data, dict):
+        return classify_default(status_code, data)
+    if "Note" in data or "Information" in data:
+        return RATE_LIMITED
+    if "Error Message" in data:
+        return ERROR
+    return OK
+
+
+def classify_newsapi(status_code: int, data: Any) -> str:
+    """NewsAPI uses HTTP 429 and `code: rateLimited`."""
+    if isinstance(data, dict) and data.get("code") in ("rateLimited", "maximumResultsReached"):
+        return RATE_LIMITED
+    if isinstance(data, dict) and data.get("status") == "error":
+        return ERROR
+    return classify_default(status_code, data)
+
+
+# ====================================
+# Backends
+# ====================================
+class FileCacheBackend:
+    """One JSON file per entry under a cache directory."""
+
+    def __init__(self, directory: str):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning("http_cache_entry_unreadable", path=str(path), error=str(e))
+            return None
+
+    def set(self, key: str, entry: Dict[str, Any], ttl_seconds: Optional[int] = None) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # write-then-rename so readers never see a half-written file; the temp
+        # name is unique so concurrent writers of one key never share it
+        tmp = tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=path.parent, suffix=".tmp", delete=False
+        )
+        try:
+            with tmp:
+                json.dump(entry, tmp, ensure_ascii=False)
+            os.replace(tmp.name, path)
+        except BaseException:
+            Path(tmp.name).unlink(missing_ok=True)
+            raise
+
+
+class RedisCacheBackend:
+    """Entries stored as JSON strings in Redis."""
+
+    KEY_PREFIX = "http_cache:"
+
+    def __init__(self, url: Optional[str] = None, client: Any = None):
+        if client is None:
+            try:
+                import redis
+            except ImportError as e:
+                raise RuntimeError("redis package is required for the Redis HTTP cache") from e
+            client = redis.Redis.from_url(url or settings.REDIS_URL)
+        self.client = client
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        raw = self.client.get(self.KEY_PREFIX + key)
+        return json.loads(raw) if raw else None
+
+    def set(self, key: str, entry: Dict[str, Any], ttl_seconds: Optional[int] = None) -> None:
+        # keep entries past their TTL so they can be served stale
+        self.client.set(
+            self.KEY_PREFIX + key,
+            json.dumps(entry, ensure_ascii=False),
+            ex=ttl_seconds,
+        )
+
+
+# ====================================
+# Cache
+# ====================================
+class HttpResponseCache:
+    """
+    Cached `GET` for JSON APIs.
+
+    Example:
+        >>> cache = get_http_cache()
+        >>> response = cache.get_json(
+        ...     "alpha_vantage", BASE_URL, params,
+        ...     classify=classify_alpha_vantage,
+        ... )
+        >>> response.from_cache, response.stale
+        (True, False)
+    """
+
+    MODES = ("live", "off", "record", "replay")
+
+    def __init__(
+        self,
+        backend: Any = None,
+        mode: Optional[str] = None,
+        ttls: Optional[Mapping[str, int]] = None,
+        default_ttl: Optional[int] = None,
+        max_stale_seconds: Optional[int] = None,
+        http_get: Callable[..., requests.Response] = requests.get,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            backend: Storage backend (default: from HTTP_CACHE_BACKEND)
+            mode: live, off, record or replay (default: HTTP_CACHE_MODE)
+            ttls: TTL in seconds per source
+            default_ttl: TTL for sources missing from `ttls`
+            max_stale_seconds: Oldest entry served when quota is exhausted
+            http_get: Function used for network requests
+            clock: Wall clock (injectable for tests)
+        """
+        self.mode = (mode or settings.HTTP_CACHE_MODE).lower()
+        if self.mode not in self.MODES:
+            raise ValueError(f"Unknown HTTP cache mode: {self.mode}")
+
+        self.backend = backend if backend is not None else _build_backend()
+        self.ttls = dict(ttls if ttls is not None else settings.HTTP_CACHE_TTLS)
+        self.default_ttl = default_ttl if default_ttl is not None else settings.CACHE_TTL_SECONDS
+        self.max_stale_seconds = (
+            max_stale_seconds if max_stale_seconds is not None
+            else settings.HTTP_CACHE_MAX_STALE_SECONDS
+        )
+        self._http_get = http_get
+        self._clock = clock
+
+    @staticmethod
+    def make_key(source: str, url: str, params: Optional[Mapping[str, Any]] = None) -> str:
+        """
+        Stable cache key: source + URL + sorted params without secrets.
+
+        Example:
+            >>> HttpResponseCache.make_key("av", "u", {"b": 1, "a": 2, "apikey": "x"}) == \\
+            ...     HttpResponseCache.make_key("av", "u", {"a": "2", "b": "1"})
+            True
+        """
+        normalized = sorted(
+            (str(k), str(v))
+            for k, v in (params or {}).items()
+            if k not in SECRET_PARAMS and v is not None
+        )
+        raw = json.dumps([source, url, normalized], separators=(",", ":"))
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def ttl_for(self, source: str) -> int:
+        """TTL in seconds for a source."""
+        return int(self.ttls.get(source, self.default_ttl))
+
+    def get_json(
+        self,
+        source: str,
+        url: str,
+        params: Optional[Mapping[str, Any]] = None,
+        timeout: float = 30,
+        headers: Optional[Mapping[str, str]] = None,
+        classify: Classifier = classify_default,
+    ) -> CachedResponse:
+        """
+        GET a JSON endpoint through the cache.
+
+        Raises:
+            CacheMissError: replay mode and nothing stored
+            requests.RequestException: network failure with no stored entry
+        """
+        key = self.make_key(source, url, params)
+        now = self._clock()
+        entry = self.backend.get(key) if self.mode != "off" else None
+        age = now - entry["stored_at"] if entry else None
+
+        if self.mode == "replay":
+            if entry is None:
+                observe_cache("http", "miss")
+                raise CacheMissError(f"No recorded response for {source} {url}")
+            observe_cache("http", "hit")
+            return self._from_entry(entry, stale=False)
+
+        if self.mode == "live" and entry is not None and age < self.ttl_for(source):
+            logger.debug("http_cache_hit", source=source, age_seconds=round(age))
+            observe_cache("http", "hit")
+            return self._from_entry(entry, stale=False)
+
+        started = time.perf_counter()
+        try:
+            response = self._http_get(url, params=params, headers=headers, timeout=timeout)
+        except requests.exceptions.RequestException as e:
+            COLLECTOR_FETCH_SECONDS.labels(source=source, outcome="error").observe(time.perf_counter() - started)
+            if self._can_serve_stale(entry, age):
+                logger.warning("http_cache_serving_stale", source=source, reason="network_error", error=str(e))
+                observe_cache("http", "stale")
+                return self._from_entry(entry, stale=True, reason="network_error")
+            raise
+
+        try:
+            data = response.json()
+        except ValueError:
+            data = None
+
+        status = classify(response.status_code, data)
+        COLLECTOR_FETCH_SECONDS.labels(source=source, outcome=status).observe(time.perf_counter() - started)
+
+        if status == RATE_LIMITED and self._can_serve_stale(entry, age):
+            logger.warning(
+                "http_cache_serving_stale",
+                source=source,
+                reason=RATE_LIMITED,
+                age_seconds=round(age),
+            )
+            observe_cache("http", "stale")
+            return self._from_entry(entry, stale=True, reason=RATE_LIMITED)
+
+        if status == OK and self.mode in ("live", "record"):
+            self.backend.set(
+                key,
+                {
+                    "source": source,
+                    "url": url,
+                    "status_code": response.status_code,
+                    "data": data,
+                    "stored_at": now,
+                },
+                ttl_seconds=None if self.mode == "record" else self.ttl_for(source) + self.max_stale_seconds,
+            )
+
+        logger.debug("http_cache_miss", source=source, status=status)
+        observe_cache("http", "miss" if self.mode != "off" else "bypass")
+        return CachedResponse(status_code=response.status_code, data=data)
+
+    def _can_serve_stale(self, entry: Optional[Dict[str, Any]], age: Optional[float]) -> bool:
+        return entry is not None and age is not None and age <= self.max_stale_seconds
+
+    @staticmethod
+    def _from_entry(entry: Dict[str, Any], stale: bool, reason: Optional[str] = None) -> CachedResponse:
+        return CachedResponse(
+            status_code=entry["status_code"],
+            data=entry["data"],
+            from_cache=True,
+            stale=stale,
+            stale_reason=reason,
+        )
+
+
+def _build_backend() -> Any:
+    if settings.HTTP_CACHE_BACKEND.lower() == "redis":
+        return RedisCacheBackend(settings.REDIS_URL)
+    return FileCacheBackend(settings.HTTP_CACHE_DIR)
+
+
+@lru_cache(maxsize=1)
+def get_http_cache() -> HttpResponseCache:
+    """Process-wide HTTP cache built from settings."""
+    return HttpResponseCache()
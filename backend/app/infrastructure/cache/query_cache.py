@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gold Price Analyzer - Query Result Cache
+
+Two-tier cache for read-heavy service methods (latest news, news stats,
+DXY data and statistics):
+
+    local  - per-process TTL/LRU dict; entries live at most
+             QUERY_CACHE_LOCAL_TTL_SECONDS so workers never drift far apart
+    redis  - shared tier (QUERY_CACHE_BACKEND=redis), values pickled,
+             per-namespace TTL from QUERY_CACHE_TTLS
+
+Concurrent misses for the same key are coalesced: one caller runs the
+query, the others await its result (no stampede after an invalidation).
+
+Mutable values (DataFrames, lists, dicts) are copied into and out of the
+local tier and for coalesced waiters, so one caller editing its result
+never changes what the next caller sees.
+
+Keys are grouped by namespace ("news", "dollar_index"). Collectors call
+`invalidate(namespace)` after writing rows, which drops the local entries
+and every Redis key recorded under that namespace.
+
+    @cached("news")
+    async def get_latest_news(self, limit: int = 10): ...
+
+    await get_query_cache().invalidate("news")
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+License: MIT
+"""
+
+import asyncio
+import copy
+import functools
+import hashlib
+import json
+import pickle
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, Mapping, Optional, Tuple
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.metrics import observe_cache
+
+logger = get_logger(__name__)
+
+KEY_PREFIX = "query_cache:"
+
+_IMMUTABLE = (str, bytes, int, float, bool, type(None))
+
+
+def _detached(value: Any) -> Any:
+    """A copy callers may mutate (immutable values are returned as is)."""
+    if isinstance(value, _IMMUTABLE):
+        return value
+    return copy.deepcopy(value)
+
+
+class LocalTier:
+    """In-process TTL + LRU store."""
+
+    def __init__(self, max_entries: int, clock: Callable[[], float] = time.monotonic):
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        item = self._entries.get(key)
+        if item is None:
+            return False, None
+        expires_at, value = item
+        if expires_at <= self._clock():
+            del self._entries[key]
+            return False, None
+        self._entries.move_to_end(key)
+        return True, _detached(value)
+
+    def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        self._entries[key] = (self._clock() + ttl_seconds, _detached(value))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def drop_namespace(self, namespace: str) -> int:
+        prefix = f"{namespace}:"
+        stale = [key for key in self._entries if key.startswith(prefix)]
+        for key in stale:
+            del self._entries[key]
+        return len(stale)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class QueryCache:
+    """
+    Local + Redis cache with request coalescing.
+
+    Example:
+        >>> cache = QueryCache(redis=None)
+        >>> stats = await cache.get_or_load("news", "stats", load_stats)
+    """
+
+    def __init__(
+        self,
+        redis: Any = None,
+        ttls: Optional[Mapping[str, int]] = None,
+        default_ttl: Optional[int] = None,
+        local_ttl: Optional[float] = None,
+        local_max_entries: Optional[int] = None,
+        enabled: Optional[bool] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            redis: redis.asyncio client for the shared tier (None = local only)
+            ttls: TTL in seconds per namespace
+            default_ttl: TTL for namespaces missing from `ttls`
+            local_ttl: Upper bound for local entries
+            local_max_entries: LRU size of the local tier
+            enabled: False turns every call into a pass-through
+            clock: Monotonic clock (injectable for tests)
+        """
+        self.redis = redis
+        self.ttls = dict(ttls if ttls is not None else settings.QUERY_CACHE_TTLS)
+        self.default_ttl = default_ttl if default_ttl is not None else settings.CACHE_TTL_SECONDS
+        self.local_ttl = local_ttl if local_ttl is not None else settings.QUERY_CACHE_LOCAL_TTL_SECONDS
+        self.enabled = settings.QUERY_CACHE_ENABLED if enabled is None else enabled
+        self.local = LocalTier(
+            local_max_entries if local_max_entries is not None else settings.QUERY_CACHE_LOCAL_MAX_ENTRIES,
+            clock=clock,
+        )
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._generations: Dict[str, int] = {}
+
+    @staticmethod
+    def make_key(namespace: str, name: str, args: tuple = (), kwargs: Optional[Mapping[str, Any]] = None) -> str:
+        """`namespace:name:hash(args)`; the namespace prefix is what invalidation matches."""
+        raw = json.dumps([args, sorted((kwargs or {}).items())], default=str, separators=(",", ":"))
+        digest = hashlib.sha1(raw.encode("utf-8")).hexdigest()[:16]
+        return f"{namespace}:{name}:{digest}"
+
+    def ttl_for(self, namespace: str) -> int:
+        """TTL in seconds for a namespace."""
+        return int(self.ttls.get(namespace, self.default_ttl))
+
+    async def get_or_load(
+        self,
+        namespace: str,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """
+        Cached value for `key`, running `loader` once on a miss.
+
+        `key` must start with `namespace:` (use `make_key`).
+        """
+        if not self.enabled:
+            observe_cache("query", "bypass")
+            return await loader()
+
+        found, value = self.local.get(key)
+        if found:
+            observe_cache("query", "hit_local")
+            return value
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            observe_cache("query", "coalesced")
+            return _detached(await asyncio.shield(inflight))
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await self._load(namespace, key, loader)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # nobody else may be waiting; don't warn about an unretrieved exception
+            future.exception()
+            raise
+        else:
+            future.set_result(value)
+            return value
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    async def _load(self, namespace: str, key: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        ttl = self.ttl_for(namespace)
+        generation = self._generations.get(namespace, 0)
+
+        if self.redis is not None:
+            found, value = await self._redis_get(key)
+            if found:
+                observe_cache("query", "hit_redis")
+                self.local.set(key, value, min(ttl, self.local_ttl))
+                return value
+
+        observe_cache("query", "miss")
+        value = await loader()
+        if self._generations.get(namespace, 0) != generation:
+            # invalidated while loading: the result may predate the write
+            return value
+        self.local.set(key, value, min(ttl, self.local_ttl))
+        if self.redis is not None:
+            await self._redis_set(namespace, key, value, ttl)
+        return value
+
+    async def _redis_get(self, key: str) -> Tuple[bool, Any]:
+        try:
+            raw = await self.redis.get(KEY_PREFIX + key)
+            if raw is None:
+                return False, None
+            return True, pickle.loads(raw)
+        except Exception as e:
+            logger.warning("query_cache_redis_error", op="get", key=key, error=str(e))
+            return False, None
+
+    async def _redis_set(self, namespace: str, key: str, value: Any, ttl: int) -> None:
+        members = f"{KEY_PREFIX}ns:{namespace}"
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.set(KEY_PREFIX + key, pickle.dumps(value), ex=ttl)
+                pipe.sadd(members, key)
+                pipe.expire(members, ttl)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning("query_cache_redis_error", op="set", key=key, error=str(e))
+
+    async def invalidate(self, *namespaces: str) -> None:
+        """Drop every cached entry of the given namespaces (both tiers)."""
+        for namespace in namespaces:
+            self._generations[namespace] = self._generations.get(namespace, 0) + 1
+            prefix = f"{namespace}:"
+            for key in [k for k in self._inflight if k.startswith(prefix)]:
+                # later callers start a fresh load instead of joining a stale one
+                del self._inflight[key]
+            dropped = self.local.drop_namespace(namespace)
+            if self.redis is not None:
+                members = f"{KEY_PREFIX}ns:{namespace}"
+                try:
+                    keys = await self.redis.smembers(members)
+                    dropped += len(keys)
+                    await self.redis.delete(
+                        members,
+                        *(KEY_PREFIX + (k.decode() if isinstance(k, bytes) else k) for k in keys),
+                    )
+                except Exception as e:
+                    logger.warning("query_cache_redis_error", op="invalidate", namespace=namespace, error=str(e))
+            logger.debug("query_cache_invalidated", namespace=namespace, dropped=dropped)
+
+
+def cached(namespace: str) -> Callable:
+    """
+    Cache an async method's result under `namespace`.
+
+    The key is the method's qualified name plus its arguments (`self` is
+    skipped), so every argument must have a stable `str`.
+    """
+    def decorator(func: Callable) -> Callable:
+        name = func.__qualname__
+
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            cache = get_query_cache()
+            key = cache.make_key(namespace, name, args, kwargs)
+            return await cache.get_or_load(namespace, key, lambda: func(self, *args, **kwargs))
+
+        return wrapper
+
+    return decorator
+
+
+async def invalidate(*namespaces: str) -> None:
+    """Invalidate namespaces on the process-wide cache."""
+    await get_query_cache().invalidate(*namespaces)
+
+
+def _build_redis() -> Any:
+    if settings.QUERY_CACHE_BACKEND.lower() != "redis":
+        return None
+    try:
+        import redis.asyncio as aioredis
+    except ImportError as e:
+        raise RuntimeError("redis package is required for QUERY_CACHE_BACKEND=redis") from e
+    return aioredis.Redis.from_url(settings.REDIS_URL)
+
+
+@lru_cache(maxsize=1)
+def get_query_cache() -> QueryCache:
+    """Process-wide query cache built from settings."""
+    return QueryCache(redis=_build_redis())
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gold Price Analyzer - Token Cache
+
+Tokenized news_events inputs on disk, so re-analysis (force_reanalyze,
+a new FinBERT checkpoint with the same tokenizer) skips the tokenizer.
+
+One directory per tokenizer version (vocabulary + scoring mode + length
+limits, see SentimentAnalysisService.tokenizer_version):
+
+    tokens.i32    every article's token IDs, packed back to back
+    offsets.i64   article i is tokens[offsets[i]:offsets[i + 1]]
+    ids.i64       news_events.id of article i
+    hashes.u64    content_hash(title, description) of article i
+    meta.json     layout version and committed article count
+
+All arrays are append-only and read through np.memmap; lookups return
+views into the mapped tokens. An ID whose stored hash does not match the
+caller's is a miss (edited row, or IDs reused after a database reset);
+re-adding it appends a new row that supersedes the old one. meta.json is
+replaced atomically after every append, and bytes past its count (an
+interrupted append) are truncated before the next one. Appends hold an
+exclusive lock on `.lock`, so several processes can share a directory.
+
+    hashes = [content_hash(n.title, n.description) for n in articles]
+    cache = TokenCache(settings.FINBERT_TOKEN_CACHE_DIR, service.tokenizer_version())
+    cached = cache.get_many(article_ids, hashes)    # array view or None per id
+    cache.add(missing_ids, encoded, missing_hashes)
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+License: MIT
+"""
+
+import hashlib
+import json
+import os
+import re
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not POSIX
+    fcntl = None
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+TOKEN_DTYPE = np.int32
+INDEX_DTYPE = np.int64
+HASH_DTYPE = np.uint64
+
+# bumped when the file layout changes; older caches are dropped
+FORMAT_VERSION = 2
+
+
+def content_hash(title: Optional[str], description: Optional[str]) -> int:
+    """64-bit hash of the text an article is tokenized from."""
+    text = f"{title or ''}\x1f{description or ''}".encode('utf-8')
+    return int.from_bytes(hashlib.blake2b(text, digest_size=8).digest(), 'little')
+
+
+class TokenCache:
+    """Packed int32 token arrays keyed by article ID, for one tokenizer version."""
+
+    def __init__(self, directory: str, tokenizer_version: str):
+        self.tokenizer_version = tokenizer_version
+        self.path = Path(directory) / re.sub(r'[^A-Za-z0-9_.-]+', '_', tokenizer_version)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._tokens_file = self.path / 'tokens.i32'
+        self._offsets_file = self.path / 'offsets.i64'
+        self._ids_file = self.path / 'ids.i64'
+        self._hashes_file = self.path / 'hashes.u64'
+        self._meta_file = self.path / 'meta.json'
+        self._lock_file = self.path / '.lock'
+        self._load()
+
+    # ------------------------------------------------------------------
+    # read
+    # ------------------------------------------------------------------
+    def _load(self) -> None:
+        self.count = 0
+        if self._meta_file.exists():
+            meta = json.loads(self._meta_file.read_text())
+            if meta.get('tokenizer_version') == self.tokenizer_version and meta.get('format') == FORMAT_VERSION:
+                self.count = int(meta['count'])
+
+        self._offsets = self._map(self._offsets_file, INDEX_DTYPE, self.count + 1 if self.count else 0)
+        self._ids = self._map(self._ids_file, INDEX_DTYPE, self.count)
+        self._hashes = self._map(self._hashes_file, HASH_DTYPE, self.count)
+        total = int(self._offsets[-1]) if self.count else 0
+        self._tokens = self._map(self._tokens_file, TOKEN_DTYPE, total)
+        # a re-added ID's later row supersedes the earlier one
+        self._rows: Dict[int, int] = {int(article_id): row for row, article_id in enumerate(self._ids)}
+
+    @staticmethod
+    def _map(path: Path, dtype, length: int) -> np.ndarray:
+        if length == 0:
+            return np.empty(0, dtype=dtype)
+        return np.memmap(path, dtype=dtype, mode='r', shape=(length,))
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __contains__(self, article_id: int) -> bool:
+        return int(article_id) in self._rows
+
+    def get(self, article_id: int, content_hash: Optional[int] = None) -> Optional[np.ndarray]:
+        """
+        Token IDs of one article (read-only view), or None.
+
+        With `content_hash`, an entry tokenized from other text is a miss.
+        """
+        row = self._rows.get(int(article_id))
+        if row is None:
+            return None
+        if content_hash is not None and int(self._hashes[row]) != content_hash:
+            return None
+        return self._tokens[self._offsets[row]:self._offsets[row + 1]]
+
+    def get_many(
+        self,
+        article_ids: Sequence[int],
+        content_hashes: Optional[Sequence[int]] = None,
+    ) -> List[Optional[np.ndarray]]:
+        """`get` for every ID, in order."""
+        hashes = content_hashes if content_hashes is not None else [None] * len(article_ids)
+        return [self.get(article_id, h) for article_id, h in zip(article_ids, hashes)]
+
+    # ------------------------------------------------------------------
+    # write
+    # ------------------------------------------------------------------
+    def add(
+        self,
+        article_ids: Sequence[int],
+        encoded: Sequence[Sequence[int]],
+        content_hashes: Optional[Sequence[int]] = None,
+    ) -> int:
+        """
+        Append token IDs for articles that are not cached yet, or whose
+        cached entry has another content hash.
+
+        Returns:
+            Number of articles appended
+        """
+        hashes = content_hashes if content_hashes is not None else [0] * len(article_ids)
+        if not len(article_ids) == len(encoded) == len(hashes):
+            raise ValueError("article_ids, encoded and content_hashes must have the same length")
+
+        with self._locked():
+            # another process may have appended since we mapped the files
+            self._load()
+            return self._append(article_ids, encoded, hashes)
+
+    def _append(self, article_ids: Sequence[int], encoded: Sequence[Sequence[int]], hashes: Sequence[int]) -> int:
+        new_ids: List[int] = []
+        new_hashes: List[int] = []
+        arrays: List[np.ndarray] = []
+        for article_id, ids, h in zip(article_ids, encoded, hashes):
+            article_id = int(article_id)
+            if self.get(article_id, int(h)) is not None or article_id in new_ids:
+                continue
+            new_ids.append(article_id)
+            new_hashes.append(int(h))
+            arrays.append(np.asarray(ids, dtype=TOKEN_DTYPE))
+        if not new_ids:
+            return 0
+
+        total = int(self._offsets[-1]) if self.count else 0
+        lengths = np.fromiter((len(a) for a in arrays), dtype=INDEX_DTYPE, count=len(arrays))
+        offsets = total + np.cumsum(lengths)
+        if not self.count:
+            offsets = np.concatenate([[0], offsets]).astype(INDEX_DTYPE)
+
+        # drop whatever an interrupted append left past the committed count
+        self._truncate(self._tokens_file, total * TOKEN_DTYPE().itemsize)
+        self._truncate(self._offsets_file, (self.count + 1 if self.count else 0) * INDEX_DTYPE().itemsize)
+        self._truncate(self._ids_file, self.count * INDEX_DTYPE().itemsize)
+        self._truncate(self._hashes_file, self.count * HASH_DTYPE().itemsize)
+
+        with open(self._tokens_file, 'ab') as f:
+            for array in arrays:
+                f.write(array.tobytes())
+        with open(self._offsets_file, 'ab') as f:
+            f.write(offsets.astype(INDEX_DTYPE).tobytes())
+        with open(self._ids_file, 'ab') as f:
+            f.write(np.asarray(new_ids, dtype=INDEX_DTYPE).tobytes())
+        with open(self._hashes_file, 'ab') as f:
+            f.write(np.asarray(new_hashes, dtype=HASH_DTYPE).tobytes())
+
+        self._commit(self.count + len(new_ids))
+        self._load()
+        logger.debug("token_cache_appended", articles=len(new_ids), total=self.count,
+                     tokens=int(lengths.sum()))
+        return len(new_ids)
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Exclusive lock on the cache directory (no-op without fcntl)."""
+        with open(self._lock_file, 'a') as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock, fcntl.LOCK_UN)
+
+    @staticmethod
+    def _truncate(path: Path, size: int) -> None:
+        if path.exists() and path.stat().st_size > size:
+            os.truncate(path, size)
+
+    def _commit(self, count: int) -> None:
+        tmp = self._meta_file.with_suffix('.tmp')
+        tmp.write_text(json.dumps({
+            'tokenizer_version': self.tokenizer_version,
+            'format': FORMAT_VERSION,
+            'count': count,
+        }))
+        os.replace(tmp, self._meta_file)
+
+    def clear(self) -> None:
+        """Forget every cached article of this tokenizer version."""
+        with self._locked():
+            for path in (self._tokens_file, self._offsets_file, self._ids_file, self._hashes_file, self._meta_file):
+                path.unlink(missing_ok=True)
+            self._load()
@@ -23,19 +23,17 @@ from sqlalchemy import text
 
 from app.core.config import settings
 from app.core.logging import get_logger
+from app.infrastructure.database.engine import dispose_sync_engines, engine_options
 
 logger = get_logger(__name__)
 
 # ====================================
 # Engine Setup
 # ====================================
+# تنظیمات pool مشترک با engine همگام (engine.py) | Same pool settings as the sync engine
 engine = create_async_engine(
     settings.DATABASE_URL,
-    echo=settings.DEBUG,
-    pool_size=settings.DATABASE_POOL_SIZE,
-    max_overflow=settings.DATABASE_MAX_OVERFLOW,
-    pool_pre_ping=True,
-    pool_recycle=3600,
+    **engine_options(settings.DATABASE_URL),
 )
 
 # ====================================
@@ -86,6 +84,11 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
 # ====================================
 # Database Lifecycle
 # ====================================
+# ستون‌هایی که بعد از ساخت جدول اضافه شده‌اند | Columns added after the table was first created
+ADDED_COLUMNS = (
+    "ALTER TABLE news_events ADD COLUMN IF NOT EXISTS sentiment_model VARCHAR(20)",
+)
+
 async def init_db() -> None:
     """
     Initialize database - create all tables.
@@ -102,10 +105,20 @@ async def init_db() -> None:
         from app.infrastructure.database.models import (
             gold_price_fact,
             news_event,
+            dollar_index,
+            collection_watermark,
+            sentiment_rollup,
+            news_impact,
+            backfill_chunk,
         )
         
         # Create all tables
         await conn.run_sync(Base.metadata.create_all)
+
+        # create_all does not add columns to existing tables
+        if conn.dialect.name == "postgresql":
+            for statement in ADDED_COLUMNS:
+                await conn.execute(text(statement))
     
     logger.info("database_initialized", tables=len(Base.metadata.tables))
 
@@ -121,6 +134,7 @@ async def close_db() -> None:
     """
     logger.info("database_closing")
     await engine.dispose()
+    dispose_sync_engines()
     logger.info("database_closed")
 
 
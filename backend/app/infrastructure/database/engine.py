@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gold Price Analyzer - Database Engines
+
+One pooled engine per process and URL, for both access styles:
+
+    async  - `base.engine` / `AsyncSessionLocal` (API, collectors)
+    sync   - `get_sync_engine()` (pandas-based ML pipeline, scripts)
+
+Both are built from `engine_options`, so DATABASE_POOL_SIZE,
+DATABASE_MAX_OVERFLOW and DATABASE_POOL_TIMEOUT mean the same thing
+on either path.
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+License: MIT
+"""
+
+import threading
+from typing import Any, Dict, Optional
+
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+_sync_engines: Dict[str, Engine] = {}
+_lock = threading.Lock()
+
+
+def engine_options(url: str) -> Dict[str, Any]:
+    """
+    Shared engine keyword arguments.
+
+    SQLite (tests, benchmarks) uses its own pool classes, which reject
+    the queue-pool sizing arguments.
+    """
+    options: Dict[str, Any] = {"echo": settings.DEBUG or settings.DATABASE_ECHO}
+    if make_url(url).get_backend_name() == "sqlite":
+        return options
+
+    options.update(
+        pool_size=settings.DATABASE_POOL_SIZE,
+        max_overflow=settings.DATABASE_MAX_OVERFLOW,
+        pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+        pool_pre_ping=True,
+        pool_recycle=3600,
+    )
+    return options
+
+
+def get_sync_engine(url: Optional[str] = None) -> Engine:
+    """
+    Process-wide synchronous engine (default: SYNC_DATABASE_URL).
+
+    Repeated calls with the same URL share one engine and its pool.
+    """
+    url = url or settings.SYNC_DATABASE_URL
+    engine = _sync_engines.get(url)
+    if engine is None:
+        with _lock:
+            engine = _sync_engines.get(url)
+            if engine is None:
+                engine = create_engine(url, **engine_options(url))
+                _sync_engines[url] = engine
+                logger.info("sync_engine_created", backend=engine.dialect.name)
+    return engine
+
+
+def get_sync_sessionmaker(url: Optional[str] = None) -> sessionmaker:
+    """Session factory bound to the shared sync engine."""
+    return sessionmaker(get_sync_engine(url), class_=Session, expire_on_commit=False)
+
+
+def dispose_sync_engines() -> None:
+    """Close every pooled sync connection (shutdown / after fork)."""
+    with _lock:
+        for engine in _sync_engines.values():
+            engine.dispose()
+        _sync_engines.clear()
@@ -13,9 +13,19 @@ License: MIT
 from app.infrastructure.database.models.gold_price_fact import GoldPriceFact
 from app.infrastructure.database.models.news_event import NewsEvent
 from app.infrastructure.database.models.dollar_index import DollarIndexPrice
+from app.infrastructure.database.models.collection_watermark import CollectionWatermark
+from app.infrastructure.database.models.sentiment_rollup import SentimentRollup, SentimentRollupBuild
+from app.infrastructure.database.models.news_impact import NewsImpactState, NewsImpactCheckpoint
+from app.infrastructure.database.models.backfill_chunk import BackfillChunk
 
 __all__ = [
     "GoldPriceFact",
     "NewsEvent",
     "DollarIndexPrice",
+    "CollectionWatermark",
+    "SentimentRollup",
+    "SentimentRollupBuild",
+    "NewsImpactState",
+    "NewsImpactCheckpoint",
+    "BackfillChunk",
 ]
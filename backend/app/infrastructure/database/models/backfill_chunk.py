@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gold Price Analyzer - Backfill Chunk Model
+
+Checkpoint of a historical backfill: one row per (job, date-range chunk)
+so an interrupted backfill resumes with the chunks that are not done.
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+License: MIT
+"""
+
+from typing import Dict, Any
+from sqlalchemy import (
+    Column,
+    BigInteger,
+    Integer,
+    String,
+    Text,
+    DateTime,
+    UniqueConstraint,
+)
+from sqlalchemy.sql import func
+
+from app.infrastructure.database.base import Base
+
+
+class BackfillChunk(Base):
+    """
+    Status of one backfill chunk.
+
+    `status` is running, done or failed. A chunk left `running` belongs
+    to a run that died and is picked up again like a failed one.
+
+    Author: Hoseyn Doulabi (@hoseynd-ai)
+    Created: 2026-10-19
+    """
+
+    __tablename__ = "backfill_chunks"
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+
+    job = Column(
+        String(50),
+        nullable=False,
+        comment="نام backfill: gold_daily, dollar_index, newsapi, ..."
+    )
+
+    chunk_start = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        comment="شروع بازه (UTC)"
+    )
+
+    chunk_end = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        comment="پایان بازه (UTC، انحصاری)"
+    )
+
+    status = Column(
+        String(10),
+        nullable=False,
+        comment="running, done, failed"
+    )
+
+    attempts = Column(
+        Integer,
+        nullable=False,
+        default=0,
+        comment="تعداد اجرا"
+    )
+
+    rows = Column(
+        Integer,
+        nullable=False,
+        default=0,
+        comment="ردیف‌های ذخیره شده در آخرین اجرا"
+    )
+
+    error = Column(
+        Text,
+        nullable=True,
+        comment="خطای آخرین اجرا"
+    )
+
+    updated_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        comment="زمان بروزرسانی"
+    )
+
+    __table_args__ = (
+        UniqueConstraint(
+            'job',
+            'chunk_start',
+            'chunk_end',
+            name='uq_backfill_chunks_job_range'
+        ),
+    )
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return (
+            f"<BackfillChunk("
+            f"job={self.job}, "
+            f"chunk_start={self.chunk_start}, "
+            f"status={self.status}"
+            f")>"
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "job": self.job,
+            "chunk_start": self.chunk_start.isoformat() if self.chunk_start else None,
+            "chunk_end": self.chunk_end.isoformat() if self.chunk_end else None,
+            "status": self.status,
+            "attempts": self.attempts,
+            "rows": self.rows,
+            "error": self.error,
+        }
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gold Price Analyzer - Collection Watermark Model
+
+High-water mark per (source, timeframe) so collectors can request only
+data newer than what they already stored.
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+License: MIT
+"""
+
+from typing import Dict, Any
+from sqlalchemy import (
+    Column,
+    BigInteger,
+    Integer,
+    String,
+    DateTime,
+    UniqueConstraint,
+)
+from sqlalchemy.sql import func
+
+from app.infrastructure.database.base import Base
+
+
+class CollectionWatermark(Base):
+    """
+    Collection high-water mark.
+
+    One row per (source, timeframe). `last_timestamp` is the newest
+    timestamp successfully stored by that collector.
+
+    Author: Hoseyn Doulabi (@hoseynd-ai)
+    Created: 2026-10-19
+    """
+
+    __tablename__ = "collection_watermarks"
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+
+    source = Column(
+        String(50),
+        nullable=False,
+        comment="منبع داده: yahoo_finance, alpha_vantage_gld, ..."
+    )
+
+    timeframe = Column(
+        String(20),
+        nullable=False,
+        comment="بازه زمانی: hourly, daily"
+    )
+
+    last_timestamp = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        comment="آخرین timestamp ذخیره شده"
+    )
+
+    last_run_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        comment="زمان آخرین اجرا"
+    )
+
+    last_rows = Column(
+        Integer,
+        default=0,
+        comment="تعداد ردیف‌های آخرین اجرا"
+    )
+
+    total_rows = Column(
+        BigInteger,
+        default=0,
+        comment="مجموع ردیف‌های ذخیره شده"
+    )
+
+    __table_args__ = (
+        UniqueConstraint(
+            'source',
+            'timeframe',
+            name='uq_collection_watermarks_source_tf'
+        ),
+    )
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return (
+            f"<CollectionWatermark("
+            f"source={self.source}, "
+            f"timeframe={self.timeframe}, "
+            f"last_timestamp={self.last_timestamp}"
+            f")>"
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "source": self.source,
+            "timeframe": self.timeframe,
+            "last_timestamp": self.last_timestamp.isoformat() if self.last_timestamp else None,
+            "last_run_at": self.last_run_at.isoformat() if self.last_run_at else None,
+            "last_rows": self.last_rows,
+            "total_rows": self.total_rows,
+        }
@@ -115,6 +115,11 @@ class NewsEvent(Base):
         DECIMAL(3, 2),
         comment="اطمینان ML (0 to 1)"
     )
+
+    sentiment_model = Column(
+        String(20),
+        comment="مدلی که امتیاز را تولید کرد: textblob, finbert"
+    )
     
     # ====================================
     # Impact on Gold Price
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gold Price Analyzer - News Impact Models
+
+Persisted state of the exponentially time-decayed news impact signal:
+the running value (one row) and a checkpoint per scored article so the
+signal can be evaluated at any past timestamp.
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+License: MIT
+"""
+
+from typing import Dict, Any
+from sqlalchemy import (
+    Column,
+    BigInteger,
+    Integer,
+    Float,
+    String,
+    DateTime,
+    Index,
+)
+from sqlalchemy.sql import func
+
+from app.infrastructure.database.base import Base
+
+
+class NewsImpactState(Base):
+    """
+    Running decayed impact.
+
+    One row per signal name. `intensity` and `pressure` are the values
+    as of `as_of`; anything later is obtained by decaying them forward.
+
+    Author: Hoseyn Doulabi (@hoseynd-ai)
+    Created: 2026-10-19
+    """
+
+    __tablename__ = "news_impact_state"
+
+    name = Column(
+        String(50),
+        primary_key=True,
+        comment="نام سیگنال"
+    )
+
+    half_life_seconds = Column(
+        Float,
+        nullable=False,
+        comment="نیمه عمر (ثانیه)"
+    )
+
+    as_of = Column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="زمان آخرین خبر اعمال شده"
+    )
+
+    intensity = Column(
+        Float,
+        nullable=False,
+        default=0.0,
+        comment="مجموع decay شده impact_score × confidence"
+    )
+
+    pressure = Column(
+        Float,
+        nullable=False,
+        default=0.0,
+        comment="همان مقدار با علامت جهت sentiment"
+    )
+
+    article_count = Column(
+        Integer,
+        nullable=False,
+        default=0,
+        comment="تعداد اخبار اعمال شده"
+    )
+
+    updated_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        comment="زمان بروزرسانی"
+    )
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return (
+            f"<NewsImpactState("
+            f"name={self.name}, "
+            f"as_of={self.as_of}, "
+            f"intensity={self.intensity:.4f}"
+            f")>"
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "name": self.name,
+            "half_life_seconds": self.half_life_seconds,
+            "as_of": self.as_of.isoformat() if self.as_of else None,
+            "intensity": self.intensity,
+            "pressure": self.pressure,
+            "article_count": self.article_count,
+        }
+
+
+class NewsImpactCheckpoint(Base):
+    """
+    Value of the signal right after an article was applied.
+
+    Author: Hoseyn Doulabi (@hoseynd-ai)
+    Created: 2026-10-19
+    """
+
+    __tablename__ = "news_impact_checkpoints"
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+
+    name = Column(
+        String(50),
+        nullable=False,
+        comment="نام سیگنال"
+    )
+
+    ts = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        comment="زمان انتشار خبر"
+    )
+
+    intensity = Column(Float, nullable=False)
+    pressure = Column(Float, nullable=False)
+
+    __table_args__ = (
+        Index('idx_news_impact_checkpoints_name_ts', 'name', 'ts'),
+    )
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"<NewsImpactCheckpoint(name={self.name}, ts={self.ts}, intensity={self.intensity:.4f})>"
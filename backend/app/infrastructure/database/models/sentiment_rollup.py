@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gold Price Analyzer - Sentiment Rollup Model
+
+Pre-aggregated news sentiment per time bucket (1h, 4h, 1d, ...).
+Rows hold additive sums so they can be updated incrementally as
+articles are scored; means are derived on read.
+
+`sentiment_rollup_builds` records which bucket sizes were fully built
+from news_events; incremental deltas are only valid on top of a build.
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+License: MIT
+"""
+
+from typing import Dict, Any
+from sqlalchemy import (
+    Column,
+    BigInteger,
+    Integer,
+    Float,
+    String,
+    DateTime,
+    UniqueConstraint,
+)
+from sqlalchemy.sql import func
+
+from app.infrastructure.database.base import Base
+
+
+class SentimentRollup(Base):
+    """
+    Sentiment rollup bucket.
+
+    One row per (bucket_size, bucket_start).
+
+    Author: Hoseyn Doulabi (@hoseynd-ai)
+    Created: 2026-10-19
+    """
+
+    __tablename__ = "sentiment_rollups"
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+
+    bucket_size = Column(
+        String(10),
+        nullable=False,
+        comment="اندازه بازه: 1h, 4h, 1d"
+    )
+
+    bucket_start = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        comment="شروع بازه (UTC)"
+    )
+
+    article_count = Column(
+        Integer,
+        nullable=False,
+        default=0,
+        comment="تعداد اخبار تحلیل شده"
+    )
+
+    sum_score = Column(
+        Float,
+        nullable=False,
+        default=0.0,
+        comment="مجموع sentiment_score"
+    )
+
+    sum_confidence = Column(
+        Float,
+        nullable=False,
+        default=0.0,
+        comment="مجموع confidence"
+    )
+
+    sum_weighted_score = Column(
+        Float,
+        nullable=False,
+        default=0.0,
+        comment="مجموع sentiment_score × confidence"
+    )
+
+    sum_impact = Column(
+        Float,
+        nullable=False,
+        default=0.0,
+        comment="مجموع impact_score"
+    )
+
+    max_impact = Column(
+        Float,
+        nullable=False,
+        default=0.0,
+        comment="بیشترین impact_score"
+    )
+
+    bullish_count = Column(
+        Integer,
+        nullable=False,
+        default=0,
+        comment="تعداد اخبار bullish / very_bullish"
+    )
+
+    bearish_count = Column(
+        Integer,
+        nullable=False,
+        default=0,
+        comment="تعداد اخبار bearish / very_bearish"
+    )
+
+    updated_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        comment="زمان بروزرسانی"
+    )
+
+    __table_args__ = (
+        UniqueConstraint(
+            'bucket_size',
+            'bucket_start',
+            name='uq_sentiment_rollups_size_start'
+        ),
+    )
+
+    @property
+    def mean_score(self) -> float:
+        """Average sentiment score."""
+        return self.sum_score / self.article_count if self.article_count else 0.0
+
+    @property
+    def weighted_score(self) -> float:
+        """Confidence-weighted sentiment score."""
+        return self.sum_weighted_score / self.sum_confidence if self.sum_confidence else 0.0
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return (
+            f"<SentimentRollup("
+            f"bucket_size={self.bucket_size}, "
+            f"bucket_start={self.bucket_start}, "
+            f"count={self.article_count}"
+            f")>"
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "bucket_size": self.bucket_size,
+            "bucket_start": self.bucket_start.isoformat() if self.bucket_start else None,
+            "article_count": self.article_count,
+            "mean_score": self.mean_score,
+            "weighted_score": self.weighted_score,
+            "max_impact": self.max_impact,
+            "bullish_count": self.bullish_count,
+            "bearish_count": self.bearish_count,
+        }
+
+
+class SentimentRollupBuild(Base):
+    """
+    Full-build marker for one bucket size.
+
+    Author: Hoseyn Doulabi (@hoseynd-ai)
+    Created: 2026-10-19
+    """
+
+    __tablename__ = "sentiment_rollup_builds"
+
+    bucket_size = Column(
+        String(10),
+        primary_key=True,
+        comment="اندازه بازه: 1h, 4h, 1d"
+    )
+
+    built_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        comment="زمان آخرین ساخت کامل از news_events"
+    )
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"<SentimentRollupBuild(bucket_size={self.bucket_size}, built_at={self.built_at})>"
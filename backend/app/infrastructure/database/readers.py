@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gold Price Analyzer - Streaming Readers
+
+Large reads into pandas without buffering the whole result set twice.
+
+`pd.read_sql` fetches every row into a list of tuples before building
+the frame. These readers use a server-side cursor (`stream_results`,
+a named cursor on psycopg2 / asyncpg) and fetch DB_READ_CHUNK_SIZE rows
+at a time, so the driver never holds more than one chunk:
+
+    iter_frames(sql, params)         - sync, yields DataFrame chunks
+    read_frame(sql, params)          - sync, one DataFrame
+    async_read_frame(sql, params)    - async, one DataFrame
+
+`overlapping` re-feeds the tail of each chunk into the next, so
+chunked consumers can compute rolling windows across chunk boundaries.
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+License: MIT
+"""
+
+from typing import Any, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+import pandas as pd
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.sql import Executable
+
+from app.core.config import settings
+from app.infrastructure.database.engine import get_sync_engine
+
+Query = Union[str, Executable]
+
+
+def _statement(query: Query) -> Executable:
+    return text(query) if isinstance(query, str) else query
+
+
+def _frame(rows: Sequence[Any], columns: List[str]) -> pd.DataFrame:
+    # Decimal -> float, same as pd.read_sql
+    return pd.DataFrame.from_records(rows, columns=columns, coerce_float=True)
+
+
+def _concat(chunks: List[pd.DataFrame], columns: List[str]) -> pd.DataFrame:
+    if not chunks:
+        return pd.DataFrame(columns=columns)
+    if len(chunks) == 1:
+        return chunks[0]
+    return pd.concat(chunks, ignore_index=True)
+
+
+def iter_frames(
+    query: Query,
+    params: Optional[Mapping[str, Any]] = None,
+    engine: Optional[Engine] = None,
+    chunk_size: Optional[int] = None,
+) -> Iterator[pd.DataFrame]:
+    """
+    Stream a query as DataFrame chunks of at most `chunk_size` rows.
+
+    Args:
+        query: SQL text (bind parameters as :name) or a SQLAlchemy statement
+        params: Bind parameter values
+        engine: Sync engine (default: the shared engine)
+        chunk_size: Rows per chunk (default: DB_READ_CHUNK_SIZE)
+    """
+    engine = engine or get_sync_engine()
+    chunk_size = chunk_size or settings.DB_READ_CHUNK_SIZE
+
+    with engine.connect() as conn:
+        result = conn.execution_options(stream_results=True, max_row_buffer=chunk_size).execute(
+            _statement(query), dict(params or {})
+        )
+        columns = list(result.keys())
+        for rows in result.partitions(chunk_size):
+            yield _frame(rows, columns)
+
+
+def read_frame(
+    query: Query,
+    params: Optional[Mapping[str, Any]] = None,
+    engine: Optional[Engine] = None,
+    chunk_size: Optional[int] = None,
+) -> pd.DataFrame:
+    """Whole result as one DataFrame, fetched through a server-side cursor."""
+    engine = engine or get_sync_engine()
+    chunk_size = chunk_size or settings.DB_READ_CHUNK_SIZE
+
+    with engine.connect() as conn:
+        result = conn.execution_options(stream_results=True, max_row_buffer=chunk_size).execute(
+            _statement(query), dict(params or {})
+        )
+        columns = list(result.keys())
+        chunks = [_frame(rows, columns) for rows in result.partitions(chunk_size)]
+    return _concat(chunks, columns)
+
+
+async def async_read_frame(
+    query: Query,
+    params: Optional[Mapping[str, Any]] = None,
+    engine: Optional[AsyncEngine] = None,
+    chunk_size: Optional[int] = None,
+) -> pd.DataFrame:
+    """Async counterpart of `read_frame` (default: the app's async engine)."""
+    if engine is None:
+        from app.infrastructure.database.base import engine as async_engine
+        engine = async_engine
+    chunk_size = chunk_size or settings.DB_READ_CHUNK_SIZE
+
+    async with engine.connect() as conn:
+        result = await conn.stream(
+            _statement(query).execution_options(max_row_buffer=chunk_size),
+            dict(params or {}),
+        )
+        columns = list(result.keys())
+        chunks = [_frame(rows, columns) async for rows in result.partitions(chunk_size)]
+    return _concat(chunks, columns)
+
+
+def overlapping(chunks: Iterable[pd.DataFrame], overlap: int) -> Iterator[Tuple[pd.DataFrame, int]]:
+    """
+    Prefix every chunk with the last `overlap` rows seen before it.
+
+    Yields (frame, warmup) where the first `warmup` rows of `frame` were
+    already yielded with an earlier chunk. Rolling windows up to
+    `overlap` rows computed on `frame` are exact for the rows after them.
+    """
+    tail: Optional[pd.DataFrame] = None
+    for chunk in chunks:
+        if chunk.empty:
+            continue
+        if tail is None or tail.empty:
+            yield chunk, 0
+            frame = chunk
+        else:
+            frame = pd.concat([tail, chunk])
+            yield frame, len(tail)
+        tail = frame.iloc[-overlap:] if overlap > 0 else None
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gold Price Analyzer - Backfill Repository
+
+Reads and writes backfill chunk checkpoints.
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+License: MIT
+"""
+
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infrastructure.database.models import BackfillChunk
+
+ChunkKey = Tuple[datetime, datetime]
+
+
+async def get_chunk_statuses(
+    session: AsyncSession,
+    job: str,
+) -> Dict[ChunkKey, str]:
+    """Status of every recorded chunk of a job, keyed by (start, end)."""
+    result = await session.execute(
+        select(BackfillChunk.chunk_start, BackfillChunk.chunk_end, BackfillChunk.status)
+        .where(BackfillChunk.job == job)
+    )
+    return {(start, end): status for start, end, status in result.all()}
+
+
+async def upsert_chunk_status(
+    session: AsyncSession,
+    job: str,
+    chunk_start: datetime,
+    chunk_end: datetime,
+    status: str,
+    rows: int = 0,
+    error: Optional[str] = None,
+) -> None:
+    """
+    Record a chunk's status; `running` also counts an attempt.
+
+    Does not commit; the caller owns the transaction.
+    """
+    attempts = 1 if status == "running" else 0
+    stmt = pg_insert(BackfillChunk).values(
+        job=job,
+        chunk_start=chunk_start,
+        chunk_end=chunk_end,
+        status=status,
+        attempts=attempts,
+        rows=rows,
+        error=error,
+    )
+    stmt = stmt.on_conflict_do_update(
+        constraint="uq_backfill_chunks_job_range",
+        set_={
+            "status": stmt.excluded.status,
+            "attempts": BackfillChunk.attempts + stmt.excluded.attempts,
+            "rows": stmt.excluded.rows,
+            "error": stmt.excluded.error,
+            "updated_at": func.now(),
+        },
+    )
+    await session.execute(stmt)
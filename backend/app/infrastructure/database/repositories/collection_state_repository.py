@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gold Price Analyzer - Collection State Repository
+
+Queries the newest stored row per source so collectors can fetch only
+the delta since their last run.
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+License: MIT
+"""
+
+from datetime import date, datetime
+from typing import Iterable, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infrastructure.database.models import (
+    DollarIndexPrice,
+    GoldPriceFact,
+    NewsEvent,
+)
+
+
+async def get_latest_price_timestamp(
+    session: AsyncSession,
+    timeframe: str,
+    source: str,
+) -> Optional[datetime]:
+    """
+    Latest stored candle timestamp for a (timeframe, source) pair.
+
+    Uses the composite index on (timestamp, timeframe).
+    """
+    result = await session.execute(
+        select(func.max(GoldPriceFact.timestamp)).where(
+            GoldPriceFact.timeframe == timeframe,
+            GoldPriceFact.source == source,
+        )
+    )
+    return result.scalar()
+
+
+async def get_latest_news_timestamp(
+    session: AsyncSession,
+    sources: Iterable[str],
+) -> Optional[datetime]:
+    """Latest `published_at` among the given news sources."""
+    result = await session.execute(
+        select(func.max(NewsEvent.published_at)).where(
+            NewsEvent.source.in_(list(sources))
+        )
+    )
+    return result.scalar()
+
+
+async def get_latest_dollar_index_date(session: AsyncSession) -> Optional[date]:
+    """Latest stored DXY trading day."""
+    result = await session.execute(select(func.max(DollarIndexPrice.date)))
+    return result.scalar()
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gold Price Analyzer - Gold Price Repository
+
+Bulk writes for `gold_price_facts` and collection high-water marks.
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+License: MIT
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.metrics import ROWS_INGESTED
+from app.infrastructure.database.models import CollectionWatermark, GoldPriceFact
+from app.infrastructure.database.repositories.collection_state_repository import (
+    get_latest_price_timestamp,
+)
+
+# asyncpg allows 32767 bind parameters per statement (~12 per candle)
+UPSERT_BATCH_SIZE = 2000
+
+_UPDATABLE_COLUMNS = (
+    "open",
+    "high",
+    "low",
+    "close",
+    "volume",
+    "price_change",
+    "price_change_pct",
+    "market",
+    "data_quality",
+)
+
+
+def build_candle_upsert(rows: Sequence[Dict[str, Any]]):
+    """
+    INSERT ... ON CONFLICT (timestamp, timeframe, source) DO UPDATE.
+
+    Args:
+        rows: Candle dictionaries (GoldPriceFact columns)
+
+    Returns:
+        Insert statement ready to execute
+    """
+    stmt = pg_insert(GoldPriceFact).values(list(rows))
+    return stmt.on_conflict_do_update(
+        constraint="uq_gold_price_facts_time_tf_source",
+        set_={
+            **{col: getattr(stmt.excluded, col) for col in _UPDATABLE_COLUMNS},
+            "updated_at": func.now(),
+        },
+    )
+
+
+async def bulk_upsert_candles(
+    session: AsyncSession,
+    rows: List[Dict[str, Any]],
+) -> int:
+    """
+    Merge candles with one upsert statement per batch.
+
+    Does not commit; the caller owns the transaction.
+
+    Returns:
+        int: Number of rows written (inserted or updated)
+    """
+    written = 0
+
+    for i in range(0, len(rows), UPSERT_BATCH_SIZE):
+        batch = rows[i:i + UPSERT_BATCH_SIZE]
+        result = await session.execute(build_candle_upsert(batch))
+        written += result.rowcount if result.rowcount is not None else len(batch)
+
+    if rows:
+        ROWS_INGESTED.labels(table="gold_price_facts", source=rows[0].get("source", "unknown")).inc(written)
+
+    return written
+
+
+# ====================================
+# High-water marks
+# ====================================
+async def get_watermark(
+    session: AsyncSession,
+    source: str,
+    timeframe: str,
+) -> Optional[datetime]:
+    """
+    Newest stored timestamp for a collector.
+
+    Falls back to `MAX(timestamp)` on gold_price_facts when no watermark
+    has been recorded yet (databases filled before watermarks existed).
+    """
+    result = await session.execute(
+        select(CollectionWatermark.last_timestamp).where(
+            CollectionWatermark.source == source,
+            CollectionWatermark.timeframe == timeframe,
+        )
+    )
+    last_timestamp = result.scalar()
+
+    if last_timestamp is not None:
+        return last_timestamp
+
+    return await get_latest_price_timestamp(session, timeframe, source)
+
+
+async def update_watermark(
+    session: AsyncSession,
+    source: str,
+    timeframe: str,
+    last_timestamp: datetime,
+    rows: int,
+) -> None:
+    """Advance (never rewind) the high-water mark and record run counters."""
+    stmt = pg_insert(CollectionWatermark).values(
+        source=source,
+        timeframe=timeframe,
+        last_timestamp=last_timestamp,
+        last_rows=rows,
+        total_rows=rows,
+    )
+    stmt = stmt.on_conflict_do_update(
+        constraint="uq_collection_watermarks_source_tf",
+        set_={
+            "last_timestamp": func.greatest(
+                CollectionWatermark.last_timestamp,
+                stmt.excluded.last_timestamp,
+            ),
+            "last_rows": stmt.excluded.last_rows,
+            "total_rows": CollectionWatermark.total_rows + stmt.excluded.last_rows,
+            "last_run_at": func.now(),
+        },
+    )
+    await session.execute(stmt)
+
+
+async def touch_watermark(
+    session: AsyncSession,
+    source: str,
+    timeframe: str,
+) -> None:
+    """Record a run that found nothing new (keeps `last_run_at` fresh)."""
+    await session.execute(
+        CollectionWatermark.__table__.update()
+        .where(
+            CollectionWatermark.source == source,
+            CollectionWatermark.timeframe == timeframe,
+        )
+        .values(last_rows=0, last_run_at=func.now())
+    )
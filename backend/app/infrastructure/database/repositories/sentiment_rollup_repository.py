@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gold Price Analyzer - Sentiment Rollup Repository
+
+Incremental maintenance and range reads of `sentiment_rollups`.
+
+Scoring code hands the freshly scored articles to
+`apply_sentiment_rollups`, which folds them into one delta per
+(bucket_size, bucket_start) and merges those with a single upsert in the
+same transaction. `rebuild_sentiment_rollups` recomputes buckets from
+`news_events` (backfill, or after a forced re-analysis) and marks full
+builds in `sentiment_rollup_builds`. Deltas only make sense on top of a
+full build, so the first apply for an unbuilt bucket size builds it
+instead (existing databases, newly configured sizes).
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+License: MIT
+"""
+
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime, UTC
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import pandas as pd
+from sqlalchemy import delete, func, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.infrastructure.database.models import SentimentRollup, SentimentRollupBuild
+
+BUCKET_UNITS = {"m": 60, "h": 3600, "d": 86400}
+
+BULLISH = ("bullish", "very_bullish")
+BEARISH = ("bearish", "very_bearish")
+
+
+def bucket_seconds(bucket_size: str) -> int:
+    """
+    '4h' -> 14400.
+
+    Raises:
+        ValueError: malformed bucket size
+    """
+    try:
+        return int(bucket_size[:-1]) * BUCKET_UNITS[bucket_size[-1]]
+    except (KeyError, ValueError, IndexError):
+        raise ValueError(f"Invalid bucket size: {bucket_size!r} (e.g. 15m, 1h, 4h, 1d)")
+
+
+def bucket_start(ts: datetime, seconds: int) -> datetime:
+    """Floor a timestamp to its UTC bucket."""
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=UTC)
+    epoch = int(ts.timestamp())
+    return datetime.fromtimestamp(epoch - epoch % seconds, tz=UTC)
+
+
+@dataclass
+class ScoredArticle:
+    """The fields of a scored NewsEvent that feed the rollups."""
+
+    published_at: datetime
+    score: float
+    confidence: float
+    impact_score: float
+    price_impact: Optional[str]
+
+    @classmethod
+    def from_news(cls, news: Any) -> "ScoredArticle":
+        return cls(
+            published_at=news.published_at,
+            score=float(news.sentiment_score or 0),
+            confidence=float(news.confidence or 0),
+            impact_score=float(news.impact_score or 0),
+            price_impact=news.price_impact,
+        )
+
+
+def build_rollup_deltas(
+    articles: Iterable[ScoredArticle],
+    bucket_sizes: Sequence[str],
+    sign: int = 1,
+) -> List[Dict[str, Any]]:
+    """
+    Fold articles into one additive delta row per (bucket_size, bucket_start).
+
+    Args:
+        articles: Scored articles
+        bucket_sizes: Bucket sizes to maintain
+        sign: +1 to add articles, -1 to remove a previous score
+
+    Returns:
+        Rows for `build_rollup_upsert`
+    """
+    sizes = [(size, bucket_seconds(size)) for size in bucket_sizes]
+    deltas: Dict[Tuple[str, datetime], Dict[str, Any]] = defaultdict(
+        lambda: {
+            "article_count": 0,
+            "sum_score": 0.0,
+            "sum_confidence": 0.0,
+            "sum_weighted_score": 0.0,
+            "sum_impact": 0.0,
+            "max_impact": 0.0,
+            "bullish_count": 0,
+            "bearish_count": 0,
+        }
+    )
+
+    for article in articles:
+        for size, seconds in sizes:
+            row = deltas[(size, bucket_start(article.published_at, seconds))]
+            row["article_count"] += sign
+            row["sum_score"] += sign * article.score
+            row["sum_confidence"] += sign * article.confidence
+            row["sum_weighted_score"] += sign * article.score * article.confidence
+            row["sum_impact"] += sign * article.impact_score
+            if sign > 0:
+                # a running max cannot be undone; rebuild restores it exactly
+                row["max_impact"] = max(row["max_impact"], article.impact_score)
+            row["bullish_count"] += sign * (article.price_impact in BULLISH)
+            row["bearish_count"] += sign * (article.price_impact in BEARISH)
+
+    return [
+        {"bucket_size": size, "bucket_start": start, **values}
+        for (size, start), values in deltas.items()
+    ]
+
+
+def build_rollup_upsert(rows: Sequence[Dict[str, Any]]):
+    """INSERT ... ON CONFLICT DO UPDATE adding the deltas to existing buckets."""
+    stmt = pg_insert(SentimentRollup).values(list(rows))
+    table = SentimentRollup
+    return stmt.on_conflict_do_update(
+        constraint="uq_sentiment_rollups_size_start",
+        set_={
+            "article_count": table.article_count + stmt.excluded.article_count,
+            "sum_score": table.sum_score + stmt.excluded.sum_score,
+            "sum_confidence": table.sum_confidence + stmt.excluded.sum_confidence,
+            "sum_weighted_score": table.sum_weighted_score + stmt.excluded.sum_weighted_score,
+            "sum_impact": table.sum_impact + stmt.excluded.sum_impact,
+            "max_impact": func.greatest(table.max_impact, stmt.excluded.max_impact),
+            "bullish_count": table.bullish_count + stmt.excluded.bullish_count,
+            "bearish_count": table.bearish_count + stmt.excluded.bearish_count,
+            "updated_at": func.now(),
+        },
+    )
+
+
+def built_sizes_query(bucket_sizes: Sequence[str]):
+    """Bucket sizes among `bucket_sizes` that have a full build."""
+    return select(SentimentRollupBuild.bucket_size).where(
+        SentimentRollupBuild.bucket_size.in_(list(bucket_sizes))
+    )
+
+
+async def unbuilt_rollup_sizes(session: AsyncSession, bucket_sizes: Sequence[str]) -> List[str]:
+    """Bucket sizes that were never fully built from news_events."""
+    result = await session.execute(built_sizes_query(bucket_sizes))
+    built = set(result.scalars().all())
+    return [size for size in bucket_sizes if size not in built]
+
+
+async def apply_sentiment_rollups(
+    session: AsyncSession,
+    articles: Iterable[ScoredArticle],
+    sign: int = 1,
+    bucket_sizes: Optional[Sequence[str]] = None,
+) -> int:
+    """
+    Merge scored articles into the rollups. Does not commit.
+
+    Unbuilt bucket sizes are rebuilt from news_events first. The session
+    is flushed before that, so the rebuild sees the current scores: new
+    scores are already counted (no delta), and a retracted previous score
+    is counted and then removed by the delta.
+
+    Returns:
+        int: Number of bucket rows touched
+    """
+    articles = list(articles)
+    sizes = list(bucket_sizes or settings.SENTIMENT_ROLLUP_BUCKETS)
+    if not articles:
+        return 0
+
+    touched = 0
+    unbuilt = await unbuilt_rollup_sizes(session, sizes)
+    if unbuilt:
+        await session.flush()
+        touched += await rebuild_sentiment_rollups(session, unbuilt)
+        if sign > 0:
+            sizes = [size for size in sizes if size not in unbuilt]
+
+    rows = build_rollup_deltas(articles, sizes, sign)
+    if rows:
+        await session.execute(build_rollup_upsert(rows))
+    return touched + len(rows)
+
+
+async def rebuild_sentiment_rollups(
+    session: AsyncSession,
+    bucket_sizes: Optional[Sequence[str]] = None,
+    since: Optional[datetime] = None,
+) -> int:
+    """
+    Recompute buckets from `news_events`. Does not commit.
+
+    Args:
+        bucket_sizes: Bucket sizes to rebuild (default: all configured)
+        since: Only rebuild buckets starting at or after this time
+            (a partial rebuild does not mark the size as built)
+
+    Returns:
+        int: Number of bucket rows written
+    """
+    written = 0
+
+    for size in bucket_sizes or settings.SENTIMENT_ROLLUP_BUCKETS:
+        seconds = bucket_seconds(size)
+        start = bucket_start(since, seconds) if since else None
+
+        stmt = delete(SentimentRollup).where(SentimentRollup.bucket_size == size)
+        if start is not None:
+            stmt = stmt.where(SentimentRollup.bucket_start >= start)
+        await session.execute(stmt)
+
+        result = await session.execute(
+            text(
+                """
+                INSERT INTO sentiment_rollups (
+                    bucket_size, bucket_start, article_count,
+                    sum_score, sum_confidence, sum_weighted_score,
+                    sum_impact, max_impact, bullish_count, bearish_count
+                )
+                SELECT
+                    :bucket_size,
+                    to_timestamp(floor(extract(epoch FROM published_at) / :seconds) * :seconds),
+                    COUNT(*),
+                    SUM(sentiment_score),
+                    SUM(COALESCE(confidence, 0)),
+                    SUM(sentiment_score * COALESCE(confidence, 0)),
+                    SUM(COALESCE(impact_score, 0)),
+                    MAX(COALESCE(impact_score, 0)),
+                    COUNT(*) FILTER (WHERE price_impact IN ('bullish', 'very_bullish')),
+                    COUNT(*) FILTER (WHERE price_impact IN ('bearish', 'very_bearish'))
+                FROM news_events
+                WHERE sentiment_score IS NOT NULL
+                    AND (CAST(:start AS timestamptz) IS NULL OR published_at >= :start)
+                GROUP BY 2
+                """
+            ),
+            {"bucket_size": size, "seconds": seconds, "start": start},
+        )
+        written += result.rowcount or 0
+
+        if since is None:
+            marker = pg_insert(SentimentRollupBuild).values(bucket_size=size)
+            await session.execute(
+                marker.on_conflict_do_update(
+                    index_elements=[SentimentRollupBuild.bucket_size],
+                    set_={"built_at": func.now()},
+                )
+            )
+
+    return written
+
+
+def rollups_to_frame(rows: Sequence[Tuple]) -> pd.DataFrame:
+    """
+    Rollup rows -> feature frame indexed by bucket_start.
+
+    Columns: news_count, sentiment_score (mean), sentiment_weighted,
+    impact_mean, max_impact, bullish_count, bearish_count
+    """
+    columns = [
+        "bucket_start", "article_count", "sum_score", "sum_confidence",
+        "sum_weighted_score", "sum_impact", "max_impact",
+        "bullish_count", "bearish_count",
+    ]
+    raw = pd.DataFrame(list(rows), columns=columns)
+    raw["bucket_start"] = pd.to_datetime(raw["bucket_start"], utc=True)
+    raw = raw.set_index("bucket_start")
+
+    count = raw["article_count"].astype(float)
+    conf = raw["sum_confidence"].astype(float)
+
+    return pd.DataFrame(
+        {
+            "news_count": count,
+            "sentiment_score": (raw["sum_score"] / count.where(count > 0)).fillna(0.0),
+            "sentiment_weighted": (raw["sum_weighted_score"] / conf.where(conf > 0)).fillna(0.0),
+            "impact_mean": (raw["sum_impact"] / count.where(count > 0)).fillna(0.0),
+            "max_impact": raw["max_impact"].astype(float),
+            "bullish_count": raw["bullish_count"].astype(float),
+            "bearish_count": raw["bearish_count"].astype(float),
+        },
+        index=raw.index,
+    )
+
+
+def rollup_range_query(
+    bucket_size: str,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+):
+    """Indexed range read over (bucket_size, bucket_start)."""
+    stmt = (
+        select(
+            SentimentRollup.bucket_start,
+            SentimentRollup.article_count,
+            SentimentRollup.sum_score,
+            SentimentRollup.sum_confidence,
+            SentimentRollup.sum_weighted_score,
+            SentimentRollup.sum_impact,
+            SentimentRollup.max_impact,
+            SentimentRollup.bullish_count,
+            SentimentRollup.bearish_count,
+        )
+        .where(
+            SentimentRollup.bucket_size == bucket_size,
+            SentimentRollup.article_count > 0,
+        )
+        .order_by(SentimentRollup.bucket_start)
+    )
+    if start is not None:
+        stmt = stmt.where(SentimentRollup.bucket_start >= start)
+    if end is not None:
+        stmt = stmt.where(SentimentRollup.bucket_start < end)
+    return stmt
+
+
+async def load_sentiment_rollups(
+    session: AsyncSession,
+    bucket_size: str,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+) -> pd.DataFrame:
+    """Sentiment features for [start, end) at the given bucket size."""
+    bucket_seconds(bucket_size)
+    result = await session.execute(rollup_range_query(bucket_size, start, end))
+    return rollups_to_frame(result.all())
@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gold Price Analyzer - Streaming Infrastructure
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+License: MIT
+"""
+
+from app.infrastructure.streaming.broker import (
+    RedisStreamRelay,
+    StreamBroker,
+    StreamMessage,
+    Subscription,
+    get_stream_broker,
+)
+
+__all__ = [
+    "RedisStreamRelay",
+    "StreamBroker",
+    "StreamMessage",
+    "Subscription",
+    "get_stream_broker",
+]
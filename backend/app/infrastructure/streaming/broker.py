@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gold Price Analyzer - Stream Broker
+
+In-process pub/sub used to fan out live ticks, indicator values and
+sentiment updates to WebSocket / SSE subscribers.
+
+Every subscriber owns a bounded queue. A slow consumer never blocks the
+publisher: when its queue is full the oldest message is dropped (and
+counted), so the client always catches up to the newest state. Messages
+are JSON-encoded once per publish, not once per subscriber.
+
+With STREAM_BACKEND=redis, `publish` goes to a Redis channel and every
+worker relays the channel into its own local broker, so a single feeder
+can serve subscribers connected to any worker.
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+License: MIT
+"""
+
+import asyncio
+import json
+from dataclasses import dataclass
+from datetime import datetime, UTC
+from typing import Any, Dict, Iterable, Optional, Set
+
+from app.core.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+TOPICS = ("tick", "indicators", "sentiment")
+
+
+@dataclass(frozen=True)
+class StreamMessage:
+    """A published message, already encoded for the wire."""
+
+    topic: str
+    encoded: str
+
+    def to_sse(self) -> str:
+        """Server-Sent Events frame."""
+        return f"event: {self.topic}\ndata: {self.encoded}\n\n"
+
+
+def encode_message(topic: str, data: Any) -> StreamMessage:
+    """Wrap a payload with its topic and timestamp and encode it once."""
+    body = {
+        "type": topic,
+        "ts": datetime.now(UTC).isoformat(),
+        "data": data,
+    }
+    return StreamMessage(topic=topic, encoded=json.dumps(body, default=str))
+
+
+class Subscription:
+    """One subscriber: topic filter + bounded queue (drop oldest when full)."""
+
+    def __init__(self, broker: "StreamBroker", topics: Optional[Iterable[str]], maxsize: int):
+        self._broker = broker
+        self.topics = frozenset(topics) if topics else None
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self.delivered = 0
+        self.dropped = 0
+        self.closed = False
+
+    def wants(self, topic: str) -> bool:
+        return self.topics is None or topic in self.topics
+
+    def offer(self, message: StreamMessage) -> None:
+        """Enqueue without blocking; evict the oldest message if full."""
+        if self.queue.full():
+            try:
+                self.queue.get_nowait()
+                self.dropped += 1
+            except asyncio.QueueEmpty:
+                pass
+        self.queue.put_nowait(message)
+        self.delivered += 1
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[StreamMessage]:
+        """
+        Next message, or None after `timeout` seconds without one.
+        """
+        if timeout is None:
+            return await self.queue.get()
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def close(self) -> None:
+        if not self.closed:
+            self.closed = True
+            self._broker.unsubscribe(self)
+
+    def __enter__(self) -> "Subscription":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class StreamBroker:
+    """
+    Topic-based fan-out to many subscribers.
+
+    Example:
+        >>> broker = StreamBroker()
+        >>> with broker.subscribe(["tick"]) as sub:
+        ...     await broker.publish("tick", {"price": 4113.5})
+        ...     message = await sub.get()
+    """
+
+    def __init__(self, queue_size: Optional[int] = None, relay: Optional["RedisStreamRelay"] = None):
+        """
+        Initialize broker.
+
+        Args:
+            queue_size: Per-subscriber queue bound
+            relay: Redis relay for multi-worker deployments (optional)
+        """
+        self.queue_size = queue_size or settings.STREAM_QUEUE_SIZE
+        self.relay = relay
+        self._subscribers: Set[Subscription] = set()
+        self._latest: Dict[str, StreamMessage] = {}
+        self.published = 0
+
+    def subscribe(self, topics: Optional[Iterable[str]] = None, replay_latest: bool = True) -> Subscription:
+        """
+        Register a subscriber.
+
+        Args:
+            topics: Topics to receive (None = all)
+            replay_latest: Start with the latest message of every topic
+        """
+        sub = Subscription(self, topics, self.queue_size)
+        if replay_latest:
+            for topic, message in self._latest.items():
+                if sub.wants(topic):
+                    sub.offer(message)
+        self._subscribers.add(sub)
+        return sub
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        self._subscribers.discard(sub)
+
+    async def publish(self, topic: str, data: Any) -> None:
+        """Publish to every subscriber (through Redis when a relay is set)."""
+        message = encode_message(topic, data)
+        if self.relay is not None:
+            await self.relay.publish(message)
+        else:
+            self.deliver(message)
+
+    def deliver(self, message: StreamMessage) -> int:
+        """Fan a message out to local subscribers. Returns the receiver count."""
+        self._latest[message.topic] = message
+        self.published += 1
+
+        receivers = 0
+        for sub in tuple(self._subscribers):
+            if sub.wants(message.topic):
+                sub.offer(message)
+                receivers += 1
+        return receivers
+
+    def latest(self, topic: str) -> Optional[Dict[str, Any]]:
+        """Latest decoded message of a topic."""
+        message = self._latest.get(topic)
+        return json.loads(message.encoded) if message else None
+
+    def stats(self) -> Dict[str, Any]:
+        """Broker snapshot for the status endpoint."""
+        return {
+            "backend": "redis" if self.relay is not None else "memory",
+            "subscribers": len(self._subscribers),
+            "published": self.published,
+            "dropped": sum(s.dropped for s in self._subscribers),
+            "queue_size": self.queue_size,
+            "topics": sorted(self._latest),
+        }
+
+
+class RedisStreamRelay:
+    """
+    Redis pub/sub bridge.
+
+    `publish` sends to the Redis channel; `run` listens on the channel and
+    delivers everything into the local broker (including our own messages).
+    """
+
+    def __init__(self, url: Optional[str] = None, channel: Optional[str] = None):
+        try:
+            import redis.asyncio as aioredis
+        except ImportError as e:
+            raise RuntimeError("redis package is required for STREAM_BACKEND=redis") from e
+
+        self.client = aioredis.Redis.from_url(url or settings.REDIS_URL)
+        self.channel = channel or settings.STREAM_REDIS_CHANNEL
+        self._task: Optional[asyncio.Task] = None
+
+    async def publish(self, message: StreamMessage) -> None:
+        await self.client.publish(
+            self.channel,
+            json.dumps({"topic": message.topic, "encoded": message.encoded}),
+        )
+
+    async def run(self, broker: StreamBroker) -> None:
+        pubsub = self.client.pubsub()
+        await pubsub.subscribe(self.channel)
+        logger.info("stream_relay_subscribed", channel=self.channel)
+
+        try:
+            async for raw in pubsub.listen():
+                if raw.get("type") != "message":
+                    continue
+                try:
+                    payload = json.loads(raw["data"])
+                    broker.deliver(StreamMessage(payload["topic"], payload["encoded"]))
+                except (ValueError, KeyError) as e:
+                    logger.warning("stream_relay_bad_message", error=str(e))
+        finally:
+            await pubsub.unsubscribe(self.channel)
+            await pubsub.close()
+
+    def start(self, broker: StreamBroker) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self.run(broker), name="stream-relay")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.client.close()
+
+
+_broker: Optional[StreamBroker] = None
+
+
+def get_stream_broker() -> StreamBroker:
+    """Process-wide broker (Redis-relayed when STREAM_BACKEND=redis)."""
+    global _broker
+
+    if _broker is None:
+        relay = RedisStreamRelay() if settings.STREAM_BACKEND.lower() == "redis" else None
+        _broker = StreamBroker(relay=relay)
+
+    return _broker
@@ -36,7 +36,42 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
         version=settings.APP_VERSION,
         author="Hoseyn Doulabi (@hoseynd-ai)",
     )
+
+    scheduler = None
+    if settings.SCHEDULER_ENABLED:
+        from app.application.services.scheduling.collection_jobs import create_default_scheduler
+
+        scheduler = create_default_scheduler()
+        await scheduler.start()
+        app.state.scheduler = scheduler
+
+    broker, feeder = None, None
+    if settings.STREAM_ENABLED:
+        from app.application.services.streaming import PriceStreamService
+        from app.infrastructure.streaming import get_stream_broker
+
+        broker = get_stream_broker()
+        if broker.relay is not None:
+            broker.relay.start(broker)
+        if settings.STREAM_FEEDER_ENABLED:
+            feeder = PriceStreamService(broker)
+            feeder.start()
+
     yield
+
+    if feeder is not None:
+        await feeder.stop()
+
+    if broker is not None and broker.relay is not None:
+        await broker.relay.stop()
+
+    if scheduler is not None:
+        await scheduler.stop()
+
+    from app.application.services.data_collection.feed_pipeline import shutdown_parse_process_pool
+
+    shutdown_parse_process_pool()
+
     logger.info("application_shutdown")
 
 
@@ -96,6 +131,37 @@ app.add_middleware(
 app.include_router(api_router, prefix="/api/v1")
 
 
+if settings.METRICS_ENABLED:
+    import time
+
+    from fastapi import Request, Response
+
+    from app.core.metrics import HTTP_REQUEST_SECONDS, render_latest
+
+    @app.middleware("http")
+    async def record_request_latency(request: Request, call_next):
+        """Request latency by route template (not raw path, to bound cardinality)."""
+        started = time.perf_counter()
+        status = 500
+        try:
+            response = await call_next(request)
+            status = response.status_code
+            return response
+        finally:
+            route = request.scope.get("route")
+            HTTP_REQUEST_SECONDS.labels(
+                method=request.method,
+                route=getattr(route, "path", "unmatched"),
+                status=str(status),
+            ).observe(time.perf_counter() - started)
+
+    @app.get("/metrics", tags=["Monitoring"], include_in_schema=False)
+    async def metrics() -> Response:
+        """Prometheus scrape endpoint."""
+        body, content_type = render_latest()
+        return Response(content=body, media_type=content_type)
+
+
 @app.get("/", tags=["Root"])
 async def root():
     """Root endpoint."""
@@ -13,9 +13,11 @@ License: MIT
 
 from fastapi import APIRouter
 
-from app.presentation.api.v1.endpoints import health
+from app.presentation.api.v1.endpoints import analytics, health, stream
 
 api_router = APIRouter()
 
 # Include endpoint routers
 api_router.include_router(health.router, prefix="/health", tags=["Health"])
+api_router.include_router(stream.router, prefix="/stream", tags=["Stream"])
+api_router.include_router(analytics.router, prefix="/analytics", tags=["Analytics"])
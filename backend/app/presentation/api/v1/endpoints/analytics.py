@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gold Price Analyzer - Analytics Endpoints
+
+Rolling correlation, beta and cointegration between assets.
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+License: MIT
+"""
+
+from datetime import date
+from typing import Any, Dict, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.application.services.analysis.correlation_service import (
+    ASSETS,
+    get_correlation_service,
+    parse_pair,
+)
+from app.core.logging import get_logger
+from app.infrastructure.database.base import get_db
+
+router = APIRouter()
+logger = get_logger(__name__)
+
+
+@router.get(
+    "/correlation",
+    summary="Rolling Correlation",
+    description=(
+        "Rolling correlation, beta and Engle-Granger cointegration for asset pairs. "
+        f"Assets: {', '.join(sorted(ASSETS))}."
+    ),
+)
+async def correlation(
+    pairs: str = Query(default="gold:dxy", description="Comma-separated pairs, e.g. gold:dxy,gld:dxy"),
+    windows: str = Query(default="20,60,120,250", description="Comma-separated window lengths (bars)"),
+    as_of: Optional[date] = Query(default=None, description="Last bar date (default: latest)"),
+    history: bool = Query(default=False, description="Include the full rolling series"),
+    db: AsyncSession = Depends(get_db),
+) -> Dict[str, Any]:
+    """Correlation statistics for every (pair, window)."""
+    try:
+        pair_list = [parse_pair(p) for p in pairs.split(",") if p.strip()]
+        window_list = sorted({int(w) for w in windows.split(",") if w.strip()})
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    if not pair_list or not window_list or min(window_list) < 2:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="At least one pair and windows >= 2 are required",
+        )
+
+    service = get_correlation_service()
+    new_bars = await service.refresh(db, pair_list)
+
+    response: Dict[str, Any] = {
+        "new_bars": new_bars,
+        "results": service.summary(pair_list, window_list, as_of),
+    }
+
+    if history:
+        response["history"] = {
+            f"{y}:{x}": _history_records(service.history((y, x), window_list))
+            for y, x in pair_list
+        }
+
+    logger.info("correlation_requested", pairs=pairs, windows=window_list)
+    return response
+
+
+def _history_records(df) -> list:
+    if df.empty:
+        return []
+    out = df.reset_index()
+    out["date"] = out["date"].dt.date.astype(str)
+    return out.astype(object).where(out.notna(), None).to_dict(orient="records")
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gold Price Analyzer - Streaming Endpoints
+
+Live ticks, indicator values and sentiment updates over WebSocket or
+Server-Sent Events. Both transports read from the same broker; pass
+`?topics=tick,indicators` to receive a subset.
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+License: MIT
+"""
+
+import asyncio
+from typing import AsyncIterator, List, Optional
+
+from fastapi import APIRouter, HTTPException, Query, Request, WebSocket, status
+from fastapi.responses import StreamingResponse
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.infrastructure.streaming.broker import TOPICS, StreamBroker, get_stream_broker
+
+router = APIRouter()
+logger = get_logger(__name__)
+
+HEARTBEAT = '{"type":"heartbeat"}'
+
+
+def _parse_topics(topics: Optional[str]) -> Optional[List[str]]:
+    if not topics:
+        return None
+    requested = [t.strip() for t in topics.split(",") if t.strip()]
+    unknown = sorted(set(requested) - set(TOPICS))
+    if unknown:
+        raise ValueError(f"Unknown topics: {', '.join(unknown)}")
+    return requested
+
+
+def _broker() -> StreamBroker:
+    if not settings.STREAM_ENABLED:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Streaming is disabled (STREAM_ENABLED=false)",
+        )
+    return get_stream_broker()
+
+
+@router.websocket("/ws")
+async def stream_websocket(websocket: WebSocket, topics: Optional[str] = None):
+    """
+    WebSocket stream.
+
+    Each frame is a JSON object: {"type": ..., "ts": ..., "data": ...}.
+    A heartbeat frame is sent when nothing was published for a while.
+    """
+    if not settings.STREAM_ENABLED:
+        await websocket.close(code=1013)
+        return
+
+    try:
+        topic_filter = _parse_topics(topics)
+    except ValueError:
+        await websocket.close(code=1008)
+        return
+
+    await websocket.accept()
+
+    with get_stream_broker().subscribe(topic_filter) as sub:
+
+        async def send_loop():
+            while True:
+                message = await sub.get(timeout=settings.STREAM_HEARTBEAT_SECONDS)
+                await websocket.send_text(message.encoded if message else HEARTBEAT)
+
+        async def receive_loop():
+            # clients never send anything useful; this only notices disconnects
+            while True:
+                if (await websocket.receive())["type"] == "websocket.disconnect":
+                    return
+
+        tasks = [asyncio.create_task(send_loop()), asyncio.create_task(receive_loop())]
+        try:
+            await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            if sub.dropped:
+                logger.info("stream_subscriber_dropped_messages", transport="ws", dropped=sub.dropped)
+
+
+@router.get(
+    "/sse",
+    summary="Server-Sent Events stream",
+    description="Live ticks, indicators and sentiment as text/event-stream.",
+)
+async def stream_sse(request: Request, topics: Optional[str] = Query(default=None)):
+    """SSE stream (`event: <topic>` + JSON `data:` lines)."""
+    broker = _broker()
+
+    try:
+        topic_filter = _parse_topics(topics)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    async def events() -> AsyncIterator[str]:
+        with broker.subscribe(topic_filter) as sub:
+            while not await request.is_disconnected():
+                message = await sub.get(timeout=settings.STREAM_HEARTBEAT_SECONDS)
+                yield message.to_sse() if message else ": keepalive\n\n"
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get(
+    "/status",
+    summary="Stream Status",
+    description="Subscriber count, published and dropped messages.",
+)
+async def stream_status():
+    """Broker statistics."""
+    return _broker().stats()
@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Feature pipeline benchmarks: indicators, price features, sentiment merge.
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+"""
+
+from app.application.services.ml.technical_indicators_service import TechnicalIndicatorsService
+
+
+def bench_calculate_all_indicators(benchmark, ohlcv):
+    service = TechnicalIndicatorsService()
+    result = benchmark(service.calculate_all_indicators, ohlcv)
+    assert len(result) == len(ohlcv)
+
+
+def bench_add_price_features(benchmark, ohlcv, feature_service):
+    df = feature_service.add_technical_indicators(ohlcv)
+    # add_price_features writes into its input, so every round gets a fresh copy
+    result = benchmark.pedantic(
+        feature_service.add_price_features,
+        setup=lambda: ((df.copy(),), {}),
+        rounds=50,
+    )
+    assert len(result) == len(df)
+
+
+def bench_merge_sentiment_data(benchmark, ohlcv, sentiment, feature_service):
+    result = benchmark(feature_service.merge_sentiment_data, ohlcv, sentiment)
+    assert "sentiment_ma_5" in result.columns
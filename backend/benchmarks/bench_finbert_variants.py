@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+FinBERT variants on CPU: fp32 vs int8 (dynamic quantization) vs onnx.
+
+Latency is the benchmark timing of one 64-headline batch. Model size
+(serialized weights: state_dict for the torch variants, the optimized
+.onnx file for onnx) is stored in `extra_info["model_mib"]`.
+
+    FINBERT_LOCAL_PATH   local checkpoint (default: FINBERT_MODEL_NAME)
+
+Skipped when torch / transformers are not installed; the onnx case is
+skipped without optimum[onnxruntime].
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+"""
+
+import io
+import os
+from pathlib import Path
+
+import pytest
+
+torch = pytest.importorskip("torch")
+pytest.importorskip("transformers")
+
+from generators import synthetic_headlines  # noqa: E402
+
+from app.application.services.ml.sentiment_analysis_service import SentimentAnalysisService  # noqa: E402
+
+
+def _model_mib(service) -> float:
+    if service.variant == 'onnx':
+        return Path(service.model.model_path).stat().st_size / 2**20
+    buffer = io.BytesIO()
+    torch.save(service.model.state_dict(), buffer)
+    return buffer.tell() / 2**20
+
+
+@pytest.fixture(scope="module")
+def headlines():
+    return synthetic_headlines(64)
+
+
+@pytest.mark.parametrize("variant", SentimentAnalysisService.VARIANTS)
+def bench_finbert_variant(benchmark, headlines, variant):
+    service = SentimentAnalysisService(os.getenv("FINBERT_LOCAL_PATH"), variant=variant)
+    try:
+        service.load_model()
+    except (ImportError, OSError) as e:
+        pytest.skip(f"{variant} unavailable: {e}")
+
+    results = benchmark(service.analyze_batch, headlines)
+
+    benchmark.extra_info["model_mib"] = round(_model_mib(service), 1)
+    benchmark.extra_info["ms_per_article"] = round(benchmark.stats.stats.mean * 1000 / len(headlines), 2)
+    assert len(results) == len(headlines)
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Ingestion benchmarks: per-row ORM inserts versus bulk statements.
+
+Runs against BENCH_DATABASE_URL (default in-memory SQLite). On
+PostgreSQL the bulk case is the collectors' real upsert path
+(`bulk_upsert_candles`); elsewhere it is a Core executemany insert.
+Every round starts from an empty `gold_price_facts` table.
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+"""
+
+import asyncio
+
+import pytest
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from conftest import BENCH_DATABASE_URL, BENCH_INGEST_ROWS
+from generators import candle_rows, synthetic_ohlcv
+
+from app.infrastructure.database.models import GoldPriceFact
+from app.infrastructure.database.repositories.gold_price_repository import bulk_upsert_candles
+
+IS_POSTGRES = BENCH_DATABASE_URL.startswith("postgresql")
+TABLE = GoldPriceFact.__table__
+
+
+@pytest.fixture(scope="module")
+def rows():
+    return candle_rows(synthetic_ohlcv(years=BENCH_INGEST_ROWS / 252 + 0.01)[:BENCH_INGEST_ROWS])
+
+
+@pytest.fixture(scope="module")
+def loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="module")
+def engine(loop):
+    kwargs = {} if IS_POSTGRES else {"poolclass": StaticPool}
+    engine = create_async_engine(BENCH_DATABASE_URL, **kwargs)
+    yield engine
+    loop.run_until_complete(engine.dispose())
+
+
+async def _reset(engine):
+    async with engine.begin() as conn:
+        await conn.run_sync(TABLE.drop, checkfirst=True)
+        await conn.run_sync(TABLE.create)
+
+
+async def _count(engine) -> int:
+    async with engine.connect() as conn:
+        return (await conn.execute(select(func.count()).select_from(TABLE))).scalar_one()
+
+
+async def _orm_insert(engine, rows):
+    Session = async_sessionmaker(engine, expire_on_commit=False)
+    async with Session() as session:
+        for row in rows:
+            session.add(GoldPriceFact(**row))
+            await session.flush()
+        await session.commit()
+
+
+async def _bulk_insert(engine, rows):
+    Session = async_sessionmaker(engine, expire_on_commit=False)
+    async with Session() as session:
+        if IS_POSTGRES:
+            await bulk_upsert_candles(session, [{k: v for k, v in r.items() if k != "id"} for r in rows])
+        else:
+            await session.execute(insert(GoldPriceFact), rows)
+        await session.commit()
+
+
+def _run(benchmark, loop, engine, rows, writer):
+    benchmark.pedantic(
+        lambda: loop.run_until_complete(writer(engine, rows)),
+        setup=lambda: loop.run_until_complete(_reset(engine)),
+        rounds=5,
+        iterations=1,
+    )
+    assert loop.run_until_complete(_count(engine)) == len(rows)
+
+
+def bench_ingest_orm_per_row(benchmark, loop, engine, rows):
+    _run(benchmark, loop, engine, rows, _orm_insert)
+
+
+def bench_ingest_bulk(benchmark, loop, engine, rows):
+    _run(benchmark, loop, engine, rows, _bulk_insert)
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Feature build memory: DataFrame pipeline vs preallocated float32 matrix.
+
+Both build the price, indicator and sentiment features and end with the
+scaled float32 array the LSTM consumes. Peak traced memory (tracemalloc,
+which sees numpy buffers) is stored in `extra_info["peak_mib"]` next to
+the timings.
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+"""
+
+import tracemalloc
+
+import numpy as np
+import pytest
+
+sklearn = pytest.importorskip("sklearn.preprocessing")
+
+
+def _peak_mib(func, *args):
+    tracemalloc.start()
+    try:
+        func(*args)
+        return tracemalloc.get_traced_memory()[1] / 2**20
+    finally:
+        tracemalloc.stop()
+
+
+@pytest.fixture
+def patched_service(feature_service, ohlcv, sentiment, monkeypatch):
+    monkeypatch.setattr(feature_service, "load_price_data", lambda start_date=None: ohlcv.copy())
+    monkeypatch.setattr(feature_service, "load_sentiment_data", lambda start_date=None: sentiment)
+    monkeypatch.setattr(feature_service, "add_news_impact_features", lambda df: df)
+    return feature_service
+
+
+def build_frame_mode(service):
+    X, y = service.prepare_ml_dataset(include_macro=False)
+    return sklearn.MinMaxScaler().fit_transform(X.values).astype(np.float32)
+
+
+def build_matrix_mode(service):
+    X, y = service.prepare_ml_matrix(include_macro=False)
+    return X.scale_minmax_(sklearn.MinMaxScaler()).values
+
+
+def bench_feature_build_frame(benchmark, patched_service):
+    benchmark.extra_info["peak_mib"] = round(_peak_mib(build_frame_mode, patched_service), 2)
+    result = benchmark(build_frame_mode, patched_service)
+    assert result.dtype == np.float32
+
+
+def bench_feature_build_matrix(benchmark, patched_service):
+    benchmark.extra_info["peak_mib"] = round(_peak_mib(build_matrix_mode, patched_service), 2)
+    result = benchmark(build_matrix_mode, patched_service)
+    assert result.dtype == np.float32 and result.flags.c_contiguous
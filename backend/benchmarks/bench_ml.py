@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+LSTM benchmarks: sequence building and single-prediction latency.
+
+Skipped when TensorFlow is not installed.
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("tensorflow")
+
+from app.application.services.ml.lstm_model_service import LSTMGoldPricePredictor  # noqa: E402
+
+N_FEATURES = 42
+
+
+@pytest.fixture(scope="module")
+def matrix(ohlcv):
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(len(ohlcv), N_FEATURES))
+    y = ohlcv[["close"]].to_numpy()
+    return X, y
+
+
+@pytest.fixture(scope="module")
+def predictor(matrix):
+    X, y = matrix
+    model = LSTMGoldPricePredictor(sequence_length=60)
+    model.scaler_X.fit(X)
+    model.scaler_y.fit(y)
+    model.model = model.build_model((model.sequence_length, X.shape[1]))
+    return model
+
+
+def bench_create_sequences(benchmark, predictor, matrix):
+    X, y = matrix
+    X_seq, y_seq = benchmark(predictor.create_sequences, X, y)
+    assert X_seq.shape == (len(X) - 60, 60, N_FEATURES)
+
+
+def bench_predict_latency(benchmark, predictor, matrix):
+    X, _ = matrix
+    window = pd.DataFrame(X[-predictor.sequence_length:])
+    predictor.predict(window)  # warm-up (graph tracing)
+    result = benchmark(predictor.predict, window)
+    assert np.isfinite(result)
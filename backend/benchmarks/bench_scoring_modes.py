@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+FinBERT scoring modes: full (title + description, 512 tokens) vs
+title_first (short title + capped description), and the cost of
+re-tokenizing vs re-using pre-tokenized IDs.
+
+`extra_info` records articles per second, mean tokens per article and
+label agreement with full mode (the reference).
+
+    FINBERT_LOCAL_PATH   local checkpoint (default: FINBERT_MODEL_NAME)
+
+Skipped when torch / transformers are not installed.
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+"""
+
+import os
+
+import pytest
+
+pytest.importorskip("torch")
+pytest.importorskip("transformers")
+
+from generators import synthetic_descriptions, synthetic_headlines  # noqa: E402
+
+from app.application.services.ml.sentiment_analysis_service import SentimentAnalysisService  # noqa: E402
+
+ARTICLES = 128
+
+
+@pytest.fixture(scope="module")
+def finbert():
+    service = SentimentAnalysisService(os.getenv("FINBERT_LOCAL_PATH"))
+    try:
+        service.load_model()
+    except OSError as e:
+        pytest.skip(f"FinBERT weights not available: {e}")
+    return service
+
+
+@pytest.fixture(scope="module")
+def articles():
+    return synthetic_headlines(ARTICLES), synthetic_descriptions(ARTICLES)
+
+
+@pytest.fixture(scope="module")
+def reference(finbert, articles):
+    return finbert.analyze_articles(*articles, mode='full')
+
+
+def _agreement(results, reference):
+    return sum(r['label'] == ref['label'] for r, ref in zip(results, reference)) / len(reference)
+
+
+@pytest.mark.parametrize("mode", SentimentAnalysisService.SCORING_MODES)
+def bench_scoring_mode(benchmark, finbert, articles, reference, mode):
+    results = benchmark(finbert.analyze_articles, *articles, mode=mode)
+
+    encoded = finbert.encode_articles(*articles, mode=mode)
+    benchmark.extra_info["articles_per_second"] = round(ARTICLES / benchmark.stats.stats.mean, 1)
+    benchmark.extra_info["mean_tokens"] = round(sum(map(len, encoded)) / len(encoded), 1)
+    benchmark.extra_info["agreement_with_full"] = round(_agreement(results, reference), 3)
+
+
+@pytest.mark.parametrize("mode", SentimentAnalysisService.SCORING_MODES)
+def bench_tokenize(benchmark, finbert, articles, mode):
+    """Tokenizer time saved per re-analysis when the IDs are kept."""
+    encoded = benchmark(finbert.encode_articles, *articles, mode=mode)
+    assert len(encoded) == ARTICLES
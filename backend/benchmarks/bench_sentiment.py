@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Sentiment benchmarks: TextBlob analyzer throughput.
+
+Skipped when TextBlob is not installed.
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+"""
+
+import pytest
+
+pytest.importorskip("textblob")
+
+from generators import synthetic_headlines  # noqa: E402
+
+from app.application.services.ml.sentiment_analysis_lite import SentimentAnalysisLite  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def headlines():
+    return synthetic_headlines(200)
+
+
+def bench_analyze_text_lite(benchmark, headlines):
+    analyzer = SentimentAnalysisLite()
+
+    def run():
+        return [analyzer.analyze_text(text) for text in headlines]
+
+    results = benchmark(run)
+    assert len(results) == len(headlines)
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Sentiment cascade vs full FinBERT: throughput and agreement.
+
+The reference labels are FinBERT's own labels on the sample (what the
+cascade would have stored had every article gone to FinBERT).
+`extra_info` records the escalation rate and the label agreement. With
+BENCH_SENTIMENT_SAMPLE=path.csv (columns: text,label) the sample is read
+from the file and accuracy against the human labels is reported too.
+
+Skipped when TextBlob or transformers is not installed.
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+"""
+
+import csv
+import os
+
+import pytest
+
+pytest.importorskip("textblob")
+pytest.importorskip("transformers")
+
+from generators import synthetic_headlines  # noqa: E402
+
+from app.application.services.ml.sentiment_analysis_lite import SentimentAnalysisLite  # noqa: E402
+from app.application.services.ml.sentiment_analysis_service import SentimentAnalysisService  # noqa: E402
+from app.application.services.ml.sentiment_cascade import SentimentCascade  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def sample():
+    """(texts, human labels or None)."""
+    path = os.getenv("BENCH_SENTIMENT_SAMPLE")
+    if not path:
+        return synthetic_headlines(200), None
+    with open(path, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    return [r["text"] for r in rows], [r["label"] for r in rows]
+
+
+@pytest.fixture(scope="module")
+def finbert():
+    service = SentimentAnalysisService()
+    try:
+        service.load_model()
+    except OSError as e:
+        pytest.skip(f"FinBERT weights not available: {e}")
+    return service
+
+
+@pytest.fixture(scope="module")
+def reference(finbert, sample):
+    return finbert.analyze_batch(sample[0])
+
+
+def _agreement(results, labels):
+    return sum(r["label"] == label for r, label in zip(results, labels)) / len(labels)
+
+
+def bench_full_finbert(benchmark, finbert, sample):
+    texts, human = sample
+    results = benchmark(finbert.analyze_batch, texts)
+
+    benchmark.extra_info["articles_per_second"] = round(len(texts) / benchmark.stats.stats.mean, 1)
+    if human:
+        benchmark.extra_info["accuracy"] = round(_agreement(results, human), 3)
+
+
+def bench_cascade(benchmark, finbert, sample, reference):
+    texts, human = sample
+    cascade = SentimentCascade(lite=SentimentAnalysisLite(), accurate=finbert)
+    results = benchmark(cascade.analyze_texts, texts)
+
+    escalated = sum(r["model"] == "finbert" for r in results)
+    benchmark.extra_info["articles_per_second"] = round(len(texts) / benchmark.stats.stats.mean, 1)
+    benchmark.extra_info["escalation_rate"] = round(escalated / len(texts), 3)
+    benchmark.extra_info["agreement_with_finbert"] = round(
+        _agreement(results, [r["label"] for r in reference]), 3
+    )
+    if human:
+        benchmark.extra_info["accuracy"] = round(_agreement(results, human), 3)
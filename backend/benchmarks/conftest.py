@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark fixtures.
+
+Sizes come from environment variables so CI can run a small suite and a
+workstation the full one:
+
+    BENCH_YEARS          years of daily OHLCV (default 20)
+    BENCH_NEWS           number of news articles (default 5000)
+    BENCH_INGEST_ROWS    candles per ingestion round (default 2000)
+    BENCH_DATABASE_URL   async URL for ingestion benchmarks
+                         (default: in-memory SQLite via aiosqlite)
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+backend_path = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_path))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from generators import daily_sentiment, synthetic_news, synthetic_ohlcv  # noqa: E402
+
+BENCH_YEARS = float(os.getenv("BENCH_YEARS", "20"))
+BENCH_NEWS = int(os.getenv("BENCH_NEWS", "5000"))
+BENCH_INGEST_ROWS = int(os.getenv("BENCH_INGEST_ROWS", "2000"))
+BENCH_DATABASE_URL = os.getenv("BENCH_DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+
+
+@pytest.fixture(scope="session")
+def ohlcv():
+    """N years of daily candles."""
+    return synthetic_ohlcv(years=BENCH_YEARS)
+
+
+@pytest.fixture(scope="session")
+def news(ohlcv):
+    """M scored articles over the candle span."""
+    return synthetic_news(BENCH_NEWS, ohlcv.index)
+
+
+@pytest.fixture(scope="session")
+def sentiment(news):
+    """Daily sentiment in the load_sentiment_data shape."""
+    return daily_sentiment(news)
+
+
+@pytest.fixture(scope="session")
+def feature_service():
+    """FeatureEngineeringService on a throwaway engine (no database needed)."""
+    from app.application.services.ml.feature_engineering_service import FeatureEngineeringService
+    return FeatureEngineeringService("sqlite://")
+
+
+def pytest_benchmark_update_json(config, benchmarks, output_json):
+    """Record the data sizes next to the timings."""
+    output_json["bench_params"] = {
+        "years": BENCH_YEARS,
+        "news": BENCH_NEWS,
+        "ingest_rows": BENCH_INGEST_ROWS,
+        "database": BENCH_DATABASE_URL.split(":", 1)[0],
+    }
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Backfill Historical Data
+
+پر کردن داده‌های تاریخی (کندل طلا، DXY، اخبار) به صورت chunk های موازی.
+اجرای دوباره فقط chunk های ناتمام یا خطادار را اجرا می‌کند.
+
+    python scripts/backfill_history.py gold_daily --start 2005-01-01 --dry-run
+    python scripts/backfill_history.py gold_daily --start 2005-01-01
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+"""
+
+import sys
+from pathlib import Path
+
+backend_path = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_path))
+
+import argparse
+import asyncio
+from datetime import datetime, UTC
+
+from app.application.services.backfill import BACKFILL_SOURCES, BackfillRunner, build_source
+from app.application.services.scheduling.collection_jobs import build_default_quotas
+from app.core.logging import setup_logging
+from app.infrastructure.database.base import init_db
+
+
+def parse_date(value: str) -> datetime:
+    return datetime.fromisoformat(value).replace(tzinfo=UTC)
+
+
+def build_runner(name: str, chunk_days: float = None, concurrency: int = None) -> BackfillRunner:
+    """Runner for a named source with its shared API quota."""
+    source = build_source(name)
+    quota = build_default_quotas().get(source.quota_source) if source.quota_source else None
+    return BackfillRunner(source, quota=quota, chunk_days=chunk_days, concurrency=concurrency)
+
+
+async def main(args) -> None:
+    await init_db()
+    runner = build_runner(args.source, args.chunk_days, args.concurrency)
+    end = args.end or datetime.now(UTC)
+
+    if args.dry_run:
+        estimate = await runner.estimate(args.start, end)
+        print(f"🧮 Dry run: {args.source}")
+        for key, value in estimate.to_dict().items():
+            print(f"   {key}: {value}")
+        return
+
+    report = await runner.run(args.start, end)
+    print(f"✅ {args.source}: {report.done}/{report.chunks_todo} chunks, {report.rows:,} rows")
+    if report.failed:
+        print(f"⚠️  {report.failed} chunks failed - run again to resume them")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Backfill historical data in resumable chunks')
+    parser.add_argument('source', choices=sorted(BACKFILL_SOURCES), help='What to backfill')
+    parser.add_argument('--start', type=parse_date, required=True, help='Range start (YYYY-MM-DD)')
+    parser.add_argument('--end', type=parse_date, default=None, help='Range end, exclusive (default: now)')
+    parser.add_argument('--chunk-days', type=float, default=None, help='Chunk length (default: per source)')
+    parser.add_argument('--concurrency', type=int, default=None, help='Chunks at once (default: per source)')
+    parser.add_argument('--dry-run', action='store_true', help='Only print chunks and API cost')
+    args = parser.parse_args()
+
+    setup_logging()
+    asyncio.run(main(args))
@@ -15,12 +15,16 @@ from pathlib import Path
 backend_path = Path(__file__).parent.parent
 sys.path.insert(0, str(backend_path))
 
+import argparse
 import asyncio
-from datetime import datetime
+from datetime import datetime, UTC
+from app.application.services.backfill import BackfillRunner, DollarIndexSource
 from app.application.services.data_collection.dollar_index_service import DollarIndexService
+from app.application.services.scheduling.collection_jobs import build_default_quotas
+from app.infrastructure.database.base import init_db
 
 
-async def main():
+async def main(years: int = 25, dry_run: bool = False):
     print("\n" + "="*80)
     print("💵 Dollar Index (DXY) Historical Data Collection")
     print("="*80)
@@ -28,14 +32,25 @@ async def main():
     print(f"👤 User: hoseynd-ai")
     print("="*80 + "\n")
     
+    await init_db()
     service = DollarIndexService()
+    runner = BackfillRunner(DollarIndexSource(service), quota=build_default_quotas()['alpha_vantage'])
+    # start of a year, so reruns line up with the chunks already done
+    start = datetime(datetime.now(UTC).year - years, 1, 1, tzinfo=UTC)
     
-    print("📥 Step 1: Fetching Dollar Index data from Alpha Vantage...")
-    print("   (این شامل 20+ سال داده می‌شود)\n")
+    if dry_run:
+        estimate = await runner.estimate(start, datetime.now(UTC))
+        print(f"🧮 Dry run ({years} سال):")
+        for key, value in estimate.to_dict().items():
+            print(f"   {key}: {value}")
+        return
+    
+    print("📥 Step 1+2: دریافت Dollar Index از Alpha Vantage و ذخیره (chunk های سالانه)...")
+    print("   (اجرای دوباره فقط chunk های ناتمام را اجرا می‌کند)\n")
     
-    df = await service.fetch_daily_data(outputsize='full')
+    report = await runner.run(start, datetime.now(UTC))
     
-    if df is None:
+    if report.failed and not report.done:
         print("❌ خطا در دریافت داده")
         print("\n💡 نکات:")
         print("   • Alpha Vantage API key رو چک کنید")
@@ -43,17 +58,8 @@ async def main():
         print("   • اتصال اینترنت رو بررسی کنید")
         return
     
-    print(f"✅ داده با موفقیت دریافت شد!")
-    print(f"   📊 تعداد رکوردها: {len(df):,}")
-    print(f"   📅 بازه زمانی: {df.index.min().date()} → {df.index.max().date()}")
-    print(f"   📆 پوشش: {(df.index.max() - df.index.min()).days / 365:.1f} سال")
-    
-    print(f"\n📊 نمونه داده (5 روز اخیر):")
-    print(df.tail().to_string())
-    
-    print(f"\n💾 Step 2: ذخیره در دیتابیس...")
-    saved = await service.save_to_database(df)
-    print(f"✅ ذخیره/به‌روزرسانی شد: {saved:,} رکورد")
+    print(f"✅ ذخیره/به‌روزرسانی شد: {report.rows:,} رکورد")
+    print(f"   📦 chunk ها: {report.done}/{report.chunks_todo} (خطا: {report.failed})")
     
     print(f"\n🔗 Step 3: محاسبه همبستگی با قیمت طلا...")
     corr_stats = await service.calculate_correlation_with_gold()
@@ -95,4 +101,9 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    parser = argparse.ArgumentParser(description='Backfill Dollar Index history')
+    parser.add_argument('--years', type=int, default=25, help='Years of history to backfill')
+    parser.add_argument('--dry-run', action='store_true', help='Only print chunks and API cost')
+    args = parser.parse_args()
+    
+    asyncio.run(main(args.years, args.dry_run))
@@ -16,17 +16,21 @@ backend_path = Path(__file__).parent.parent
 sys.path.insert(0, str(backend_path))
 
 import asyncio
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, UTC
+from app.application.services.backfill import BackfillRunner, NewsAPISource
 from app.application.services.data_collection.news_service import NewsService
+from app.application.services.scheduling.collection_jobs import build_default_quotas
 from app.application.services.ml.sentiment_analysis_service import SentimentAnalysisService
+from app.infrastructure.database.base import init_db
 
 
-async def collect_news_in_batches(months_back: int = 24):
+async def collect_news_in_batches(months_back: int = 24, dry_run: bool = False):
     """
-    جمع‌آوری اخبار به صورت batch (دسته‌بندی شده)
+    جمع‌آوری اخبار تاریخی با backfill (chunk های هفتگی NewsAPI)
     
     Args:
         months_back: چند ماه عقب برگردیم (پیش‌فرض: 24 ماه = 2 سال)
+        dry_run: فقط تعداد chunk ها و درخواست‌های API را نشان بده
     """
     print("\n" + "="*70)
     print("📰 Historical Gold News Collection")
@@ -35,60 +39,35 @@ async def collect_news_in_batches(months_back: int = 24):
     print(f"👤 User: hoseynd-ai")
     print("="*70 + "\n")
     
+    await init_db()
     news_service = NewsService()
     sentiment_service = SentimentAnalysisService()
-    
-    total_collected = 0
-    total_analyzed = 0
+    runner = BackfillRunner(NewsAPISource(), quota=build_default_quotas()['newsapi'])
+    end_date = datetime.now(UTC)
+    start_date = end_date - timedelta(days=30 * months_back)
     
     print(f"🎯 Target: Collect news from last {months_back} months")
-    print(f"📊 Strategy: Collect in monthly batches to avoid rate limits\n")
-    
-    # جمع‌آوری به صورت ماهانه
-    for month_offset in range(months_back):
-        print(f"\n{'='*70}")
-        print(f"📅 Month {month_offset + 1}/{months_back}")
-        print(f"{'='*70}\n")
-        
-        # محاسبه بازه زمانی
-        end_date = datetime.utcnow() - timedelta(days=30 * month_offset)
-        start_date = end_date - timedelta(days=30)
-        
-        print(f"📅 Date range: {start_date.date()} to {end_date.date()}")
-        
-        try:
-            # جمع‌آوری اخبار (آخرین 30 روز × ماه)
-            hours_back = 24 * 30 * (month_offset + 1)
-            
-            print(f"📥 Fetching news (looking back {hours_back} hours)...")
-            saved = await news_service.fetch_and_save_news(
-                hours_back=hours_back,
-                filter_gold=True
-            )
-            
-            total_collected += saved
-            print(f"✅ Collected: {saved} articles")
-            
-            # تحلیل احساسات
-            if saved > 0:
-                print(f"🤖 Analyzing sentiment...")
-                analyzed = await sentiment_service.analyze_all_news(force_reanalyze=False)
-                total_analyzed += analyzed
-                print(f"✅ Analyzed: {analyzed} articles")
-            
-            # آمار کلی تا الان
-            print(f"\n📊 Progress:")
-            print(f"   Total collected: {total_collected} articles")
-            print(f"   Total analyzed: {total_analyzed} articles")
-            
-            # صبر کردن برای rate limit (5 ثانیه)
-            if month_offset < months_back - 1:
-                print(f"\n⏳ Waiting 5 seconds for rate limit...")
-                await asyncio.sleep(5)
-            
-        except Exception as e:
-            print(f"❌ Error in month {month_offset + 1}: {e}")
-            continue
+    print(f"📊 Strategy: weekly NewsAPI chunks, resumable (free tier: last 30 days only)\n")
+    
+    if dry_run:
+        estimate = await runner.estimate(start_date, end_date)
+        print("🧮 Dry run:")
+        for key, value in estimate.to_dict().items():
+            print(f"   {key}: {value}")
+        return
+    
+    report = await runner.run(start_date, end_date)
+    total_collected = report.rows
+    print(f"✅ Collected: {total_collected} articles ({report.done}/{report.chunks_todo} chunks)")
+    if report.failed:
+        print(f"⚠️  {report.failed} chunks failed - run again to resume them")
+    
+    # تحلیل احساسات
+    total_analyzed = 0
+    if total_collected > 0:
+        print(f"🤖 Analyzing sentiment...")
+        total_analyzed = await sentiment_service.analyze_all_news(force_reanalyze=False)
+        print(f"✅ Analyzed: {total_analyzed} articles")
     
     # آمار نهایی
     print("\n" + "="*70)
@@ -176,6 +155,11 @@ def main():
         default=90,
         help='Number of days to collect (for quick mode)'
     )
+    parser.add_argument(
+        '--dry-run',
+        action='store_true',
+        help='Only print chunks and API cost (for full mode)'
+    )
     
     args = parser.parse_args()
     
@@ -184,7 +168,7 @@ def main():
         asyncio.run(quick_collect_recent(args.days))
     else:
         print("🚀 Starting FULL collection (24 months)...")
-        asyncio.run(collect_news_in_batches(args.months))
+        asyncio.run(collect_news_in_batches(args.months, args.dry_run))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Rebuild Sentiment Rollups
+
+بازسازی جدول sentiment_rollups از news_events (backfill اولیه،
+یا بعد از تغییر SENTIMENT_ROLLUP_BUCKETS).
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+"""
+
+import sys
+from pathlib import Path
+
+backend_path = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_path))
+
+import argparse
+import asyncio
+from datetime import datetime, UTC
+
+from app.core.config import settings
+from app.core.logging import setup_logging
+from app.infrastructure.database.base import AsyncSessionLocal, init_db
+from app.infrastructure.database.repositories.sentiment_rollup_repository import (
+    rebuild_sentiment_rollups,
+)
+
+
+async def main(buckets: list, since: datetime = None):
+    await init_db()
+
+    async with AsyncSessionLocal() as session:
+        written = await rebuild_sentiment_rollups(session, buckets, since)
+        await session.commit()
+
+    print(f"✅ Rebuilt {written} rollup buckets ({', '.join(buckets)})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Rebuild sentiment rollups from news_events')
+    parser.add_argument(
+        '--buckets',
+        nargs='*',
+        default=settings.SENTIMENT_ROLLUP_BUCKETS,
+        help='Bucket sizes to rebuild (e.g. 1h 4h 1d)'
+    )
+    parser.add_argument(
+        '--since',
+        type=lambda s: datetime.fromisoformat(s).replace(tzinfo=UTC),
+        default=None,
+        help='Only rebuild buckets from this date (YYYY-MM-DD)'
+    )
+    args = parser.parse_args()
+
+    setup_logging()
+    asyncio.run(main(args.buckets, args.since))
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Run Collection Worker
+
+اجرای scheduler جمع‌آوری داده به صورت یک worker مستقل
+(بدون FastAPI). Runs every collector on its own interval until Ctrl+C.
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+"""
+
+import sys
+from pathlib import Path
+
+backend_path = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_path))
+
+import argparse
+import asyncio
+
+from app.application.services.scheduling import CollectionScheduler
+from app.application.services.scheduling.collection_jobs import (
+    build_default_jobs,
+    build_default_quotas,
+)
+from app.core.config import settings
+from app.core.logging import setup_logging
+
+
+async def main(only: list):
+    jobs = [job for job in build_default_jobs() if not only or job.name in only]
+
+    scheduler = CollectionScheduler(
+        jobs=jobs,
+        max_concurrency=settings.SCHEDULER_MAX_CONCURRENCY,
+        quotas=build_default_quotas(),
+    )
+
+    print("\n" + "="*70)
+    print("⏱️  Collection Worker")
+    print("="*70)
+    for job in scheduler.jobs.values():
+        print(f"   • {job.name:<15} every {job.interval_seconds / 60:>7.0f} min")
+    print("="*70 + "\n")
+
+    await scheduler.run_forever()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Run the data collection scheduler')
+    parser.add_argument(
+        '--only',
+        nargs='*',
+        default=[],
+        help='Run only these jobs (e.g. yahoo_finance rss_news)'
+    )
+    args = parser.parse_args()
+
+    setup_logging()
+
+    try:
+        asyncio.run(main(args.only))
+    except KeyboardInterrupt:
+        print("\n👋 Worker stopped")
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Stream Load Test
+
+تست بار endpoint استریم: N اتصال همزمان WebSocket به سرور در حال اجرا.
+Opens N concurrent WebSocket subscribers against a running API
+(STREAM_ENABLED=true) and reports received messages and delivery lag.
+
+Usage:
+    python scripts/stream_load_test.py --clients 1000 --duration 60
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from datetime import datetime
+
+import websockets
+
+
+async def subscriber(url: str, duration: float, lags: list, counts: list, errors: list):
+    received = 0
+    deadline = time.monotonic() + duration
+
+    try:
+        async with websockets.connect(url, open_timeout=30) as ws:
+            while (remaining := deadline - time.monotonic()) > 0:
+                try:
+                    frame = json.loads(await asyncio.wait_for(ws.recv(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+                if frame.get("type") == "heartbeat":
+                    continue
+
+                received += 1
+                sent_at = datetime.fromisoformat(frame["ts"]).timestamp()
+                lags.append(time.time() - sent_at)
+    except Exception as e:
+        errors.append(str(e))
+
+    counts.append(received)
+
+
+async def main(args):
+    url = f"{args.url}?topics={args.topics}"
+    lags, counts, errors = [], [], []
+
+    print(f"\n🔌 Connecting {args.clients} subscribers to {url}")
+    started = time.monotonic()
+
+    await asyncio.gather(*(
+        subscriber(url, args.duration, lags, counts, errors)
+        for _ in range(args.clients)
+    ))
+
+    print("\n" + "="*70)
+    print("📊 Stream Load Test")
+    print("="*70)
+    print(f"   Clients:          {args.clients}")
+    print(f"   Errors:           {len(errors)}")
+    print(f"   Elapsed:          {time.monotonic() - started:.1f}s")
+    print(f"   Messages:         {sum(counts)} (min/client {min(counts, default=0)})")
+    if lags:
+        lags.sort()
+        print(f"   Lag p50:          {statistics.median(lags) * 1000:.1f} ms")
+        print(f"   Lag p99:          {lags[int(len(lags) * 0.99) - 1] * 1000:.1f} ms")
+    print("="*70 + "\n")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='WebSocket stream load test')
+    parser.add_argument('--url', default='ws://localhost:8000/api/v1/stream/ws')
+    parser.add_argument('--topics', default='tick,indicators,sentiment')
+    parser.add_argument('--clients', type=int, default=1000)
+    parser.add_argument('--duration', type=float, default=60.0)
+
+    asyncio.run(main(parser.parse_args()))
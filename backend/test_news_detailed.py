@@ -65,8 +65,8 @@ async def main():
             print(f"📡 {source_name} ({len(articles)} articles):")
             
             for i, article in enumerate(articles, 1):
-                print(f"   {i}. {article.title[:60]}...")
-                print(f"      📅 {article.published_at.strftime('%Y-%m-%d %H:%M UTC')}")
+                print(f"   {i}. {article['title'][:60]}...")
+                print(f"      📅 {article['published_at'][:16].replace('T', ' ')} UTC")
             print()
     
     # Test 4: Recent 24h articles
@@ -95,7 +95,7 @@ async def main():
     
     keyword_count = {}
     for article in all_articles:
-        text = f"{article.title} {article.description}".lower()
+        text = f"{article['title']} {article['description']}".lower()
         
         for keyword in service.GOLD_KEYWORDS:
             if keyword.lower() in text:
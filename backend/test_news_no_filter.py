@@ -86,11 +86,11 @@ async def main():
     
     for i, article in enumerate(articles[:10], 1):
         # Check if gold-related
-        is_gold = service.is_gold_related(article.title, article.description or '')
+        is_gold = service.is_gold_related(article['title'], article['description'] or '')
         emoji = "🏆" if is_gold else "📰"
         
-        print(f"\n{i}. {emoji} {article.title[:60]}...")
-        print(f"   Source: {article.source} | {article.published_at.strftime('%Y-%m-%d %H:%M UTC')}")
+        print(f"\n{i}. {emoji} {article['title'][:60]}...")
+        print(f"   Source: {article['source']} | {article['published_at'][:16].replace('T', ' ')} UTC")
         
         if is_gold:
             print(f"   ✅ Gold-related!")
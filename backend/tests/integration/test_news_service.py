@@ -69,19 +69,19 @@ async def main():
     
     if articles:
         for i, article in enumerate(articles, 1):
-            print(f"{i}. 📌 {article.title}")
-            print(f"   🗓️  {article.published_at.strftime('%Y-%m-%d %H:%M UTC')}")
-            print(f"   🏷️  Source: {article.source} | Category: {article.category}")
-            print(f"   👤 Author: {article.author}")
-            print(f"   🔗 {article.url}")
+            print(f"{i}. 📌 {article['title']}")
+            print(f"   🗓️  {article['published_at'][:16].replace('T', ' ')} UTC")
+            print(f"   🏷️  Source: {article['source']} | Category: {article['category']}")
+            print(f"   👤 Author: {article['author']}")
+            print(f"   🔗 {article['url']}")
             
-            if article.description:
-                desc = article.description[:200].replace('\n', ' ').strip()
+            if article['description']:
+                desc = article['description'][:200].replace('\n', ' ').strip()
                 print(f"   📝 {desc}...")
             
-            if article.sentiment_score:
-                emoji = "📈" if article.sentiment_score > 0 else "📉" if article.sentiment_score < 0 else "➡️"
-                print(f"   {emoji} Sentiment: {article.sentiment_label} ({article.sentiment_score})")
+            if article['sentiment_score']:
+                emoji = "📈" if article['sentiment_score'] > 0 else "📉" if article['sentiment_score'] < 0 else "➡️"
+                print(f"   {emoji} Sentiment: {article['sentiment_label']} ({article['sentiment_score']})")
             
             print()
     else:
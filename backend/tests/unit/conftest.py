@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Shared fixtures for the unit tests.
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+"""
+
+import pytest
+
+FINBERT_HEADLINES = [
+    "Gold prices surge as Fed signals dovish stance",
+    "Gold falls on strong jobs data while dollar strengthens",
+    "Bullion steady amid geopolitical risk and central bank demand",
+    "Precious metals drop after inflation data surprise",
+    "Investors buy gold as uncertainty weighs on markets",
+    "Gold rally fades as yields climb",
+    "Central bank purchases support bullion prices",
+    "Gold crash deepens on hawkish Fed minutes",
+]
+
+
+class FakeClock:
+    """Callable clock that only moves when a test sets or advances `now`."""
+
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture(scope="session")
+def finbert_headlines():
+    return list(FINBERT_HEADLINES)
+
+
+@pytest.fixture(scope="session")
+def tiny_finbert(tmp_path_factory):
+    """
+    Local checkpoint shaped like FinBERT (BERT + 3-label head), random weights.
+
+    Small enough to build per session, so FinBERT code paths are tested
+    without downloading ProsusAI/finbert.
+    """
+    torch = pytest.importorskip("torch")
+    transformers = pytest.importorskip("transformers")
+
+    path = tmp_path_factory.mktemp("tiny_finbert")
+    words = sorted({w.lower().strip(",.") for text in FINBERT_HEADLINES for w in text.split()})
+    vocab = path / "vocab.txt"
+    vocab.write_text("\n".join(["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]", ".", *words]) + "\n")
+
+    torch.manual_seed(0)
+    config = transformers.BertConfig(
+        vocab_size=6 + len(words),
+        hidden_size=64,
+        num_hidden_layers=2,
+        num_attention_heads=2,
+        intermediate_size=128,
+        num_labels=3,
+    )
+    transformers.BertForSequenceClassification(config).save_pretrained(path)
+    transformers.BertTokenizer(str(vocab)).save_pretrained(path)
+    return str(path)
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the as-of join engine and its feature engineering use.
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+"""
+
+import numpy as np
+import pandas as pd
+
+from app.application.services.ml.asof_join_service import (
+    AsofJoinService,
+    ExogenousSource,
+    asof_positions,
+)
+from app.application.services.ml.feature_engineering_service import FeatureEngineeringService
+
+
+def _gold(periods=10, freq="D"):
+    index = pd.date_range("2025-01-06", periods=periods, freq=freq, tz="UTC", name="timestamp")
+    return pd.DataFrame({"close": np.linspace(2600, 2700, periods)}, index=index)
+
+
+def test_asof_positions_respects_staleness():
+    day = pd.Timedelta(days=1).value
+    left = np.array([0, 1, 2, 5, 9]) * day
+    right = np.array([1, 4]) * day
+
+    positions = asof_positions(left, right, max_staleness_ns=2 * day)
+
+    assert positions.tolist() == [-1, 0, 0, 1, -1]
+
+
+def test_join_forward_fills_weekend_and_caches_source_features():
+    gold = _gold(periods=14)
+    weekdays = gold.index[gold.index.dayofweek < 5].tz_localize(None)
+    dxy = pd.DataFrame({"close": np.arange(100.0, 100.0 + len(weekdays))}, index=weekdays)
+    source = ExogenousSource("dxy", dxy, lags=(1,), corr_windows=(3,))
+    joiner = AsofJoinService()
+
+    joined = joiner.join(gold, [source])
+    joiner.join(gold, [source])
+
+    saturday = gold.index[gold.index.dayofweek == 5][0]
+    friday = saturday - pd.Timedelta(days=1)
+    assert joined.loc[saturday, "dxy_close"] == joined.loc[friday, "dxy_close"]
+    assert joined.loc[saturday, "dxy_age_hours"] == 24
+    assert list(joined.columns[:1]) == ["close"]
+    assert {"dxy_return_1", "dxy_return_5", "dxy_close_lag_1", "dxy_corr_3"} <= set(joined.columns)
+    assert len(joiner._source_cache) == 1
+
+
+def test_feature_caches_are_bounded_lru():
+    gold = _gold(periods=10)
+    joiner = AsofJoinService(cache_size=2)
+    sources = [
+        ExogenousSource(f"s{i}", pd.DataFrame({"close": 100.0 + np.arange(10.0) + i}, index=gold.index), corr_windows=(3,))
+        for i in range(3)
+    ]
+
+    joiner.join(gold, sources[:2])
+    joiner.source_features(sources[0])
+    joiner.join(gold, sources[2:])
+
+    assert [key[0] for key in joiner._source_cache] == ["s0", "s2"]
+    assert len(joiner._corr_cache) == 2
+
+
+def test_merge_sentiment_matches_date_merge():
+    gold = _gold(periods=48, freq="h")
+    sentiment = pd.DataFrame(
+        {"sentiment_score": [0.4, -0.2], "news_count": [3, 1]},
+        index=pd.DatetimeIndex(["2025-01-06", "2025-01-07"], name="date"),
+    )
+    service = FeatureEngineeringService("sqlite://")
+
+    merged = service.merge_sentiment_data(gold, sentiment)
+
+    # reference: the original pandas merge on calendar date
+    ref = gold.copy()
+    ref["date"] = pd.to_datetime(ref.index.date)
+    ref = ref.merge(sentiment, left_on="date", right_index=True, how="left").drop("date", axis=1)
+    ref[["sentiment_score", "news_count"]] = ref[["sentiment_score", "news_count"]].fillna(0)
+
+    assert list(merged.columns) == [
+        "close", "sentiment_score", "news_count",
+        "sentiment_lag_1", "sentiment_lag_3", "sentiment_ma_5",
+    ]
+    np.testing.assert_allclose(merged["sentiment_score"], ref["sentiment_score"])
+    np.testing.assert_allclose(merged["news_count"], ref["news_count"])
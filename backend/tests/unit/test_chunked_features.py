@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the chunked price loader and overlapped feature chunks.
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from sqlalchemy import text
+
+from app.application.services.ml.feature_engineering_service import FeatureEngineeringService
+from app.infrastructure.database.engine import get_sync_engine
+from app.infrastructure.database.readers import overlapping
+
+ROWS = 1500
+
+
+@pytest.fixture
+def service(tmp_path):
+    url = f"sqlite:///{tmp_path / 'prices.db'}"
+    rng = np.random.default_rng(7)
+    close = 1800 + np.cumsum(rng.normal(0, 5, ROWS))
+    days = pd.date_range("2020-01-01", periods=ROWS, freq="D")
+
+    with get_sync_engine(url).begin() as conn:
+        conn.execute(text(
+            "CREATE TABLE gold_price_facts (timestamp TIMESTAMP, timeframe TEXT, source TEXT, "
+            "open FLOAT, high FLOAT, low FLOAT, close FLOAT, volume FLOAT)"
+        ))
+        conn.execute(
+            text(
+                "INSERT INTO gold_price_facts VALUES "
+                "(:timestamp, 'daily', 'alpha_vantage_gold_converted', :open, :high, :low, :close, :volume)"
+            ),
+            [
+                {
+                    "timestamp": day.to_pydatetime(),
+                    "open": c - 1, "high": c + 3, "low": c - 3, "close": c,
+                    "volume": float(1000 + i),
+                }
+                for i, (day, c) in enumerate(zip(days, close))
+            ],
+        )
+    return FeatureEngineeringService(url)
+
+
+def test_overlapping_prefixes_tail_of_previous_chunks():
+    frames = [pd.DataFrame({"x": range(a, b)}) for a, b in [(0, 4), (4, 5), (5, 9)]]
+    out = [(f["x"].tolist(), warmup) for f, warmup in overlapping(frames, 3)]
+
+    assert out == [([0, 1, 2, 3], 0), ([1, 2, 3, 4], 3), ([2, 3, 4, 5, 6, 7, 8], 3)]
+
+
+def test_price_chunks_match_full_load(service):
+    chunks = list(service.iter_price_data(chunk_rows=512))
+
+    assert [len(c) for c in chunks] == [512, 512, ROWS - 1024]
+    pd.testing.assert_frame_equal(pd.concat(chunks), service.load_price_data())
+
+
+def test_feature_chunks_match_single_pass_pipeline(service):
+    full = service.add_price_features(service.add_technical_indicators(service.load_price_data()))
+    chunked = pd.concat(list(service.iter_feature_chunks(chunk_rows=300, include_sentiment=False)))
+
+    assert chunked.index.equals(full.index)
+    assert chunked.index.is_unique
+    np.testing.assert_allclose(
+        chunked.to_numpy(dtype=float), full.to_numpy(dtype=float), rtol=1e-9, atol=1e-8, equal_nan=True
+    )
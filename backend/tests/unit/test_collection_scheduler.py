@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the collection scheduler.
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+"""
+
+import asyncio
+from datetime import datetime, UTC, timedelta
+
+from app.application.services.scheduling.collection_jobs import (
+    days_since,
+    hours_since,
+    outputsize_for,
+)
+from app.application.services.scheduling.collection_scheduler import (
+    CollectionScheduler,
+    CollectorJob,
+    QuotaBudget,
+)
+
+
+def test_quota_budget_sliding_window(clock):
+    budget = QuotaBudget(limit=2, period_seconds=10, clock=clock)
+
+    assert budget.try_acquire()
+    assert budget.try_acquire()
+    assert not budget.try_acquire()
+    assert budget.remaining == 0
+
+    clock.now = 10
+    assert budget.remaining == 2
+    assert not budget.try_acquire(3)
+
+
+def test_quota_exhaustion_skips_run():
+    calls = []
+
+    async def run():
+        calls.append(1)
+        return 1
+
+    async def scenario():
+        scheduler = CollectionScheduler(
+            jobs=[CollectorJob("av", run, interval_seconds=60, quota_source="av")],
+            quotas={"av": QuotaBudget(limit=1)},
+        )
+        await scheduler.run_job_now("av")
+        await scheduler.run_job_now("av")
+        return scheduler
+
+    scheduler = asyncio.run(scenario())
+
+    assert len(calls) == 1
+    assert scheduler.states["av"].skipped_quota == 1
+
+
+def test_concurrency_cap():
+    active = 0
+    peak = 0
+
+    async def run():
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+
+    async def scenario():
+        jobs = [CollectorJob(f"job{i}", run, interval_seconds=60) for i in range(5)]
+        scheduler = CollectionScheduler(jobs=jobs, max_concurrency=2)
+        await asyncio.gather(*(scheduler.run_job_now(j.name) for j in jobs))
+
+    asyncio.run(scenario())
+
+    assert peak == 2
+
+
+def test_failures_are_recorded_and_loop_survives():
+    async def boom():
+        raise RuntimeError("source down")
+
+    async def scenario():
+        scheduler = CollectionScheduler(
+            jobs=[CollectorJob("broken", boom, interval_seconds=0.01)]
+        )
+        await scheduler.start()
+        await asyncio.sleep(0.05)
+        await scheduler.stop()
+        return scheduler
+
+    scheduler = asyncio.run(scenario())
+    state = scheduler.states["broken"]
+
+    assert state.failures >= 2
+    assert state.last_error == "source down"
+    assert not scheduler.is_running
+
+
+def test_missed_runs_are_coalesced(clock):
+    runs = []
+
+    async def slow_run():
+        runs.append(clock.now)
+        # pretend the run took 3.5 intervals
+        clock.now += 35
+
+    async def scenario():
+        scheduler = CollectionScheduler(
+            jobs=[CollectorJob("slow", slow_run, interval_seconds=10)],
+            clock=clock,
+        )
+        await scheduler.start()
+        for _ in range(10):
+            await asyncio.sleep(0)
+        await scheduler.stop()
+        return scheduler
+
+    scheduler = asyncio.run(scenario())
+
+    assert scheduler.states["slow"].coalesced >= 3
+    # runs are never fired back-to-back for the backlog
+    assert all(b - a >= 35 for a, b in zip(runs, runs[1:]))
+
+
+def test_delta_windows():
+    now = datetime.now(UTC)
+
+    assert days_since(None, default=30, maximum=730) == 30
+    assert days_since(now - timedelta(days=3, hours=1), default=30, maximum=730) == 4
+    assert days_since(now - timedelta(days=5000), default=30, maximum=730) == 730
+    assert hours_since(now - timedelta(minutes=90), default=24, maximum=720) == 3
+    assert outputsize_for(None) == "full"
+    assert outputsize_for((now - timedelta(days=5)).date()) == "compact"
+    assert outputsize_for((now - timedelta(days=400)).date()) == "full"
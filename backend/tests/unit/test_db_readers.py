@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the shared engines and streaming readers.
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+"""
+
+import asyncio
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.application.services.ml.feature_engineering_service import FeatureEngineeringService
+from app.infrastructure.database.engine import engine_options, get_sync_engine
+from app.infrastructure.database.readers import async_read_frame, iter_frames, read_frame
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / "readers.db"
+    engine = get_sync_engine(f"sqlite:///{path}")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE prices (id INTEGER PRIMARY KEY, close NUMERIC)"))
+        conn.execute(
+            text("INSERT INTO prices (id, close) VALUES (:id, :close)"),
+            [{"id": i, "close": 1800 + i} for i in range(25)],
+        )
+    return path
+
+
+def test_services_share_one_engine_per_url(db_path):
+    url = f"sqlite:///{db_path}"
+    a, b = FeatureEngineeringService(url), FeatureEngineeringService(url)
+
+    assert a.engine is b.engine is get_sync_engine(url)
+    assert "pool_size" not in engine_options(url)
+    assert engine_options("postgresql+psycopg2://u:p@h/db")["pool_size"] > 0
+
+
+def test_iter_frames_streams_in_chunks(db_path):
+    engine = get_sync_engine(f"sqlite:///{db_path}")
+    query = "SELECT id, close FROM prices WHERE id >= :start ORDER BY id"
+
+    chunks = list(iter_frames(query, {"start": 3}, engine=engine, chunk_size=10))
+    assert [len(c) for c in chunks] == [10, 10, 2]
+
+    df = read_frame(query, {"start": 3}, engine=engine, chunk_size=10)
+    assert df["id"].tolist() == list(range(3, 25))
+    assert df["close"].dtype.kind in "if"
+
+    empty = read_frame(query, {"start": 100}, engine=engine)
+    assert empty.empty and list(empty.columns) == ["id", "close"]
+
+
+def test_async_read_frame_matches_sync(db_path):
+    async def run():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+        try:
+            return await async_read_frame("SELECT id FROM prices ORDER BY id", engine=engine, chunk_size=7)
+        finally:
+            await engine.dispose()
+
+    df = asyncio.run(run())
+    assert df["id"].tolist() == list(range(25))
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the fast logging mode (orjson, queue handler, sampling).
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+"""
+
+import io
+import json
+
+import pytest
+
+from app.core.config import settings
+from app.core.logging import EventSampler, flush_logging, get_logger, setup_logging
+
+
+@pytest.fixture
+def fast_stream():
+    stream = io.StringIO()
+    setup_logging("fast", stream=stream)
+    yield stream
+    setup_logging("standard")
+
+
+def _lines(stream):
+    flush_logging()
+    return [json.loads(line) for line in stream.getvalue().splitlines() if line]
+
+
+def test_fast_mode_renders_json_with_static_fields(fast_stream):
+    get_logger("unit.fast_json").info("unit_fast_event", rows=3, ts={"a": 1})
+
+    [line] = [r for r in _lines(fast_stream) if r["event"] == "unit_fast_event"]
+    assert line["rows"] == 3
+    assert line["level"] == "info"
+    assert line["app"] == settings.APP_NAME
+    assert line["version"] == settings.APP_VERSION
+    assert "timestamp" in line
+
+
+def test_fast_mode_samples_listed_events(fast_stream):
+    event = settings.LOG_SAMPLED_EVENTS[0]
+    every = round(1 / settings.LOG_SAMPLE_RATE)
+    log = get_logger("unit.fast_sampled")
+
+    for i in range(every * 3):
+        log.info(event, i=i)
+    log.info("unit_unsampled_event")
+
+    lines = _lines(fast_stream)
+    kept = [r for r in lines if r["event"] == event]
+    assert [r["i"] for r in kept] == [0, every, every * 2]
+    assert kept[1]["sampled_every"] == every and kept[1]["suppressed"] == every - 1
+    assert any(r["event"] == "unit_unsampled_event" for r in lines)
+
+
+def test_sampler_rate_zero_drops_everything():
+    import structlog
+
+    sampler = EventSampler(["noisy"], 0)
+    with pytest.raises(structlog.DropEvent):
+        sampler(None, "info", {"event": "noisy"})
+    assert sampler(None, "info", {"event": "quiet"}) == {"event": "quiet"}
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the feature graph (planning, batch and incremental evaluation).
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.application.services.ml.feature_graph import (
+    INDICATOR_FEATURES,
+    PRICE_FEATURES,
+    FeatureRegistry,
+    IncrementalFeatures,
+    get_feature_registry,
+)
+
+
+@pytest.fixture
+def ohlcv():
+    rng = np.random.default_rng(11)
+    close = 1800 + np.cumsum(rng.normal(0, 4, 1200))
+    return pd.DataFrame(
+        {
+            "open": close - 1,
+            "high": close + 2,
+            "low": close - 2,
+            "close": close,
+            "volume": rng.uniform(1e3, 2e3, len(close)),
+        },
+        index=pd.date_range("2020-01-01", periods=len(close), freq="D"),
+    )
+
+
+def _reference(df):
+    """The pre-graph formulas, written out column by column."""
+    out = pd.DataFrame(index=df.index)
+    c = df["close"]
+    out["sma_20"] = c.rolling(20).mean()
+    out["ema_12"] = c.ewm(span=12, adjust=False).mean()
+    out["ema_26"] = c.ewm(span=26, adjust=False).mean()
+    delta = c.diff()
+    rs = delta.where(delta > 0, 0).rolling(14).mean() / (-delta.where(delta < 0, 0)).rolling(14).mean()
+    out["rsi"] = 100 - 100 / (1 + rs)
+    out["macd"] = out["ema_12"] - out["ema_26"]
+    out["macd_signal"] = out["macd"].ewm(span=9, adjust=False).mean()
+    out["bb_upper"] = out["sma_20"] + c.rolling(20).std() * 2
+    out["returns"] = c.pct_change()
+    out["volatility_20d"] = out["returns"].rolling(20).std()
+    out["returns_lag_7"] = out["returns"].shift(7)
+    out["volume_ratio"] = df["volume"] / df["volume"].rolling(5).mean()
+    return out
+
+
+def test_batch_evaluation_matches_reference_and_computes_shared_nodes_once(ohlcv, monkeypatch):
+    registry = get_feature_registry()
+    expected = _reference(ohlcv)
+
+    result = registry.evaluate(ohlcv, INDICATOR_FEATURES + PRICE_FEATURES)
+    pd.testing.assert_frame_equal(result[expected.columns], expected, check_freq=False)
+    assert list(result.columns) == INDICATOR_FEATURES + PRICE_FEATURES
+
+    plan = [f.name for f in registry.plan(["bb_upper", "bb_lower", "sma_20", "volatility_5d", "returns_lag_1"])]
+    assert plan.count("sma_20") == 1 and plan.count("returns") == 1
+    assert plan.index("sma_20") < plan.index("bb_middle") < plan.index("bb_upper")
+    assert "ema_12" not in plan
+
+
+def test_only_requested_columns_and_their_sources_are_needed():
+    registry = get_feature_registry()
+
+    assert registry.sources(INDICATOR_FEATURES) == ["close"]
+    close_only = pd.DataFrame({"close": np.linspace(1, 2, 60)})
+    assert list(registry.evaluate(close_only, ["rsi", "sma_50"]).columns) == ["rsi", "sma_50"]
+    with pytest.raises(KeyError, match="volume"):
+        registry.evaluate(close_only, ["volume_ratio"])
+
+
+def test_cycles_are_rejected():
+    registry = FeatureRegistry()
+    registry.add("a", ["b"], lambda b: b)
+    registry.add("b", ["a"], lambda a: a)
+
+    with pytest.raises(ValueError, match="cycle"):
+        registry.plan(["a"])
+
+
+def test_incremental_updates_match_batch(ohlcv):
+    registry = get_feature_registry()
+    targets = ["macd_histogram", "rsi", "bb_lower", "volatility_10d", "returns_lag_3"]
+    batch = registry.evaluate(ohlcv, targets)
+
+    live = IncrementalFeatures(registry, targets, history=ohlcv.iloc[:800])
+    assert live.lookback == registry.lookback(["macd_histogram"])
+
+    parts = [live.update(ohlcv.iloc[i:i + 50]) for i in range(800, len(ohlcv), 50)]
+    incremental = pd.concat(parts)
+
+    np.testing.assert_allclose(
+        incremental.to_numpy(), batch.iloc[800:].to_numpy(), rtol=1e-9, atol=1e-8
+    )
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the float32 feature matrix build mode.
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.application.services.ml.feature_engineering_service import FeatureEngineeringService
+from app.application.services.ml.feature_graph import INDICATOR_FEATURES, PRICE_FEATURES, get_feature_registry
+from app.application.services.ml.feature_matrix import FeatureMatrix, sequence_windows
+from app.application.services.ml.news_impact_service import NEWS_IMPACT_FEATURES
+
+
+@pytest.fixture
+def ohlcv():
+    rng = np.random.default_rng(3)
+    close = 1800 + np.cumsum(rng.normal(0, 4, 400))
+    return pd.DataFrame(
+        {
+            "open": close - 1,
+            "high": close + 2,
+            "low": close - 2,
+            "close": close,
+            "volume": rng.uniform(1e3, 2e3, len(close)),
+        },
+        index=pd.date_range("2021-01-01", periods=len(close), freq="D"),
+    )
+
+
+def test_evaluate_into_matches_evaluate(ohlcv):
+    registry = get_feature_registry()
+    targets = ["close"] + INDICATOR_FEATURES + PRICE_FEATURES
+
+    matrix = FeatureMatrix.allocate(ohlcv.index, targets)
+    registry.evaluate_into(ohlcv, targets, matrix)
+
+    assert matrix.values.dtype == np.float32 and matrix.values.flags.c_contiguous
+    np.testing.assert_allclose(
+        matrix.values, registry.evaluate(ohlcv, targets).to_numpy(), rtol=1e-6, equal_nan=True
+    )
+
+
+def test_sequence_windows_match_loop_without_copying():
+    X = np.arange(40, dtype=np.float32).reshape(10, 4)
+
+    windows = sequence_windows(X, 3)
+    expected = np.array([X[i - 3:i] for i in range(3, len(X))])
+
+    np.testing.assert_array_equal(windows, expected)
+    assert np.shares_memory(windows, X)
+    assert sequence_windows(X, 10).shape == (0, 10, 4)
+
+
+def test_take_rows_and_inplace_scaling(ohlcv):
+    MinMaxScaler = pytest.importorskip("sklearn.preprocessing").MinMaxScaler
+    matrix = FeatureMatrix.from_frame(ohlcv)
+    matrix["open"][:3] = np.nan
+
+    kept = matrix.take_rows(matrix.valid_rows())
+    assert len(kept) == len(ohlcv) - 3 and np.shares_memory(kept.values, matrix.values)
+
+    expected = MinMaxScaler().fit_transform(kept.values.astype(np.float64))
+    kept.scale_minmax_(MinMaxScaler())
+    np.testing.assert_allclose(kept.values, expected, atol=1e-5)
+
+
+def test_prepare_ml_matrix_matches_dataframe_mode(ohlcv, monkeypatch):
+    service = FeatureEngineeringService("sqlite://")
+    sentiment = pd.DataFrame(
+        {"sentiment_score": np.sin(np.arange(len(ohlcv))), "news_count": 3.0},
+        index=ohlcv.index,
+    )
+    monkeypatch.setattr(service, "load_price_data", lambda start_date=None: ohlcv.copy())
+    monkeypatch.setattr(service, "load_sentiment_data", lambda start_date=None: sentiment)
+    monkeypatch.setattr(service, "add_news_impact_features", lambda df: df)
+
+    X_df, y_df = service.prepare_ml_dataset(include_macro=False)
+    X, y = service.prepare_ml_matrix(include_macro=False)
+
+    assert X.columns == list(X_df.columns)
+    common = X_df.index.intersection(X.index)
+    assert len(common) == len(X_df)
+    rows = X.index.get_indexer(common)
+    np.testing.assert_allclose(X.values[rows], X_df.loc[common].to_numpy(), rtol=1e-5)
+    np.testing.assert_allclose(y[rows], y_df.loc[common].to_numpy(), rtol=1e-6)
+
+    subset = ["rsi", "sentiment_lag_1"]
+    X_small, _ = service.prepare_ml_matrix(include_macro=False, feature_columns=subset)
+    assert X_small.columns == subset
+
+
+def test_macro_features_are_opt_in(ohlcv, monkeypatch):
+    service = FeatureEngineeringService("sqlite://")
+    sentiment = pd.DataFrame({"sentiment_score": 0.1, "news_count": 1.0}, index=ohlcv.index)
+    monkeypatch.setattr(service, "load_price_data", lambda start_date=None: ohlcv.copy())
+    monkeypatch.setattr(service, "load_sentiment_data", lambda start_date=None: sentiment)
+    monkeypatch.setattr(service, "add_news_impact_features", lambda df: df)
+
+    def no_dxy(start_date=None):
+        raise AssertionError("DXY loaded without include_macro")
+
+    monkeypatch.setattr(service, "load_dollar_index_data", no_dxy)
+
+    X_df, _ = service.prepare_ml_dataset()
+    X, _ = service.prepare_ml_matrix()
+
+    assert X.columns == list(X_df.columns)
+    assert not any(col.startswith("dxy") for col in X.columns)
+
+
+def test_news_impact_features_are_opt_in(ohlcv, monkeypatch):
+    service = FeatureEngineeringService("sqlite://")
+    sentiment = pd.DataFrame({"sentiment_score": 0.1, "news_count": 1.0}, index=ohlcv.index)
+    monkeypatch.setattr(service, "load_price_data", lambda start_date=None: ohlcv.copy())
+    monkeypatch.setattr(service, "load_sentiment_data", lambda start_date=None: sentiment)
+    monkeypatch.setattr(
+        service, "add_news_impact_features",
+        lambda df: df.assign(**{col: 0.5 for col in NEWS_IMPACT_FEATURES}),
+    )
+
+    X_default, _ = service.prepare_ml_dataset()
+    X_opted, _ = service.prepare_ml_dataset(include_news_impact=True)
+    X_requested, _ = service.prepare_ml_matrix(feature_columns=["rsi", "news_impact_pressure"])
+
+    assert not set(NEWS_IMPACT_FEATURES) & set(X_default.columns)
+    assert set(NEWS_IMPACT_FEATURES) <= set(X_opted.columns)
+    assert X_requested.columns == ["rsi", "news_impact_pressure"]
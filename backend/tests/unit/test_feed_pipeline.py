@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the RSS fetch -> parse -> filter -> dedup -> insert pipeline.
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
+
+import pytest
+
+pytest.importorskip("feedparser")
+
+from app.application.services.data_collection.feed_parsing import parse_feed  # noqa: E402
+from app.application.services.data_collection.feed_pipeline import (  # noqa: E402
+    FeedPipeline,
+    get_parse_process_pool,
+    shutdown_parse_process_pool,
+)
+from app.core.config import settings  # noqa: E402
+
+
+def rss(*items):
+    body = "".join(
+        f"<item><title>{title}</title><link>{link}</link>"
+        f"<description>{desc}</description><pubDate>{date}</pubDate></item>"
+        for title, link, desc, date in items
+    )
+    return f'<?xml version="1.0"?><rss version="2.0"><channel><title>t</title>{body}</channel></rss>'.encode()
+
+
+FEEDS = {
+    "kitco": {"url": "https://kitco.test/rss", "category": "gold_market"},
+    "reuters": {"url": "https://reuters.test/rss", "category": "commodities"},
+    "down": {"url": "https://down.test/rss", "category": "x"},
+}
+BODIES = {
+    "https://kitco.test/rss": rss(
+        ("Gold rallies", "https://a/1", "bullion demand", "Mon, 06 Jan 2025 10:00:00 GMT"),
+        ("Gold slips", "https://a/2", "dollar firm", "Mon, 06 Jan 2025 11:00:00 GMT"),
+        ("Old gold news", "https://a/3", "gold", "Mon, 30 Dec 2024 11:00:00 GMT"),
+    ),
+    "https://reuters.test/rss": rss(
+        ("Gold slips", "https://a/2", "dollar firm", "Mon, 06 Jan 2025 11:00:00 GMT"),  # same URL
+        ("Oil climbs", "https://b/1", "crude supply", "Mon, 06 Jan 2025 12:00:00 GMT"),
+        ("Fed holds, gold steady", "https://b/2", "rates", "Mon, 06 Jan 2025 13:00:00 GMT"),
+    ),
+}
+
+
+class FakeStore:
+    def __init__(self, existing=()):
+        self.existing = set(existing)
+        self.inserted = []
+        self.lookups = 0
+
+    async def existing_urls(self, urls):
+        self.lookups += 1
+        return self.existing & set(urls)
+
+    async def insert(self, records):
+        self.inserted.extend(records)
+        return len(records)
+
+
+def test_parse_feed_normalizes_entries():
+    feed = parse_feed(BODIES["https://kitco.test/rss"], "kitco", "gold_market")
+
+    assert feed.entries == 3 and feed.failed == 0
+    first = feed.records[0]
+    assert first["published_at"] == datetime(2025, 1, 6, 10, tzinfo=UTC)
+    assert (first["title"], first["url"], first["source"], first["category"]) == (
+        "Gold rallies", "https://a/1", "kitco", "gold_market",
+    )
+
+
+def test_pipeline_filters_dedups_and_inserts_in_batches():
+    store = FakeStore(existing={"https://b/2"})
+    pipeline = FeedPipeline(
+        fetch=BODIES.get,
+        is_relevant=lambda title, desc: "gold" in f"{title} {desc}".lower(),
+        store=store,
+        executor=ThreadPoolExecutor(2),
+        workers=2,
+        queue_size=1,
+        batch_size=10,
+        batch_linger=5,  # the run ends before the linger; one dedup batch
+    )
+
+    stats = asyncio.run(pipeline.run(FEEDS, cutoff=datetime(2025, 1, 1, tzinfo=UTC)))
+
+    assert sorted(r["url"] for r in store.inserted) == ["https://a/1", "https://a/2"]
+    assert stats.saved == 2
+    assert stats.feeds_fetched == 2  # "down" returned nothing
+    assert stats.entries == 6
+    assert stats.skipped_old == 1
+    assert stats.skipped_not_gold == 1
+    assert stats.skipped_duplicate == 2  # a/2 seen twice in the run, b/2 already stored
+    assert store.lookups == 1
+    assert sum(stats.saved_by_source.values()) == 2
+
+
+def test_store_failure_is_counted_not_raised():
+    class BrokenStore(FakeStore):
+        async def insert(self, records):
+            raise RuntimeError("db down")
+
+    pipeline = FeedPipeline(fetch=BODIES.get, store=BrokenStore(), executor=ThreadPoolExecutor(1), batch_size=2)
+    stats = asyncio.run(pipeline.run(FEEDS, cutoff=datetime(2025, 1, 1, tzinfo=UTC)))
+
+    assert stats.saved == 0
+    assert stats.failed > 0
+
+
+def test_process_executor_is_one_shared_spawn_pool(monkeypatch):
+    monkeypatch.setattr(settings, "NEWS_PARSE_EXECUTOR", "process")
+    try:
+        executor, owned = FeedPipeline(fetch=BODIES.get)._make_executor()
+        again, _ = FeedPipeline(fetch=BODIES.get)._make_executor()
+
+        assert executor is again is get_parse_process_pool()
+        assert not owned
+        assert executor._mp_context.get_start_method() == "spawn"
+    finally:
+        shutdown_parse_process_pool()
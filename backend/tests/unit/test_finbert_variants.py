@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Parity tests for the optimized FinBERT variants (int8, onnx) against fp32.
+
+No network: the tiny random BERT from conftest.py stands in for the
+checkpoint. Set FINBERT_LOCAL_PATH to a downloaded ProsusAI/finbert
+checkpoint to also check parity on the real weights.
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+"""
+
+import os
+
+import numpy as np
+import pytest
+
+torch = pytest.importorskip("torch")
+transformers = pytest.importorskip("transformers")
+
+from app.application.services.ml.sentiment_analysis_service import SentimentAnalysisService  # noqa: E402
+
+
+def _probabilities(service, texts):
+    return np.array([
+        [r['probabilities'][k] for k in ('positive', 'negative', 'neutral')]
+        for r in service.analyze_batch(texts)
+    ])
+
+
+def _assert_parity(model_path, texts, variant, atol, min_agreement=None):
+    reference = _probabilities(SentimentAnalysisService(model_path, variant='fp32'), texts)
+    optimized = _probabilities(SentimentAnalysisService(model_path, variant=variant), texts)
+
+    assert np.abs(reference - optimized).max() <= atol
+    if min_agreement is not None:
+        # random tiny weights give near-uniform probabilities, so labels are only compared on real weights
+        agreement = (reference.argmax(axis=1) == optimized.argmax(axis=1)).mean()
+        assert agreement >= min_agreement
+
+
+def test_int8_matches_fp32(tiny_finbert, finbert_headlines):
+    _assert_parity(tiny_finbert, finbert_headlines, 'int8', atol=0.05)
+
+
+def test_onnx_matches_fp32(tiny_finbert, finbert_headlines, tmp_path, monkeypatch):
+    pytest.importorskip("optimum.onnxruntime")
+    from app.core.config import settings
+    monkeypatch.setattr(settings, "FINBERT_ONNX_DIR", str(tmp_path))
+
+    _assert_parity(tiny_finbert, finbert_headlines, 'onnx', atol=1e-3)
+
+
+@pytest.mark.skipif(not os.getenv("FINBERT_LOCAL_PATH"), reason="FINBERT_LOCAL_PATH not set")
+def test_int8_matches_fp32_on_finbert_weights(finbert_headlines):
+    _assert_parity(os.environ["FINBERT_LOCAL_PATH"], finbert_headlines, 'int8', atol=0.1, min_agreement=0.85)
+
+
+def test_unknown_variant_is_rejected():
+    with pytest.raises(ValueError):
+        SentimentAnalysisService(variant='fp16')
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the vectorized GLD to gold conversion.
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+"""
+
+from datetime import UTC, datetime
+from decimal import Decimal
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.application.services.data_collection.gold_candle_converter import (
+    GoldCandleConverter,
+    convert_frame,
+    factor_series,
+    interpolate_factors,
+)
+
+
+def _series(values, start="2024-01-01", freq="D", hour=0):
+    index = pd.date_range(start, periods=len(values), freq=freq, tz=UTC) + pd.Timedelta(hours=hour)
+    return pd.Series(values, index=index, dtype=float)
+
+
+def test_factor_series_uses_overlapping_days_and_smooths_outliers():
+    gld = _series([200.0, 200.0, 200.0, 200.0, 200.0], hour=21)
+    # reference closes at a different time of day; day 3 is a bad print
+    reference = _series([2000.0, 2002.0, 2600.0, 2006.0], hour=22)
+
+    raw = factor_series(gld, reference)
+    smoothed = factor_series(gld, reference, smoothing_days=3)
+
+    assert list(raw.index) == list(pd.date_range("2024-01-01", periods=4, freq="D", tz=UTC))
+    assert raw.iloc[2] == pytest.approx(13.0)
+    assert smoothed.iloc[2] == pytest.approx(10.03)
+
+
+def test_interpolation_between_days_and_flat_beyond_ends():
+    factors = pd.Series(
+        [10.0, 11.0],
+        index=pd.DatetimeIndex(["2024-01-01", "2024-01-03"], tz=UTC),
+    )
+    timestamps = pd.DatetimeIndex(["2023-12-01", "2024-01-02", "2024-01-02 12:00", "2024-06-01"], tz=UTC)
+
+    assert interpolate_factors(timestamps, factors).tolist() == pytest.approx([10.0, 10.5, 10.75, 11.0])
+
+
+def test_convert_frame_matches_per_candle_conversion():
+    candle = SimpleNamespace(
+        timestamp=datetime(2024, 1, 2, tzinfo=UTC),
+        timeframe="daily",
+        open=Decimal("190.10"),
+        high=Decimal("191.55"),
+        low=Decimal("189.05"),
+        close=Decimal("191.00"),
+        volume=1234567,
+        price_change=Decimal("0.90"),
+        price_change_pct=Decimal("0.47"),
+    )
+    frame = pd.DataFrame([vars(candle)])
+
+    [row] = convert_frame(frame, np.array([10.89]))
+    expected = GoldCandleConverter(conversion_factor=10.89).convert_gld_candle_to_gold(candle)
+
+    assert row["source"] == expected["source"] == "alpha_vantage_gold_converted"
+    for key in ("open", "high", "low", "close", "price_change", "volume"):
+        assert row[key] == expected[key]
+    assert row["price_change_pct"] == pytest.approx(float(expected["price_change_pct"]))
+
+
+def test_convert_frame_maps_missing_values_to_null():
+    frame = pd.DataFrame([{
+        "timestamp": datetime(2024, 1, 2, tzinfo=UTC),
+        "timeframe": "daily",
+        "open": 190.0, "high": 191.0, "low": 189.0, "close": 190.5,
+        "volume": None, "price_change": None, "price_change_pct": None,
+    }])
+
+    [row] = convert_frame(frame, np.array([10.0]))
+
+    assert row["close"] == 1905.0
+    assert row["volume"] is None and row["price_change"] is None and row["price_change_pct"] is None
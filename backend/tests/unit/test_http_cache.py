@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the external API response cache.
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+"""
+
+import pytest
+import requests
+
+from app.infrastructure.cache.http_cache import (
+    CacheMissError,
+    FileCacheBackend,
+    HttpResponseCache,
+    classify_alpha_vantage,
+    classify_newsapi,
+)
+
+
+class FakeResponse:
+    def __init__(self, status_code, data):
+        self.status_code = status_code
+        self._data = data
+
+    def json(self):
+        return self._data
+
+
+class FakeHttp:
+    """Replays queued responses and counts network calls."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    def __call__(self, url, params=None, headers=None, timeout=None):
+        self.calls.append(dict(params or {}))
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+def make_cache(tmp_path, http, clock, mode="live"):
+    return HttpResponseCache(
+        backend=FileCacheBackend(str(tmp_path)),
+        mode=mode,
+        ttls={"alpha_vantage": 3600},
+        max_stale_seconds=7 * 86400,
+        http_get=http,
+        clock=clock,
+    )
+
+
+GOOD = {"Time Series (Daily)": {"2025-10-24": {"4. close": "250.0"}}}
+THROTTLED = {"Note": "Thank you for using Alpha Vantage! ... 25 requests per day"}
+
+
+def test_key_ignores_api_key_and_param_order():
+    a = HttpResponseCache.make_key("av", "u", {"symbol": "GLD", "outputsize": "compact", "apikey": "k1"})
+    b = HttpResponseCache.make_key("av", "u", {"outputsize": "compact", "symbol": "GLD", "apikey": "k2"})
+    c = HttpResponseCache.make_key("av", "u", {"outputsize": "full", "symbol": "GLD"})
+
+    assert a == b
+    assert a != c
+
+
+def test_fresh_entry_skips_network_until_ttl(tmp_path, clock):
+    http = FakeHttp(FakeResponse(200, GOOD), FakeResponse(200, GOOD))
+    cache = make_cache(tmp_path, http, clock)
+    params = {"symbol": "GLD", "apikey": "secret"}
+
+    first = cache.get_json("alpha_vantage", "u", params, classify=classify_alpha_vantage)
+    clock.now += 600
+    second = cache.get_json("alpha_vantage", "u", params, classify=classify_alpha_vantage)
+
+    assert not first.from_cache
+    assert second.from_cache and not second.stale
+    assert second.json() == GOOD
+    assert len(http.calls) == 1
+
+    clock.now += 3600
+    cache.get_json("alpha_vantage", "u", params, classify=classify_alpha_vantage)
+    assert len(http.calls) == 2
+
+
+def test_stale_entry_served_when_quota_exhausted(tmp_path, clock):
+    http = FakeHttp(
+        FakeResponse(200, GOOD),
+        FakeResponse(200, THROTTLED),
+        requests.exceptions.ConnectionError("down"),
+    )
+    cache = make_cache(tmp_path, http, clock)
+
+    cache.get_json("alpha_vantage", "u", {"symbol": "GLD"}, classify=classify_alpha_vantage)
+    clock.now += 2 * 86400
+
+    throttled = cache.get_json("alpha_vantage", "u", {"symbol": "GLD"}, classify=classify_alpha_vantage)
+    offline = cache.get_json("alpha_vantage", "u", {"symbol": "GLD"}, classify=classify_alpha_vantage)
+
+    assert throttled.stale and throttled.json() == GOOD
+    assert offline.stale and offline.json() == GOOD
+    assert (throttled.stale_reason, offline.stale_reason) == ("rate_limited", "network_error")
+
+
+def test_rate_limited_response_is_not_cached(tmp_path, clock):
+    http = FakeHttp(FakeResponse(200, THROTTLED), FakeResponse(200, GOOD))
+    cache = make_cache(tmp_path, http, clock)
+
+    first = cache.get_json("alpha_vantage", "u", {}, classify=classify_alpha_vantage)
+    second = cache.get_json("alpha_vantage", "u", {}, classify=classify_alpha_vantage)
+
+    assert first.json() == THROTTLED
+    assert second.json() == GOOD
+    assert len(http.calls) == 2
+
+
+def test_record_then_replay_without_network(tmp_path, clock):
+    recorder = make_cache(tmp_path, FakeHttp(FakeResponse(200, GOOD)), clock, mode="record")
+    recorder.get_json("alpha_vantage", "u", {"symbol": "GLD"})
+
+    offline = FakeHttp()
+    replay = make_cache(tmp_path, offline, clock, mode="replay")
+    clock.now += 365 * 86400
+
+    assert replay.get_json("alpha_vantage", "u", {"symbol": "GLD"}).json() == GOOD
+    with pytest.raises(CacheMissError):
+        replay.get_json("alpha_vantage", "u", {"symbol": "SLV"})
+    assert offline.calls == []
+
+
+def test_newsapi_classifier():
+    assert classify_newsapi(429, {"status": "error", "code": "rateLimited"}) == "rate_limited"
+    assert classify_newsapi(200, {"status": "ok", "articles": []}) == "ok"
+    assert classify_newsapi(401, {"status": "error", "code": "apiKeyInvalid"}) == "error"
+
+
+def test_file_backend_leaves_no_temp_files(tmp_path):
+    backend = FileCacheBackend(str(tmp_path))
+
+    backend.set("abcdef", {"body": 1})
+    backend.set("abcdef", {"body": 2})
+
+    assert backend.get("abcdef") == {"body": 2}
+    assert [p.name for p in (tmp_path / "ab").iterdir()] == ["abcdef.json"]
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unit tests for incremental Yahoo / Alpha Vantage collection helpers.
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+"""
+
+from datetime import datetime, UTC
+
+import pandas as pd
+from sqlalchemy.dialects import postgresql
+
+from app.application.services.data_collection.alpha_vantage_service import (
+    last_completed_trading_day,
+)
+from app.application.services.data_collection.yahoo_finance_service import YahooFinanceService
+from app.infrastructure.database.repositories.gold_price_repository import build_candle_upsert
+
+
+def test_frame_to_price_dicts_matches_row_conversion():
+    index = pd.DatetimeIndex(
+        ["2025-10-20", "2025-10-21"], tz="America/New_York"
+    )
+    data = pd.DataFrame(
+        {
+            "Open": [2700.0, 2710.0],
+            "High": [2720.0, 2725.0],
+            "Low": [2690.0, 2700.0],
+            "Close": [2710.0, 2705.0],
+            "Volume": [1000, None],
+        },
+        index=index,
+    )
+    service = YahooFinanceService()
+
+    rows = service._frame_to_price_dicts(data, "daily")
+
+    assert len(rows) == 2
+    for (ts, row), converted in zip(data.iterrows(), rows):
+        expected = service._convert_to_price_dict(row, ts.to_pydatetime(), "daily")
+        assert converted["timestamp"] == expected["timestamp"]
+        assert converted["timestamp"].utcoffset().total_seconds() == 0
+        for key in ("open", "high", "low", "close", "volume",
+                    "price_change", "price_change_pct", "source", "timeframe"):
+            assert converted[key] == expected[key]
+
+
+def test_last_completed_trading_day_skips_weekend():
+    monday = datetime(2025, 10, 27, 12, tzinfo=UTC)
+    wednesday = datetime(2025, 10, 29, 12, tzinfo=UTC)
+
+    assert last_completed_trading_day(monday).isoformat() == "2025-10-24"
+    assert last_completed_trading_day(wednesday).isoformat() == "2025-10-28"
+
+
+def test_candle_upsert_is_single_statement():
+    rows = [
+        {
+            "timestamp": datetime(2025, 10, 20, tzinfo=UTC),
+            "timeframe": "daily",
+            "open": 1.0,
+            "high": 1.0,
+            "low": 1.0,
+            "close": 1.0,
+            "volume": 0,
+            "price_change": 0.0,
+            "price_change_pct": 0.0,
+            "source": "yahoo_finance",
+            "market": "futures",
+            "data_quality": 1.0,
+        }
+    ] * 3
+
+    sql = str(build_candle_upsert(rows).compile(dialect=postgresql.dialect()))
+
+    assert sql.count("INSERT INTO gold_price_facts") == 1
+    assert "ON CONFLICT ON CONSTRAINT uq_gold_price_facts_time_tf_source DO UPDATE" in sql
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the staged ingestion pipeline (queues, batching, failures).
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+"""
+
+import asyncio
+from datetime import date
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.application.services.ingestion import IngestionAborted, IngestionPipeline, NewsDeduplicator, Stage
+from app.application.services.ingestion.stages import build_dollar_index_upsert
+
+
+class ListSink:
+    def __init__(self, delay=0.0):
+        self.batches = []
+        self.delay = delay
+
+    async def __call__(self, batch):
+        await asyncio.sleep(self.delay)
+        self.batches.append(list(batch))
+        return len(batch)
+
+
+def test_stages_map_drop_and_write_in_batches():
+    sink = ListSink()
+
+    async def double_evens(n):
+        return n * 2 if n % 2 == 0 else None
+
+    pipeline = IngestionPipeline("test", [
+        Stage("normalize", double_evens, concurrency=3),
+        Stage("sink", sink, batch_size=4),
+    ], queue_size=2, batch_linger=1.0)
+    result = asyncio.run(pipeline.run(range(20)))
+
+    assert sorted(x for batch in sink.batches for x in batch) == [n * 2 for n in range(0, 20, 2)]
+    assert all(len(batch) <= 4 for batch in sink.batches)
+    assert len(sink.batches) == 3  # 10 rows, batches of 4
+    assert result.written == 10
+    assert result.stages["normalize"].received == 20
+    assert result.stages["normalize"].dropped == 10
+
+
+def test_slow_sink_backpressures_the_source():
+    produced = []
+    sink = ListSink(delay=0.01)
+
+    def source():
+        for n in range(30):
+            # items the sink has not taken yet can only sit in the queues
+            assert len(produced) - sum(map(len, sink.batches)) <= 2 * 2 + 2 * 2
+            produced.append(n)
+            yield n
+
+    pipeline = IngestionPipeline("test", [
+        Stage("fetch", lambda n: [n], fan_out=True),
+        Stage("sink", sink, batch_size=2),
+    ], queue_size=2, batch_linger=0)
+    result = asyncio.run(pipeline.run(source()))
+
+    assert result.written == 30
+    assert result.stages["sink"].max_lag_seconds > 0
+
+
+def test_failing_item_is_counted_and_the_rest_continue():
+    sink = ListSink()
+
+    async def parse(n):
+        if n == 3:
+            raise ValueError("bad record")
+        return n
+
+    pipeline = IngestionPipeline("test", [
+        Stage("parse", parse),
+        Stage("sink", sink, batch_size=10),
+    ], batch_linger=0.5)
+    result = asyncio.run(pipeline.run(range(6)))
+
+    assert result.written == 5
+    assert result.failed == 1
+    assert result.stages["parse"].failed == 1
+
+
+def test_fail_fast_stops_before_later_batches_commit():
+    committed = []
+
+    async def watermark_sink(batch):
+        if 4 in batch:
+            raise ConnectionError("db down")
+        committed.append(max(batch))
+        return len(batch)
+
+    # small queues: the source is still blocked on a full queue when the sink fails
+    pipeline = IngestionPipeline("test", [
+        Stage("fetch", lambda n: [n], fan_out=True),
+        Stage("sink", watermark_sink, batch_size=2),
+    ], queue_size=1, batch_linger=0.5, fail_fast=True)
+
+    with pytest.raises(IngestionAborted) as error:
+        asyncio.run(asyncio.wait_for(pipeline.run(range(100)), timeout=5))
+
+    assert error.value.stage == "sink"
+    assert isinstance(error.value.__cause__, ConnectionError)
+    assert committed == [1, 3]
+
+
+def test_news_dedup_by_url_title_and_store():
+    class Store:
+        async def existing_urls(self, urls):
+            return {"https://stored"} & set(urls)
+
+    dedup = NewsDeduplicator(Store(), by_title=True)
+    batch = [
+        {"url": "https://a", "title": "Gold up"},
+        {"url": "https://a", "title": "Gold up"},          # same URL
+        {"url": "https://b", "title": "Gold up"},          # same title, other URL
+        {"url": "https://stored", "title": "Gold down"},   # already in news_events
+        {"url": "https://c", "title": "Fed holds"},
+    ]
+
+    kept = asyncio.run(dedup(batch))
+
+    assert [r["url"] for r in kept] == ["https://a", "https://c"]
+    assert dedup.duplicates == 3
+
+
+def test_dollar_index_upsert_is_single_statement():
+    rows = [
+        {"date": date(2025, 1, d), "open": 1.0, "high": 1.0, "low": 1.0, "close": 1.0}
+        for d in (6, 7, 8)
+    ]
+
+    sql = str(build_dollar_index_upsert(rows).compile(dialect=postgresql.dialect()))
+
+    assert sql.count("INSERT INTO dollar_index_prices") == 1
+    assert "ON CONFLICT (date) DO UPDATE" in sql
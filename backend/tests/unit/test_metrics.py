@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the metrics layer and /metrics endpoint.
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+"""
+
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+
+from app.core.metrics import MODEL_INFERENCE_SECONDS, timed
+
+
+def _count(model: str) -> float:
+    return REGISTRY.get_sample_value("gold_model_inference_seconds_count", {"model": model}) or 0.0
+
+
+def test_timed_observes_sync_async_and_failing_calls():
+    @timed("unit_sync", MODEL_INFERENCE_SECONDS, model="unit_sync")
+    def sync_call(x):
+        return x * 2
+
+    @timed("unit_async", MODEL_INFERENCE_SECONDS, model="unit_async")
+    async def async_call(x):
+        await asyncio.sleep(0)
+        return x + 1
+
+    before_sync, before_async = _count("unit_sync"), _count("unit_async")
+
+    assert sync_call(2) == 4
+    assert asyncio.run(async_call(2)) == 3
+    with pytest.raises(ZeroDivisionError):
+        with timed("unit_block", MODEL_INFERENCE_SECONDS, model="unit_sync") as span:
+            1 / 0
+
+    assert _count("unit_sync") == before_sync + 2
+    assert _count("unit_async") == before_async + 1
+    assert span.elapsed >= 0 and span.ms == round(span.elapsed * 1000, 3)
+
+
+def test_metrics_endpoint_exposes_request_latency():
+    from app.main import app
+
+    client = TestClient(app)
+    assert client.get("/").status_code == 200
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert 'gold_http_request_seconds_count{method="GET",route="/",status="200"}' in response.text
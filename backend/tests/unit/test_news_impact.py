@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the decayed news impact signal.
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+"""
+
+from datetime import datetime, timedelta, UTC
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.application.services.ml.news_impact_service import (
+    DecayedImpact,
+    NewsImpactService,
+    contribution,
+    decayed_series,
+)
+from app.infrastructure.database.repositories.sentiment_rollup_repository import ScoredArticle
+
+HALF_LIFE = 6 * 3600
+T0 = datetime(2026, 10, 19, tzinfo=UTC)
+
+
+def _articles(n=50, seed=3):
+    rng = np.random.default_rng(seed)
+    hours = np.sort(rng.uniform(0, 72, n))
+    return [
+        ScoredArticle(
+            published_at=T0 + timedelta(hours=float(h)),
+            score=float(rng.uniform(-1, 1)),
+            confidence=float(rng.uniform(0.3, 1)),
+            impact_score=float(rng.uniform(0, 1)),
+            price_impact=None,
+        )
+        for h in hours
+    ]
+
+
+def _brute_force(articles, at):
+    intensity = pressure = 0.0
+    for a in articles:
+        if a.published_at <= at:
+            factor = 2 ** (-(at - a.published_at).total_seconds() / HALF_LIFE)
+            i, p = contribution(a)
+            intensity += i * factor
+            pressure += p * factor
+    return intensity, pressure
+
+
+def test_online_update_matches_full_sum_including_late_articles():
+    articles = _articles()
+    late, on_time = articles[::7], [a for i, a in enumerate(articles) if i % 7]
+
+    state = DecayedImpact(HALF_LIFE)
+    for a in on_time + late:  # late ones arrive after newer news
+        state.add(a.published_at, *contribution(a))
+
+    at = T0 + timedelta(hours=80)
+    expected = _brute_force(articles, at)
+    assert state.value_at(at) == pytest.approx(expected, rel=1e-9)
+    assert state.article_count == len(articles)
+
+    # one half-life later the signal has halved
+    later = state.value_at(at + timedelta(seconds=HALF_LIFE))
+    assert later[0] == pytest.approx(expected[0] / 2)
+
+
+def test_retraction_cancels_contribution():
+    a, b = _articles(2)
+    state = DecayedImpact(HALF_LIFE)
+    state.add(a.published_at, *contribution(a))
+    state.add(b.published_at, *contribution(b))
+    state.add(a.published_at, *contribution(a, sign=-1))
+
+    at = T0 + timedelta(days=4)
+    assert state.value_at(at) == pytest.approx(_brute_force([b], at), abs=1e-12)
+
+
+def test_checkpoint_series_matches_brute_force_at_any_time():
+    articles = _articles()
+    state = DecayedImpact(HALF_LIFE)
+    rows = []
+    for a in articles:
+        state.add(a.published_at, *contribution(a))
+        rows.append((state.as_of, state.intensity, state.pressure))
+    checkpoints = pd.DataFrame(rows, columns=["ts", "intensity", "pressure"])
+
+    index = pd.date_range(T0 - timedelta(hours=5), periods=100, freq="47min")
+    service = NewsImpactService(half_life_hours=HALF_LIFE / 3600)
+    series = service.series_at(index.tz_localize(None), checkpoints)
+
+    for ts, row in zip(index, series.itertuples()):
+        expected = _brute_force(articles, ts.to_pydatetime())
+        assert row.news_impact_intensity == pytest.approx(expected[0], rel=1e-9, abs=1e-12)
+        assert row.news_impact_pressure == pytest.approx(expected[1], rel=1e-9, abs=1e-12)
+
+    empty = decayed_series(np.array([1, 2]), np.array([], dtype=np.int64), np.array([]), np.array([]), HALF_LIFE)
+    assert empty[0].tolist() == [0.0, 0.0]
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the concurrent spot price aggregator.
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+"""
+
+import threading
+import time
+
+from app.application.services.data_collection.price_aggregator import SpotPriceAggregator
+
+
+def test_first_valid_price_wins_without_waiting_for_slow_source():
+    release = threading.Event()
+
+    def slow():
+        release.wait(5)
+        return 4000.0
+
+    aggregator = SpotPriceAggregator(
+        {"slow": slow, "fast": lambda: 4113.0, "broken": lambda: None},
+        timeout=5,
+    )
+
+    started = time.monotonic()
+    price = aggregator.get_current_price()
+    elapsed = time.monotonic() - started
+    release.set()
+
+    assert price == 4113.0
+    assert elapsed < 1.0
+
+
+def test_quorum_returns_median_and_rejects_out_of_range():
+    aggregator = SpotPriceAggregator(
+        {
+            "a": lambda: 4100.0,
+            "b": lambda: 4110.0,
+            "c": lambda: 4120.0,
+            "bogus": lambda: 41.0,
+        },
+        quorum=3,
+    )
+
+    assert aggregator.get_current_price() == 4110.0
+
+
+def test_failing_source_is_skipped_during_cooldown(clock):
+    calls = {"bad": 0}
+
+    def bad():
+        calls["bad"] += 1
+        raise ConnectionError("timeout")
+
+    aggregator = SpotPriceAggregator(
+        {"bad": bad, "good": lambda: 4113.0},
+        quorum=2,
+        failure_threshold=2,
+        cooldown_seconds=60,
+        clock=clock,
+    )
+
+    for _ in range(4):
+        assert aggregator.get_current_price() == 4113.0
+
+    assert calls["bad"] == 2
+    stats = {s["name"]: s for s in aggregator.stats()}
+    assert stats["bad"]["consecutive_failures"] == 2
+    assert stats["bad"]["error_rate"] > stats["good"]["error_rate"]
+
+    clock.now += 61
+    aggregator.get_current_price()
+    assert calls["bad"] == 3
+
+
+def test_returns_none_when_every_source_fails():
+    aggregator = SpotPriceAggregator({"a": lambda: None, "b": lambda: 0.0})
+
+    assert aggregator.get_current_price() is None
+
+
+def test_deadline_follows_injected_clock(clock):
+    release = threading.Event()
+
+    def slow():
+        release.wait(5)
+        return 4000.0
+
+    def stalls_past_deadline():
+        clock.now += 10
+        return None
+
+    aggregator = SpotPriceAggregator(
+        {"slow": slow, "stalled": stalls_past_deadline},
+        timeout=5,
+        clock=clock,
+    )
+
+    started = time.monotonic()
+    price = aggregator.get_current_price()
+    elapsed = time.monotonic() - started
+    release.set()
+
+    assert price is None
+    assert elapsed < 1.0
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the two-tier query result cache.
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+"""
+
+import asyncio
+
+import pytest
+
+from app.infrastructure.cache import query_cache
+from app.infrastructure.cache.query_cache import QueryCache, cached
+
+
+def _redis():
+    fakeredis = pytest.importorskip("fakeredis")
+    return fakeredis.FakeAsyncRedis()
+
+
+def test_local_tier_expires_and_concurrent_misses_are_coalesced(clock):
+    cache = QueryCache(redis=None, ttls={"news": 60}, local_ttl=5, clock=clock)
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return len(calls)
+
+    async def run():
+        key = cache.make_key("news", "stats")
+        values = await asyncio.gather(*(cache.get_or_load("news", key, loader) for _ in range(10)))
+        cached_value = await cache.get_or_load("news", key, loader)
+        clock.now = 6
+        expired_value = await cache.get_or_load("news", key, loader)
+        return values, cached_value, expired_value
+
+    values, cached_value, expired_value = asyncio.run(run())
+    assert values == [1] * 10
+    assert cached_value == 1
+    assert expired_value == 2
+
+
+def test_redis_tier_is_shared_and_invalidated_by_namespace():
+    redis = _redis()
+    worker_a = QueryCache(redis=redis, ttls={"news": 60, "dollar_index": 60})
+    worker_b = QueryCache(redis=redis, ttls={"news": 60, "dollar_index": 60})
+    loads = {"news": 0, "dollar_index": 0}
+
+    def loader(namespace):
+        async def load():
+            loads[namespace] += 1
+            return {"namespace": namespace, "load": loads[namespace]}
+        return load
+
+    async def run():
+        news_key = worker_a.make_key("news", "latest", (10,))
+        dxy_key = worker_a.make_key("dollar_index", "latest", (30,))
+
+        await worker_a.get_or_load("news", news_key, loader("news"))
+        await worker_a.get_or_load("dollar_index", dxy_key, loader("dollar_index"))
+        shared = await worker_b.get_or_load("news", news_key, loader("news"))
+
+        await worker_a.invalidate("news")
+        worker_b.local.drop_namespace("news")  # local tier of B expires on its own
+        fresh = await worker_b.get_or_load("news", news_key, loader("news"))
+        dxy = await worker_b.get_or_load("dollar_index", dxy_key, loader("dollar_index"))
+        return shared, fresh, dxy
+
+    shared, fresh, dxy = asyncio.run(run())
+    assert shared["load"] == 1
+    assert fresh["load"] == 2
+    assert dxy["load"] == 1
+    assert loads == {"news": 2, "dollar_index": 1}
+
+
+def test_cached_decorator_keys_on_arguments(monkeypatch):
+    cache = QueryCache(redis=None, ttls={"news": 60})
+    monkeypatch.setattr(query_cache, "get_query_cache", lambda: cache)
+
+    class Service:
+        def __init__(self):
+            self.calls = []
+
+        @cached("news")
+        async def get_latest_news(self, limit: int = 10, source=None):
+            self.calls.append((limit, source))
+            return [limit, source]
+
+    service = Service()
+
+    async def run():
+        await service.get_latest_news(5)
+        await service.get_latest_news(5)
+        await service.get_latest_news(5, source="kitco")
+        await query_cache.invalidate("news")
+        await service.get_latest_news(5)
+
+    asyncio.run(run())
+    assert service.calls == [(5, None), (5, "kitco"), (5, None)]
+
+
+def test_invalidation_during_load_does_not_store_stale_result():
+    cache = QueryCache(redis=None, ttls={"news": 60})
+    key = cache.make_key("news", "stats")
+    release = None
+
+    async def slow_loader():
+        await release.wait()
+        return "old"
+
+    async def fast_loader():
+        return "new"
+
+    async def run():
+        nonlocal release
+        release = asyncio.Event()
+        pending = asyncio.create_task(cache.get_or_load("news", key, slow_loader))
+        await asyncio.sleep(0)
+        await cache.invalidate("news")
+        release.set()
+        stale = await pending
+        fresh = await cache.get_or_load("news", key, fast_loader)
+        return stale, fresh
+
+    assert asyncio.run(run()) == ("old", "new")
+
+
+def test_local_tier_hands_out_independent_copies():
+    pd = pytest.importorskip("pandas")
+    cache = QueryCache(redis=None, ttls={"dollar_index": 60})
+
+    async def load_frame():
+        await asyncio.sleep(0.01)
+        return pd.DataFrame({"close": [100.0, 101.0]})
+
+    async def load_news():
+        return [{"title": "Gold rallies"}]
+
+    async def run():
+        frame_key = cache.make_key("dollar_index", "latest")
+        first, coalesced = await asyncio.gather(
+            cache.get_or_load("dollar_index", frame_key, load_frame),
+            cache.get_or_load("dollar_index", frame_key, load_frame),
+        )
+        first.loc[0, "close"] = 0.0
+        coalesced["close"] = -1.0
+        again = await cache.get_or_load("dollar_index", frame_key, load_frame)
+
+        news_key = cache.make_key("news", "latest")
+        news = await cache.get_or_load("news", news_key, load_news)
+        news[0]["title"] = "edited"
+        news.clear()
+        return again, await cache.get_or_load("news", news_key, load_news)
+
+    frame, news = asyncio.run(run())
+    assert frame["close"].tolist() == [100.0, 101.0]
+    assert news == [{"title": "Gold rallies"}]
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the TextBlob -> FinBERT sentiment cascade.
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+"""
+
+from app.application.services.ml.sentiment_cascade import SentimentCascade
+
+
+class FakeLite:
+    """Returns preset (score, confidence) per text."""
+
+    def __init__(self, scores):
+        self.scores = scores
+
+    def analyze_text(self, text):
+        score, confidence = self.scores[text]
+        return {
+            "label": "neutral",
+            "score": score,
+            "confidence": confidence,
+            "price_impact": "neutral",
+            "impact_score": 0.0,
+        }
+
+
+class FakeAccurate:
+    def __init__(self, error=None):
+        self.calls = []
+        self.error = error
+
+    def analyze_batch(self, texts):
+        if self.error is not None:
+            raise self.error
+        self.calls.append(list(texts))
+        return [
+            {"label": "positive", "score": 0.9, "confidence": 0.95, "price_impact": "very_bullish", "impact_score": 0.86}
+            for _ in texts
+        ]
+
+
+SCORES = {
+    "gold steady in quiet trade": (0.05, 0.6),
+    "gold maybe": (0.05, 0.05),
+    "gold soars to record": (0.8, 0.7),
+    "fed holds as gold drifts": (0.05, 0.6),
+}
+
+
+def make_cascade(accurate):
+    return SentimentCascade(
+        lite=FakeLite(SCORES),
+        accurate=accurate,
+        min_confidence=0.2,
+        impact_threshold=0.5,
+        impact_keywords=["fed", "central bank"],
+    )
+
+
+def test_routes_only_uncertain_or_impactful_texts():
+    accurate = FakeAccurate()
+    texts = list(SCORES)
+
+    results = make_cascade(accurate).analyze_texts(texts)
+
+    assert [r["model"] for r in results] == ["textblob", "finbert", "finbert", "finbert"]
+    assert [r["escalation"] for r in results] == [None, "low_confidence", "high_impact", "impact_keyword"]
+    # escalated texts go to FinBERT in one batch, in input order
+    assert accurate.calls == [texts[1:]]
+    assert results[0]["score"] == 0.05
+    assert results[2]["score"] == 0.9
+
+
+def test_keywords_match_whole_words():
+    cascade = make_cascade(FakeAccurate())
+    lite = {"score": 0.0, "confidence": 0.9}
+
+    assert cascade.escalation_reason("federal holiday thins trading", lite) is None
+    assert cascade.escalation_reason("Central Bank buying lifts gold", lite) == "impact_keyword"
+
+
+def test_keeps_lite_scores_when_finbert_unavailable():
+    accurate = FakeAccurate(error=ImportError("No module named 'transformers'"))
+    cascade = make_cascade(accurate)
+
+    results = cascade.analyze_texts(list(SCORES))
+    assert all(r["model"] == "textblob" for r in results)
+    assert results[1]["escalation"] == "low_confidence"
+
+    # not retried on every batch
+    accurate.error = None
+    cascade.analyze_texts(["gold maybe"])
+    assert accurate.calls == []
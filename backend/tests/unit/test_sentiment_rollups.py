@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unit tests for incremental sentiment rollups.
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+"""
+
+import asyncio
+from datetime import datetime, UTC
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.infrastructure.database.repositories.sentiment_rollup_repository import (
+    ScoredArticle,
+    apply_sentiment_rollups,
+    bucket_seconds,
+    bucket_start,
+    build_rollup_deltas,
+    build_rollup_upsert,
+    rollups_to_frame,
+)
+
+
+def _article(hour, minute, score, label="neutral"):
+    return ScoredArticle(
+        published_at=datetime(2026, 10, 19, hour, minute, tzinfo=UTC),
+        score=score,
+        confidence=0.5,
+        impact_score=abs(score),
+        price_impact=label,
+    )
+
+
+def test_bucket_floor_and_sizes():
+    assert bucket_seconds("4h") == 14400
+    assert bucket_seconds("15m") == 900
+    with pytest.raises(ValueError):
+        bucket_seconds("1w")
+
+    ts = datetime(2026, 10, 19, 13, 45, tzinfo=UTC)
+    assert bucket_start(ts, 3600) == datetime(2026, 10, 19, 13, tzinfo=UTC)
+    assert bucket_start(ts, 14400) == datetime(2026, 10, 19, 12, tzinfo=UTC)
+    assert bucket_start(ts, 86400) == datetime(2026, 10, 19, tzinfo=UTC)
+
+
+def test_deltas_fold_one_row_per_bucket_and_retract():
+    articles = [
+        _article(1, 10, 0.6, "bullish"),
+        _article(1, 50, -0.2, "bearish"),
+        _article(5, 0, 0.4, "very_bullish"),
+    ]
+    rows = build_rollup_deltas(articles, ["1h", "1d"])
+    by_key = {(r["bucket_size"], r["bucket_start"].hour): r for r in rows}
+
+    assert len(rows) == 3  # two hourly buckets + one daily
+    hour_1 = by_key[("1h", 1)]
+    assert hour_1["article_count"] == 2
+    assert hour_1["sum_score"] == pytest.approx(0.4)
+    assert hour_1["bullish_count"] == 1 and hour_1["bearish_count"] == 1
+    day = by_key[("1d", 0)]
+    assert day["article_count"] == 3
+    assert day["max_impact"] == pytest.approx(0.6)
+    assert day["sum_weighted_score"] == pytest.approx(0.4)
+
+    removed = build_rollup_deltas(articles[:1], ["1d"], sign=-1)[0]
+    assert removed["article_count"] == -1
+    assert removed["sum_score"] == pytest.approx(-0.6)
+    assert removed["bullish_count"] == -1
+    assert removed["max_impact"] == 0.0
+
+    frame = rollups_to_frame([
+        (r["bucket_start"], r["article_count"], r["sum_score"], r["sum_confidence"],
+         r["sum_weighted_score"], r["sum_impact"], r["max_impact"],
+         r["bullish_count"], r["bearish_count"])
+        for r in rows if r["bucket_size"] == "1d"
+    ])
+    assert frame["sentiment_score"].iloc[0] == pytest.approx(0.8 / 3)
+    assert frame["news_count"].iloc[0] == 3
+
+
+def test_upsert_adds_to_existing_bucket():
+    rows = build_rollup_deltas([_article(2, 0, 0.3)], ["1h"])
+    sql = str(build_rollup_upsert(rows).compile(dialect=postgresql.dialect()))
+
+    assert "ON CONFLICT ON CONSTRAINT uq_sentiment_rollups_size_start DO UPDATE" in sql
+    assert "sentiment_rollups.sum_score + excluded.sum_score" in sql
+    assert "greatest(sentiment_rollups.max_impact, excluded.max_impact)" in sql
+
+
+class FakeResult:
+    def __init__(self, values=()):
+        self.values = list(values)
+        self.rowcount = 1
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self.values
+
+
+class FakeSession:
+    """Records (kind, bucket sizes) per statement; answers the build-marker query."""
+
+    def __init__(self, built=()):
+        self.built = set(built)
+        self.calls = []
+        self.flushes = 0
+
+    async def flush(self):
+        self.flushes += 1
+
+    async def execute(self, stmt, params=None):
+        compiled = stmt.compile(dialect=postgresql.dialect())
+        sql = str(compiled)
+        if sql.startswith("SELECT sentiment_rollup_builds"):
+            return FakeResult(self.built)
+
+        params = params or compiled.params
+        sizes = sorted({v for k, v in params.items() if k.startswith("bucket_size")})
+        if sql.startswith("INSERT INTO sentiment_rollup_builds"):
+            self.built.update(sizes)
+        elif "FROM news_events" in sql:
+            self.calls.append(("rebuild", sizes))
+        elif sql.startswith("INSERT INTO sentiment_rollups"):
+            self.calls.append(("delta", sizes))
+        return FakeResult()
+
+
+def test_first_apply_builds_unbuilt_sizes_instead_of_adding_deltas():
+    session = FakeSession(built={"1h"})
+
+    asyncio.run(apply_sentiment_rollups(session, [_article(2, 0, 0.3)], bucket_sizes=["1h", "1d"]))
+
+    # 1d was never built: rebuilt from news_events (which already holds the
+    # flushed new score); only 1h gets the delta
+    assert session.flushes == 1
+    assert session.calls == [("rebuild", ["1d"]), ("delta", ["1h"])]
+    assert session.built == {"1h", "1d"}
+
+    session.calls.clear()
+    asyncio.run(apply_sentiment_rollups(session, [_article(3, 0, 0.1)], bucket_sizes=["1h", "1d"]))
+    assert session.calls == [("delta", ["1d", "1h"])]
+
+
+def test_retraction_on_unbuilt_size_rebuilds_then_subtracts():
+    session = FakeSession()
+
+    asyncio.run(apply_sentiment_rollups(session, [_article(2, 0, 0.3)], sign=-1, bucket_sizes=["1d"]))
+
+    # the rebuild counts the previous score, the delta removes it again
+    assert session.calls == [("rebuild", ["1d"]), ("delta", ["1d"])]
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the live stream broker, feeder and endpoints.
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+"""
+
+import asyncio
+import json
+
+from fastapi.testclient import TestClient
+
+from app.application.services.streaming import PriceStreamService
+from app.core.config import settings
+from app.infrastructure.streaming import StreamBroker, broker as broker_module
+
+
+def test_fan_out_to_1k_concurrent_subscribers():
+    async def scenario():
+        broker = StreamBroker(queue_size=64)
+        subs = [broker.subscribe(["tick"]) for _ in range(1000)]
+        received = [0] * len(subs)
+
+        async def consume(i, sub):
+            for _ in range(50):
+                message = await sub.get(timeout=5)
+                assert json.loads(message.encoded)["type"] == "tick"
+                received[i] += 1
+
+        consumers = [asyncio.create_task(consume(i, s)) for i, s in enumerate(subs)]
+        for n in range(50):
+            await broker.publish("tick", {"price": 4100 + n})
+            await asyncio.sleep(0)
+        await asyncio.gather(*consumers)
+
+        assert broker.stats()["subscribers"] == 1000
+        for sub in subs:
+            sub.close()
+        return received, broker.stats()
+
+    received, stats = asyncio.run(scenario())
+
+    assert received == [50] * 1000
+    assert stats["subscribers"] == 0
+
+
+def test_slow_consumer_keeps_only_newest_messages():
+    async def scenario():
+        broker = StreamBroker(queue_size=3)
+        slow = broker.subscribe()
+        for n in range(10):
+            await broker.publish("tick", {"price": n})
+        prices = [json.loads((await slow.get()).encoded)["data"]["price"] for _ in range(3)]
+        return prices, slow.dropped
+
+    prices, dropped = asyncio.run(scenario())
+
+    assert prices == [7, 8, 9]
+    assert dropped == 7
+
+
+def test_topic_filter_and_latest_replay():
+    async def scenario():
+        broker = StreamBroker()
+        await broker.publish("sentiment", {"avg_sentiment": 0.2})
+        await broker.publish("tick", {"price": 4113.5})
+
+        late = broker.subscribe(["tick"])
+        first = await late.get(timeout=1)
+        nothing_else = await late.get(timeout=0.01)
+        return json.loads(first.encoded), nothing_else
+
+    first, nothing_else = asyncio.run(scenario())
+
+    assert first["type"] == "tick" and first["data"]["price"] == 4113.5
+    assert nothing_else is None
+
+
+def test_feeder_publishes_only_changes():
+    prices = iter([4100.0, 4100.0, 4101.5])
+
+    async def tick_loader():
+        return {"price": next(prices)}
+
+    async def scenario():
+        broker = StreamBroker()
+        feeder = PriceStreamService(broker, tick_loader=tick_loader)
+        published = [await feeder.poll_once("tick") for _ in range(3)]
+        return published, broker.published
+
+    published, count = asyncio.run(scenario())
+
+    assert published == [True, False, True]
+    assert count == 2
+
+
+def test_websocket_endpoint_replays_latest_tick(monkeypatch):
+    from app.main import app
+
+    broker = StreamBroker()
+    asyncio.run(broker.publish("tick", {"price": 4113.5}))
+    monkeypatch.setattr(broker_module, "_broker", broker)
+    monkeypatch.setattr(settings, "STREAM_ENABLED", True)
+    monkeypatch.setattr(settings, "STREAM_FEEDER_ENABLED", False)
+
+    client = TestClient(app)
+    with client.websocket_connect("/api/v1/stream/ws?topics=tick") as ws:
+        frame = json.loads(ws.receive_text())
+
+    assert frame["type"] == "tick"
+    assert frame["data"]["price"] == 4113.5
+    assert client.get("/api/v1/stream/sse?topics=bogus").status_code == 400
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unit tests for FinBERT scoring modes and pre-tokenized batches.
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+"""
+
+import numpy as np
+import pytest
+
+pytest.importorskip("torch")
+pytest.importorskip("transformers")
+
+from app.application.services.ml.sentiment_analysis_service import SentimentAnalysisService  # noqa: E402
+from app.core.config import settings  # noqa: E402
+
+DESCRIPTION = "Gold rally fades as yields climb " * 40
+
+
+@pytest.fixture
+def service(tiny_finbert, monkeypatch):
+    monkeypatch.setattr(settings, "FINBERT_TITLE_MAX_LENGTH", 8)
+    monkeypatch.setattr(settings, "FINBERT_DESCRIPTION_TOKEN_BUDGET", 5)
+    return SentimentAnalysisService(tiny_finbert, variant='fp32')
+
+
+def test_title_first_respects_token_budgets(service, finbert_headlines):
+    titles = finbert_headlines[:3]
+    full = service.encode_articles(titles, [DESCRIPTION] * 3, mode='full')
+    title_first = service.encode_articles(titles, [DESCRIPTION] * 3, mode='title_first')
+
+    assert all(len(ids) > 200 for ids in full)
+    # [CLS] + title (<= 6) + "." + description (<= 5) + [SEP]
+    assert all(len(ids) <= 8 + 1 + 5 for ids in title_first)
+
+    title_only = service.encode_articles(titles, [None] * 3, mode='title_first')
+    assert all(len(ids) <= 8 for ids in title_only)
+
+
+def test_encoded_batches_match_per_text_scoring(service, finbert_headlines):
+    # length-sorted batches must return results in input order
+    texts = [finbert_headlines[0] + " gold" * n for n in (12, 0, 5, 30, 1)]
+    encoded = service.tokenizer(texts, truncation=True, max_length=512)['input_ids']
+
+    batched = service.analyze_encoded(encoded, batch_size=2)
+    single = [service.analyze_text(text) for text in texts]
+
+    for b, s in zip(batched, single):
+        assert b['label'] == s['label']
+        assert np.isclose(b['score'], s['score'], atol=1e-3)
+
+    # the same token IDs can be scored again without the tokenizer
+    assert service.analyze_encoded(encoded) == batched
+
+
+def test_unknown_scoring_mode_is_rejected(service):
+    with pytest.raises(ValueError):
+        service.encode_articles(["Gold rises"], mode='summary')
+
+
+def test_failing_batch_is_retried_per_article(service, finbert_headlines, monkeypatch):
+    articles = [type("News", (), {"id": i, "title": title})() for i, title in enumerate(finbert_headlines[:3])]
+    encoded = service.encode_articles([news.title for news in articles], mode='full')
+    analyze = service.analyze_encoded
+
+    def fails_on_batches_and_article_1(batch, batch_size=None):
+        if len(batch) > 1 or list(batch[0]) == list(encoded[1]):
+            raise RuntimeError("CUDA out of memory")
+        return analyze(batch, batch_size)
+
+    monkeypatch.setattr(service, "analyze_encoded", fails_on_batches_and_article_1)
+    results = service._score_batch(articles, encoded)
+
+    assert results[1] is None
+    assert results[0] == analyze([encoded[0]])[0]
+    assert results[2] == analyze([encoded[2]])[0]
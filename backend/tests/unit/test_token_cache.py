@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the memory-mapped token cache.
+
+Author: Hoseyn Doulabi (@hoseynd-ai)
+Created: 2026-10-19
+"""
+
+import numpy as np
+
+from app.infrastructure.cache.token_cache import TokenCache, content_hash
+
+VERSION = "BertTokenizerFast-abc123-lower-full-512"
+
+
+def test_roundtrip_and_reopen(tmp_path):
+    cache = TokenCache(str(tmp_path), VERSION)
+    assert cache.add([10, 11], [[101, 7, 102], [101, 102]]) == 2
+    assert cache.add([12, 10], [[101, 8, 9, 102], [1, 2, 3]]) == 1  # 10 already cached
+
+    reopened = TokenCache(str(tmp_path), VERSION)
+    assert len(reopened) == 3
+    tokens = reopened.get_many([12, 99, 10, 11])
+    assert tokens[1] is None
+    assert [t.tolist() for t in (tokens[0], tokens[2], tokens[3])] == [[101, 8, 9, 102], [101, 7, 102], [101, 102]]
+    assert tokens[0].dtype == np.int32
+    assert isinstance(tokens[0].base, np.memmap) or isinstance(tokens[0], np.memmap)
+
+
+def test_versions_are_separate(tmp_path):
+    TokenCache(str(tmp_path), VERSION).add([1], [[101, 102]])
+
+    other = TokenCache(str(tmp_path), VERSION.replace("full-512", "title_first-64-64"))
+    assert 1 not in other
+    assert len(other) == 0
+
+
+def test_interrupted_append_is_discarded(tmp_path):
+    cache = TokenCache(str(tmp_path), VERSION)
+    cache.add([1], [[101, 5, 102]])
+
+    # bytes written without a meta.json commit
+    with open(cache.path / "tokens.i32", "ab") as f:
+        f.write(np.arange(50, dtype=np.int32).tobytes())
+    with open(cache.path / "ids.i64", "ab") as f:
+        f.write(np.array([2], dtype=np.int64).tobytes())
+
+    reopened = TokenCache(str(tmp_path), VERSION)
+    assert 2 not in reopened
+    reopened.add([3], [[101, 6, 102]])
+
+    final = TokenCache(str(tmp_path), VERSION)
+    assert final.get(1).tolist() == [101, 5, 102]
+    assert final.get(3).tolist() == [101, 6, 102]
+    assert (cache.path / "tokens.i32").stat().st_size == 6 * 4
+
+
+def test_changed_content_is_a_miss_and_re_added(tmp_path):
+    old = content_hash("Gold rises", "Fed pause")
+    new = content_hash("Gold falls", "Fed hike")
+    cache = TokenCache(str(tmp_path), VERSION)
+    cache.add([1], [[101, 5, 102]], [old])
+
+    # edited row, or ID reused after a database reset
+    assert cache.get(1, new) is None
+    assert cache.get(1, old).tolist() == [101, 5, 102]
+
+    assert cache.add([1], [[101, 6, 102]], [new]) == 1
+    assert cache.add([1], [[101, 6, 102]], [new]) == 0
+    reopened = TokenCache(str(tmp_path), VERSION)
+    assert reopened.get(1, new).tolist() == [101, 6, 102]
+    assert reopened.get(1, old) is None
+
+
+def test_appends_from_two_handles_do_not_clobber(tmp_path):
+    first = TokenCache(str(tmp_path), VERSION)
+    second = TokenCache(str(tmp_path), VERSION)
+
+    first.add([1], [[101, 1, 102]])
+    # `second` still maps the empty cache; add reloads under the lock
+    second.add([2, 1], [[101, 2, 102], [101, 1, 102]])
+
+    final = TokenCache(str(tmp_path), VERSION)
+    assert len(final) == 2
+    assert final.get(1).tolist() == [101, 1, 102]
+    assert final.get(2).tolist() == [101, 2, 102]